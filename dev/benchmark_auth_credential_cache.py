@@ -0,0 +1,71 @@
+"""
+Benchmark the number of requests per second that the basic auth plugin can authenticate with and
+without the credential cache of its `SqlAlchemyStore`.
+
+Usage:
+
+    python dev/benchmark_auth_credential_cache.py --num-requests 200
+"""
+
+import argparse
+import base64
+import tempfile
+import time
+from pathlib import Path
+
+from flask import Flask, request
+
+from qcflow.server.auth.sqlalchemy_store import SqlAlchemyStore
+
+_USERNAME = "benchmark-user"
+_PASSWORD = "benchmark-password"
+
+
+def _create_app(store):
+    app = Flask(__name__)
+
+    @app.route("/")
+    def index():
+        authorization = request.authorization
+        if store.authenticate_user(authorization.username, authorization.password):
+            return "ok"
+        return "unauthorized", 401
+
+    return app
+
+
+def _requests_per_second(app, num_requests):
+    credentials = base64.b64encode(f"{_USERNAME}:{_PASSWORD}".encode()).decode()
+    headers = {"Authorization": f"Basic {credentials}"}
+    with app.test_client() as client:
+        start = time.perf_counter()
+        for _ in range(num_requests):
+            assert client.get("/", headers=headers).status_code == 200
+        return num_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-requests", type=int, default=200)
+    parser.add_argument("--ttl", type=float, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_uri = f"sqlite:///{Path(tmp_dir, 'basic_auth.db')}"
+        uncached_store = SqlAlchemyStore()
+        uncached_store.init_db(db_uri)
+        uncached_store.create_user(_USERNAME, _PASSWORD)
+        cached_store = SqlAlchemyStore(credential_cache_ttl=args.ttl)
+        cached_store.init_db(db_uri)
+
+        uncached = _requests_per_second(_create_app(uncached_store), args.num_requests)
+        cached = _requests_per_second(_create_app(cached_store), args.num_requests)
+
+    print(f"{'credential cache':<20}{'requests/s':>12}")
+    print(f"{'disabled':<20}{uncached:>12.1f}")
+    print(f"{'enabled':<20}{cached:>12.1f}")
+    print(f"speedup: {cached / uncached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark the vectorized retrieval metrics in `qcflow.metrics.metric_definitions` against the
+row-by-row implementations they replaced, including the validation of the input doc IDs.
+
+Usage:
+
+    python dev/benchmark_metric_definitions.py --num-rows 100000 --k 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import ndcg_score
+
+from qcflow.metrics.metric_definitions import (
+    _ndcg_at_k_eval_fn,
+    _precision_at_k_eval_fn,
+    _recall_at_k_eval_fn,
+)
+
+
+def _row_wise_validate(data):
+    for value in data:
+        if not (
+            (isinstance(value, list) and all(isinstance(val, (str, int)) for val in value))
+            or (
+                isinstance(value, np.ndarray)
+                and (np.issubdtype(value.dtype, str) or np.issubdtype(value.dtype, int))
+            )
+        ):
+            raise ValueError(f"Invalid doc IDs: {value}")
+
+
+def _row_wise_precision_at_k(predictions, targets, k):
+    _row_wise_validate(predictions)
+    _row_wise_validate(targets)
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        ground_truth, retrieved = set(target), prediction[:k]
+        relevant_doc_count = sum(1 for doc in retrieved if doc in ground_truth)
+        scores.append(relevant_doc_count / len(retrieved) if len(retrieved) > 0 else 0)
+    return scores
+
+
+def _row_wise_recall_at_k(predictions, targets, k):
+    _row_wise_validate(predictions)
+    _row_wise_validate(targets)
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        ground_truth, retrieved = set(target), set(prediction[:k])
+        if len(ground_truth) > 0:
+            scores.append(len(ground_truth & retrieved) / len(ground_truth))
+        else:
+            scores.append(1 if len(retrieved) == 0 else 0)
+    return scores
+
+
+def _row_wise_ndcg_at_k(predictions, targets, k):
+    _row_wise_validate(predictions)
+    _row_wise_validate(targets)
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        if len(prediction) == 0 or len(target) == 0:
+            scores.append(1 if len(prediction) == len(target) else 0)
+            continue
+        retrieved, ground_truth, counts = [], set(target), {}
+        for doc in prediction[:k]:
+            counts[doc] = counts.get(doc, 0) + 1
+            retrieved.append(doc if counts[doc] == 1 else f"{doc}_{counts[doc]}")
+            if counts[doc] > 1 and doc in ground_truth:
+                ground_truth.add(retrieved[-1])
+        doc_to_index = {doc: i for i, doc in enumerate(ground_truth.union(retrieved))}
+        y_true = np.zeros((1, max(len(doc_to_index), 2)), dtype=np.float32)
+        y_score = np.zeros((1, max(len(doc_to_index), 2)), dtype=np.float32)
+        for i, doc in enumerate(retrieved):
+            y_score[0, doc_to_index[doc]] = 1 - i * 1e-6
+        for doc in ground_truth:
+            y_true[0, doc_to_index[doc]] = 1
+        scores.append(ndcg_score(y_true, y_score, k=len(retrieved), ignore_ties=True))
+    return scores
+
+
+def _generate_data(num_rows, num_docs, num_retrieved, num_targets, seed=0):
+    rng = np.random.default_rng(seed)
+    predictions = [
+        [f"doc-{i}" for i in rng.integers(0, num_docs, size=num_retrieved)] for _ in range(num_rows)
+    ]
+    targets = [
+        [f"doc-{i}" for i in rng.integers(0, num_docs, size=num_targets)] for _ in range(num_rows)
+    ]
+    return pd.Series(predictions), pd.Series(targets)
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=100_000)
+    parser.add_argument("--num-docs", type=int, default=1000)
+    parser.add_argument("--num-retrieved", type=int, default=10)
+    parser.add_argument("--num-targets", type=int, default=3)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    predictions, targets = _generate_data(
+        args.num_rows, args.num_docs, args.num_retrieved, args.num_targets
+    )
+    benchmarks = {
+        "precision_at_k": (_precision_at_k_eval_fn, _row_wise_precision_at_k),
+        "recall_at_k": (_recall_at_k_eval_fn, _row_wise_recall_at_k),
+        "ndcg_at_k": (_ndcg_at_k_eval_fn, _row_wise_ndcg_at_k),
+    }
+
+    print(f"{'metric':<16}{'row-wise (s)':>14}{'vectorized (s)':>16}{'speedup':>10}")
+    for name, (make_eval_fn, row_wise_fn) in benchmarks.items():
+        eval_fn = make_eval_fn(args.k)
+        vectorized_time, result = _time(lambda: eval_fn(predictions, targets))
+        row_wise_time, expected = _time(lambda: row_wise_fn(predictions, targets, args.k))
+        np.testing.assert_allclose(result.scores, expected, atol=1e-6)
+        print(
+            f"{name:<16}{row_wise_time:>14.3f}{vectorized_time:>16.3f}"
+            f"{row_wise_time / vectorized_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark `qcflow.evaluate` of a CPU-bound scikit-learn model with predictions sharded across
+worker processes via the `num_prediction_workers` evaluator config.
+
+Usage:
+
+    python dev/benchmark_parallel_prediction.py --num-rows 500000 --num-workers 1 4 8
+
+The model is a random forest restricted to a single thread, so that prediction time scales with
+the number of rows evaluated by each process. The reported time includes spawning the workers
+and loading the model in each of them.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+import qcflow
+
+
+def _make_data(num_rows, num_features, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        rng.normal(size=(num_rows, num_features)), columns=[f"f{i}" for i in range(num_features)]
+    )
+    y = X.sum(axis=1) + rng.normal(size=num_rows)
+    return X, y
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=500_000)
+    parser.add_argument("--num-features", type=int, default=20)
+    parser.add_argument("--num-trees", type=int, default=100)
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    X_train, y_train = _make_data(10_000, args.num_features)
+    model = RandomForestRegressor(n_estimators=args.num_trees, n_jobs=1, random_state=0)
+    model.fit(X_train, y_train)
+    X, y = _make_data(args.num_rows, args.num_features, seed=1)
+    data = X.assign(target=y)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        qcflow.set_tracking_uri(f"sqlite:///{os.path.join(tmp_dir, 'qcflow.db')}")
+        with qcflow.start_run():
+            model_uri = qcflow.sklearn.log_model(model, "model").model_uri
+
+        print(f"{'workers':<10}{'evaluate (s)':>14}{'speedup':>10}")
+        baseline = None
+        for num_workers in args.num_workers:
+            with qcflow.start_run():
+                start = time.perf_counter()
+                qcflow.evaluate(
+                    model_uri,
+                    data,
+                    targets="target",
+                    model_type="regressor",
+                    evaluators="regressor",
+                    evaluator_config={"num_prediction_workers": num_workers},
+                )
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{num_workers:<10}{elapsed:>14.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark the per-span overhead of the `@qcflow.trace` decorator.
+
+Usage:
+
+    python dev/benchmark_trace_overhead.py --num-spans 100 --num-documents 100
+
+Each trace mimics a RAG pipeline passing a list of retrieved documents through many child spans,
+so that the cost of creating the trace in the backend is amortized over the spans. The overhead
+is measured against the same functions without tracing, with tracing disabled, and with tail
+sampling dropping every trace.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import qcflow
+from qcflow.tracing.provider import reset_tracer_setup
+
+
+def _make_documents(num_documents: int, document_size: int) -> list[dict[str, str]]:
+    return [
+        {"id": str(i), "page_content": "x" * document_size, "metadata": {"source": f"doc-{i}"}}
+        for i in range(num_documents)
+    ]
+
+
+def _rerank(documents):
+    return documents
+
+
+def _pipeline(documents, num_spans):
+    for _ in range(num_spans):
+        documents = _rerank(documents)
+    return len(documents)
+
+
+traced_rerank = qcflow.trace(_rerank)
+
+
+@qcflow.trace
+def traced_pipeline(documents, num_spans):
+    for _ in range(num_spans):
+        documents = traced_rerank(documents)
+    return len(documents)
+
+
+def _measure(func, documents, num_spans: int, num_traces: int) -> float:
+    """Return the median latency per trace in microseconds."""
+    latencies = []
+    for _ in range(num_traces):
+        start = time.perf_counter()
+        func(documents, num_spans)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-traces", type=int, default=20)
+    parser.add_argument("--num-spans", type=int, default=100)
+    parser.add_argument("--num-documents", type=int, default=100)
+    parser.add_argument("--document-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    documents = _make_documents(args.num_documents, args.document_size)
+    num_spans = args.num_spans
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        qcflow.set_tracking_uri(f"sqlite:///{os.path.join(tmp_dir, 'qcflow.db')}")
+        qcflow.set_experiment("benchmark")
+
+        baseline = _measure(_pipeline, documents, num_spans, args.num_traces)
+        results = {"traced": _measure(traced_pipeline, documents, num_spans, args.num_traces)}
+
+        os.environ["QCFLOW_TRACE_TAIL_SAMPLING_RATIO"] = "0"
+        reset_tracer_setup()
+        results["traced, dropped by tail sampling"] = _measure(
+            traced_pipeline, documents, num_spans, args.num_traces
+        )
+        del os.environ["QCFLOW_TRACE_TAIL_SAMPLING_RATIO"]
+        reset_tracer_setup()
+
+        qcflow.tracing.disable()
+        results["tracing disabled"] = _measure(
+            traced_pipeline, documents, num_spans, args.num_traces
+        )
+        qcflow.tracing.enable()
+
+    print(f"{'baseline':<36}{baseline:>12.1f} us/trace")
+    for name, latency in results.items():
+        overhead = (latency - baseline) / num_spans
+        print(f"{name:<36}{latency:>12.1f} us/trace{overhead:>12.1f} us/span overhead")
+
+
+if __name__ == "__main__":
+    main()
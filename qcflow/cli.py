@@ -1,4 +1,5 @@
 import contextlib
+import importlib.util
 import json
 import logging
 import os
@@ -18,7 +19,13 @@ import qcflow.store.artifact.cli
 from qcflow import projects, version
 from qcflow.entities import ViewType
 from qcflow.entities.lifecycle_stage import LifecycleStage
-from qcflow.environment_variables import QCFLOW_EXPERIMENT_ID, QCFLOW_EXPERIMENT_NAME
+from qcflow.environment_variables import (
+    QCFLOW_EXPERIMENT_ID,
+    QCFLOW_EXPERIMENT_NAME,
+    QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW,
+    QCFLOW_SQLALCHEMYSTORE_POOL_RECYCLE,
+    QCFLOW_SQLALCHEMYSTORE_POOL_SIZE,
+)
 from qcflow.exceptions import InvalidUrlException, QCFlowException
 from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from qcflow.store.artifact.artifact_repository_registry import get_artifact_repository
@@ -372,6 +379,62 @@ def _validate_static_prefix(ctx, param, value):
         "Unsupported on Windows."
     ),
 )
+@click.option(
+    "--production",
+    envvar="QCFLOW_SERVER_PRODUCTION",
+    is_flag=True,
+    default=False,
+    help=(
+        "If enabled, load the application and the backend stores in the gunicorn master process "
+        "before forking the workers, which then open their own database connections, and use "
+        "the 'gthread' worker class with 4 threads per worker unless '--worker-class' or "
+        "'--threads' is specified. Cannot be used with '--dev'. Unsupported on Windows."
+    ),
+)
+@click.option(
+    "--worker-class",
+    envvar="QCFLOW_SERVER_WORKER_CLASS",
+    default=None,
+    type=click.Choice(["sync", "gthread", "uvicorn"]),
+    help=(
+        "The gunicorn worker class. 'gthread' serves the requests of each worker with a pool of "
+        "'--threads' threads. 'uvicorn' requires the uvicorn package. Unsupported on Windows."
+    ),
+)
+@click.option(
+    "--threads",
+    envvar="QCFLOW_SERVER_THREADS",
+    default=None,
+    type=click.IntRange(min=1),
+    help="The number of threads of each gunicorn worker. Unsupported on Windows.",
+)
+@click.option(
+    "--db-pool-size",
+    default=None,
+    type=click.IntRange(min=0),
+    help=(
+        "The size of the database connection pool of each worker, see "
+        f"{QCFLOW_SQLALCHEMYSTORE_POOL_SIZE}. Should be at least the number of threads."
+    ),
+)
+@click.option(
+    "--db-max-overflow",
+    default=None,
+    type=click.IntRange(min=0),
+    help=(
+        "The number of database connections each worker may open beyond the pool size, see "
+        f"{QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW}."
+    ),
+)
+@click.option(
+    "--db-pool-recycle",
+    default=None,
+    type=int,
+    help=(
+        "The number of seconds after which the pooled database connections are recycled, see "
+        f"{QCFLOW_SQLALCHEMYSTORE_POOL_RECYCLE}."
+    ),
+)
 def server(
     backend_store_uri,
     registry_store_uri,
@@ -388,6 +451,12 @@ def server(
     expose_prometheus,
     app_name,
     dev,
+    production,
+    worker_class,
+    threads,
+    db_pool_size,
+    db_max_overflow,
+    db_pool_recycle,
 ):
     """
     Run the QCFlow tracking server.
@@ -406,6 +475,20 @@ def server(
     if dev and gunicorn_opts:
         raise click.UsageError("'--dev' and '--gunicorn-opts' cannot be specified together.")
 
+    if dev and production:
+        raise click.UsageError("'--dev' and '--production' cannot be specified together.")
+
+    if is_windows() and (production or worker_class or threads):
+        raise click.UsageError(
+            "'--production', '--worker-class' and '--threads' are not supported on Windows."
+        )
+
+    if worker_class == "uvicorn" and importlib.util.find_spec("uvicorn") is None:
+        raise click.UsageError(
+            "The 'uvicorn' worker class requires the uvicorn package. "
+            "Please install it with `pip install uvicorn`."
+        )
+
     gunicorn_opts = "--log-level debug --reload" if dev else gunicorn_opts
     _validate_server_args(gunicorn_opts=gunicorn_opts, workers=workers, waitress_opts=waitress_opts)
 
@@ -445,12 +528,74 @@ def server(
             waitress_opts,
             expose_prometheus,
             app_name,
+            worker_class=worker_class,
+            threads=threads,
+            production=production,
+            db_pool_size=db_pool_size,
+            db_max_overflow=db_max_overflow,
+            db_pool_recycle=db_pool_recycle,
         )
     except ShellCommandException:
         eprint("Running the qcflow server failed. Please see the logs above for details.")
         sys.exit(1)
 
 
+@cli.command("load-test", short_help="Measure the throughput of a tracking server.")
+@click.option(
+    "--tracking-uri",
+    envvar="QCFLOW_TRACKING_URI",
+    metavar="URI",
+    default=None,
+    help="The URI of the tracking server, e.g. 'http://localhost:5000'.",
+)
+@click.option(
+    "--duration",
+    default=30.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="The number of seconds to send requests for.",
+)
+@click.option(
+    "--concurrency",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of threads sending requests.",
+)
+@click.option(
+    "--batch-size",
+    default=100,
+    show_default=True,
+    type=click.IntRange(min=1, max=1000),
+    help="The number of metrics logged by each log_batch request.",
+)
+@click.option(
+    "--search-ratio",
+    default=0.1,
+    show_default=True,
+    type=click.FloatRange(min=0, max=1),
+    help="The proportion of the requests that are search_runs requests.",
+)
+def load_test(tracking_uri, duration, concurrency, batch_size, search_ratio):
+    """
+    Run a load test against a tracking server and print the throughput and the latencies of its
+    log_batch and search_runs requests.
+
+    The load test logs the metrics of a run per thread in a new experiment, which is deleted at
+    the end of the test.
+    """
+    from qcflow.server.load_test import run_load_test
+
+    result = run_load_test(
+        tracking_uri,
+        duration=duration,
+        concurrency=concurrency,
+        batch_size=batch_size,
+        search_ratio=search_ratio,
+    )
+    click.echo(result.format())
+
+
 @cli.command(short_help="Permanently delete runs in the `deleted` lifecycle stage.")
 @click.option(
     "--older-than",
@@ -1,6 +1,6 @@
 import json
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 
 class DatasetSource:
@@ -83,6 +83,17 @@ class DatasetSource:
         """
         return json.dumps(self.to_dict())
 
+    def _compute_content_digest(self) -> Optional[str]:
+        """Computes a digest of the full content of the dataset source. When
+        ``QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST`` is enabled, datasets use this digest instead of
+        computing one from their data.
+
+        Returns:
+            A string digest, or None if the content of the source cannot be hashed.
+
+        """
+        return None
+
     @classmethod
     @abstractmethod
     def from_dict(cls, source_dict: dict[Any, Any]) -> "DatasetSource":
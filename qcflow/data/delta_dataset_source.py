@@ -2,6 +2,7 @@ import logging
 from typing import Any, Optional
 
 from qcflow.data.dataset_source import DatasetSource
+from qcflow.data.digest_utils import compute_delta_digest
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_managed_catalog_messages_pb2 import (
     GetTable,
@@ -12,6 +13,7 @@ from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from qcflow.utils._spark_utils import _get_active_spark_session
 from qcflow.utils._unity_catalog_utils import get_full_name_from_sc
 from qcflow.utils.databricks_utils import get_databricks_host_creds
+from qcflow.utils.file_utils import local_file_uri_to_path
 from qcflow.utils.proto_json_utils import message_to_json
 from qcflow.utils.rest_utils import (
     _REST_API_PATH_PREFIX,
@@ -19,6 +21,7 @@ from qcflow.utils.rest_utils import (
     extract_api_info_for_service,
 )
 from qcflow.utils.string_utils import _backtick_quote
+from qcflow.utils.uri import is_local_uri
 
 DATABRICKS_HIVE_METASTORE_NAME = "hive_metastore"
 # these two catalog names both points to the workspace local default HMS (hive metastore).
@@ -104,6 +107,16 @@ class DeltaDatasetSource(DatasetSource):
     def _can_resolve(raw_source: Any):
         return False
 
+    def _compute_content_digest(self) -> Optional[str]:
+        if self._path is None or not is_local_uri(self._path, is_tracking_or_registry_uri=False):
+            return None
+        try:
+            return compute_delta_digest(
+                local_file_uri_to_path(self._path), version=self._delta_table_version
+            )
+        except (QCFlowException, OSError, ValueError):
+            return None
+
     @classmethod
     def _resolve(cls, raw_source: str) -> "DeltaDatasetSource":
         raise NotImplementedError
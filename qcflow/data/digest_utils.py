@@ -1,13 +1,27 @@
 import hashlib
-from typing import Any
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+from urllib.parse import unquote
 
 from packaging.version import Version
 
+from qcflow.environment_variables import QCFLOW_DATA_DIGEST_NUM_WORKERS
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 
 MAX_ROWS = 10000
 
+# Maximum number of per-file content digests kept in memory, keyed by file path, size and mtime
+_FILE_DIGEST_CACHE_SIZE = 10000
+_DELTA_LOG_DIR_NAME = "_delta_log"
+_DELTA_COMMIT_FILE_PATTERN = re.compile(r"^(\d{20})\.json$")
+_DELTA_CHECKPOINT_FILE_PATTERN = re.compile(r"^(\d{20})\.checkpoint(\.\d+\.\d+)?\.parquet$")
+
 
 def compute_pandas_digest(df) -> str:
     """Computes a digest for the given Pandas DataFrame.
@@ -106,3 +120,249 @@ def get_normalized_md5_digest(elements: list[Any]) -> str:
         md5.update(element)
 
     return md5.hexdigest()[:8]
+
+
+class _FileDigestCache:
+    """
+    A thread-safe LRU cache of Parquet file content digests. Entries are keyed by the absolute
+    path, size and modification time of the file, so a rewritten file is hashed again.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, digest: str) -> None:
+        with self._lock:
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_file_digest_cache = _FileDigestCache(_FILE_DIGEST_CACHE_SIZE)
+
+
+def _hash_arrow_column(column) -> bytes:
+    import pandas as pd
+
+    try:
+        return pd.util.hash_array(column.to_numpy()).tobytes()
+    except (TypeError, ValueError):
+        # Nested and other non-hashable values, e.g. lists and structs
+        return repr(column.to_pylist()).encode()
+
+
+def _hash_row_group(path: str, metadata, index: int) -> bytes:
+    import numpy as np
+    import pyarrow.parquet as pq
+
+    # Passing the footer read while listing the row groups avoids parsing it for every row group
+    table = pq.ParquetFile(path, metadata=metadata).read_row_group(index)
+    md5 = hashlib.md5(usedforsecurity=False)
+    md5.update(np.int64(table.num_rows))
+    for name, column in zip(table.column_names, table.columns):
+        md5.update(name.encode())
+        md5.update(_hash_arrow_column(column))
+    return md5.digest()
+
+
+def _combine_row_group_digests(metadata, row_group_digests: list[bytes]) -> str:
+    import numpy as np
+
+    md5 = hashlib.md5(usedforsecurity=False)
+    md5.update(str(metadata.schema.to_arrow_schema()).encode())
+    md5.update(np.int64(metadata.num_rows))
+    for digest in row_group_digests:
+        md5.update(digest)
+    return md5.hexdigest()
+
+
+def _compute_parquet_file_digests(paths: list[str], max_workers: Optional[int]) -> list[str]:
+    """
+    Computes the content digests of the specified Parquet files. Each file digest is the root of a
+    Merkle tree whose leaves are the digests of the file's row groups. The row groups of all files
+    that are not cached are read and hashed concurrently, one row group at a time per worker.
+    """
+    import pyarrow.parquet as pq
+
+    digests = [None] * len(paths)
+    pending = []
+    for i, path in enumerate(paths):
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if (digest := _file_digest_cache.get(key)) is not None:
+            digests[i] = digest
+        else:
+            pending.append((i, key, path, pq.read_metadata(path)))
+
+    tasks = [
+        (path, metadata, index)
+        for _, _, path, metadata in pending
+        for index in range(metadata.num_row_groups)
+    ]
+    with ThreadPoolExecutor(
+        max_workers=max_workers or QCFLOW_DATA_DIGEST_NUM_WORKERS.get(),
+        thread_name_prefix="QCFlowDataDigest",
+    ) as executor:
+        row_group_digests = iter(list(executor.map(lambda task: _hash_row_group(*task), tasks)))
+
+    for i, key, _, metadata in pending:
+        file_row_group_digests = [next(row_group_digests) for _ in range(metadata.num_row_groups)]
+        digests[i] = _combine_row_group_digests(metadata, file_row_group_digests)
+        _file_digest_cache.put(key, digests[i])
+
+    return digests
+
+
+def _list_parquet_files(path: str) -> list[str]:
+    if os.path.isfile(path):
+        return [path]
+
+    parquet_files = []
+    for root, dirs, files in os.walk(path):
+        # Skip metadata directories such as `_delta_log` and hidden files such as `.crc` files
+        dirs[:] = sorted(d for d in dirs if not d.startswith(("_", ".")))
+        parquet_files.extend(
+            os.path.join(root, f)
+            for f in sorted(files)
+            if f.endswith(".parquet") and not f.startswith(("_", "."))
+        )
+    return parquet_files
+
+
+def _get_dataset_digest(root: str, paths: list[str], max_workers: Optional[int]) -> str:
+    file_digests = _compute_parquet_file_digests(paths, max_workers)
+    elements = []
+    for path, digest in sorted(zip(paths, file_digests), key=lambda item: item[0]):
+        # The relative path carries the partition values of partitioned datasets
+        elements.append(os.path.relpath(path, root).replace(os.sep, "/").encode())
+        elements.append(digest.encode())
+    return get_normalized_md5_digest(elements)
+
+
+def compute_parquet_digest(path: str, max_workers: Optional[int] = None) -> str:
+    """Computes a digest of the full content of a Parquet file or a directory of Parquet files.
+
+    Unlike :py:func:`compute_pandas_digest`, every row is hashed. The row groups are read and
+    hashed in parallel without loading the whole dataset into memory, and the digest of each file
+    is cached by its path, size and modification time, so only new or modified files are read
+    again when the digest of a growing dataset is recomputed.
+
+    Args:
+        path: The local path of a Parquet file or of a directory containing Parquet files.
+        max_workers: The number of threads used to read and hash the row groups. Defaults to
+            ``QCFLOW_DATA_DIGEST_NUM_WORKERS``.
+
+    Returns:
+        A string digest.
+    """
+    paths = _list_parquet_files(path)
+    if not paths:
+        raise QCFlowException(
+            f"No Parquet files were found at '{path}'",
+            INVALID_PARAMETER_VALUE,
+        )
+    root = os.path.dirname(path) if os.path.isfile(path) else path
+    return _get_dataset_digest(root, paths, max_workers)
+
+
+def _read_delta_actions(path: str, version: Optional[int]) -> dict[str, bool]:
+    """
+    Replays the Delta transaction log up to the specified version, starting from the latest
+    checkpoint if there is one, and returns the data files mapped to whether they are active.
+    """
+    import pyarrow.parquet as pq
+
+    log_dir = os.path.join(path, _DELTA_LOG_DIR_NAME)
+    commits, checkpoints = {}, {}
+    for name in os.listdir(log_dir):
+        if match := _DELTA_COMMIT_FILE_PATTERN.match(name):
+            commits[int(match.group(1))] = name
+        elif match := _DELTA_CHECKPOINT_FILE_PATTERN.match(name):
+            checkpoints.setdefault(int(match.group(1)), []).append(name)
+
+    if not commits and not checkpoints:
+        raise QCFlowException(
+            f"The Delta table at '{path}' has no transaction log",
+            INVALID_PARAMETER_VALUE,
+        )
+    if version is None:
+        version = max([*commits, *checkpoints])
+
+    files = {}
+    start = 0
+    if usable_checkpoints := [v for v in checkpoints if v <= version]:
+        start = max(usable_checkpoints)
+        for name in sorted(checkpoints[start]):
+            table = pq.read_table(os.path.join(log_dir, name), columns=["add", "remove"])
+            for action in table.to_pylist():
+                if action.get("add"):
+                    files[action["add"]["path"]] = True
+                elif action.get("remove"):
+                    files[action["remove"]["path"]] = False
+        start += 1
+
+    for commit_version in range(start, version + 1):
+        if commit_version not in commits:
+            raise QCFlowException(
+                f"Version {commit_version} of the Delta table at '{path}' is missing from the "
+                "transaction log",
+                INVALID_PARAMETER_VALUE,
+            )
+        with open(os.path.join(log_dir, commits[commit_version])) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                action = json.loads(line)
+                if "add" in action:
+                    files[action["add"]["path"]] = True
+                elif "remove" in action:
+                    files[action["remove"]["path"]] = False
+    return files
+
+
+def compute_delta_digest(
+    path: str, version: Optional[int] = None, max_workers: Optional[int] = None
+) -> str:
+    """Computes a digest of the full content of a version of a Delta table stored on the local
+    filesystem.
+
+    The data files of the version are determined from the table's transaction log and hashed the
+    same way as :py:func:`compute_parquet_digest`, so the digests of files shared by several
+    versions of the table are computed only once.
+
+    Args:
+        path: The local path of the Delta table.
+        version: The version of the Delta table. Defaults to the latest version.
+        max_workers: The number of threads used to read and hash the row groups. Defaults to
+            ``QCFLOW_DATA_DIGEST_NUM_WORKERS``.
+
+    Returns:
+        A string digest.
+    """
+    from qcflow.utils.file_utils import local_file_uri_to_path
+
+    paths = [
+        os.path.join(path, unquote(file_path))
+        if "://" not in file_path
+        else local_file_uri_to_path(file_path)
+        for file_path, active in _read_delta_actions(path, version).items()
+        if active
+    ]
+    if not paths:
+        # All the data files have been removed from this version of the table
+        return get_normalized_md5_digest([path.encode()])
+    return _get_dataset_digest(path, paths, max_workers)
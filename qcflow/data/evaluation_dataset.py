@@ -1,4 +1,5 @@
 import hashlib
+import itertools
 import json
 import logging
 import math
@@ -213,6 +214,29 @@ def convert_data_to_qcflow_dataset(data, targets=None, predictions=None):
         return data
 
 
+def _is_arrow_dataset(data):
+    """Returns True if the data is a ``pyarrow.dataset.Dataset``, without importing pyarrow."""
+    if "pyarrow.dataset" not in sys.modules:
+        return False
+
+    import pyarrow.dataset
+
+    return isinstance(data, pyarrow.dataset.Dataset)
+
+
+def _validate_dataset_name_and_path(name, path):
+    if name is not None and '"' in name:
+        raise QCFlowException(
+            message=f'Dataset name cannot include a double quote (") but got {name}',
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if path is not None and '"' in path:
+        raise QCFlowException(
+            message=f'Dataset path cannot include a double quote (") but got {path}',
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
 def _validate_dataset_type_supports_predictions(data, supported_predictions_dataset_types):
     """
     Validate that the dataset type supports a user-specified "predictions" column.
@@ -251,16 +275,7 @@ class EvaluationDataset:
         """
         The values of the constructor arguments comes from the `evaluate` call.
         """
-        if name is not None and '"' in name:
-            raise QCFlowException(
-                message=f'Dataset name cannot include a double quote (") but got {name}',
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        if path is not None and '"' in path:
-            raise QCFlowException(
-                message=f'Dataset path cannot include a double quote (") but got {path}',
-                error_code=INVALID_PARAMETER_VALUE,
-            )
+        _validate_dataset_name_and_path(name, path)
 
         self._user_specified_name = name
         self._path = path
@@ -551,3 +566,215 @@ class EvaluationDataset:
             and self.path == other.path
             and self._feature_names == other._feature_names
         )
+
+
+class StreamingEvaluationDataset(EvaluationDataset):
+    """
+    An input dataset for model evaluation that is read in record batches instead of being loaded
+    in memory, backed by a ``pyarrow.dataset.Dataset`` (e.g. a directory of Parquet files) or a
+    Spark DataFrame. Unlike :py:class:`EvaluationDataset`, Spark DataFrames are not truncated.
+
+    The built-in classifier and regressor evaluators evaluate a streaming dataset chunk by chunk,
+    see the ``chunk_size`` evaluator config of :py:func:`qcflow.models.evaluate()`. The dataset
+    hash covers every row and is computed incrementally in a single pass over the batches the
+    first time it is accessed.
+    """
+
+    DEFAULT_BATCH_SIZE = 10000
+
+    def __init__(
+        self,
+        data,
+        *,
+        targets=None,
+        name=None,
+        path=None,
+        feature_names=None,
+        predictions=None,
+        batch_size=None,
+    ):
+        _validate_dataset_name_and_path(name, path)
+
+        spark_df_type = None
+        if "pyspark" in sys.modules:
+            from qcflow.utils.spark_utils import get_spark_dataframe_type
+
+            spark_df_type = get_spark_dataframe_type()
+
+        if _is_arrow_dataset(data):
+            columns = list(data.schema.names)
+        elif spark_df_type is not None and isinstance(data, spark_df_type):
+            columns = list(data.columns)
+        else:
+            raise QCFlowException(
+                message="The data argument of a streaming evaluation dataset must be a "
+                f"`pyarrow.dataset.Dataset` or a Spark DataFrame, but got {type(data)}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        for argument, column in (("targets", targets), ("predictions", predictions)):
+            if column is not None and column not in columns:
+                raise QCFlowException(
+                    message=f"The `{argument}` argument must be the name of a column of the "
+                    f"streaming evaluation dataset, but got {column!r}. Available columns: "
+                    f"{columns}.",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+
+        if feature_names is not None:
+            feature_names = list(feature_names)
+            if len(set(feature_names)) < len(feature_names):
+                raise QCFlowException(
+                    message="`feature_names` argument must be a list containing unique feature "
+                    "names.",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            if missing := [c for c in feature_names if c not in columns]:
+                raise QCFlowException(
+                    message=f"The feature columns {missing} are not present in the streaming "
+                    "evaluation dataset.",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            self._feature_columns = feature_names
+        else:
+            self._feature_columns = [c for c in columns if c not in (targets, predictions)]
+
+        batch_size = batch_size or StreamingEvaluationDataset.DEFAULT_BATCH_SIZE
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+            raise QCFlowException(
+                message=f"batch_size must be a positive integer, got {batch_size!r}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        self._data = data
+        self._is_spark = not _is_arrow_dataset(data)
+        self._batch_size = batch_size
+        self._user_specified_name = name
+        self._path = path
+        self._hash = None
+        self._targets_name = targets
+        self._has_targets = targets is not None
+        self._predictions_name = predictions
+        self._has_predictions = predictions is not None
+        self._feature_names = [
+            generate_feature_name_if_not_string(c) for c in self._feature_columns
+        ]
+
+    @property
+    def batch_size(self):
+        """
+        The default number of rows of the batches yielded by :py:meth:`iter_batches`.
+        """
+        return self._batch_size
+
+    def _iter_dataframes(self, batch_size):
+        columns = self._feature_columns + [
+            c for c in (self._targets_name, self._predictions_name) if c is not None
+        ]
+        if self._is_spark:
+            rows = self._data.select(*columns).toLocalIterator(prefetchPartitions=True)
+            while batch := list(itertools.islice(rows, batch_size)):
+                yield pd.DataFrame.from_records(batch, columns=columns)
+        else:
+            for batch in self._data.to_batches(columns=columns, batch_size=batch_size):
+                if batch.num_rows > 0:
+                    yield batch.to_pandas()
+
+    def iter_batches(self, batch_size=None):
+        """
+        Iterate over the dataset in record batches. Only one batch is held in memory at a time.
+
+        Args:
+            batch_size: The maximum number of rows of each batch. Defaults to the ``batch_size``
+                of the dataset.
+
+        Returns:
+            An iterator of ``(features, labels, predictions)`` tuples, where ``features`` is a
+            Pandas DataFrame with the feature columns, and ``labels`` and ``predictions`` are
+            numpy arrays, or None if the dataset has no targets or predictions.
+        """
+        for df in self._iter_dataframes(batch_size or self._batch_size):
+            yield (
+                df[self._feature_columns],
+                df[self._targets_name].to_numpy() if self._has_targets else None,
+                df[self._predictions_name].to_numpy() if self._has_predictions else None,
+            )
+
+    def head(self, num_rows):
+        """
+        Load the first ``num_rows`` rows of the dataset as an in-memory
+        :py:class:`EvaluationDataset`.
+        """
+        dfs = []
+        remaining = num_rows
+        for df in self._iter_dataframes(min(num_rows, self._batch_size)):
+            dfs.append(df.head(remaining))
+            remaining -= len(dfs[-1])
+            if remaining <= 0:
+                break
+
+        return EvaluationDataset(
+            pd.concat(dfs, ignore_index=True),
+            targets=self._targets_name,
+            name=self._user_specified_name,
+            path=self._path,
+            feature_names=self._feature_columns,
+            predictions=self._predictions_name,
+        )
+
+    def _compute_hash(self):
+        md5_gen = hashlib.md5(usedforsecurity=False)
+        num_rows = 0
+        for df in self._iter_dataframes(self._batch_size):
+            # Index the rows by their position in the dataset, so that the hash does not depend on
+            # how the rows are split into batches
+            df.index = pd.RangeIndex(num_rows, num_rows + len(df))
+            md5_gen.update(_hash_array_like_obj_as_bytes(df))
+            num_rows += len(df)
+        md5_gen.update(_hash_uint64_ndarray_as_bytes(np.array([num_rows], dtype="uint64")))
+        md5_gen.update(",".join(list(map(str, self._feature_names))).encode("UTF-8"))
+        return md5_gen.hexdigest()
+
+    @property
+    def hash(self):
+        """
+        Dataset hash, computed over all the rows of the dataset.
+        """
+        if self._hash is None:
+            self._hash = self._compute_hash()
+        return self._hash
+
+    def _raise_not_in_memory(self):
+        raise QCFlowException(
+            message="A streaming evaluation dataset is not loaded in memory. Use `iter_batches()` "
+            "to read it, or evaluate it with the built-in classifier or regressor evaluators.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    @property
+    def features_data(self):
+        self._raise_not_in_memory()
+
+    @property
+    def labels_data(self):
+        self._raise_not_in_memory()
+
+    @property
+    def predictions_data(self):
+        self._raise_not_in_memory()
+
+    def __eq__(self, other):
+        if not isinstance(other, StreamingEvaluationDataset):
+            return False
+
+        return (
+            self._data is other._data
+            and self._targets_name == other._targets_name
+            and self._predictions_name == other._predictions_name
+            and self.name == other.name
+            and self.path == other.path
+            and self._feature_names == other._feature_names
+        )
+
+    def __hash__(self):
+        return hash(self.hash)
@@ -1,7 +1,11 @@
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 from qcflow.data.dataset_source import DatasetSource
+from qcflow.data.digest_utils import compute_parquet_digest
+from qcflow.exceptions import QCFlowException
+from qcflow.utils.file_utils import local_file_uri_to_path
+from qcflow.utils.uri import is_local_uri
 
 
 class FileSystemDatasetSource(DatasetSource):
@@ -46,6 +50,20 @@ class FileSystemDatasetSource(DatasetSource):
 
         """
 
+    def _compute_content_digest(self) -> Optional[str]:
+        """Computes a digest of the full content of the Parquet files at the dataset source URI.
+
+        Returns:
+            A string digest, or None if the URI does not refer to local Parquet files.
+
+        """
+        if not is_local_uri(str(self.uri), is_tracking_or_registry_uri=False):
+            return None
+        try:
+            return compute_parquet_digest(local_file_uri_to_path(str(self.uri)))
+        except (QCFlowException, OSError, ValueError):
+            return None
+
     @staticmethod
     @abstractmethod
     def _can_resolve(raw_source: Any) -> bool:
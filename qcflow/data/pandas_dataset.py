@@ -7,9 +7,10 @@ import pandas as pd
 
 from qcflow.data.dataset import Dataset
 from qcflow.data.dataset_source import DatasetSource
-from qcflow.data.digest_utils import compute_pandas_digest
+from qcflow.data.digest_utils import compute_pandas_digest, get_normalized_md5_digest
 from qcflow.data.evaluation_dataset import EvaluationDataset
 from qcflow.data.pyfunc_dataset_mixin import PyFuncConvertibleDatasetMixin, PyFuncInputsOutputs
+from qcflow.environment_variables import QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from qcflow.types import Schema
@@ -67,7 +68,14 @@ class PandasDataset(Dataset, PyFuncConvertibleDatasetMixin):
         Computes a digest for the dataset. Called if the user doesn't supply
         a digest when constructing the dataset.
         """
-        return compute_pandas_digest(self._df)
+        digest = compute_pandas_digest(self._df)
+        if QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST.get() and (
+            content_digest := self._source._compute_content_digest()
+        ):
+            # The DataFrame may have been filtered or modified after it was read from the source,
+            # so the digest of the source content is combined with the digest of the DataFrame
+            return get_normalized_md5_digest([content_digest.encode(), digest.encode()])
+        return digest
 
     def to_dict(self) -> dict[str, str]:
         """Create config dictionary for the dataset.
@@ -9,9 +9,10 @@ from qcflow.data.dataset import Dataset
 from qcflow.data.dataset_source import DatasetSource
 from qcflow.data.delta_dataset_source import DeltaDatasetSource
 from qcflow.data.digest_utils import get_normalized_md5_digest
-from qcflow.data.evaluation_dataset import EvaluationDataset
+from qcflow.data.evaluation_dataset import EvaluationDataset, StreamingEvaluationDataset
 from qcflow.data.pyfunc_dataset_mixin import PyFuncConvertibleDatasetMixin, PyFuncInputsOutputs
 from qcflow.data.spark_dataset_source import SparkDatasetSource
+from qcflow.environment_variables import QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from qcflow.types import Schema
@@ -71,7 +72,15 @@ class SparkDataset(Dataset, PyFuncConvertibleDatasetMixin):
             semantic_hash = self._df.semanticHash()
         else:
             semantic_hash = self._df._jdf.queryExecution().analyzed().semanticHash()
-        return get_normalized_md5_digest([np.int64(semantic_hash)])
+        digest = get_normalized_md5_digest([np.int64(semantic_hash)])
+
+        if QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST.get() and (
+            content_digest := self._source._compute_content_digest()
+        ):
+            # The DataFrame may apply filters or transformations to the data read from the
+            # source, so the digest of the source content is combined with the digest of the plan
+            return get_normalized_md5_digest([content_digest.encode(), digest.encode()])
+        return digest
 
     def to_dict(self) -> dict[str, str]:
         """Create config dictionary for the dataset.
@@ -222,6 +231,23 @@ class SparkDataset(Dataset, PyFuncConvertibleDatasetMixin):
             predictions=self._predictions,
         )
 
+    def to_streaming_evaluation_dataset(
+        self, path=None, feature_names=None, batch_size=None
+    ) -> StreamingEvaluationDataset:
+        """
+        Converts the dataset to a StreamingEvaluationDataset that reads all the rows of the Spark
+        DataFrame in batches of ``batch_size`` rows, instead of the first 10000 rows read by
+        :py:meth:`to_evaluation_dataset`.
+        """
+        return StreamingEvaluationDataset(
+            data=self._df,
+            targets=self._targets,
+            path=path,
+            feature_names=feature_names,
+            predictions=self._predictions,
+            batch_size=batch_size,
+        )
+
 
 def load_delta(
     path: Optional[str] = None,
@@ -1,8 +1,11 @@
 from typing import Any, Optional
 
 from qcflow.data.dataset_source import DatasetSource
+from qcflow.data.digest_utils import compute_parquet_digest
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from qcflow.utils.file_utils import local_file_uri_to_path
+from qcflow.utils.uri import is_local_uri
 
 
 class SparkDatasetSource(DatasetSource):
@@ -51,6 +54,14 @@ class SparkDatasetSource(DatasetSource):
     def _can_resolve(raw_source: Any):
         return False
 
+    def _compute_content_digest(self) -> Optional[str]:
+        if self._path is None or not is_local_uri(self._path, is_tracking_or_registry_uri=False):
+            return None
+        try:
+            return compute_parquet_digest(local_file_uri_to_path(self._path))
+        except (QCFlowException, OSError, ValueError):
+            return None
+
     @classmethod
     def _resolve(cls, raw_source: str) -> "SparkDatasetSource":
         raise NotImplementedError
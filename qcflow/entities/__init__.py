@@ -3,6 +3,7 @@ The ``qcflow.entities`` module defines entities returned by the QCFlow
 `REST API <../rest-api.html>`_.
 """
 
+from qcflow.entities.change_event import ChangeEntityType, ChangeEvent, ChangeOperation
 from qcflow.entities.dataset import Dataset
 from qcflow.entities.dataset_input import DatasetInput
 from qcflow.entities.dataset_summary import _DatasetSummary
@@ -59,4 +60,7 @@ __all__ = [
     "SpanStatusCode",
     "_DatasetSummary",
     "Document",
+    "ChangeEvent",
+    "ChangeEntityType",
+    "ChangeOperation",
 ]
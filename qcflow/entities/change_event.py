@@ -0,0 +1,114 @@
+from typing import Any, Optional
+
+from qcflow.entities._qcflow_object import _QCFlowObject
+
+
+class ChangeEntityType:
+    """
+    The types of the entities whose changes are recorded in the change feed.
+    """
+
+    EXPERIMENT = "experiment"
+    RUN = "run"
+    REGISTERED_MODEL = "registered_model"
+    MODEL_VERSION = "model_version"
+    REGISTERED_MODEL_ALIAS = "registered_model_alias"
+
+    TRACKING = (EXPERIMENT, RUN)
+    MODEL_REGISTRY = (REGISTERED_MODEL, MODEL_VERSION, REGISTERED_MODEL_ALIAS)
+    _VALID_TYPES = {*TRACKING, *MODEL_REGISTRY}
+
+    @classmethod
+    def is_valid(cls, entity_type):
+        return entity_type in cls._VALID_TYPES
+
+
+class ChangeOperation:
+    """
+    The operations recorded in the change feed.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    RESTORE = "restore"
+
+
+class ChangeEvent(_QCFlowObject):
+    """
+    A change of a tracking or model registry entity, recorded in the change feed.
+
+    Args:
+        sequence: The position of the event in the change feed. The sequences of the events
+            increase in the order in which they were recorded.
+        timestamp: The time the event was recorded, in milliseconds since the UNIX epoch.
+        entity_type: The type of the changed entity, one of :py:class:`ChangeEntityType`.
+        entity_id: The identifier of the changed entity, e.g. the ID of a run, the name of a
+            registered model, ``<name>/<version>`` for a model version or ``<name>@<alias>`` for
+            a registered model alias.
+        op: The operation, one of :py:class:`ChangeOperation`.
+        data: The changed fields of the entity, e.g. the status of a run or the version an alias
+            points to.
+    """
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: int,
+        entity_type: str,
+        entity_id: str,
+        op: str,
+        data: Optional[dict[str, Any]] = None,
+    ):
+        self._sequence = sequence
+        self._timestamp = timestamp
+        self._entity_type = entity_type
+        self._entity_id = entity_id
+        self._op = op
+        self._data = data or {}
+
+    def __eq__(self, other) -> bool:
+        if type(other) is type(self):
+            return self.__dict__ == other.__dict__
+        return False
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def timestamp(self) -> int:
+        return self._timestamp
+
+    @property
+    def entity_type(self) -> str:
+        return self._entity_type
+
+    @property
+    def entity_id(self) -> str:
+        return self._entity_id
+
+    @property
+    def op(self) -> str:
+        return self._op
+
+    @property
+    def data(self) -> dict[str, Any]:
+        return self._data
+
+    @property
+    def token(self) -> str:
+        """
+        The page token to pass to ``get_change_events`` to resume the feed after this event.
+        """
+        return str(self._sequence)
+
+    def to_dictionary(self) -> dict[str, Any]:
+        return {
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "op": self.op,
+            "data": self.data,
+        }
@@ -12,9 +12,10 @@ from opentelemetry.trace import Span as OTelSpan
 import qcflow
 from qcflow.entities.span_event import SpanEvent
 from qcflow.entities.span_status import SpanStatus, SpanStatusCode
+from qcflow.environment_variables import QCFLOW_TRACE_MAX_ATTRIBUTE_SIZE
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from qcflow.tracing.constant import SpanAttributeKey
+from qcflow.tracing.constant import TRUNCATION_SUFFIX, SpanAttributeKey
 from qcflow.tracing.utils import (
     TraceJSONEncoder,
     build_otel_context,
@@ -22,6 +23,7 @@ from qcflow.tracing.utils import (
     encode_span_id,
     encode_trace_id,
 )
+from qcflow.tracing.utils.otlp import should_use_otlp_exporter
 
 _logger = logging.getLogger(__name__)
 
@@ -53,9 +55,14 @@ def create_qcflow_span(
     When creating a QCFlow span object from the OpenTelemetry span, the factory function
     should always be used to ensure the correct span object is created.
     """
-    if not otel_span or isinstance(otel_span, NonRecordingSpan):
+    if not otel_span:
         return NoOpSpan()
 
+    if isinstance(otel_span, NonRecordingSpan):
+        # Keep the non-recording span e.g. of a trace that is not sampled, so that its context
+        # is propagated to the child spans and they follow the same sampling decision.
+        return NoOpSpan(otel_span)
+
     if isinstance(otel_span, OTelSpan):
         return LiveSpan(otel_span, request_id, span_type)
 
@@ -382,6 +389,11 @@ class LiveSpan(Span):
         if self.status.status_code != SpanStatusCode.ERROR:
             self.set_status(SpanStatus(SpanStatusCode.OK))
 
+        if should_use_otlp_exporter():
+            # The OpenTelemetry span is exported to the collector as-is, so the attribute
+            # values cannot be serialized lazily at export time.
+            self._attributes.get_all_serialized()
+
         self._span.end(end_time=end_time)
 
     def from_dict(cls, data: dict[str, Any]) -> "Span":
@@ -393,8 +405,28 @@ class LiveSpan(Span):
 
         :meta private:
         """
-        # All state of the live span is already persisted in the OpenTelemetry span object.
-        return Span(self._span)
+        # All state of the live span is persisted in the OpenTelemetry span object, except for
+        # the attribute values serialized after the span ended, as its attributes are read-only.
+        attributes = self._attributes.get_all_serialized()
+        if self._attributes.is_synced():
+            return Span(self._span)
+
+        return Span(
+            OTelReadableSpan(
+                name=self._span.name,
+                context=self._span.context,
+                parent=self._span.parent,
+                resource=self._span.resource,
+                attributes=attributes,
+                events=self._span.events,
+                links=self._span.links,
+                kind=self._span.kind,
+                status=self._span.status,
+                start_time=self._span.start_time,
+                end_time=self._span.end_time,
+                instrumentation_scope=self._span.instrumentation_scope,
+            )
+        )
 
     @classmethod
     def from_immutable_span(
@@ -490,8 +522,8 @@ class NoOpSpan(Span):
 
     """
 
-    def __init__(self):
-        self._span = NonRecordingSpan(context=None)
+    def __init__(self, otel_span: Optional[NonRecordingSpan] = None):
+        self._span = otel_span or NonRecordingSpan(context=None)
         self._attributes = {}
 
     @property
@@ -564,16 +596,25 @@ class _SpanAttributesRegistry:
     Therefore, we serialize all values into JSON string before storing them in the span.
     This class provides simple getter and setter methods to interact with the span attributes
     without worrying about the serde process.
+
+    Serializing large values such as a list of retrieved documents is expensive, so values
+    other than primitives are kept as a snapshot and serialized lazily, when the value is read
+    or the span is exported. Traces that are dropped never pay the serialization cost.
     """
 
     def __init__(self, otel_span: OTelSpan):
         self._span = otel_span
+        # Snapshots of the values that have not been serialized yet.
+        self._pending: dict[str, Any] = {}
+        # Values serialized after the span has ended. The attributes of an ended OpenTelemetry
+        # span are read-only, so they are kept here instead.
+        self._serialized: dict[str, str] = {}
 
     def get_all(self) -> dict[str, Any]:
-        return {key: self.get(key) for key in self._span.attributes.keys()}
+        return {key: self.get(key) for key in self.get_all_serialized().keys()}
 
     def get(self, key: str):
-        serialized_value = self._span.attributes.get(key)
+        serialized_value = self.get_serialized(key)
         if serialized_value:
             try:
                 return json.loads(serialized_value)
@@ -583,15 +624,104 @@ class _SpanAttributesRegistry:
                     f"on qcflow Span class instead of directly to the OpenTelemetry span. {e}"
                 )
 
+    def get_serialized(self, key: str) -> Optional[str]:
+        """Get the JSON-serialized value of the attribute, serializing it if still pending."""
+        if key in self._pending:
+            self._serialize_pending(key)
+        if key in self._serialized:
+            return self._serialized[key]
+        return self._span.attributes.get(key)
+
+    def get_all_serialized(self) -> dict[str, str]:
+        """Get all attributes as JSON-serialized values, serializing the pending ones."""
+        for key in list(self._pending):
+            self._serialize_pending(key)
+        return {**self._span.attributes, **self._serialized}
+
+    def is_synced(self) -> bool:
+        """Whether all attribute values are serialized into the OpenTelemetry span."""
+        return not self._pending and not self._serialized
+
     def set(self, key: str, value: Any):
         if not isinstance(key, str):
             _logger.warning(f"Attribute key must be a string, but got {type(key)}. Skipping.")
             return
 
-        # NB: OpenTelemetry attribute can store not only string but also a few primitives like
-        #   int, float, bool, and list of them. However, we serialize all into JSON string here
-        #   for the simplicity in deserialization process.
-        self._span.set_attribute(key, json.dumps(value, cls=TraceJSONEncoder, ensure_ascii=False))
+        self._serialized.pop(key, None)
+        if not isinstance(value, _EAGERLY_SERIALIZED_TYPES) and self._span.is_recording():
+            snapshot = _snapshot(value)
+            if snapshot is not _NO_SNAPSHOT:
+                self._pending[key] = snapshot
+                return
+
+        self._pending.pop(key, None)
+        # NB: OpenTelemetry attribute can store not only string but also a few primitives
+        #   like int, float, bool, and list of them. However, we serialize all into JSON
+        #   string here for the simplicity in deserialization process.
+        self._span.set_attribute(key, _serialize_attribute(value))
+
+    def _serialize_pending(self, key: str):
+        serialized_value = _serialize_attribute(self._pending.pop(key))
+        if self._span.is_recording():
+            self._span.set_attribute(key, serialized_value)
+        else:
+            self._serialized[key] = serialized_value
+
+
+# Cheap to serialize and immutable, so there is no benefit in deferring the serialization.
+_EAGERLY_SERIALIZED_TYPES = (str, int, float, bool, type(None))
+
+# Returned by _snapshot for the values that cannot be copied cheaply
+_NO_SNAPSHOT = object()
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    Copy the built-in dicts, lists and tuples in the value, so that mutating the value after it
+    is set to a span, e.g. appending to a list of documents, does not change the recorded value.
+    The leaves are immutable primitives, which are shared, so the cost is proportional to the
+    number of containers rather than to the size of the value. If the value contains any other
+    object, which may be mutable, ``_NO_SNAPSHOT`` is returned and the value must be serialized
+    immediately instead.
+    """
+    value_type = type(value)
+    if value_type in _EAGERLY_SERIALIZED_TYPES:
+        return value
+    if value_type is dict:
+        snapshot = {}
+        for k, v in value.items():
+            if (v := _snapshot(v)) is _NO_SNAPSHOT:
+                return _NO_SNAPSHOT
+            snapshot[k] = v
+        return snapshot
+    if value_type is list or value_type is tuple:
+        snapshot = []
+        for v in value:
+            if (v := _snapshot(v)) is _NO_SNAPSHOT:
+                return _NO_SNAPSHOT
+            snapshot.append(v)
+        return snapshot if value_type is list else tuple(snapshot)
+    return _NO_SNAPSHOT
+
+
+def _serialize_attribute(value: Any) -> str:
+    """Serialize the attribute value into JSON, truncating it if it exceeds the size limit."""
+    serialized_value = json.dumps(value, cls=TraceJSONEncoder, ensure_ascii=False)
+    max_size = QCFLOW_TRACE_MAX_ATTRIBUTE_SIZE.get()
+    if max_size is not None and len(serialized_value) > max_size:
+        # The truncated value is stored as a JSON string, whose quotes and escaped characters
+        # count towards the limit too. Every character removed from the value shortens the
+        # string by at least one character, so the second attempt always fits.
+        length = max(max_size - len(TRUNCATION_SUFFIX) - 2, 0)
+        while True:
+            truncated = json.dumps(
+                serialized_value[:length] + TRUNCATION_SUFFIX, ensure_ascii=False
+            )
+            if len(truncated) <= max_size or length == 0:
+                break
+            length = max(length - (len(truncated) - max_size), 0)
+        serialized_value = truncated
+    return serialized_value
 
 
 class _CachedSpanAttributesRegistry(_SpanAttributesRegistry):
@@ -590,6 +590,101 @@ QCFLOW_TRACE_BUFFER_TTL_SECONDS = _EnvironmentVariable("QCFLOW_TRACE_BUFFER_TTL_
 # How many traces to be buffered at the in-memory trace client.
 QCFLOW_TRACE_BUFFER_MAX_SIZE = _EnvironmentVariable("QCFLOW_TRACE_BUFFER_MAX_SIZE", int, 1000)
 
+#: Specifies whether to export ended child spans of an in-flight trace incrementally in batches,
+#: instead of holding every span in memory until the root span ends. The batches are assembled
+#: into the full trace when the trace data is read.
+#: (default: ``False``)
+QCFLOW_TRACE_INCREMENTAL_EXPORT = _BooleanEnvironmentVariable(
+    "QCFLOW_TRACE_INCREMENTAL_EXPORT", False
+)
+
+#: Specifies the number of ended spans accumulated before a batch is exported when incremental
+#: span export is enabled via ``QCFLOW_TRACE_INCREMENTAL_EXPORT``.
+#: (default: ``1000``)
+QCFLOW_TRACE_SPAN_BATCH_SIZE = _EnvironmentVariable("QCFLOW_TRACE_SPAN_BATCH_SIZE", int, 1000)
+
+#: Number of worker threads used to export traces when ``QCFLOW_ENABLE_ASYNC_LOGGING``
+#: is enabled.
+#: (default: ``5``)
+QCFLOW_ASYNC_TRACE_LOGGING_MAX_WORKERS = _EnvironmentVariable(
+    "QCFLOW_ASYNC_TRACE_LOGGING_MAX_WORKERS", int, 5
+)
+
+#: Maximum number of pending tasks in the asynchronous trace export queue. Set to ``0``
+#: for an unbounded queue.
+#: (default: ``1000``)
+QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE = _EnvironmentVariable(
+    "QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", int, 1000
+)
+
+#: Specifies whether to drop traces when the asynchronous trace export queue is full. If
+#: ``False``, the traced application is blocked until the queue has room for the trace. The span
+#: batches of the traces exported incrementally are never dropped, as the trace would be incomplete.
+#: (default: ``True``)
+QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL = _BooleanEnvironmentVariable(
+    "QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL", True
+)
+
+#: Maximum number of trace info updates coalesced into a single bulk call to the tracking
+#: backend by the asynchronous trace export queue.
+#: (default: ``100``)
+QCFLOW_ASYNC_TRACE_LOGGING_MAX_BATCH_SIZE = _EnvironmentVariable(
+    "QCFLOW_ASYNC_TRACE_LOGGING_MAX_BATCH_SIZE", int, 100
+)
+
+#: Specifies the probability of recording a trace, decided when its root span starts. Spans of
+#: traces that are not sampled are not recorded at all, so they add almost no overhead.
+#: (default: ``1.0``)
+QCFLOW_TRACE_SAMPLING_RATIO = _EnvironmentVariable("QCFLOW_TRACE_SAMPLING_RATIO", float, 1.0)
+
+#: Specifies the probability of exporting a recorded trace that does not match any of the tail
+#: sampling rules, decided when its root span ends. The rules are configured with the
+#: ``QCFLOW_TRACE_TAIL_SAMPLING_*`` environment variables.
+#: (default: ``1.0``)
+QCFLOW_TRACE_TAIL_SAMPLING_RATIO = _EnvironmentVariable(
+    "QCFLOW_TRACE_TAIL_SAMPLING_RATIO", float, 1.0
+)
+
+#: Tail sampling rule to always export traces that ended with an error status.
+#: (default: ``True``)
+QCFLOW_TRACE_TAIL_SAMPLING_KEEP_ERRORS = _BooleanEnvironmentVariable(
+    "QCFLOW_TRACE_TAIL_SAMPLING_KEEP_ERRORS", True
+)
+
+#: Tail sampling rule to always export traces whose execution time is greater than or equal to
+#: the given threshold in milliseconds.
+#: (default: ``None``)
+QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS = _EnvironmentVariable(
+    "QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS", int, None
+)
+
+#: Tail sampling rule to always export traces with the given tags, specified as a comma-separated
+#: list of ``key=value`` pairs, or bare keys to match any value, e.g. ``env=prod,debug``.
+#: (default: ``None``)
+QCFLOW_TRACE_TAIL_SAMPLING_KEEP_TAGS = _EnvironmentVariable(
+    "QCFLOW_TRACE_TAIL_SAMPLING_KEEP_TAGS", str, None
+)
+
+#: Specifies the maximum number of characters of a serialized span attribute value, e.g. span
+#: inputs and outputs. Longer values are truncated and stored as a JSON string. Unlimited if unset.
+#: (default: ``None``)
+QCFLOW_TRACE_MAX_ATTRIBUTE_SIZE = _EnvironmentVariable("QCFLOW_TRACE_MAX_ATTRIBUTE_SIZE", int, None)
+
+#: Specifies whether to index the summaries of the spans of exported traces, such as the span
+#: name, type, status and duration, in the tracking store. This allows to search traces by their
+#: spans, e.g. ``span.type = 'RETRIEVER' AND span.duration > 2000``, without downloading the
+#: trace data. Only supported by the SQL-based tracking store.
+#: (default: ``False``)
+QCFLOW_TRACE_INDEX_SPANS = _BooleanEnvironmentVariable("QCFLOW_TRACE_INDEX_SPANS", False)
+
+#: Specifies a comma-separated list of span attribute keys to index when
+#: ``QCFLOW_TRACE_INDEX_SPANS`` is enabled, which can be searched with the
+#: ``span.attributes.<key>`` filter.
+#: (default: ``None``)
+QCFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES = _EnvironmentVariable(
+    "QCFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES", str, None
+)
+
 #: Private configuration option.
 #: Enables the ability to catch exceptions within QCFlow evaluate for classification models
 #: where a class imbalance due to a missing target class would raise an error in the
@@ -680,3 +775,166 @@ QCFLOW_RECORD_ENV_VARS_IN_MODEL_LOGGING = _BooleanEnvironmentVariable(
 QCFLOW_CONVERT_MESSAGES_DICT_FOR_LANGCHAIN = _BooleanEnvironmentVariable(
     "QCFLOW_CONVERT_MESSAGES_DICT_FOR_LANGCHAIN", None
 )
+
+#: Whether to cache the responses of the judge model used by GenAI metrics on the local disk, so
+#: that re-evaluating unchanged rows with the same judge model, parameters, and prompt does not
+#: call the judge model again. Only enable this for deterministic judges, e.g. with temperature 0.
+#: (default: ``False``)
+QCFLOW_ENABLE_GENAI_JUDGE_CACHE = _BooleanEnvironmentVariable(
+    "QCFLOW_ENABLE_GENAI_JUDGE_CACHE", False
+)
+
+#: Path of the SQLite database that stores the cached judge responses when
+#: ``QCFLOW_ENABLE_GENAI_JUDGE_CACHE`` is enabled. If unset, ``~/.qcflow/genai_judge_cache.db``
+#: is used.
+#: (default: ``None``)
+QCFLOW_GENAI_JUDGE_CACHE_PATH = _EnvironmentVariable("QCFLOW_GENAI_JUDGE_CACHE_PATH", str, None)
+
+#: Maximum number of judge responses to keep in the cache. The least recently used responses are
+#: evicted first.
+#: (default: ``100000``)
+QCFLOW_GENAI_JUDGE_CACHE_MAX_ENTRIES = _EnvironmentVariable(
+    "QCFLOW_GENAI_JUDGE_CACHE_MAX_ENTRIES", int, 100000
+)
+
+#: Whether GenAI metrics score the payloads with an asynchronous engine that adapts the number of
+#: concurrent judge requests to the rate limits of the provider. Only judge models served by the
+#: supported LLM providers (e.g. ``openai:/gpt-4o-mini``, ``anthropic:/claude-3-5-sonnet``) use
+#: the asynchronous engine, other judges are scored with a thread pool.
+#: (default: ``False``)
+QCFLOW_ENABLE_GENAI_ASYNC_SCORING = _BooleanEnvironmentVariable(
+    "QCFLOW_ENABLE_GENAI_ASYNC_SCORING", False
+)
+
+#: Maximum number of concurrent judge requests of the asynchronous scoring engine. The engine
+#: starts from the ``max_workers`` of the metric, increases the concurrency additively while the
+#: requests succeed, and halves it when the provider responds with a rate limit error or the
+#: latency exceeds ``QCFLOW_GENAI_JUDGE_LATENCY_THRESHOLD_SECONDS``.
+#: (default: ``64``)
+QCFLOW_GENAI_JUDGE_MAX_CONCURRENCY = _EnvironmentVariable(
+    "QCFLOW_GENAI_JUDGE_MAX_CONCURRENCY", int, 64
+)
+
+#: Maximum number of judge requests per second sent by the asynchronous scoring engine. If unset,
+#: the request rate is only limited by the concurrency.
+#: (default: ``None``)
+QCFLOW_GENAI_JUDGE_REQUESTS_PER_SECOND = _EnvironmentVariable(
+    "QCFLOW_GENAI_JUDGE_REQUESTS_PER_SECOND", float, None
+)
+
+#: Latency in seconds above which a judge request is treated as a sign of an overloaded provider
+#: and the concurrency of the asynchronous scoring engine is decreased. If unset, only rate limit
+#: errors decrease the concurrency.
+#: (default: ``None``)
+QCFLOW_GENAI_JUDGE_LATENCY_THRESHOLD_SECONDS = _EnvironmentVariable(
+    "QCFLOW_GENAI_JUDGE_LATENCY_THRESHOLD_SECONDS", float, None
+)
+
+#: Maximum number of times the asynchronous scoring engine retries a judge request rejected with
+#: a rate limit error, backing off exponentially between the attempts.
+#: (default: ``5``)
+QCFLOW_GENAI_JUDGE_MAX_RETRIES = _EnvironmentVariable("QCFLOW_GENAI_JUDGE_MAX_RETRIES", int, 5)
+
+#: Maximum number of SHAP explainers and values that ``qcflow.evaluate`` keeps in memory for
+#: reuse by later evaluations of the same model on the same sampled rows. Set to ``0`` to disable
+#: the cache.
+#: (default: ``4``)
+QCFLOW_EVALUATE_SHAP_CACHE_SIZE = _EnvironmentVariable("QCFLOW_EVALUATE_SHAP_CACHE_SIZE", int, 4)
+
+#: Whether datasets whose source is a local Parquet file, a directory of Parquet files or a Delta
+#: table compute their digest from the full content of the source files, in addition to a sample
+#: of the rows or the query plan, which tell apart the datasets filtered or modified after they
+#: are read from the same source.
+#: (default: ``False``)
+QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST = _BooleanEnvironmentVariable(
+    "QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST", False
+)
+
+#: Number of threads used to read and hash the row groups of Parquet files when computing a full
+#: content dataset digest. If unset, the number of threads is determined from the number of CPUs.
+#: (default: ``None``)
+QCFLOW_DATA_DIGEST_NUM_WORKERS = _EnvironmentVariable("QCFLOW_DATA_DIGEST_NUM_WORKERS", int, None)
+
+#: Maximum number of models loaded by ``qcflow.pyfunc.load_model`` from ``runs:/`` and ``models:/``
+#: URIs that are kept in memory and reused by later calls for the same run or model version. Set
+#: to ``0`` to disable the cache.
+#: (default: ``0``)
+QCFLOW_PYFUNC_MODEL_CACHE_SIZE = _EnvironmentVariable("QCFLOW_PYFUNC_MODEL_CACHE_SIZE", int, 0)
+
+#: Specifies whether ``qcflow.pyfunc.load_model`` should check the environment of a remote model
+#: and import its loader module while the model files are being downloaded, instead of after the
+#: download completes.
+#: (default: ``False``)
+QCFLOW_ENABLE_PIPELINED_MODEL_LOAD = _BooleanEnvironmentVariable(
+    "QCFLOW_ENABLE_PIPELINED_MODEL_LOAD", False
+)
+
+#: Number of seconds the SQL model registry store caches the resolution of model aliases, latest
+#: versions and download URIs. Changes made through the store invalidate the cache immediately,
+#: while changes made by other processes sharing the database are visible after at most this
+#: duration. Set to ``0`` to disable the cache.
+#: (default: ``0``)
+QCFLOW_MODEL_REGISTRY_CACHE_TTL = _EnvironmentVariable("QCFLOW_MODEL_REGISTRY_CACHE_TTL", float, 0)
+
+#: Maximum number of lookups cached by the SQL model registry store, see
+#: ``QCFLOW_MODEL_REGISTRY_CACHE_TTL``.
+#: (default: ``10000``)
+QCFLOW_MODEL_REGISTRY_CACHE_SIZE = _EnvironmentVariable(
+    "QCFLOW_MODEL_REGISTRY_CACHE_SIZE", int, 10000
+)
+
+#: Specifies whether the model registry file store keeps an in-memory index of the registered
+#: models and model versions, reloading only the models changed since the previous search, instead
+#: of reading the files of all the models on every search. Changes made to the store directory by
+#: other means than the file store of this QCFlow version may not be detected.
+#: (default: ``True``)
+QCFLOW_ENABLE_REGISTRY_FILE_STORE_INDEX = _BooleanEnvironmentVariable(
+    "QCFLOW_ENABLE_REGISTRY_FILE_STORE_INDEX", True
+)
+
+#: Specifies whether the SQL tracking and model registry stores record the changes of experiments,
+#: runs, registered models, model versions and aliases in the change feed read by
+#: ``QCFlowClient.get_change_events``.
+#: (default: ``False``)
+QCFLOW_ENABLE_CHANGE_FEED = _BooleanEnvironmentVariable("QCFLOW_ENABLE_CHANGE_FEED", False)
+
+#: Number of seconds between the checks for new events of a ``get_change_events`` call waiting
+#: for events.
+#: (default: ``1.0``)
+QCFLOW_CHANGE_FEED_POLL_INTERVAL = _EnvironmentVariable(
+    "QCFLOW_CHANGE_FEED_POLL_INTERVAL", float, 1.0
+)
+
+#: Number of seconds a change event is held back from the change feed after it is recorded. The
+#: sequences of the events are assigned when they are inserted, so with concurrent writers an event
+#: may be committed after an event with a higher sequence. Holding the recent events back ensures
+#: that a reader resuming the feed from a page token does not skip such an event, as long as the
+#: write transactions commit within this duration and the clocks of the writers and the readers
+#: agree. Set to ``0`` to return the events as soon as they are committed.
+#: (default: ``1.0``)
+QCFLOW_CHANGE_FEED_COMMIT_LAG = _EnvironmentVariable("QCFLOW_CHANGE_FEED_COMMIT_LAG", float, 1.0)
+
+#: Number of seconds the tracking server caches the responses of the ``get-experiment``,
+#: ``runs/search``, ``metrics/get-history`` and ``registered-models/search`` endpoints in each
+#: process. Changes made through the same process invalidate the cache immediately, while changes
+#: made by other processes, e.g. the other workers of the server, are visible after at most this
+#: duration. Set to ``0`` to disable the cache.
+#: (default: ``0``)
+QCFLOW_SERVER_RESPONSE_CACHE_TTL = _EnvironmentVariable(
+    "QCFLOW_SERVER_RESPONSE_CACHE_TTL", float, 0
+)
+
+#: Maximum number of responses cached by each process of the tracking server, see
+#: ``QCFLOW_SERVER_RESPONSE_CACHE_TTL``.
+#: (default: ``1000``)
+QCFLOW_SERVER_RESPONSE_CACHE_SIZE = _EnvironmentVariable(
+    "QCFLOW_SERVER_RESPONSE_CACHE_SIZE", int, 1000
+)
+
+#: Number of seconds above which the tracking server logs a warning with the database queries and
+#: the store method calls of a request, when the Prometheus exporter is enabled with
+#: ``--expose-prometheus``. If unset, slow requests are not logged.
+#: (default: ``None``)
+QCFLOW_SERVER_SLOW_REQUEST_THRESHOLD = _EnvironmentVariable(
+    "QCFLOW_SERVER_SLOW_REQUEST_THRESHOLD", float, None
+)
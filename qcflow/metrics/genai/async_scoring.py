@@ -0,0 +1,395 @@
+"""
+Asynchronous scoring engine for GenAI metrics.
+
+Judge requests to the LLM providers supported by the QCFlow Gateway are sent with ``aiohttp`` over
+a single client session, reusing the gateway provider classes to build the request payloads and
+parse the responses. The number of in-flight requests is adapted with AIMD (additive increase,
+multiplicative decrease): it grows by one per round trip while the requests succeed and is halved
+when the provider responds with a rate limit error or the latency exceeds a threshold. Rate
+limited requests are retried with exponential backoff, and the request rate can additionally be
+capped with a token bucket.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from qcflow.environment_variables import (
+    QCFLOW_GENAI_JUDGE_LATENCY_THRESHOLD_SECONDS,
+    QCFLOW_GENAI_JUDGE_MAX_CONCURRENCY,
+    QCFLOW_GENAI_JUDGE_MAX_RETRIES,
+    QCFLOW_GENAI_JUDGE_REQUESTS_PER_SECOND,
+)
+from qcflow.exceptions import QCFlowException
+from qcflow.metrics.genai import model_utils
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_logger = logging.getLogger(__name__)
+
+# HTTP status codes that indicate the provider is throttling the requests
+_THROTTLING_STATUS_CODES = (429, 503)
+_REQUEST_TIMEOUT_SECONDS = 60
+_INITIAL_BACKOFF_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 60.0
+_PROGRESS_LOG_INTERVAL_SECONDS = 10
+
+
+def is_async_scoring_supported(model_uri: str) -> bool:
+    """
+    Whether the judge model can be scored with the asynchronous engine, i.e. it is served by an
+    LLM provider that is called over HTTP.
+    """
+    from qcflow.gateway.config import Provider
+
+    prefix, _ = model_utils._parse_model_uri(model_uri)
+    return prefix in (
+        Provider.OPENAI,
+        Provider.ANTHROPIC,
+        Provider.MISTRAL,
+        Provider.TOGETHERAI,
+    )
+
+
+class _ThrottledError(Exception):
+    def __init__(self, status: int, retry_after: Optional[float]):
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(f"The judge LLM is throttling the requests (HTTP {status})")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit the number of concurrent requests with AIMD congestion control.
+
+    The limit increases by ``1 / limit`` for every successful request, i.e. by one per round
+    trip of the whole window, and is multiplied by ``decrease_factor`` when a request is
+    throttled or slower than ``latency_threshold_seconds``. Requests that were already in flight
+    when the limit was decreased do not decrease it again, so a burst of throttled responses only
+    counts as a single congestion signal.
+
+    Args:
+        initial_limit: The initial number of concurrent requests.
+        max_limit: The maximum number of concurrent requests.
+        min_limit: The minimum number of concurrent requests.
+        latency_threshold_seconds: The latency above which a successful request is treated as a
+            congestion signal. If None, only throttled requests decrease the limit.
+        decrease_factor: The factor applied to the limit on congestion.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_threshold_seconds: Optional[float] = None,
+        decrease_factor: float = 0.5,
+    ):
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._generation = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """
+        Wait until a request can be sent.
+
+        Returns:
+            A token that must be passed to ``release`` when the request completes.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            return self._generation
+
+    async def release(self, token: int, throttled: bool, latency: Optional[float] = None):
+        """
+        Release the slot of a completed request and adjust the limit.
+
+        Args:
+            token: The token returned by ``acquire``.
+            throttled: Whether the provider throttled the request.
+            latency: The latency of the request in seconds, if it completed.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            congested = throttled or (
+                self.latency_threshold_seconds is not None
+                and latency is not None
+                and latency > self.latency_threshold_seconds
+            )
+            if congested:
+                if token == self._generation:
+                    self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                    self._generation += 1
+            elif latency is not None:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class TokenBucket:
+    """
+    Limit the rate of requests to ``rate`` per second, allowing bursts of up to ``capacity``.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _ProgressReporter:
+    def __init__(self, total: int, limiter: AdaptiveConcurrencyLimiter):
+        self.total = total
+        self.completed = 0
+        self.throttled = 0
+        self.limiter = limiter
+        self.start_time = time.monotonic()
+        self._last_log_time = self.start_time
+        try:
+            from tqdm.auto import tqdm
+
+            self._progress_bar = tqdm(total=total)
+        except ImportError:
+            self._progress_bar = None
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self.start_time
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def on_throttled(self):
+        self.throttled += 1
+
+    def on_completed(self):
+        self.completed += 1
+        if self._progress_bar is not None:
+            self._progress_bar.update(1)
+            self._progress_bar.set_postfix(
+                concurrency=int(self.limiter.limit),
+                rps=f"{self.throughput:.1f}",
+                throttled=self.throttled,
+                refresh=False,
+            )
+        elif time.monotonic() - self._last_log_time >= _PROGRESS_LOG_INTERVAL_SECONDS:
+            self._last_log_time = time.monotonic()
+            _logger.info(
+                f"Scored {self.completed}/{self.total} payloads ({self.throughput:.1f} requests/s, "
+                f"concurrency {int(self.limiter.limit)}, {self.throttled} throttled responses)"
+            )
+
+    def close(self):
+        if self._progress_bar is not None:
+            self._progress_bar.close()
+        _logger.debug(
+            f"Scored {self.completed} payloads in {time.monotonic() - self.start_time:.1f}s "
+            f"({self.throughput:.1f} requests/s, {self.throttled} throttled responses, final "
+            f"concurrency {int(self.limiter.limit)})"
+        )
+
+
+class AsyncJudgeScorer:
+    """
+    Score prompts with a judge model served by an LLM provider using asynchronous requests.
+
+    Args:
+        model_uri: The judge model URI, e.g. ``openai:/gpt-4o-mini``.
+        parameters: The inference parameters sent to the judge model.
+        extra_headers: Additional headers sent with each request.
+        proxy_url: The URL to send the requests to instead of the provider endpoint.
+        initial_concurrency: The initial number of concurrent requests.
+        max_concurrency: The maximum number of concurrent requests.
+        requests_per_second: The maximum request rate. If None, the rate is not limited.
+        latency_threshold_seconds: The latency above which the concurrency is decreased.
+        max_retries: The maximum number of retries of a throttled request.
+    """
+
+    def __init__(
+        self,
+        model_uri: str,
+        parameters: Optional[dict[str, Any]] = None,
+        extra_headers: Optional[dict[str, str]] = None,
+        proxy_url: Optional[str] = None,
+        initial_concurrency: int = 10,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        latency_threshold_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.model_uri = model_uri
+        self.parameters = parameters or {}
+        self.extra_headers = extra_headers or {}
+        self.proxy_url = proxy_url
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency or QCFLOW_GENAI_JUDGE_MAX_CONCURRENCY.get()
+        self.requests_per_second = requests_per_second or (
+            QCFLOW_GENAI_JUDGE_REQUESTS_PER_SECOND.get()
+        )
+        self.latency_threshold_seconds = latency_threshold_seconds or (
+            QCFLOW_GENAI_JUDGE_LATENCY_THRESHOLD_SECONDS.get()
+        )
+        self.max_retries = (
+            max_retries if max_retries is not None else QCFLOW_GENAI_JUDGE_MAX_RETRIES.get()
+        )
+
+    def score(self, payloads: list[str]) -> list[Union[str, Exception]]:
+        """
+        Score the prompts with the judge model.
+
+        Args:
+            payloads: The fully rendered prompts.
+
+        Returns:
+            For each prompt, the content of the judge response, or the exception raised while
+            scoring it.
+        """
+        if not payloads:
+            return []
+        return _run_coroutine(self._score_all(payloads))
+
+    async def _score_all(self, payloads: list[str]) -> list[Union[str, Exception]]:
+        import aiohttp
+
+        prefix, model = model_utils._parse_model_uri(self.model_uri)
+        provider = model_utils._get_provider_instance(prefix, model)
+        url = self.proxy_url or provider.get_endpoint_url("llm/v1/chat")
+        headers = {**provider.headers, **self.extra_headers}
+
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=self.initial_concurrency,
+            max_limit=self.max_concurrency,
+            latency_threshold_seconds=self.latency_threshold_seconds,
+        )
+        bucket = TokenBucket(self.requests_per_second) if self.requests_per_second else None
+        progress = _ProgressReporter(len(payloads), limiter)
+
+        results = [None] * len(payloads)
+        indices = iter(range(len(payloads)))
+
+        # A fixed pool of workers pulls the payloads so that large evaluation sets don't create a
+        # coroutine per row; the limiter decides how many of them actually send requests.
+        async def worker(session):
+            for indx in indices:
+                try:
+                    chat_payload = model_utils._get_chat_payload(
+                        provider, model, payloads[indx], self.parameters
+                    )
+                    response = await self._send_with_retries(
+                        session, url, headers, chat_payload, limiter, bucket, progress
+                    )
+                    results[indx] = model_utils._parse_chat_response_from_provider(
+                        provider, response
+                    )
+                except Exception as e:
+                    results[indx] = e
+                progress.on_completed()
+
+        timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT_SECONDS)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        num_workers = min(len(payloads), limiter.max_limit)
+        try:
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                await asyncio.gather(*(worker(session) for _ in range(num_workers)))
+        finally:
+            progress.close()
+        return results
+
+    async def _send_with_retries(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+        limiter: AdaptiveConcurrencyLimiter,
+        bucket: Optional[TokenBucket],
+        progress: _ProgressReporter,
+    ) -> dict[str, Any]:
+        for attempt in range(self.max_retries + 1):
+            if bucket is not None:
+                await bucket.acquire()
+            token = await limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = await self._send(session, url, headers, payload)
+            except _ThrottledError as e:
+                await limiter.release(token, throttled=True)
+                progress.on_throttled()
+                if attempt == self.max_retries:
+                    raise QCFlowException(
+                        f"Failed to call LLM endpoint at {url} after {attempt + 1} attempts.\n"
+                        f"- Error: {e}"
+                    )
+                await asyncio.sleep(_get_backoff_seconds(attempt, e.retry_after))
+            except BaseException:
+                await limiter.release(token, throttled=False)
+                raise
+            else:
+                await limiter.release(token, throttled=False, latency=time.monotonic() - start)
+                return response
+
+    async def _send(
+        self,
+        session: "aiohttp.ClientSession",
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        async with session.post(url, headers=headers, json=payload) as response:
+            if response.status in _THROTTLING_STATUS_CODES:
+                raise _ThrottledError(
+                    response.status, _parse_retry_after(response.headers.get("Retry-After"))
+                )
+            if response.status >= 400:
+                raise QCFlowException(
+                    f"Failed to call LLM endpoint at {url}.\n"
+                    f"- Error: {response.status} {response.reason}: {await response.text()}\n"
+                    f"- Input payload: {payload}."
+                )
+            return await response.json(content_type=None)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        # HTTP dates are not worth parsing for the short delays used by LLM providers
+        return None
+
+
+def _get_backoff_seconds(attempt: int, retry_after: Optional[float]) -> float:
+    if retry_after is not None:
+        return min(retry_after, _MAX_BACKOFF_SECONDS)
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(_MAX_BACKOFF_SECONDS, _INITIAL_BACKOFF_SECONDS * 2**attempt))
+
+
+def _run_coroutine(coro):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # An event loop is already running in this thread, e.g. in a notebook
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
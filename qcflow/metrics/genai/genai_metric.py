@@ -10,10 +10,13 @@ from typing import Any, Optional, Union
 import pandas as pd
 
 import qcflow
+from qcflow.environment_variables import QCFLOW_ENABLE_GENAI_ASYNC_SCORING
 from qcflow.exceptions import QCFlowException
 from qcflow.metrics.base import MetricValue
 from qcflow.metrics.genai import model_utils
+from qcflow.metrics.genai.async_scoring import AsyncJudgeScorer, is_async_scoring_supported
 from qcflow.metrics.genai.base import EvaluationExample
+from qcflow.metrics.genai.judge_cache import JudgeResponseCache
 from qcflow.metrics.genai.prompt_template import PromptTemplate
 from qcflow.metrics.genai.utils import _get_default_model, _get_latest_metric_version
 from qcflow.models import EvaluationMetric, make_metric
@@ -104,62 +107,118 @@ def _score_model_on_one_payload(
     parameters: Optional[dict[str, Any]],
     extra_headers: Optional[dict[str, str]] = None,
     proxy_url: Optional[str] = None,
+    cache: Optional[JudgeResponseCache] = None,
 ):
     try:
+        cache_key = cache and JudgeResponseCache.make_key(eval_model, parameters, payload)
+        if cache and (raw_result := cache.get(cache_key)) is not None:
+            return _extract_score_and_justification(raw_result)
+
         # If the endpoint does not specify type, default to chat format
         endpoint_type = model_utils.get_endpoint_type(eval_model) or "llm/v1/chat"
         raw_result = model_utils.score_model_on_payload(
             eval_model, payload, parameters, extra_headers, proxy_url, endpoint_type
         )
+        if cache and isinstance(raw_result, str):
+            cache.set(cache_key, raw_result)
         return _extract_score_and_justification(raw_result)
-    except ImportError:
-        raise
-    except QCFlowException as e:
-        if e.error_code in [
-            ErrorCode.Name(BAD_REQUEST),
-            ErrorCode.Name(UNAUTHENTICATED),
-            ErrorCode.Name(INVALID_PARAMETER_VALUE),
-        ]:
-            raise
-        else:
-            return None, f"Failed to score model on payload. Error: {e!s}"
     except Exception as e:
-        return None, f"Failed to score model on payload. Error: {e!s}"
+        return _handle_scoring_error(e)
+
+
+def _handle_scoring_error(error: Exception):
+    if isinstance(error, ImportError):
+        raise error
+    if isinstance(error, QCFlowException) and error.error_code in [
+        ErrorCode.Name(BAD_REQUEST),
+        ErrorCode.Name(UNAUTHENTICATED),
+        ErrorCode.Name(INVALID_PARAMETER_VALUE),
+    ]:
+        raise error
+    return None, f"Failed to score model on payload. Error: {error!s}"
+
+
+def _score_model_on_payloads_async(
+    grading_payloads, model, parameters, headers, proxy_url, max_workers, cache
+) -> list[tuple[Optional[int], Optional[str]]]:
+    results = [None] * len(grading_payloads)
+    pending = {}
+    for indx, payload in enumerate(grading_payloads):
+        cache_key = cache and JudgeResponseCache.make_key(model, parameters, payload)
+        if cache and (raw_result := cache.get(cache_key)) is not None:
+            results[indx] = _extract_score_and_justification(raw_result)
+        else:
+            pending[indx] = cache_key
+
+    scorer = AsyncJudgeScorer(
+        model, parameters, headers, proxy_url, initial_concurrency=max_workers
+    )
+    raw_results = scorer.score([grading_payloads[indx] for indx in pending])
+    for (indx, cache_key), raw_result in zip(pending.items(), raw_results):
+        if isinstance(raw_result, Exception):
+            results[indx] = _handle_scoring_error(raw_result)
+            continue
+        if cache:
+            cache.set(cache_key, raw_result)
+        results[indx] = _extract_score_and_justification(raw_result)
+    return results
 
 
 def _score_model_on_payloads(
     grading_payloads, model, parameters, headers, proxy_url, max_workers
-) -> tuple[list[int], list[str]]:
+) -> tuple[list[int], list[str], Optional[int]]:
+    """
+    Score the payloads with the judge model in parallel.
+
+    Returns:
+        A tuple of the scores, the justifications, and the number of responses served from the
+        judge response cache, which is None if the cache is not enabled.
+    """
     scores = [None] * len(grading_payloads)
     justifications = [None] * len(grading_payloads)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(
-                _score_model_on_one_payload,
-                payload,
-                model,
-                parameters,
-                headers,
-                proxy_url,
-            ): indx
-            for indx, payload in enumerate(grading_payloads)
-        }
+    cache = JudgeResponseCache.from_env()
+    if QCFLOW_ENABLE_GENAI_ASYNC_SCORING.get() and is_async_scoring_supported(model):
+        results = _score_model_on_payloads_async(
+            grading_payloads, model, parameters, headers, proxy_url, max_workers, cache
+        )
+        for indx, (score, justification) in enumerate(results):
+            scores[indx] = score
+            justifications[indx] = justification
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _score_model_on_one_payload,
+                    payload,
+                    model,
+                    parameters,
+                    headers,
+                    proxy_url,
+                    cache,
+                ): indx
+                for indx, payload in enumerate(grading_payloads)
+            }
 
-        as_comp = as_completed(futures)
-        try:
-            from tqdm.auto import tqdm
+            as_comp = as_completed(futures)
+            try:
+                from tqdm.auto import tqdm
 
-            as_comp = tqdm(as_comp, total=len(futures))
-        except ImportError:
-            pass
+                as_comp = tqdm(as_comp, total=len(futures))
+            except ImportError:
+                pass
 
-        for future in as_comp:
-            indx = futures[future]
-            score, justification = future.result()
-            scores[indx] = score
-            justifications[indx] = justification
+            for future in as_comp:
+                indx = futures[future]
+                score, justification = future.result()
+                scores[indx] = score
+                justifications[indx] = justification
+
+    if cache is None:
+        return scores, justifications, None
 
-    return scores, justifications
+    cache.close()
+    _logger.debug(f"Served {cache.hits} of {len(grading_payloads)} judge responses from the cache")
+    return scores, justifications, cache.hits
 
 
 def _get_aggregate_results(scores, aggregations):
@@ -302,11 +361,13 @@ def make_genai_metric_from_prompt(
         kwargs = {k: [v] if np.isscalar(v) else v for k, v in kwargs.items()}
         grading_payloads = pd.DataFrame(kwargs).to_dict(orient="records")
         arg_strings = [prompt_template.format(**payload) for payload in grading_payloads]
-        scores, justifications = _score_model_on_payloads(
+        scores, justifications, cache_hits = _score_model_on_payloads(
             arg_strings, model, parameters, extra_headers, proxy_url, max_workers
         )
 
         aggregate_scores = _get_aggregate_results(scores, aggregations)
+        if cache_hits is not None:
+            aggregate_scores["judge_cache_hits"] = cache_hits
 
         return MetricValue(scores, justifications, aggregate_scores)
 
@@ -582,37 +643,13 @@ def make_genai_metric(
                 )
             )
 
-        scores = [None] * len(inputs)
-        justifications = [None] * len(inputs)
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _score_model_on_one_payload,
-                    payload,
-                    eval_model,
-                    eval_parameters,
-                    extra_headers,
-                    proxy_url,
-                ): indx
-                for indx, payload in enumerate(grading_payloads)
-            }
-
-            as_comp = as_completed(futures)
-            try:
-                from tqdm.auto import tqdm
-
-                as_comp = tqdm(as_comp, total=len(futures))
-            except ImportError:
-                pass
-
-            for future in as_comp:
-                indx = futures[future]
-                score, justification = future.result()
-                scores[indx] = score
-                justifications[indx] = justification
+        scores, justifications, cache_hits = _score_model_on_payloads(
+            grading_payloads, eval_model, eval_parameters, extra_headers, proxy_url, max_workers
+        )
 
         aggregate_results = _get_aggregate_results(scores, aggregations)
+        if cache_hits is not None:
+            aggregate_results["judge_cache_hits"] = cache_hits
         return MetricValue(scores, justifications, aggregate_results)
 
     signature_parameters = [
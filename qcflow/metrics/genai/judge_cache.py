@@ -0,0 +1,140 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from qcflow.environment_variables import (
+    QCFLOW_ENABLE_GENAI_JUDGE_CACHE,
+    QCFLOW_GENAI_JUDGE_CACHE_MAX_ENTRIES,
+    QCFLOW_GENAI_JUDGE_CACHE_PATH,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Bump this to invalidate the existing cache entries when the key or value format changes
+_CACHE_FORMAT_VERSION = 1
+
+
+def _get_default_cache_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".qcflow", "genai_judge_cache.db")
+
+
+class JudgeResponseCache:
+    """
+    A content-addressed cache of judge model responses stored in a local SQLite database.
+
+    Responses are keyed by a hash of the judge model URI, the inference parameters, and the fully
+    rendered grading prompt, so a response is only reused when the judge would receive exactly
+    the same request. When the cache holds more than ``max_entries`` responses, the least
+    recently used ones are evicted.
+
+    The database file can be shared by multiple cache instances and processes. Each instance
+    counts its own hits and misses, which is used to report the hit count of a single metric
+    evaluation.
+
+    Args:
+        path: The path of the SQLite database file. Parent directories are created if needed.
+        max_entries: The maximum number of responses to keep.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if dirname := os.path.dirname(path):
+            os.makedirs(dirname, exist_ok=True)
+        # The connection is shared by the threads scoring the payloads and guarded by the lock
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS judge_responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, last_accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS index_judge_responses_last_accessed "
+                "ON judge_responses (last_accessed)"
+            )
+
+    @classmethod
+    def from_env(cls) -> Optional["JudgeResponseCache"]:
+        """
+        Create a cache configured with the ``QCFLOW_GENAI_JUDGE_CACHE_*`` environment variables.
+
+        Returns:
+            The cache, or None if ``QCFLOW_ENABLE_GENAI_JUDGE_CACHE`` is not enabled or the
+            database cannot be opened.
+        """
+        if not QCFLOW_ENABLE_GENAI_JUDGE_CACHE.get():
+            return None
+
+        path = QCFLOW_GENAI_JUDGE_CACHE_PATH.get() or _get_default_cache_path()
+        try:
+            return cls(path, QCFLOW_GENAI_JUDGE_CACHE_MAX_ENTRIES.get())
+        except (OSError, sqlite3.Error) as e:
+            _logger.warning(f"Failed to open the judge response cache at {path}: {e}")
+            return None
+
+    @staticmethod
+    def make_key(model: str, parameters: Optional[dict[str, Any]], payload: str) -> str:
+        """Compute the cache key of a judge request."""
+        request = {
+            "version": _CACHE_FORMAT_VERSION,
+            "model": model,
+            "parameters": parameters or {},
+            "payload": payload,
+        }
+        serialized = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached response for the key and mark it as recently used."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response FROM judge_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    with self._conn:
+                        self._conn.execute(
+                            "UPDATE judge_responses SET last_accessed = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+            except sqlite3.Error as e:
+                _logger.debug(f"Failed to read from the judge response cache: {e}")
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Cache the response for the key, evicting the least recently used responses if full."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO judge_responses (key, response, last_accessed) "
+                        "VALUES (?, ?, ?)",
+                        (key, response, time.time()),
+                    )
+                    (count,) = self._conn.execute("SELECT COUNT(*) FROM judge_responses").fetchone()
+                    if count > self.max_entries:
+                        self._conn.execute(
+                            "DELETE FROM judge_responses WHERE key IN ("
+                            "SELECT key FROM judge_responses ORDER BY last_accessed LIMIT ?)",
+                            (count - self.max_entries,),
+                        )
+            except sqlite3.Error as e:
+                _logger.debug(f"Failed to write to the judge response cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -125,9 +125,31 @@ def _call_llm_provider_api(
             URL for the LLM provider will be used.
     """
     from qcflow.gateway.config import Provider
-    from qcflow.gateway.schemas import chat
 
     provider = _get_provider_instance(provider_name, model)
+    chat_payload = _get_chat_payload(provider, model, input_data, eval_parameters)
+
+    if provider_name in [Provider.AMAZON_BEDROCK, Provider.BEDROCK]:
+        if proxy_url or extra_headers:
+            _logger.warning(
+                "Proxy URL and extra headers are not supported for Bedrock LLMs. "
+                "Ignoring the provided proxy URL and extra headers.",
+            )
+        response = provider._request(chat_payload)
+    else:
+        response = _send_request(
+            endpoint=proxy_url or provider.get_endpoint_url("llm/v1/chat"),
+            headers={**provider.headers, **extra_headers},
+            payload=chat_payload,
+        )
+    return _parse_chat_response_from_provider(provider, response)
+
+
+def _get_chat_payload(
+    provider: "BaseProvider", model: str, input_data: str, eval_parameters: dict[str, Any]
+) -> dict[str, Any]:
+    """Build the provider-specific chat request payload for the given string prompt."""
+    from qcflow.gateway.schemas import chat
 
     chat_request = chat.RequestPayload(
         model=model,
@@ -150,20 +172,11 @@ def _call_llm_provider_api(
     }
     chat_payload = provider.adapter_class.chat_to_model(payload, provider.config)
     chat_payload.update(eval_parameters)
+    return chat_payload
 
-    if provider_name in [Provider.AMAZON_BEDROCK, Provider.BEDROCK]:
-        if proxy_url or extra_headers:
-            _logger.warning(
-                "Proxy URL and extra headers are not supported for Bedrock LLMs. "
-                "Ignoring the provided proxy URL and extra headers.",
-            )
-        response = provider._request(chat_payload)
-    else:
-        response = _send_request(
-            endpoint=proxy_url or provider.get_endpoint_url("llm/v1/chat"),
-            headers={**provider.headers, **extra_headers},
-            payload=chat_payload,
-        )
+
+def _parse_chat_response_from_provider(provider: "BaseProvider", response: dict[str, Any]) -> str:
+    """Extract the content of the first choice from the provider-specific chat response."""
     chat_response = provider.adapter_class.model_to_chat(response, provider.config)
     if len(chat_response.choices) == 0:
         raise QCFlowException(
@@ -1,8 +1,10 @@
 import functools
+import itertools
 import logging
 import os
 
 import numpy as np
+import pandas as pd
 
 from qcflow.metrics.base import MetricValue, standard_aggregations
 
@@ -45,6 +47,14 @@ def _validate_array_like_id_data(data, metric_name, col_specifier):
     if data is None or len(data) == 0:
         return False
 
+    # Check the types of all rows and IDs at once, and only scan the rows one by one to find the
+    # invalid row if the fast check fails, e.g. because of numpy arrays or subclasses of str/int
+    if set(map(type, data)) == {list} and set(map(type, itertools.chain.from_iterable(data))) <= {
+        str,
+        int,
+    }:
+        return True
+
     for index, value in data.items():
         if not (
             (isinstance(value, list) and all(isinstance(val, (str, int)) for val in value))
@@ -70,12 +80,14 @@ def _token_count_eval_fn(predictions, targets=None, metrics=None):
     os.environ["TIKTOKEN_CACHE_DIR"] = ""
     encoding = tiktoken.get_encoding("cl100k_base")
 
-    num_tokens = []
-    for prediction in predictions:
-        if isinstance(prediction, str):
-            num_tokens.append(len(encoding.encode(prediction)))
-        else:
-            num_tokens.append(None)
+    # Iterate positionally, since the predictions may be a series with a non-range index
+    predictions = list(predictions)
+    num_tokens = [None] * len(predictions)
+    indices = [i for i, prediction in enumerate(predictions) if isinstance(prediction, str)]
+    # encode_batch tokenizes the texts in parallel threads outside of the GIL
+    encoded = encoding.encode_batch([predictions[i] for i in indices])
+    for i, tokens in zip(indices, encoded):
+        num_tokens[i] = len(tokens)
 
     return MetricValue(
         scores=num_tokens,
@@ -114,6 +126,13 @@ def _toxicity_eval_fn(predictions, targets=None, metrics=None):
     )
 
 
+def _score_unique_texts(score_fn, texts):
+    """Apply the scoring function once per distinct text, as eval sets often repeat outputs."""
+    codes, uniques = pd.factorize(np.asarray(texts, dtype=object))
+    unique_scores = np.array([score_fn(text) for text in uniques], dtype=np.float64)
+    return unique_scores[codes].tolist()
+
+
 def _flesch_kincaid_eval_fn(predictions, targets=None, metrics=None):
     if not _validate_text_data(predictions, "flesch_kincaid", predictions_col_specifier):
         return
@@ -127,7 +146,7 @@ def _flesch_kincaid_eval_fn(predictions, targets=None, metrics=None):
         )
         return
 
-    scores = [textstat.flesch_kincaid_grade(prediction) for prediction in predictions]
+    scores = _score_unique_texts(textstat.flesch_kincaid_grade, predictions)
     return MetricValue(
         scores=scores,
         aggregate_results=standard_aggregations(scores),
@@ -148,7 +167,7 @@ def _ari_eval_fn(predictions, targets=None, metrics=None):
         )
         return
 
-    scores = [textstat.automated_readability_index(prediction) for prediction in predictions]
+    scores = _score_unique_texts(textstat.automated_readability_index, predictions)
     return MetricValue(
         scores=scores,
         aggregate_results=standard_aggregations(scores),
@@ -366,6 +385,85 @@ def _f1_score_eval_fn(
         return MetricValue(aggregate_results={"f1_score": f1})
 
 
+class _RetrievalIds:
+    """
+    Retrieved and ground-truth doc IDs of all rows encoded for vectorized metric computation.
+
+    Every (row, doc ID) pair is encoded as the integer key ``row * num_ids + id_code``, so that
+    membership tests between the retrieved and the ground-truth docs of the same row can be done
+    for all rows at once with sorted array operations instead of a Python set per row.
+
+    Args:
+        predictions: The retrieved doc IDs of each row. Only the first ``k`` are used.
+        targets: The ground-truth doc IDs of each row.
+        k: The number of top retrieved docs to use.
+    """
+
+    def __init__(self, predictions, targets, k):
+        self.num_rows = len(predictions)
+        rows = np.arange(self.num_rows)
+        prediction_lengths = _get_lengths(predictions)
+        prediction_rows = np.repeat(rows, prediction_lengths)
+        # The rank of each retrieved doc within its row, used to only keep the top k
+        offsets = np.cumsum(prediction_lengths) - prediction_lengths
+        prediction_ranks = np.arange(len(prediction_rows)) - np.repeat(offsets, prediction_lengths)
+        top_k = prediction_ranks < k
+        self.num_retrieved = np.minimum(prediction_lengths, k)
+        self.retrieved_rows = prediction_rows[top_k]
+        self.retrieved_ranks = prediction_ranks[top_k]
+        target_rows = np.repeat(rows, _get_lengths(targets))
+
+        # pd.factorize hashes the IDs like a Python set does, e.g. 1 and "1" are different IDs
+        codes, uniques = pd.factorize(
+            np.concatenate([_flatten_ids(targets), _flatten_ids(predictions)[top_k]])
+        )
+        num_ids = max(len(uniques), 1)
+        num_targets = len(target_rows)
+        self.target_keys = _sorted_unique(target_rows * num_ids + codes[:num_targets])
+        self.retrieved_keys = self.retrieved_rows * num_ids + codes[num_targets:]
+        self.num_ids = num_ids
+
+    @functools.cached_property
+    def is_relevant(self):
+        """Whether each retrieved doc is one of the ground-truth docs of its row."""
+        if len(self.target_keys) == 0:
+            return np.zeros(len(self.retrieved_keys), dtype=bool)
+        indices = np.searchsorted(self.target_keys, self.retrieved_keys)
+        indices[indices == len(self.target_keys)] = 0
+        return self.target_keys[indices] == self.retrieved_keys
+
+    @functools.cached_property
+    def num_unique_targets(self):
+        return np.bincount(self.target_keys // self.num_ids, minlength=self.num_rows)
+
+    @functools.cached_property
+    def num_relevant(self):
+        """The number of retrieved docs that are relevant, counting duplicates."""
+        return np.bincount(self.retrieved_rows[self.is_relevant], minlength=self.num_rows)
+
+    @functools.cached_property
+    def num_unique_relevant(self):
+        """The number of distinct retrieved docs that are relevant."""
+        relevant_keys = _sorted_unique(self.retrieved_keys[self.is_relevant])
+        return np.bincount(relevant_keys // self.num_ids, minlength=self.num_rows)
+
+
+def _get_lengths(id_lists):
+    return np.fromiter(map(len, id_lists), dtype=np.int64, count=len(id_lists))
+
+
+def _flatten_ids(id_lists):
+    ids = list(itertools.chain.from_iterable(id_lists))
+    flattened = np.empty(len(ids), dtype=object)
+    flattened[:] = ids
+    return flattened
+
+
+def _sorted_unique(keys):
+    keys = np.sort(keys)
+    return keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+
+
 def _precision_at_k_eval_fn(k):
     if not (isinstance(k, int) and k > 0):
         _logger.warning(
@@ -380,76 +478,20 @@ def _precision_at_k_eval_fn(k):
         ) or not _validate_array_like_id_data(targets, "precision_at_k", targets_col_specifier):
             return
 
-        scores = []
-        for target, prediction in zip(targets, predictions):
-            # only include the top k retrieved chunks
-            ground_truth, retrieved = set(target), prediction[:k]
-            relevant_doc_count = sum(1 for doc in retrieved if doc in ground_truth)
-            if len(retrieved) > 0:
-                scores.append(relevant_doc_count / len(retrieved))
-            else:
-                # when no documents are retrieved, precision is 0
-                scores.append(0)
+        ids = _RetrievalIds(predictions, targets, k)
+        # when no documents are retrieved, precision is 0
+        scores = np.divide(
+            ids.num_relevant,
+            ids.num_retrieved,
+            out=np.zeros(ids.num_rows),
+            where=ids.num_retrieved > 0,
+        ).tolist()
 
         return MetricValue(scores=scores, aggregate_results=standard_aggregations(scores))
 
     return _fn
 
 
-def _expand_duplicate_retrieved_docs(predictions, targets):
-    counter = {}
-    expanded_predictions = []
-    expanded_targets = targets
-    for doc_id in predictions:
-        if doc_id not in counter:
-            counter[doc_id] = 1
-            expanded_predictions.append(doc_id)
-        else:
-            counter[doc_id] += 1
-            new_doc_id = (
-                f"{doc_id}_bc574ae_{counter[doc_id]}"  # adding a random string to avoid collisions
-            )
-            expanded_predictions.append(new_doc_id)
-            if doc_id in expanded_targets:
-                expanded_targets.add(new_doc_id)
-    return expanded_predictions, expanded_targets
-
-
-def _prepare_row_for_ndcg(predictions, targets):
-    """Prepare data one row from predictions and targets to y_score, y_true for ndcg calculation.
-
-    Args:
-        predictions: A list of strings of at most k doc IDs retrieved.
-        targets: A list of strings of ground-truth doc IDs.
-
-    Returns:
-        y_true : ndarray of shape (1, n_docs) Representing the ground-truth relevant docs.
-            n_docs is the number of unique docs in union of predictions and targets.
-        y_score : ndarray of shape (1, n_docs) Representing the retrieved docs.
-            n_docs is the number of unique docs in union of predictions and targets.
-    """
-    # sklearn does an internal sort of y_score, so to preserve the order of our retrieved
-    # docs, we need to modify the relevance value slightly
-    eps = 1e-6
-
-    # support predictions containing duplicate doc ID
-    targets = set(targets)
-    predictions, targets = _expand_duplicate_retrieved_docs(predictions, targets)
-
-    all_docs = targets.union(predictions)
-    doc_id_to_index = {doc_id: i for i, doc_id in enumerate(all_docs)}
-    n_labels = max(len(doc_id_to_index), 2)  # sklearn.metrics.ndcg_score requires at least 2 labels
-    y_true = np.zeros((1, n_labels), dtype=np.float32)
-    y_score = np.zeros((1, n_labels), dtype=np.float32)
-    for i, doc_id in enumerate(predictions):
-        # "1 - i * eps" means we assign higher score to docs that are ranked higher,
-        # but all scores are still approximately 1.
-        y_score[0, doc_id_to_index[doc_id]] = 1 - i * eps
-    for doc_id in targets:
-        y_true[0, doc_id_to_index[doc_id]] = 1
-    return y_score, y_true
-
-
 def _ndcg_at_k_eval_fn(k):
     if not (isinstance(k, int) and k > 0):
         _logger.warning(
@@ -459,32 +501,31 @@ def _ndcg_at_k_eval_fn(k):
         return noop
 
     def _fn(predictions, targets):
-        from sklearn.metrics import ndcg_score
-
         if not _validate_array_like_id_data(
             predictions, "ndcg_at_k", predictions_col_specifier
         ) or not _validate_array_like_id_data(targets, "ndcg_at_k", targets_col_specifier):
             return
 
-        scores = []
-        for ground_truth, retrieved in zip(targets, predictions):
-            # 1. If no ground truth doc IDs are provided and no documents are retrieved,
-            # the score is 1.
-            if len(retrieved) == 0 and len(ground_truth) == 0:
-                scores.append(1)  # no error is made
-                continue
-            # 2. If no ground truth doc IDs are provided and documents are retrieved,
-            # the score is 0.
-            # 3. If ground truth doc IDs are provided and no documents are retrieved,
-            # the score is 0.
-            if len(retrieved) == 0 or len(ground_truth) == 0:
-                scores.append(0)
-                continue
-
-            # only include the top k retrieved chunks
-            y_score, y_true = _prepare_row_for_ndcg(retrieved[:k], ground_truth)
-            score = ndcg_score(y_true, y_score, k=len(retrieved[:k]), ignore_ties=True)
-            scores.append(score)
+        ids = _RetrievalIds(predictions, targets, k)
+        max_retrieved = int(ids.num_retrieved.max(initial=0))
+        discounts = 1 / np.log2(np.arange(max_retrieved) + 2)
+
+        # Binary relevance of the top k retrieved docs, padded with zeros to the same length
+        relevance = np.zeros((ids.num_rows, max_retrieved))
+        relevance[ids.retrieved_rows, ids.retrieved_ranks] = ids.is_relevant
+        dcg = relevance @ discounts
+
+        # Each duplicate of a relevant retrieved doc counts as an additional relevant doc, so
+        # that retrieving the same relevant doc twice is not penalized
+        num_relevant = ids.num_unique_targets + ids.num_relevant - ids.num_unique_relevant
+        ideal_length = np.minimum(num_relevant, ids.num_retrieved)
+        ideal_dcg = np.concatenate([[0.0], np.cumsum(discounts)])[ideal_length]
+
+        scores = np.divide(dcg, ideal_dcg, out=np.zeros(ids.num_rows), where=ideal_dcg > 0)
+        # 1. If no ground truth doc IDs are provided and no documents are retrieved,
+        # the score is 1. Otherwise, if either of them is empty, the score is 0.
+        scores[(ids.num_retrieved == 0) & (ids.num_unique_targets == 0)] = 1
+        scores = scores.tolist()
 
         return MetricValue(scores=scores, aggregate_results=standard_aggregations(scores))
 
@@ -505,19 +546,17 @@ def _recall_at_k_eval_fn(k):
         ) or not _validate_array_like_id_data(targets, "recall_at_k", targets_col_specifier):
             return
 
-        scores = []
-        for target, prediction in zip(targets, predictions):
-            # only include the top k retrieved chunks
-            ground_truth, retrieved = set(target), set(prediction[:k])
-            relevant_doc_count = len(ground_truth.intersection(retrieved))
-            if len(ground_truth) > 0:
-                scores.append(relevant_doc_count / len(ground_truth))
-            elif len(retrieved) == 0:
-                # there are 0 retrieved and ground truth docs, so reward for the match
-                scores.append(1)
-            else:
-                # there are > 0 retrieved, but 0 ground truth, so penalize
-                scores.append(0)
+        ids = _RetrievalIds(predictions, targets, k)
+        scores = np.divide(
+            ids.num_unique_relevant,
+            ids.num_unique_targets,
+            out=np.zeros(ids.num_rows),
+            where=ids.num_unique_targets > 0,
+        )
+        # there are 0 retrieved and ground truth docs, so reward for the match. If there are
+        # > 0 retrieved, but 0 ground truth, the score is 0 as a penalty.
+        scores[(ids.num_unique_targets == 0) & (ids.num_retrieved == 0)] = 1
+        scores = scores.tolist()
 
         return MetricValue(scores=scores, aggregate_results=standard_aggregations(scores))
 
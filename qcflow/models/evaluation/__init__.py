@@ -1,4 +1,4 @@
-from qcflow.data.evaluation_dataset import EvaluationDataset
+from qcflow.data.evaluation_dataset import EvaluationDataset, StreamingEvaluationDataset
 from qcflow.models.evaluation.base import (
     EvaluationArtifact,
     EvaluationMetric,
@@ -13,6 +13,7 @@ from qcflow.models.evaluation.validation import MetricThreshold
 __all__ = [
     "ModelEvaluator",
     "EvaluationDataset",
+    "StreamingEvaluationDataset",
     "EvaluationResult",
     "EvaluationMetric",
     "EvaluationArtifact",
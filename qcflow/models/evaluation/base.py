@@ -19,6 +19,8 @@ import qcflow
 from qcflow.data.dataset import Dataset
 from qcflow.data.evaluation_dataset import (
     EvaluationDataset,
+    StreamingEvaluationDataset,
+    _is_arrow_dataset,
     convert_data_to_qcflow_dataset,
 )
 from qcflow.entities.dataset_input import DatasetInput
@@ -1271,6 +1273,18 @@ def evaluate(  # noqa: D417
           Explainer based on the model.
         - **explainability_nsamples**: The number of sample rows to use for computing model
           explainability insights. Default value is 2000.
+        - **explainability_background_nsamples**: The number of sample rows to use as the
+          background dataset of the SHAP explainer. By default, the kernel explainer uses a
+          separate sample of ``explainability_nsamples`` rows and the other explainers use the
+          explained rows.
+        - **explainability_stratify**: A boolean value specifying whether to sample the rows
+          for model explainability proportionally to the labels (classifiers) or label deciles
+          (regressors) rather than uniformly, so that rare classes are represented. Default value
+          is False.
+        - **explainability_n_jobs**: The number of parallel jobs used to compute the SHAP values
+          of model-agnostic explainers (e.g. kernel, permutation). The explained rows are split
+          across joblib threads by default; the backend can be changed with
+          ``joblib.parallel_config``. Default value is 1.
         - **explainability_kernel_link**: The kernel link function used by shap kernel explainer.
           Available values are "identity" and "logit". Default value is "identity".
         - **max_classes_for_multiclass_roc_pr**:
@@ -1299,6 +1313,21 @@ def evaluate(  # noqa: D417
           :mod:`recall_at_k(k) <qcflow.metrics.recall_at_k>` and
           :mod:`ndcg_at_k(k) <qcflow.metrics.ndcg_at_k>`. Default value is 3. For all other
           model types, this parameter will be ignored.
+        - **chunk_size**: For classifier and regressor models, the number of rows to evaluate at
+          a time. If specified, predictions are computed chunk by chunk and each built-in metric
+          is merged from partial aggregates of the chunks, so that the memory used by
+          predictions and metrics does not grow with the dataset. The per-row evaluation table
+          is written to an ``eval_results_table.parquet`` artifact. Metrics and artifacts that
+          require all the predicted probabilities at once (ROC and precision-recall curves and
+          AUCs, lift curve, per-class metrics) and the sklearn ``score`` are not computed, and
+          ``extra_metrics`` and ``custom_artifacts`` are not supported. Datasets backed by a
+          ``pyarrow.dataset.Dataset`` are always evaluated in chunks, which default to 10000 rows.
+        - **num_prediction_workers**: For classifier and regressor models, the number of worker
+          processes to compute predictions with. If greater than 1, the evaluation dataset is
+          sharded across a process pool whose workers each load the model once with
+          :py:func:`qcflow.pyfunc.load_model`, and the predictions are reassembled in order.
+          This requires the model to be specified as a model URI with a local ``env_manager``;
+          otherwise predictions are computed in the evaluating process.
 
      - Limitations of evaluation dataset:
         - For classification tasks, dataset labels are used to infer the total number of classes.
@@ -1371,7 +1400,14 @@ def evaluate(  # noqa: D417
                 ``feature_names`` argument not specified, all columns except for the label
                 column are regarded as feature columns. Otherwise, only column names present in
                 ``feature_names`` are regarded as feature columns. Only the first 10000 rows in
-                the Spark DataFrame will be used as evaluation data.
+                the Spark DataFrame will be used as evaluation data, unless ``chunk_size`` is
+                specified in the evaluator config, in which case all the rows are streamed to
+                the evaluator in chunks.
+            - A ``pyarrow.dataset.Dataset``, e.g. a directory of Parquet files, containing
+                evaluation features, labels, and optionally model outputs. The dataset is read in
+                record batches and is never loaded in memory as a whole, and it can only be
+                evaluated with the ``'classifier'`` and ``'regressor'`` model types. Columns
+                are selected the same way as for a Pandas DataFrame.
             - A :py:class:`qcflow.data.dataset.Dataset` instance containing evaluation
                 features, labels, and optionally model outputs. Model outputs are only supported
                 with a PandasDataset. Model outputs are required when model is unspecified, and
@@ -1718,8 +1754,19 @@ def evaluate(  # noqa: D417
     evaluator_name_list = [evaluator.name for evaluator in evaluators]
     evaluator_name_to_conf_map = {evaluator.name: evaluator.config for evaluator in evaluators}
 
+    # Spark DataFrames are streamed in chunks of `chunk_size` rows instead of being truncated when
+    # chunked evaluation is configured for a built-in evaluator
+    chunk_size = next(
+        (
+            e.config["chunk_size"]
+            for e in evaluators
+            if _model_evaluation_registry.is_builtin(e.name) and e.config.get("chunk_size")
+        ),
+        None,
+    )
+
     with _start_run_or_reuse_active_run() as run_id:
-        if not isinstance(data, Dataset):
+        if not isinstance(data, Dataset) and not _is_arrow_dataset(data):
             # Convert data to `qcflow.data.dataset.Dataset`.
             if model is None:
                 data = convert_data_to_qcflow_dataset(
@@ -1729,9 +1776,15 @@ def evaluate(  # noqa: D417
                 data = convert_data_to_qcflow_dataset(data=data, targets=targets)
 
         from qcflow.data.pyfunc_dataset_mixin import PyFuncConvertibleDatasetMixin
+        from qcflow.data.spark_dataset import SparkDataset
 
         if isinstance(data, Dataset) and issubclass(data.__class__, PyFuncConvertibleDatasetMixin):
-            dataset = data.to_evaluation_dataset(dataset_path, feature_names)
+            if chunk_size and isinstance(data, SparkDataset):
+                dataset = data.to_streaming_evaluation_dataset(
+                    dataset_path, feature_names, batch_size=chunk_size
+                )
+            else:
+                dataset = data.to_evaluation_dataset(dataset_path, feature_names)
 
             # Use metrix_prefix configured for builtin evaluators as a dataset tag
             context = None
@@ -1744,6 +1797,15 @@ def evaluate(  # noqa: D417
             tags = [InputTag(key=QCFLOW_DATASET_CONTEXT, value=context)] if context else []
             dataset_input = DatasetInput(dataset=data._to_qcflow_entity(), tags=tags)
             client.log_inputs(run_id, [dataset_input])
+        elif _is_arrow_dataset(data):
+            dataset = StreamingEvaluationDataset(
+                data,
+                targets=targets,
+                path=dataset_path,
+                feature_names=feature_names,
+                predictions=predictions,
+                batch_size=chunk_size,
+            )
         else:
             dataset = EvaluationDataset(
                 data,
@@ -1,7 +1,9 @@
+import contextlib
 import copy
 import inspect
 import json
 import logging
+import os
 import pathlib
 import pickle
 import shutil
@@ -16,7 +18,7 @@ import pandas as pd
 
 import qcflow
 from qcflow import QCFlowClient, QCFlowException
-from qcflow.data.evaluation_dataset import EvaluationDataset
+from qcflow.data.evaluation_dataset import EvaluationDataset, StreamingEvaluationDataset
 from qcflow.entities.metric import Metric
 from qcflow.metrics.base import MetricValue
 from qcflow.models.evaluation.artifacts import (
@@ -24,6 +26,7 @@ from qcflow.models.evaluation.artifacts import (
     ImageEvaluationArtifact,
     JsonEvaluationArtifact,
     NumpyEvaluationArtifact,
+    ParquetEvaluationArtifact,
     _infer_artifact_type_and_ext,
 )
 from qcflow.models.evaluation.base import EvaluationMetric, EvaluationResult, ModelEvaluator
@@ -37,6 +40,7 @@ from qcflow.utils.time import get_current_time_millis
 _logger = logging.getLogger(__name__)
 
 _EVAL_TABLE_FILE_NAME = "eval_results_table.json"
+_CHUNKED_EVAL_TABLE_FILE_NAME = "eval_results_table.parquet"
 _TOKEN_COUNT_METRIC_NAME = "token_count"
 _LATENCY_METRIC_NAME = "latency"
 
@@ -94,6 +98,90 @@ def _extract_predict_fn(model: Any) -> Optional[Callable]:
     return predict_fn
 
 
+# The model loaded by each worker process of a `_ParallelPredictor`
+_worker_model = None
+
+
+def _load_model_in_worker(model_path, model_config):
+    global _worker_model
+    _worker_model = qcflow.pyfunc.load_model(model_path, model_config=model_config)
+
+
+def _predict_in_worker(extract_predict_fns, input_df):
+    return tuple(
+        None if predict_fn is None else predict_fn(input_df)
+        for predict_fn in extract_predict_fns(_worker_model)
+    )
+
+
+def _concat_predictions(parts):
+    if any(part is None for part in parts):
+        return None
+    if isinstance(parts[0], (pd.DataFrame, pd.Series)):
+        return pd.concat(parts)
+    if isinstance(parts[0], np.ndarray):
+        return np.concatenate(parts)
+    return [prediction for part in parts for prediction in part]
+
+
+class _ParallelPredictor:
+    """
+    Shards the model input across a pool of worker processes, each of which loads the model once
+    with :py:func:`qcflow.pyfunc.load_model`, and reassembles the predictions in order.
+
+    Workers are started with the ``spawn`` method and stay alive until the predictor is closed,
+    so that the model loading cost is paid once even when predicting many chunks.
+
+    Args:
+        model: A model loaded by :py:func:`qcflow.pyfunc.load_model`.
+        num_workers: The number of worker processes.
+    """
+
+    # Split the input in more shards than workers to balance the load across workers
+    _SHARDS_PER_WORKER = 4
+
+    def __init__(self, model: "qcflow.pyfunc.PyFuncModel", num_workers: int):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.num_workers = num_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_load_model_in_worker,
+            initargs=(model._model_path, model._loaded_model_config),
+        )
+
+    def predict(self, input_df: pd.DataFrame, extract_predict_fns: Callable) -> tuple:
+        """
+        Predict on the input in the worker processes.
+
+        Args:
+            input_df: The model input.
+            extract_predict_fns: A picklable function that takes the model loaded in a worker
+                and returns a tuple of prediction functions, or None for unavailable ones.
+
+        Returns:
+            A tuple with the predictions of each function returned by ``extract_predict_fns``.
+        """
+        num_shards = min(len(input_df), self.num_workers * self._SHARDS_PER_WORKER)
+        bounds = np.linspace(0, len(input_df), num_shards + 1, dtype=int)
+        shards = [input_df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        results = list(
+            self._executor.map(_predict_in_worker, [extract_predict_fns] * len(shards), shards)
+        )
+        return tuple(_concat_predictions(list(parts)) for parts in zip(*results))
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 def _get_dataframe_with_renamed_columns(x, new_column_names):
     """
     Downstream inference functions may expect a pd.DataFrame to be created from x. However,
@@ -126,6 +214,57 @@ _matplotlib_config = {
 }
 
 
+class _EvaluationChunk(NamedTuple):
+    """
+    A namedtuple representing a contiguous slice of the evaluation dataset in chunked evaluation.
+
+    input_df : the features of the rows in the chunk, with the dataset feature names as columns
+    labels : the labels of the rows in the chunk, or None if the dataset has no targets
+    predictions : the static predictions of the rows in the chunk, or None if the dataset has
+        no predictions column
+    sample_weights : the sample weights of the rows in the chunk, or None if not specified
+    """
+
+    input_df: pd.DataFrame
+    labels: Optional[np.ndarray]
+    predictions: Optional[Any]
+    sample_weights: Optional[np.ndarray]
+
+
+class _ParquetTableWriter:
+    """
+    Incrementally writes pandas DataFrames with the same columns to a single Parquet file, so that
+    a per-row table can be produced chunk by chunk without holding all the rows in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._writer = None
+
+    def write(self, df: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            # Chunks may infer slightly different types, e.g. int64 vs. double predictions
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 class _CustomArtifact(NamedTuple):
     """
     A namedtuple representing a custom artifact function and its properties.
@@ -745,6 +884,124 @@ class BuiltInEvaluator(ModelEvaluator):
             uri=qcflow.get_artifact_uri(artifact_file_name)
         )
 
+    def _open_parallel_predictor(self, model):
+        """
+        Open a :py:class:`_ParallelPredictor` for the model if ``num_prediction_workers`` is
+        configured, or return a null context yielding None if predictions should be computed in
+        the evaluating process.
+        """
+        if model is None or not self.num_prediction_workers or self.num_prediction_workers == 1:
+            return contextlib.nullcontext()
+        if getattr(model, "_model_path", None) is None:
+            _logger.warning(
+                "Predicting in parallel with `num_prediction_workers` requires a model loaded from "
+                "a model URI with a local environment manager. Predictions are computed in the "
+                "evaluating process."
+            )
+            return contextlib.nullcontext()
+        return _ParallelPredictor(model, self.num_prediction_workers)
+
+    def _validate_chunked_evaluation(self, extra_metrics, custom_artifacts):
+        if extra_metrics or custom_artifacts:
+            raise QCFlowException(
+                message=(
+                    "Extra metrics and custom artifacts are computed on the full evaluation "
+                    "dataset and are not supported when `chunk_size` is specified in the "
+                    "evaluator config. Please remove `chunk_size` to use them."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+    def _iter_chunks(self):
+        """
+        Iterate over the evaluation dataset in chunks of ``chunk_size`` rows.
+
+        Only one chunk of features, labels, predictions and sample weights is copied at a time,
+        so that the memory used by the model predictions and the metric computations is bounded
+        by the chunk size rather than the dataset size. A :py:class:`StreamingEvaluationDataset`
+        is read batch by batch and is never loaded in memory as a whole.
+        """
+        sample_weights = self.evaluator_config.get("sample_weights")
+        if sample_weights is not None:
+            sample_weights = np.asarray(sample_weights)
+
+        def _slice(data, start, end):
+            if data is None:
+                return None
+            if isinstance(data, (pd.DataFrame, pd.Series)):
+                return data.iloc[start:end].copy()
+            return copy.deepcopy(data[start:end])
+
+        if isinstance(self.dataset, StreamingEvaluationDataset):
+            batches = self.dataset.iter_batches(self.chunk_size)
+        else:
+            features = self.dataset.features_data
+            labels = self.dataset.labels_data if self.dataset.has_targets else None
+            predictions = self.dataset.predictions_data
+            batches = (
+                (
+                    _slice(features, start, start + self.chunk_size),
+                    _slice(labels, start, start + self.chunk_size),
+                    _slice(predictions, start, start + self.chunk_size),
+                )
+                for start in range(0, len(features), self.chunk_size)
+            )
+
+        start = 0
+        for chunk_features, chunk_labels, chunk_predictions in batches:
+            end = start + len(chunk_features)
+            yield _EvaluationChunk(
+                input_df=_get_dataframe_with_renamed_columns(
+                    chunk_features, self.dataset.feature_names
+                ),
+                labels=chunk_labels,
+                predictions=chunk_predictions,
+                sample_weights=_slice(sample_weights, start, end),
+            )
+            start = end
+
+    def _get_eval_table_chunk(self, chunk: _EvaluationChunk, y_pred):
+        """
+        Build the rows of the per-row evaluation table for a chunk, using the same column names
+        as the table logged by :py:meth:`log_eval_table`.
+        """
+        data = chunk.input_df.reset_index(drop=True)
+        y_pred = np.asarray(y_pred)
+        if y_pred.ndim == 2 and y_pred.shape[1] == 1:
+            y_pred = y_pred[:, 0]
+        if chunk.labels is not None:
+            return data.assign(
+                **{
+                    self.dataset.targets_name or "target": np.asarray(chunk.labels),
+                    self.dataset.predictions_name or self.predictions or "outputs": y_pred,
+                }
+            )
+        return data.assign(outputs=y_pred)
+
+    def _get_chunked_eval_table_file_name(self):
+        metric_prefix = self.evaluator_config.get("metric_prefix", "")
+        if not isinstance(metric_prefix, str):
+            metric_prefix = ""
+        return f"{metric_prefix}{_CHUNKED_EVAL_TABLE_FILE_NAME}"
+
+    def open_chunked_eval_table_writer(self) -> _ParquetTableWriter:
+        """
+        Open a writer spilling the per-row evaluation table to a local Parquet file chunk by
+        chunk. The file is logged by :py:meth:`log_chunked_eval_table` once it is closed.
+        """
+        return _ParquetTableWriter(self.temp_dir.path(self._get_chunked_eval_table_file_name()))
+
+    def log_chunked_eval_table(self, writer: _ParquetTableWriter):
+        if not os.path.exists(writer.path):
+            return
+
+        artifact_file_name = self._get_chunked_eval_table_file_name()
+        qcflow.log_artifact(writer.path)
+        name = _EVAL_TABLE_FILE_NAME.split(".", 1)[0]
+        self.artifacts[name] = ParquetEvaluationArtifact(
+            uri=qcflow.get_artifact_uri(artifact_file_name)
+        )
+
     def _update_aggregate_metrics(self):
         self.aggregate_metrics = {}
         for metric_name, metric_value in self.metrics_values.items():
@@ -786,7 +1043,7 @@ class BuiltInEvaluator(ModelEvaluator):
         predictions=None,
         **kwargs,
     ) -> EvaluationResult:
-        if model is None and predictions is None and dataset.predictions_data is None:
+        if model is None and predictions is None and not dataset.has_predictions:
             raise QCFlowException(
                 message=(
                     "Either a model or set of predictions must be specified in order to use the"
@@ -813,6 +1070,34 @@ class BuiltInEvaluator(ModelEvaluator):
         self.col_mapping = self.evaluator_config.get("col_mapping", {})
         self.eval_results_path = self.evaluator_config.get("eval_results_path")
         self.eval_results_mode = self.evaluator_config.get("eval_results_mode", "overwrite")
+        self.chunk_size = self.evaluator_config.get("chunk_size")
+        if self.chunk_size is None and isinstance(dataset, StreamingEvaluationDataset):
+            # Streaming datasets are always evaluated chunk by chunk
+            self.chunk_size = dataset.batch_size
+        self.num_prediction_workers = self.evaluator_config.get("num_prediction_workers")
+
+        if self.chunk_size is not None and (
+            isinstance(self.chunk_size, bool)
+            or not isinstance(self.chunk_size, int)
+            or self.chunk_size <= 0
+        ):
+            raise QCFlowException(
+                message=f"chunk_size must be a positive integer, got {self.chunk_size!r}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        if self.num_prediction_workers is not None and (
+            isinstance(self.num_prediction_workers, bool)
+            or not isinstance(self.num_prediction_workers, int)
+            or self.num_prediction_workers <= 0
+        ):
+            raise QCFlowException(
+                message=(
+                    "num_prediction_workers must be a positive integer, "
+                    f"got {self.num_prediction_workers!r}."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
 
         if self.eval_results_path:
             from qcflow.utils._spark_utils import _get_active_spark_session
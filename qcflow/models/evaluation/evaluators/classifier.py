@@ -46,7 +46,6 @@ class ClassifierEvaluator(BuiltInEvaluator):
         **kwargs,
     ) -> Optional[EvaluationResult]:
         # Get classification config
-        self.y_true = self.dataset.labels_data
         self.label_list = self.evaluator_config.get("label_list")
         self.pos_label = self.evaluator_config.get("pos_label")
         self.sample_weights = self.evaluator_config.get("sample_weights")
@@ -55,6 +54,12 @@ class ClassifierEvaluator(BuiltInEvaluator):
                 f"'pos_label' {self.pos_label} must exist in 'label_list' {self.label_list}."
             )
 
+        if self.chunk_size:
+            self._validate_chunked_evaluation(extra_metrics, custom_artifacts)
+            return self._evaluate_in_chunks(model)
+
+        self.y_true = self.dataset.labels_data
+
         # Check if the model_type is consistent with ground truth labels
         inferred_model_type = _infer_model_type_by_labels(self.y_true)
         if _ModelType.CLASSIFIER != inferred_model_type:
@@ -66,7 +71,8 @@ class ClassifierEvaluator(BuiltInEvaluator):
 
         # Run model prediction
         input_df = self.X.copy_to_avoid_mutation()
-        self.y_pred, self.y_probs = self._generate_model_predictions(model, input_df)
+        with self._open_parallel_predictor(model) as predictor:
+            self.y_pred, self.y_probs = self._generate_model_predictions(model, input_df, predictor)
 
         self._validate_label_list()
 
@@ -84,13 +90,69 @@ class ClassifierEvaluator(BuiltInEvaluator):
             self._log_binary_classifier_artifacts()
         else:
             self._log_multiclass_classifier_artifacts()
-        self._log_confusion_matrix()
+        self._log_confusion_matrix(self.y_true, self.y_pred, self.sample_weights)
 
         return EvaluationResult(
             metrics=self.aggregate_metrics, artifacts=self.artifacts, run_id=self.run_id
         )
 
-    def _generate_model_predictions(self, model, input_df):
+    def _evaluate_in_chunks(self, model) -> EvaluationResult:
+        """
+        Evaluate the model chunk by chunk, merging the partial aggregates of each chunk into the
+        final metrics and spilling the per-row evaluation table to Parquet.
+
+        The metrics derived from the confusion matrix and the log loss are identical to the ones
+        of a regular evaluation. Metrics and artifacts that require the full distribution of the
+        predicted probabilities, such as ROC and precision-recall curves, are not computed.
+        """
+        accumulator = _ClassifierMetricsAccumulator()
+        with (
+            self._open_parallel_predictor(model) as predictor,
+            self.open_chunked_eval_table_writer() as writer,
+        ):
+            for chunk in self._iter_chunks():
+                y_pred, y_probs = (
+                    (chunk.predictions, None)
+                    if model is None
+                    else self._generate_model_predictions(model, chunk.input_df, predictor)
+                )
+                accumulator.update(chunk.labels, y_pred, chunk.sample_weights, y_probs)
+                writer.write(self._get_eval_table_chunk(chunk, y_pred))
+
+        inferred_model_type = _infer_model_type_by_labels(accumulator.true_labels)
+        if _ModelType.CLASSIFIER != inferred_model_type:
+            _logger.warning(
+                f"According to the evaluation dataset label values, the model type looks like "
+                f"{inferred_model_type}, but you specified model type 'classifier'. Please "
+                f"verify that you set the `model_type` and `dataset` arguments correctly."
+            )
+
+        if self.label_list is None:
+            self.label_list = accumulator.labels
+        self._validate_label_list()
+
+        average = (
+            "binary"
+            if len(self.label_list) <= 2
+            else self.evaluator_config.get("average", "weighted")
+        )
+        metrics = accumulator.compute(
+            labels=self.label_list, average=average, pos_label=self.pos_label
+        )
+        if metrics:
+            self.metrics_values.update(_get_aggregate_metrics_values(metrics))
+
+        self.log_metrics()
+        self.log_chunked_eval_table(writer)
+        self._log_confusion_matrix(*accumulator.get_weighted_pairs())
+
+        return EvaluationResult(
+            metrics=self.aggregate_metrics, artifacts=self.artifacts, run_id=self.run_id
+        )
+
+    def _generate_model_predictions(self, model, input_df, predictor=None):
+        if predictor is not None:
+            return predictor.predict(input_df, _extract_predict_fn_and_prodict_proba_fn)
         predict_fn, predict_proba_fn = _extract_predict_fn_and_prodict_proba_fn(model)
         # Classifier model is guaranteed to output single column of predictions
         y_pred = self.dataset.predictions_data if model is None else predict_fn(input_df)
@@ -294,17 +356,17 @@ class ClassifierEvaluator(BuiltInEvaluator):
             with _suppress_class_imbalance_errors(ValueError, log_warning=False):
                 self._log_lift_curve()
 
-    def _log_confusion_matrix(self):
+    def _log_confusion_matrix(self, y_true, y_pred, sample_weights):
         """
         Helper method for logging confusion matrix
         """
         # normalize the confusion matrix, keep consistent with sklearn autologging.
         confusion_matrix = sk_metrics.confusion_matrix(
-            self.y_true,
-            self.y_pred,
+            y_true,
+            y_pred,
             labels=self.label_list,
             normalize="true",
-            sample_weight=self.sample_weights,
+            sample_weight=sample_weights,
         )
 
         def plot_confusion_matrix():
@@ -523,6 +585,148 @@ def _get_multiclass_classifier_metrics(
     return metrics
 
 
+class _ClassifierMetricsAccumulator:
+    """
+    Mergeable partial aggregates of the classifier metrics returned by
+    `_get_binary_classifier_metrics` and `_get_multiclass_classifier_metrics`.
+
+    The rows are aggregated into the count and the total sample weight of every distinct
+    (label, prediction) pair, i.e. a sparse weighted confusion matrix. Since the accuracy,
+    precision, recall and F1 scores only depend on the weighted confusion matrix, computing them
+    with scikit-learn on the distinct pairs weighted by their total sample weight produces the
+    same values as on the original rows. The log loss is aggregated as the weighted sum of the
+    negative log probabilities of every class for each label, so that the class of each label can
+    be picked once the full list of labels is known.
+    """
+
+    def __init__(self):
+        self.pairs = None
+        self.log_losses = None
+        self.count = 0
+        self.weight = 0.0
+        self.has_probabilities = True
+
+    @property
+    def true_labels(self):
+        return self.pairs.index.get_level_values("label").unique().to_numpy()
+
+    @property
+    def labels(self):
+        pairs = self.pairs.index
+        return np.unique(
+            np.concatenate([pairs.get_level_values(0).unique(), pairs.get_level_values(1).unique()])
+        )
+
+    def update(self, y_true, y_pred, sample_weights=None, y_probs=None):
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred).reshape(y_true.shape)
+        if len(y_true) == 0:
+            return
+        weights = (
+            np.ones(len(y_true)) if sample_weights is None else np.asarray(sample_weights, float)
+        )
+
+        chunk = _ClassifierMetricsAccumulator()
+        chunk.count = len(y_true)
+        chunk.weight = weights.sum()
+        chunk.pairs = (
+            pd.DataFrame({"label": y_true, "prediction": y_pred, "weight": weights})
+            .groupby(["label", "prediction"], dropna=False)["weight"]
+            .agg(["size", "sum"])
+            .rename(columns={"size": "count", "sum": "weight"})
+        )
+        if y_probs is None:
+            chunk.has_probabilities = False
+        else:
+            y_probs = np.asarray(y_probs)
+            if y_probs.dtype not in (np.float32, np.float64):
+                y_probs = y_probs.astype(np.float64)
+            if y_probs.ndim == 1:
+                y_probs = np.stack([1 - y_probs, y_probs], axis=1)
+            # Consistent with the clipping of `sklearn.metrics.log_loss`
+            eps = np.finfo(y_probs.dtype).eps
+            losses = -np.log(np.clip(y_probs, eps, 1 - eps)) * weights[:, np.newaxis]
+            chunk.log_losses = pd.DataFrame(losses).groupby(y_true).sum()
+        self.merge(chunk)
+
+    def merge(self, other: "_ClassifierMetricsAccumulator"):
+        if self.count == 0:
+            self.pairs = other.pairs
+            self.log_losses = other.log_losses
+            self.has_probabilities = other.has_probabilities
+        else:
+            self.pairs = self.pairs.add(other.pairs, fill_value=0)
+            self.has_probabilities = self.has_probabilities and other.has_probabilities
+            self.log_losses = (
+                self.log_losses.add(other.log_losses, fill_value=0)
+                if self.has_probabilities
+                else None
+            )
+        self.count += other.count
+        self.weight += other.weight
+
+    def get_weighted_pairs(self):
+        """
+        Get the distinct (label, prediction) pairs and their total sample weights, which can be
+        passed to scikit-learn metric functions in place of the original rows.
+        """
+        pairs = self.pairs.reset_index()
+        return pairs["label"].to_numpy(), pairs["prediction"].to_numpy(), pairs["weight"].to_numpy()
+
+    def compute(self, labels, average, pos_label):
+        y_true, y_pred, weights = self.get_weighted_pairs()
+        metrics = {}
+        if average == "binary":
+            with _suppress_class_imbalance_errors(ValueError):
+                pairs = self.pairs.reset_index()
+                confusion_matrix = sk_metrics.confusion_matrix(
+                    pairs["label"],
+                    pairs["prediction"],
+                    sample_weight=pairs["count"].to_numpy(dtype=np.int64),
+                )
+                tn, fp, fn, tp = confusion_matrix.ravel()
+                metrics = {
+                    "true_negatives": tn,
+                    "false_positives": fp,
+                    "false_negatives": fn,
+                    "true_positives": tp,
+                }
+            if not metrics:
+                return None
+
+        metrics.update(
+            _get_common_classifier_metrics(
+                y_true=y_true,
+                y_pred=y_pred,
+                y_proba=None,
+                labels=labels,
+                average=average,
+                pos_label=pos_label if average == "binary" else None,
+                sample_weights=weights,
+            )
+        )
+        metrics["example_count"] = self.count
+
+        if self.has_probabilities:
+            with _suppress_class_imbalance_errors(ValueError):
+                metrics["log_loss"] = self._compute_log_loss(labels)
+        return metrics
+
+    def _compute_log_loss(self, labels):
+        # The probability columns are ordered by the sorted labels, as in `sklearn.metrics.log_loss`
+        classes = np.unique(labels)
+        if len(classes) != self.log_losses.shape[1]:
+            raise ValueError(
+                "The number of classes in labels is different from that in y_prob. Classes "
+                f"found in labels: {classes}"
+            )
+        total = 0.0
+        for label, losses in self.log_losses.iterrows():
+            (index,) = np.flatnonzero(classes == label)
+            total += losses.iloc[index]
+        return total / self.weight
+
+
 def _get_classifier_per_class_metrics_collection_df(y, y_pred, labels, sample_weights):
     per_class_metrics_list = []
     for positive_class_index, positive_class in enumerate(labels):
@@ -30,11 +30,16 @@ class RegressorEvaluator(BuiltInEvaluator):
         custom_artifacts=None,
         **kwargs,
     ) -> Optional[EvaluationResult]:
+        if self.chunk_size:
+            self._validate_chunked_evaluation(extra_metrics, custom_artifacts)
+            return self._evaluate_in_chunks(model)
+
         self.y_true = self.dataset.labels_data
         self.sample_weights = self.evaluator_config.get("sample_weights", None)
 
         input_df = self.X.copy_to_avoid_mutation()
-        self.y_pred = self._generate_model_predictions(model, input_df)
+        with self._open_parallel_predictor(model) as predictor:
+            self.y_pred = self._generate_model_predictions(model, input_df, predictor)
         self._compute_buildin_metrics(model)
 
         self.evaluate_metrics(extra_metrics, prediction=self.y_pred, target=self.y_true)
@@ -49,7 +54,37 @@ class RegressorEvaluator(BuiltInEvaluator):
             metrics=self.aggregate_metrics, artifacts=self.artifacts, run_id=self.run_id
         )
 
-    def _generate_model_predictions(self, model, input_df):
+    def _evaluate_in_chunks(self, model) -> EvaluationResult:
+        """
+        Evaluate the model chunk by chunk, merging the partial aggregates of each chunk into the
+        final metrics and spilling the per-row evaluation table to Parquet.
+        """
+        accumulator = _RegressorMetricsAccumulator()
+        with (
+            self._open_parallel_predictor(model) as predictor,
+            self.open_chunked_eval_table_writer() as writer,
+        ):
+            for chunk in self._iter_chunks():
+                y_pred = (
+                    chunk.predictions
+                    if model is None
+                    else self._generate_model_predictions(model, chunk.input_df, predictor)
+                )
+                accumulator.update(chunk.labels, y_pred, chunk.sample_weights)
+                writer.write(self._get_eval_table_chunk(chunk, y_pred))
+
+        self.metrics_values.update(_get_aggregate_metrics_values(accumulator.compute()))
+        self.log_metrics()
+        self.log_chunked_eval_table(writer)
+
+        return EvaluationResult(
+            metrics=self.aggregate_metrics, artifacts=self.artifacts, run_id=self.run_id
+        )
+
+    def _generate_model_predictions(self, model, input_df, predictor=None):
+        if predictor is not None:
+            (y_pred,) = predictor.predict(input_df, _extract_predict_fns)
+            return y_pred
         if predict_fn := _extract_predict_fn(model):
             return predict_fn(input_df)
         else:
@@ -64,6 +99,10 @@ class RegressorEvaluator(BuiltInEvaluator):
         )
 
 
+def _extract_predict_fns(model):
+    return (_extract_predict_fn(model),)
+
+
 def _get_regressor_metrics(y, y_pred, sample_weights):
     from qcflow.metrics.metric_definitions import _root_mean_squared_error
 
@@ -91,3 +130,88 @@ def _get_regressor_metrics(y, y_pred, sample_weights):
             y, y_pred, sample_weight=sample_weights
         ),
     }
+
+
+class _RegressorMetricsAccumulator:
+    """
+    Mergeable partial aggregates of the regressor metrics returned by `_get_regressor_metrics`.
+
+    Every metric is derived from weighted sums over the rows, plus the weighted mean and sum of
+    squared deviations of the targets for `r2_score`, which are merged with the parallel variance
+    algorithm of Chan et al. to stay numerically stable across many chunks.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.weight = 0.0
+        self.sum_absolute_error = 0.0
+        self.sum_squared_error = 0.0
+        self.sum_absolute_percentage_error = 0.0
+        self.max_error = 0.0
+        self.sum_on_target = 0.0
+        self.mean_on_target = 0.0
+        self.target_squared_deviation = 0.0
+
+    def update(self, y, y_pred, sample_weights=None):
+        y = np.asarray(y, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64).reshape(y.shape)
+        if len(y) == 0:
+            return
+        weights = (
+            np.ones_like(y) if sample_weights is None else np.asarray(sample_weights, np.float64)
+        )
+
+        chunk = _RegressorMetricsAccumulator()
+        errors = y_pred - y
+        absolute_errors = np.abs(errors)
+        chunk.count = len(y)
+        chunk.weight = weights.sum()
+        chunk.sum_absolute_error = (weights * absolute_errors).sum()
+        chunk.sum_squared_error = (weights * errors**2).sum()
+        chunk.sum_absolute_percentage_error = (
+            weights * absolute_errors / np.maximum(np.abs(y), np.finfo(np.float64).eps)
+        ).sum()
+        chunk.max_error = absolute_errors.max()
+        chunk.sum_on_target = (weights * y).sum()
+        chunk.mean_on_target = chunk.sum_on_target / chunk.weight if chunk.weight else 0.0
+        chunk.target_squared_deviation = (weights * (y - chunk.mean_on_target) ** 2).sum()
+        self.merge(chunk)
+
+    def merge(self, other: "_RegressorMetricsAccumulator"):
+        weight = self.weight + other.weight
+        if weight:
+            delta = other.mean_on_target - self.mean_on_target
+            self.mean_on_target += delta * other.weight / weight
+            self.target_squared_deviation += (
+                other.target_squared_deviation + delta**2 * self.weight * other.weight / weight
+            )
+        else:
+            self.target_squared_deviation += other.target_squared_deviation
+        self.count += other.count
+        self.weight = weight
+        self.sum_absolute_error += other.sum_absolute_error
+        self.sum_squared_error += other.sum_squared_error
+        self.sum_absolute_percentage_error += other.sum_absolute_percentage_error
+        self.max_error = max(self.max_error, other.max_error)
+        self.sum_on_target += other.sum_on_target
+
+    def compute(self):
+        mean_squared_error = self.sum_squared_error / self.weight
+        if self.count < 2:
+            r2_score = float("nan")
+        elif self.target_squared_deviation == 0:
+            # Consistent with the default `force_finite=True` of `sklearn.metrics.r2_score`
+            r2_score = 1.0 if self.sum_squared_error == 0 else 0.0
+        else:
+            r2_score = 1 - self.sum_squared_error / self.target_squared_deviation
+        return {
+            "example_count": self.count,
+            "mean_absolute_error": self.sum_absolute_error / self.weight,
+            "mean_squared_error": mean_squared_error,
+            "root_mean_squared_error": np.sqrt(mean_squared_error),
+            "sum_on_target": self.sum_on_target,
+            "mean_on_target": self.sum_on_target / self.count,
+            "r2_score": r2_score,
+            "max_error": self.max_error,
+            "mean_absolute_percentage_error": self.sum_absolute_percentage_error / self.weight,
+        }
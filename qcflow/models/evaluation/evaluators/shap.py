@@ -1,13 +1,21 @@
+import copy
 import functools
 import logging
+import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 from packaging.version import Version
 from sklearn.pipeline import Pipeline as sk_Pipeline
 
 import qcflow
 from qcflow import QCFlowException
+from qcflow.data.digest_utils import compute_pandas_digest
+from qcflow.data.evaluation_dataset import StreamingEvaluationDataset
+from qcflow.environment_variables import QCFLOW_EVALUATE_SHAP_CACHE_SIZE
 from qcflow.models.evaluation.base import EvaluationMetric, EvaluationResult, _ModelType
 from qcflow.models.evaluation.default_evaluator import (
     BuiltInEvaluator,
@@ -75,6 +83,12 @@ class ShapEvaluator(BuiltInEvaluator):
             )
             return
 
+        if isinstance(self.dataset, StreamingEvaluationDataset):
+            # Explain the leading rows rather than loading the whole dataset in memory
+            self.dataset = self.dataset.head(
+                self.evaluator_config.get("explainability_nsamples", _DEFAULT_SAMPLE_ROWS_FOR_SHAP)
+            )
+
         self.y_true = self.dataset.labels_data
         self.label_list = self.evaluator_config.get("label_list")
         self.pos_label = self.evaluator_config.get("pos_label")
@@ -125,13 +139,30 @@ class ShapEvaluator(BuiltInEvaluator):
         sample_rows = self.evaluator_config.get(
             "explainability_nsamples", _DEFAULT_SAMPLE_ROWS_FOR_SHAP
         )
+        background_rows = self.evaluator_config.get("explainability_background_nsamples")
+        stratify = self.evaluator_config.get("explainability_stratify", False)
+        n_jobs = self.evaluator_config.get("explainability_n_jobs", 1)
+        kernel_link = self.evaluator_config.get("explainability_kernel_link", "identity")
 
         X_df = self.X.copy_to_avoid_mutation()
+        mode_or_mean_dict = _compute_df_mode_or_mean(X_df)
 
-        sampled_X = shap.sample(X_df, sample_rows, random_state=0)
+        def _sample(nsamples, random_state):
+            if stratify:
+                sampled = _stratified_sample(
+                    X_df, self.y_true, nsamples, random_state, self.model_type
+                )
+            else:
+                sampled = shap.sample(X_df, nsamples, random_state=random_state)
+            return sampled.fillna(mode_or_mean_dict)
 
-        mode_or_mean_dict = _compute_df_mode_or_mean(X_df)
-        sampled_X = sampled_X.fillna(mode_or_mean_dict)
+        sampled_X = _sample(sample_rows, random_state=0)
+        if algorithm == "kernel":
+            background_X = _sample(background_rows or sample_rows, random_state=3)
+        elif background_rows is not None:
+            background_X = _sample(background_rows, random_state=3)
+        else:
+            background_X = sampled_X
 
         # shap explainer might call provided `predict_fn` with a `numpy.ndarray` type
         # argument, this might break some model inference, so convert the argument into
@@ -145,79 +176,56 @@ class ShapEvaluator(BuiltInEvaluator):
             _shap_predict_fn, predict_fn=predict_fn, feature_names=self.dataset.feature_names
         )
 
-        if self.label_list is None:
-            # If label list is not specified, infer label list from model output.
-            # We need to copy the input data as the model might mutate the input data.
-            y_pred = predict_fn(X_df.copy()) if predict_fn else self.dataset.predictions_data
-            self.label_list = np.unique(np.concatenate([self.y_true, y_pred]))
-
-        try:
-            if algorithm:
-                if algorithm == "kernel":
-                    # We need to lazily import shap, so lazily import `_PatchedKernelExplainer`
-                    from qcflow.models.evaluation._shap_patch import _PatchedKernelExplainer
-
-                    kernel_link = self.evaluator_config.get(
-                        "explainability_kernel_link", "identity"
-                    )
-                    if kernel_link not in ["identity", "logit"]:
-                        raise ValueError(
-                            "explainability_kernel_link config can only be set to 'identity' or "
-                            f"'logit', but got '{kernel_link}'."
-                        )
-                    background_X = shap.sample(X_df, sample_rows, random_state=3)
-                    background_X = background_X.fillna(mode_or_mean_dict)
-
-                    explainer = _PatchedKernelExplainer(
-                        shap_predict_fn, background_X, link=kernel_link
-                    )
-                else:
-                    explainer = shap.Explainer(
-                        shap_predict_fn,
-                        sampled_X,
-                        feature_names=self.dataset.feature_names,
-                        algorithm=algorithm,
-                    )
-            else:
-                if (
-                    raw_model
-                    and not len(self.label_list) > 2
-                    and not isinstance(raw_model, sk_Pipeline)
-                ):
-                    # For mulitnomial classifier, shap.Explainer may choose Tree/Linear explainer
-                    # for raw model, this case shap plot doesn't support it well, so exclude the
-                    # multinomial_classifier case here.
-                    explainer = shap.Explainer(
-                        raw_model, sampled_X, feature_names=self.dataset.feature_names
-                    )
-                else:
-                    # fallback to default explainer
-                    explainer = shap.Explainer(
-                        shap_predict_fn, sampled_X, feature_names=self.dataset.feature_names
-                    )
+        cache_key = _get_shap_cache_key(
+            model,
+            sampled_X,
+            background_X,
+            algorithm=algorithm,
+            kernel_link=kernel_link,
+            label_list=self.label_list,
+            feature_names=self.dataset.feature_names,
+        )
+        if cached := _shap_cache.get(cache_key):
+            _logger.info("Reusing the SHAP explainer and values of a previous evaluation.")
+            explainer, shap_values = cached
+        else:
+            try:
+                explainer, is_model_agnostic = self._create_explainer(
+                    shap,
+                    model,
+                    raw_model,
+                    algorithm,
+                    shap_predict_fn,
+                    predict_fn,
+                    X_df,
+                    background_X,
+                    kernel_link,
+                )
+                _logger.info(f"Shap explainer {explainer.__class__.__name__} is used.")
+                shap_values = _compute_shap_values(
+                    shap,
+                    explainer,
+                    sampled_X,
+                    algorithm=algorithm,
+                    feature_names=self.dataset.feature_names,
+                    n_jobs=n_jobs if is_model_agnostic else 1,
+                )
+            except Exception as e:
+                # Shap evaluation might fail on some edge cases, e.g., unsupported input data
+                # values or unsupported model on specific shap explainer. Catch exception to
+                # prevent it breaking the whole `evaluate` function.
 
-            _logger.info(f"Shap explainer {explainer.__class__.__name__} is used.")
+                if not self.evaluator_config.get("ignore_exceptions", True):
+                    raise e
 
-            if algorithm == "kernel":
-                shap_values = shap.Explanation(
-                    explainer.shap_values(sampled_X), feature_names=self.dataset.feature_names
+                _logger.warning(
+                    f"Shap evaluation failed. Reason: {e!r}. "
+                    "Set logging level to DEBUG to see the full traceback."
                 )
-            else:
-                shap_values = explainer(sampled_X)
-        except Exception as e:
-            # Shap evaluation might fail on some edge cases, e.g., unsupported input data values
-            # or unsupported model on specific shap explainer. Catch exception to prevent it
-            # breaking the whole `evaluate` function.
-
-            if not self.evaluator_config.get("ignore_exceptions", True):
-                raise e
+                _logger.debug("", exc_info=True)
+                return
+            _shap_cache.put(cache_key, (explainer, shap_values))
 
-            _logger.warning(
-                f"Shap evaluation failed. Reason: {e!r}. "
-                "Set logging level to DEBUG to see the full traceback."
-            )
-            _logger.debug("", exc_info=True)
-            return
         try:
             qcflow.shap.log_explainer(explainer, artifact_path="explainer")
         except Exception as e:
@@ -276,6 +284,218 @@ class ShapEvaluator(BuiltInEvaluator):
             run_id=self.run_id,
         )
 
+    def _create_explainer(
+        self,
+        shap,
+        model,
+        raw_model,
+        algorithm,
+        shap_predict_fn,
+        predict_fn,
+        X_df,
+        background_X,
+        kernel_link,
+    ):
+        """
+        Create the SHAP explainer for the model.
+
+        Returns:
+            A tuple of the explainer and a boolean indicating whether the explainer is
+            model-agnostic, i.e. only calls the prediction function of the model.
+        """
+        if algorithm == "kernel":
+            # We need to lazily import shap, so lazily import `_PatchedKernelExplainer`
+            from qcflow.models.evaluation._shap_patch import _PatchedKernelExplainer
+
+            if kernel_link not in ["identity", "logit"]:
+                raise ValueError(
+                    "explainability_kernel_link config can only be set to 'identity' or "
+                    f"'logit', but got '{kernel_link}'."
+                )
+            return _PatchedKernelExplainer(shap_predict_fn, background_X, link=kernel_link), True
+
+        if algorithm:
+            explainer = shap.Explainer(
+                shap_predict_fn,
+                background_X,
+                feature_names=self.dataset.feature_names,
+                algorithm=algorithm,
+            )
+            return explainer, True
+
+        if raw_model and not isinstance(raw_model, sk_Pipeline):
+            if self.label_list is None:
+                # If label list is not specified, infer label list from model output.
+                # We need to copy the input data as the model might mutate the input data.
+                y_pred = predict_fn(X_df.copy()) if predict_fn else self.dataset.predictions_data
+                self.label_list = np.unique(np.concatenate([self.y_true, y_pred]))
+            if not len(self.label_list) > 2:
+                # For mulitnomial classifier, shap.Explainer may choose Tree/Linear explainer
+                # for raw model, this case shap plot doesn't support it well, so exclude the
+                # multinomial_classifier case here.
+                explainer = shap.Explainer(
+                    raw_model, background_X, feature_names=self.dataset.feature_names
+                )
+                return explainer, False
+
+        # fallback to default explainer
+        explainer = shap.Explainer(
+            shap_predict_fn, background_X, feature_names=self.dataset.feature_names
+        )
+        return explainer, True
+
+
+class _ShapCache:
+    """
+    An in-memory LRU cache of SHAP explainers and values, so that evaluating the same model on
+    the same data again, e.g. with different metrics or against several baselines, does not
+    recompute the SHAP values from scratch. The maximum number of entries is read from
+    ``QCFLOW_EVALUATE_SHAP_CACHE_SIZE`` on each insertion.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        if key is None:
+            return None
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        max_size = QCFLOW_EVALUATE_SHAP_CACHE_SIZE.get()
+        if key is None or max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_shap_cache = _ShapCache()
+
+
+def _get_shap_cache_key(model, sampled_X, background_X, **config):
+    """
+    Compute the key of the SHAP values of a model on sampled rows, or None if the model cannot
+    be identified, e.g. a function. The key includes the digests of the explained and background
+    rows, which are small enough to be digested in full, rather than the digest of the dataset,
+    which only covers a subset of its rows.
+    """
+    model_uuid = getattr(getattr(model, "metadata", None), "model_uuid", None)
+    if model_uuid is None:
+        return None
+    background_digest = None if background_X is sampled_X else compute_pandas_digest(background_X)
+    return (
+        model_uuid,
+        compute_pandas_digest(sampled_X),
+        background_digest,
+        repr(sorted(config.items())),
+    )
+
+
+def _stratified_sample(X, y, nsamples, random_state, model_type):
+    """
+    Sample ``nsamples`` rows of ``X`` without replacement, allocating the rows to each stratum
+    proportionally to its size with the largest remainder method, and keeping at least one row
+    of each stratum if the budget allows. The strata are the labels for classifiers and the label
+    deciles for regressors. The sampled rows keep their order in ``X``.
+    """
+    if nsamples >= len(X):
+        return X
+
+    y = pd.Series(np.asarray(y))
+    if model_type == _ModelType.REGRESSOR:
+        y = pd.qcut(y, q=10, labels=False, duplicates="drop")
+    strata = y.groupby(y, sort=True).indices
+
+    sizes = np.array([len(positions) for positions in strata.values()])
+    quotas = sizes * nsamples / len(X)
+    counts = np.floor(quotas).astype(int)
+    remainder = nsamples - counts.sum()
+    counts[np.argsort(counts - quotas, kind="stable")[:remainder]] += 1
+    if nsamples >= len(sizes):
+        for stratum in np.flatnonzero(counts == 0):
+            counts[np.argmax(counts)] -= 1
+            counts[stratum] = 1
+
+    rng = np.random.default_rng(random_state)
+    positions = np.concatenate(
+        [
+            rng.choice(stratum_positions, size=count, replace=False)
+            for stratum_positions, count in zip(strata.values(), counts)
+        ]
+    )
+    return X.iloc[np.sort(positions)]
+
+
+def _explain_shard(explainer, shard, algorithm):
+    if algorithm == "kernel":
+        return explainer.shap_values(shard)
+    return explainer(shard)
+
+
+def _concat_shap_values(shap, parts, algorithm, feature_names):
+    if algorithm == "kernel":
+        if isinstance(parts[0], list):
+            # Older shap versions return a list with the values of each model output
+            values = [np.concatenate(output_values) for output_values in zip(*parts)]
+        else:
+            values = np.concatenate(parts)
+        return shap.Explanation(values, feature_names=feature_names)
+
+    if len(parts) == 1:
+        return parts[0]
+    first = parts[0]
+    return shap.Explanation(
+        values=np.concatenate([part.values for part in parts]),
+        base_values=np.concatenate([np.asarray(part.base_values) for part in parts]),
+        data=np.concatenate([np.asarray(part.data) for part in parts]),
+        feature_names=first.feature_names,
+        output_names=first.output_names,
+    )
+
+
+def _compute_shap_values(shap, explainer, sampled_X, algorithm, feature_names, n_jobs):
+    """
+    Compute the SHAP values of the sampled rows. Model-agnostic explainers spend most of their
+    time calling the model, so the rows are split into ``n_jobs`` shards explained in parallel
+    with joblib. Explainers keep state while explaining rows, so each shard is explained by its
+    own copy of the explainer. Threads are preferred because the explainer is not always
+    picklable, but the backend can be changed with ``joblib.parallel_config``.
+    """
+    if n_jobs != 1 and len(sampled_X) > 1:
+        from joblib import Parallel, delayed
+
+        num_shards = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+        num_shards = min(num_shards, len(sampled_X))
+        shards = [
+            sampled_X.iloc[indices]
+            for indices in np.array_split(np.arange(len(sampled_X)), num_shards)
+        ]
+        try:
+            explainers = [copy.deepcopy(explainer) for _ in shards]
+        except Exception as e:
+            _logger.debug(f"Failed to copy the explainer, computing SHAP values sequentially: {e}")
+        else:
+            parts = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(_explain_shard)(shard_explainer, shard, algorithm)
+                for shard_explainer, shard in zip(explainers, shards)
+            )
+            return _concat_shap_values(shap, parts, algorithm, feature_names)
+
+    parts = [_explain_shard(explainer, sampled_X, algorithm)]
+    return _concat_shap_values(shap, parts, algorithm, feature_names)
+
 
 def _compute_df_mode_or_mean(df):
     """
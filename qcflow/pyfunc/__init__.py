@@ -403,6 +403,7 @@ import importlib
 import inspect
 import logging
 import os
+import posixpath
 import shutil
 import signal
 import subprocess
@@ -411,6 +412,7 @@ import tempfile
 import threading
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import deepcopy
 from functools import lru_cache
@@ -429,6 +431,7 @@ import qcflow.pyfunc.model
 from qcflow.environment_variables import (
     _QCFLOW_IN_CAPTURE_MODULE_PROCESS,
     _QCFLOW_TESTING,
+    QCFLOW_ENABLE_PIPELINED_MODEL_LOAD,
     QCFLOW_MODEL_ENV_DOWNLOADING_TEMP_DIR,
     QCFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
 )
@@ -482,6 +485,7 @@ from qcflow.pyfunc.dbconnect_artifact_cache import (
     archive_directory,
     extract_archive_to_dir,
 )
+from qcflow.pyfunc.load_timing import ModelLoadTimings, _report_model_load_timings
 from qcflow.pyfunc.model import (
     _DEFAULT_CHAT_MODEL_METADATA_TASK,
     ChatModel,
@@ -492,10 +496,15 @@ from qcflow.pyfunc.model import (
     get_default_conda_env,  # noqa: F401
     get_default_pip_requirements,
 )
+from qcflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from qcflow.tracing.provider import trace_disabled
 from qcflow.tracing.utils import _try_get_prediction_context
 from qcflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from qcflow.tracking.artifact_utils import _download_artifact_from_uri
+from qcflow.tracking.artifact_utils import (
+    _download_artifact_from_repository,
+    _download_artifact_from_uri,
+    _get_artifact_repository_and_path,
+)
 from qcflow.types.llm import (
     CHAT_MODEL_INPUT_EXAMPLE,
     CHAT_MODEL_INPUT_SCHEMA,
@@ -735,6 +744,10 @@ class PyFuncModel:
         self._model_meta = model_meta
         self.__model_impl = model_impl
         self._predict_fn = getattr(model_impl, predict_fn)
+        # The local path and model config the model was loaded with by `load_model`, which are
+        # used to load the model again in other processes, e.g. in `qcflow.evaluate` workers
+        self._model_path = None
+        self._loaded_model_config = None
         if predict_stream_fn:
             if not hasattr(model_impl, predict_stream_fn):
                 raise QCFlowException(
@@ -1026,46 +1039,161 @@ def load_model(
 
             .. Note:: Experimental: This parameter may change or be removed in a future
                 release without warning.
+
+    .. Note:: If the ``QCFLOW_PYFUNC_MODEL_CACHE_SIZE`` environment variable is set to a positive
+        number, models loaded from ``runs:/`` and ``models:/`` URIs without a ``dst_path`` are
+        cached in memory, keyed by run ID or resolved model version, and repeated calls return
+        the same :py:class:`PyFuncModel <qcflow.pyfunc.PyFuncModel>` instance. Use
+        ``qcflow.pyfunc.model_cache.invalidate_model_cache()`` to evict cached models.
     """
+    from qcflow.pyfunc.model_cache import _model_cache, resolve_immutable_model_uri
 
-    lineage_header_info = None
     if (
-        not _QCFLOW_IN_CAPTURE_MODULE_PROCESS.get()
-    ) and databricks_utils.is_in_databricks_runtime():
-        entity_list = []
-        # Get notebook id and job id, pack them into lineage_header_info
-        if databricks_utils.is_in_databricks_notebook() and (
-            notebook_id := databricks_utils.get_notebook_id()
-        ):
-            notebook_entity = Notebook(id=notebook_id)
-            entity_list.append(Entity(notebook=notebook_entity))
+        dst_path is None
+        and _model_cache.enabled
+        and (resolved_uri := resolve_immutable_model_uri(model_uri)) is not None
+    ):
+        return _model_cache.get_or_load(
+            _model_cache.make_key(resolved_uri, model_config),
+            lambda: _load_model(resolved_uri, suppress_warnings, None, model_config),
+        )
+    return _load_model(model_uri, suppress_warnings, dst_path, model_config)
 
-        if databricks_utils.is_in_databricks_job() and (job_id := databricks_utils.get_job_id()):
-            job_entity = Job(id=job_id)
-            entity_list.append(Entity(job=job_entity))
 
-        lineage_header_info = LineageHeaderInfo(entities=entity_list) if entity_list else None
+def _get_lineage_header_info() -> Optional[LineageHeaderInfo]:
+    if _QCFLOW_IN_CAPTURE_MODULE_PROCESS.get() or not databricks_utils.is_in_databricks_runtime():
+        return None
 
-    local_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path, lineage_header_info=lineage_header_info
-    )
+    entity_list = []
+    # Get notebook id and job id, pack them into lineage_header_info
+    if databricks_utils.is_in_databricks_notebook() and (
+        notebook_id := databricks_utils.get_notebook_id()
+    ):
+        notebook_entity = Notebook(id=notebook_id)
+        entity_list.append(Entity(notebook=notebook_entity))
 
-    if not suppress_warnings:
-        model_requirements = _get_pip_requirements_from_model_path(local_path)
-        warn_dependency_requirement_mismatches(model_requirements)
+    if databricks_utils.is_in_databricks_job() and (job_id := databricks_utils.get_job_id()):
+        job_entity = Job(id=job_id)
+        entity_list.append(Entity(job=job_entity))
+
+    return LineageHeaderInfo(entities=entity_list) if entity_list else None
 
-    model_meta = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME))
 
+def _get_pyfunc_conf(model_meta: Model) -> dict[str, Any]:
     conf = model_meta.flavors.get(FLAVOR_NAME)
     if conf is None:
         raise QCFlowException(
             f'Model does not have the "{FLAVOR_NAME}" flavor',
             RESOURCE_DOES_NOT_EXIST,
         )
-    model_py_version = conf.get(PY_VERSION)
-    if not suppress_warnings:
-        _warn_potentially_incompatible_py_version_if_necessary(model_py_version=model_py_version)
+    return conf
 
+
+def _check_model_environment(model_requirements: list[str], conf: dict[str, Any]) -> None:
+    warn_dependency_requirement_mismatches(model_requirements)
+    _warn_potentially_incompatible_py_version_if_necessary(model_py_version=conf.get(PY_VERSION))
+
+
+def _download_model_pipelined(
+    repo,
+    artifact_path: str,
+    dst_path: Optional[str],
+    lineage_header_info: Optional[LineageHeaderInfo],
+    suppress_warnings: bool,
+    timings: ModelLoadTimings,
+) -> str:
+    """
+    Download the model files in the background while the environment of the model is checked and
+    its loader module is imported, from a copy of the small metadata files downloaded first.
+    """
+
+    def download_model():
+        with timings.measure("download"):
+            return _download_artifact_from_repository(
+                repo, artifact_path, output_path=dst_path, lineage_header_info=lineage_header_info
+            )
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="QCFlowModelDownload") as executor:
+        download_future = executor.submit(download_model)
+        with tempfile.TemporaryDirectory() as metadata_dir:
+            with timings.measure("download"):
+                model_meta = Model.load(
+                    repo.download_artifacts(
+                        posixpath.join(artifact_path, MLMODEL_FILE_NAME), metadata_dir
+                    )
+                )
+            conf = _get_pyfunc_conf(model_meta)
+            if not suppress_warnings:
+                with timings.measure("env_check"):
+                    try:
+                        requirements_path = repo.download_artifacts(
+                            posixpath.join(artifact_path, _REQUIREMENTS_FILE_NAME), metadata_dir
+                        )
+                    except Exception:
+                        # The model has no requirements file, or it cannot be downloaded yet, in
+                        # which case the download of the model fails with a detailed error
+                        model_requirements = []
+                    else:
+                        model_requirements = _get_pip_requirements_from_model_path(
+                            os.path.dirname(requirements_path)
+                        )
+                    _check_model_environment(model_requirements, conf)
+
+        # The loader module of a model with code paths may be part of the downloaded code
+        if CODE not in conf:
+            with timings.measure("deserialize"):
+                try:
+                    importlib.import_module(conf[MAIN])
+                except Exception:
+                    # The import is retried, and its error reported, once the model is downloaded
+                    pass
+
+        return download_future.result()
+
+
+def _load_model(
+    model_uri: str,
+    suppress_warnings: bool,
+    dst_path: Optional[str],
+    model_config: Optional[Union[str, Path, dict[str, Any]]],
+) -> PyFuncModel:
+    timings = ModelLoadTimings(model_uri)
+    with timings.measure("resolve"):
+        lineage_header_info = _get_lineage_header_info()
+        repo, artifact_path = _get_artifact_repository_and_path(model_uri)
+
+    # Local models are loaded in place unless they are copied to a `dst_path`
+    if QCFLOW_ENABLE_PIPELINED_MODEL_LOAD.get() and not (
+        dst_path is None and isinstance(repo, LocalArtifactRepository)
+    ):
+        local_path = _download_model_pipelined(
+            repo, artifact_path, dst_path, lineage_header_info, suppress_warnings, timings
+        )
+        model_meta = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME))
+        conf = _get_pyfunc_conf(model_meta)
+    else:
+        with timings.measure("download"):
+            local_path = _download_artifact_from_repository(
+                repo, artifact_path, output_path=dst_path, lineage_header_info=lineage_header_info
+            )
+        model_meta = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME))
+        conf = _get_pyfunc_conf(model_meta)
+        if not suppress_warnings:
+            with timings.measure("env_check"):
+                _check_model_environment(_get_pip_requirements_from_model_path(local_path), conf)
+
+    with timings.measure("deserialize"):
+        pyfunc_model = _load_pyfunc_model(local_path, model_meta, conf, model_config)
+    _report_model_load_timings(timings)
+    return pyfunc_model
+
+
+def _load_pyfunc_model(
+    local_path: str,
+    model_meta: Model,
+    conf: dict[str, Any],
+    model_config: Optional[Union[str, Path, dict[str, Any]]],
+) -> PyFuncModel:
     _add_code_from_conf_to_system_path(local_path, conf, code_key=CODE)
     data_path = os.path.join(local_path, conf[DATA]) if (DATA in conf) else local_path
 
@@ -1073,7 +1201,7 @@ def load_model(
         model_config = _validate_and_get_model_config_from_file(model_config)
 
     model_config = _get_overridden_pyfunc_model_config(
-        conf.get(MODEL_CONFIG, None), model_config, _logger
+        conf.get(MODEL_CONFIG), model_config, _logger
     )
 
     try:
@@ -1104,12 +1232,15 @@ def load_model(
     streamable = conf.get("streamable", False)
     predict_stream_fn = conf.get("predict_stream_fn", "predict_stream") if streamable else None
 
-    return PyFuncModel(
+    pyfunc_model = PyFuncModel(
         model_meta=model_meta,
         model_impl=model_impl,
         predict_fn=predict_fn,
         predict_stream_fn=predict_stream_fn,
     )
+    pyfunc_model._model_path = local_path
+    pyfunc_model._loaded_model_config = model_config
+    return pyfunc_model
 
 
 class _ServedPyFuncModel(PyFuncModel):
@@ -0,0 +1,104 @@
+"""
+Timing breakdown of :py:func:`qcflow.pyfunc.load_model`.
+
+Every call to ``load_model`` that loads a model, rather than getting it from the model cache,
+measures the time spent in each of its stages:
+
+- ``resolve``: resolving the model URI to the artifact repository that stores the model.
+- ``download``: downloading the model files.
+- ``env_check``: comparing the requirements and Python version of the model with the current
+  environment.
+- ``deserialize``: loading the model with the loader module of its flavor.
+
+When ``QCFLOW_ENABLE_PIPELINED_MODEL_LOAD`` is enabled, the download runs concurrently with the
+environment check and the import of the loader module, so the stage durations can add up to more
+than the ``total`` duration.
+
+The timings are logged at the DEBUG level by the ``qcflow.pyfunc.load_timing`` logger, and passed
+to the hooks registered with :py:func:`register_model_load_hook`.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+_logger = logging.getLogger(__name__)
+
+
+class ModelLoadTimings:
+    """
+    The time, in seconds, spent by :py:func:`qcflow.pyfunc.load_model` in each of its stages.
+
+    Args:
+        model_uri: The URI of the loaded model.
+    """
+
+    STAGES = ("resolve", "download", "env_check", "deserialize")
+
+    def __init__(self, model_uri: str):
+        self.model_uri = model_uri
+        self.stages = dict.fromkeys(self.STAGES, 0.0)
+        self.total: Optional[float] = None
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, stage: str):
+        """
+        Add the time spent in the context to the duration of the specified stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            # Stages may be measured from the threads of a pipelined load
+            with self._lock:
+                self.stages[stage] += elapsed
+
+    def finish(self) -> None:
+        self.total = time.perf_counter() - self._start
+
+    def to_dict(self) -> dict[str, float]:
+        return {**self.stages, "total": self.total}
+
+    def __repr__(self):
+        durations = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in self.stages.items())
+        total = f"{self.total:.3f}s" if self.total is not None else None
+        return f"ModelLoadTimings(model_uri={self.model_uri!r}, {durations}, total={total})"
+
+
+_hooks: list[Callable[[ModelLoadTimings], None]] = []
+_hooks_lock = threading.Lock()
+
+
+def register_model_load_hook(hook: Callable[[ModelLoadTimings], None]) -> None:
+    """
+    Register a function called with the :py:class:`ModelLoadTimings` of every model loaded by
+    :py:func:`qcflow.pyfunc.load_model`, e.g. to export them as metrics. Exceptions raised by the
+    hook are logged and ignored.
+    """
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def unregister_model_load_hook(hook: Callable[[ModelLoadTimings], None]) -> None:
+    """
+    Unregister a function registered with :py:func:`register_model_load_hook`.
+    """
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+
+def _report_model_load_timings(timings: ModelLoadTimings) -> None:
+    timings.finish()
+    _logger.debug("Loaded model %s: %s", timings.model_uri, timings)
+    with _hooks_lock:
+        hooks = list(_hooks)
+    for hook in hooks:
+        try:
+            hook(timings)
+        except Exception as e:
+            _logger.warning(f"Model load hook {hook!r} failed: {e}")
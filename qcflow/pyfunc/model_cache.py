@@ -0,0 +1,218 @@
+"""
+An in-process cache of the models loaded by :py:func:`qcflow.pyfunc.load_model`.
+
+The cache is disabled by default. Set the ``QCFLOW_PYFUNC_MODEL_CACHE_SIZE`` environment variable
+to the maximum number of models to keep in memory to enable it. Only models referenced by an
+immutable URI are cached: ``runs:/`` URIs and ``models:/`` URIs, whose stages, aliases and
+``latest`` suffixes are resolved to a model version on every call, so that a model is reloaded as
+soon as an alias or stage is moved to another version. Models loaded from local paths or other
+artifact locations, or with a ``dst_path``, are never cached.
+
+The cached :py:class:`PyFuncModel <qcflow.pyfunc.PyFuncModel>` instances are shared by all the
+callers and threads loading the same URI, so they must not be mutated.
+"""
+
+import json
+import threading
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
+
+import qcflow
+from qcflow.environment_variables import QCFLOW_PYFUNC_MODEL_CACHE_SIZE
+from qcflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from qcflow.store.artifact.utils.models import _parse_model_uri, get_model_name_and_version
+from qcflow.utils.uri import get_databricks_profile_uri_from_artifact_uri
+
+
+class _ModelCacheKey(NamedTuple):
+    # The tracking or registry URI the model URI is resolved against
+    store_uri: str
+    # The immutable model URI, e.g. "runs:/<run_id>/model" or "models:/<name>/<version>"
+    model_uri: str
+    # The serialized model config the model is loaded with
+    model_config: str
+
+
+def resolve_immutable_model_uri(model_uri: str) -> Optional[str]:
+    """
+    Resolve a model URI to a URI that always refers to the same model files.
+
+    Args:
+        model_uri: A model URI, e.g. ``runs:/<run_id>/model`` or ``models:/<name>@<alias>``.
+
+    Returns:
+        The URI itself for a ``runs:/`` URI, a ``models:/<name>/<version>`` URI for a
+        ``models:/`` URI, or None if the URI cannot be resolved to an immutable URI.
+    """
+    parsed = urllib.parse.urlparse(model_uri)
+    if parsed.scheme == "runs":
+        return model_uri
+    if parsed.scheme != "models":
+        return None
+
+    registered_model_uri, artifact_path = ModelsArtifactRepository.split_models_uri(model_uri)
+    name, version, _, _ = _parse_model_uri(registered_model_uri)
+    if version is None:
+        registry_uri = (
+            get_databricks_profile_uri_from_artifact_uri(model_uri) or qcflow.get_registry_uri()
+        )
+        client = qcflow.QCFlowClient(registry_uri=registry_uri)
+        name, version = get_model_name_and_version(client, registered_model_uri)
+
+    netloc = f"//{parsed.netloc}" if parsed.netloc else ""
+    resolved_uri = f"models:{netloc}/{name}/{version}"
+    return f"{resolved_uri}/{artifact_path}" if artifact_path else resolved_uri
+
+
+def _get_store_uri(model_uri: str) -> str:
+    if urllib.parse.urlparse(model_uri).scheme == "models":
+        return qcflow.get_registry_uri()
+    return qcflow.get_tracking_uri()
+
+
+class PyFuncModelCache:
+    """
+    A thread-safe, size-bounded LRU cache of loaded models keyed by immutable model URI and model
+    config.
+
+    Concurrent loads of the same key are coalesced: the first caller loads the model while the
+    others wait for it and share the result.
+
+    Args:
+        max_size: The maximum number of models to keep. Defaults to the value of
+            ``QCFLOW_PYFUNC_MODEL_CACHE_SIZE`` at the time of each lookup.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self._max_size = max_size
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return QCFLOW_PYFUNC_MODEL_CACHE_SIZE.get()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def make_key(resolved_model_uri: str, model_config: Optional[Any] = None) -> _ModelCacheKey:
+        return _ModelCacheKey(
+            store_uri=_get_store_uri(resolved_model_uri),
+            model_uri=resolved_model_uri,
+            model_config=json.dumps(model_config, sort_keys=True, default=str),
+        )
+
+    def _evict(self, max_size: int) -> None:
+        while len(self._models) > max_size:
+            self._models.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_load(self, key: _ModelCacheKey, load_fn: Callable[[], Any]):
+        """
+        Get the model cached for the key, or load it with ``load_fn`` and cache it.
+        """
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # Another thread may have loaded the model while this one was waiting
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    self.hits += 1
+                    return self._models[key]
+                self.misses += 1
+
+            try:
+                model = load_fn()
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+            with self._lock:
+                self._models[key] = model
+                self._evict(self.max_size)
+            return model
+
+    def invalidate(self, model_uri: Optional[str] = None) -> int:
+        """
+        Remove the models loaded from the specified URI, with any model config, from the cache.
+
+        Args:
+            model_uri: A model URI. Stages and aliases are resolved to the version they currently
+                refer to. If None, all the models are removed.
+
+        Returns:
+            The number of removed models.
+        """
+        resolved_uri = resolve_immutable_model_uri(model_uri) if model_uri is not None else None
+        with self._lock:
+            if model_uri is None:
+                keys = list(self._models)
+            else:
+                store_uri = _get_store_uri(model_uri)
+                keys = [
+                    key
+                    for key in self._models
+                    if key.model_uri == resolved_uri and key.store_uri == store_uri
+                ]
+            for key in keys:
+                del self._models[key]
+            return len(keys)
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._models),
+                "max_size": self.max_size,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+_model_cache = PyFuncModelCache()
+
+
+def invalidate_model_cache(model_uri: Optional[str] = None) -> int:
+    """
+    Remove models from the cache of :py:func:`qcflow.pyfunc.load_model`.
+
+    Args:
+        model_uri: The URI of the model to remove, e.g. ``models:/my_model/3`` or
+            ``models:/my_model@champion``. If None, all the cached models are removed.
+
+    Returns:
+        The number of removed models.
+    """
+    return _model_cache.invalidate(model_uri)
+
+
+def get_model_cache_stats() -> dict[str, int]:
+    """
+    Get the statistics of the cache of :py:func:`qcflow.pyfunc.load_model`.
+
+    Returns:
+        A dictionary with the number of cache ``hits``, ``misses`` and ``evictions`` since the
+        process started, and the current ``size`` and ``max_size`` of the cache.
+    """
+    return _model_cache.get_stats()
@@ -9,6 +9,11 @@ import types
 from flask import Flask, Response, send_from_directory
 from packaging.version import Version
 
+from qcflow.environment_variables import (
+    QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW,
+    QCFLOW_SQLALCHEMYSTORE_POOL_RECYCLE,
+    QCFLOW_SQLALCHEMYSTORE_POOL_SIZE,
+)
 from qcflow.exceptions import QCFlowException
 from qcflow.server import handlers
 from qcflow.server.handlers import (
@@ -17,9 +22,11 @@ from qcflow.server.handlers import (
     create_promptlab_run_handler,
     gateway_proxy_handler,
     get_artifact_handler,
+    get_change_events_handler,
     get_metric_history_bulk_handler,
     get_metric_history_bulk_interval_handler,
     get_model_version_artifact_handler,
+    get_model_versions_handler,
     get_trace_artifact_handler,
     search_datasets_handler,
     upload_artifact_handler,
@@ -41,6 +48,16 @@ ARTIFACTS_ONLY_ENV_VAR = "_QCFLOW_SERVER_ARTIFACTS_ONLY"
 
 REL_STATIC_DIR = "js/build"
 
+# The gunicorn configuration module of the production mode of the server
+GUNICORN_PRODUCTION_CONFIG = "python:qcflow.server.gunicorn_config"
+
+# The gunicorn worker classes of the `--worker-class` option of `qcflow server`
+GUNICORN_WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "qcflow.server.uvicorn_worker.QCFlowUvicornWorker",
+}
+
 app = Flask(__name__, static_folder=REL_STATIC_DIR)
 IS_FLASK_V1 = Version(importlib.metadata.version("flask")) < Version("2.0")
 
@@ -48,6 +65,10 @@ IS_FLASK_V1 = Version(importlib.metadata.version("flask")) < Version("2.0")
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
+# Invalidate the response cache of the process both before and after the write requests
+app.before_request(handlers.invalidate_response_cache)
+app.teardown_request(lambda exc: handlers.invalidate_response_cache())
+
 if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
     from qcflow.server.prometheus_exporter import activate_prometheus_exporter
 
@@ -93,6 +114,20 @@ def serve_get_metric_history_bulk_interval():
     return get_metric_history_bulk_interval_handler()
 
 
+# Serve the "model-versions/get-batch" route, which clients use to look up model versions in bulk.
+@app.route("/api/2.0/qcflow/model-versions/get-batch", methods=["POST"])
+@app.route(_add_static_prefix("/ajax-api/2.0/qcflow/model-versions/get-batch"), methods=["POST"])
+def serve_get_model_versions():
+    return get_model_versions_handler()
+
+
+# Serve the "change-events/get" route, which clients long-poll to watch the changes of entities.
+@app.route("/api/2.0/qcflow/change-events/get")
+@app.route(_add_static_prefix("/ajax-api/2.0/qcflow/change-events/get"))
+def serve_get_change_events():
+    return get_change_events_handler()
+
+
 # Serve the "experiments/search-datasets" route.
 @app.route(_add_static_prefix("/ajax-api/2.0/qcflow/experiments/search-datasets"), methods=["POST"])
 def serve_search_datasets():
@@ -222,13 +257,18 @@ def _build_waitress_command(waitress_opts, host, port, app_name, is_factory):
     ]
 
 
-def _build_gunicorn_command(gunicorn_opts, host, port, workers, app_name):
+def _build_gunicorn_command(
+    gunicorn_opts, host, port, workers, app_name, worker_class=None, threads=None, production=False
+):
     bind_address = f"{host}:{port}"
     opts = shlex.split(gunicorn_opts) if gunicorn_opts else []
     return [
         sys.executable,
         "-m",
         "gunicorn",
+        *(["-c", GUNICORN_PRODUCTION_CONFIG] if production else []),
+        *(["-k", GUNICORN_WORKER_CLASSES[worker_class]] if worker_class else []),
+        *(["--threads", str(threads)] if threads else []),
         *opts,
         "-b",
         bind_address,
@@ -253,6 +293,12 @@ def _run_server(  # noqa: D417
     waitress_opts=None,
     expose_prometheus=None,
     app_name=None,
+    worker_class=None,
+    threads=None,
+    production=False,
+    db_pool_size=None,
+    db_max_overflow=None,
+    db_pool_recycle=None,
 ):
     """
     Run the QCFlow server, wrapping it in gunicorn or waitress on windows
@@ -260,6 +306,13 @@ def _run_server(  # noqa: D417
     Args:
         static_prefix: If set, the index.html asset will be served from the path static_prefix.
                        If left None, the index.html asset will be served from the root path.
+        worker_class: The gunicorn worker class, one of the keys of ``GUNICORN_WORKER_CLASSES``.
+        threads: The number of threads of each gunicorn worker.
+        production: If True, load the backend stores in the gunicorn master process before
+                    forking the workers, see ``qcflow.server.gunicorn_config``.
+        db_pool_size: The size of the database connection pool of each worker.
+        db_max_overflow: The number of connections each worker may open beyond the pool size.
+        db_pool_recycle: The number of seconds after which the pooled connections are recycled.
 
     Returns:
         None
@@ -283,6 +336,14 @@ def _run_server(  # noqa: D417
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
 
+    for env_var, value in [
+        (QCFLOW_SQLALCHEMYSTORE_POOL_SIZE, db_pool_size),
+        (QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW, db_max_overflow),
+        (QCFLOW_SQLALCHEMYSTORE_POOL_RECYCLE, db_pool_recycle),
+    ]:
+        if value is not None:
+            env_map[env_var.name] = str(value)
+
     if app_name is None:
         app = f"{__name__}:app"
         is_factory = False
@@ -297,5 +358,14 @@ def _run_server(  # noqa: D417
     if sys.platform == "win32":
         full_command = _build_waitress_command(waitress_opts, host, port, app, is_factory)
     else:
-        full_command = _build_gunicorn_command(gunicorn_opts, host, port, workers or 4, app)
+        full_command = _build_gunicorn_command(
+            gunicorn_opts,
+            host,
+            port,
+            workers or 4,
+            app,
+            worker_class=worker_class,
+            threads=threads,
+            production=production,
+        )
     _exec_cmd(full_command, extra_env=env_map, capture_output=False)
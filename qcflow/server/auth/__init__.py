@@ -15,7 +15,16 @@ import uuid
 from typing import Any, Callable, Optional, Union
 
 import sqlalchemy
-from flask import Flask, Response, flash, jsonify, make_response, render_template_string, request
+from flask import (
+    Flask,
+    Response,
+    flash,
+    g,
+    jsonify,
+    make_response,
+    render_template_string,
+    request,
+)
 from werkzeug.datastructures import Authorization
 
 from qcflow import QCFlowException
@@ -74,9 +83,10 @@ from qcflow.protos.service_pb2 import (
     UpdateRun,
 )
 from qcflow.server import app
+from qcflow.server.auth.cache import TTLCache
 from qcflow.server.auth.config import read_auth_config
 from qcflow.server.auth.logo import QCFLOW_LOGO
-from qcflow.server.auth.permissions import MANAGE, Permission, get_permission
+from qcflow.server.auth.permissions import ALL_PERMISSIONS, MANAGE, Permission, get_permission
 from qcflow.server.auth.routes import (
     CREATE_EXPERIMENT_PERMISSION,
     CREATE_REGISTERED_MODEL_PERMISSION,
@@ -97,12 +107,13 @@ from qcflow.server.auth.routes import (
 from qcflow.server.auth.sqlalchemy_store import SqlAlchemyStore
 from qcflow.server.handlers import (
     _get_model_registry_store,
+    _get_paths,
     _get_request_message,
     _get_tracking_store,
     catch_qcflow_exception,
     get_endpoints,
 )
-from qcflow.store.entities import PagedList
+from qcflow.store.entities import AccessFilter, PagedList
 from qcflow.utils.proto_json_utils import message_to_json, parse_dict
 from qcflow.utils.rest_utils import _REST_API_PATH_PREFIX
 from qcflow.utils.search_utils import SearchUtils
@@ -110,7 +121,14 @@ from qcflow.utils.search_utils import SearchUtils
 _logger = logging.getLogger(__name__)
 
 auth_config = read_auth_config()
-store = SqlAlchemyStore()
+store = SqlAlchemyStore(
+    credential_cache_ttl=auth_config.credential_cache_ttl,
+    credential_cache_size=auth_config.credential_cache_size,
+    permission_cache_ttl=auth_config.permission_cache_ttl,
+    permission_cache_size=auth_config.permission_cache_size,
+)
+# The experiment of a run never changes, so it is cached for the authorization of run requests
+_run_experiment_ids = TTLCache(auth_config.permission_cache_ttl, auth_config.permission_cache_size)
 
 
 def is_unprotected_route(path: str) -> bool:
@@ -217,8 +235,9 @@ def _get_permission_from_run_id() -> Permission:
     # run permissions inherit from parent resource (experiment)
     # so we just get the experiment permission
     run_id = _get_request_param("run_id")
-    run = _get_tracking_store().get_run(run_id)
-    experiment_id = run.info.experiment_id
+    if (experiment_id := _run_experiment_ids.get(run_id)) is None:
+        experiment_id = _get_tracking_store().get_run(run_id).info.experiment_id
+        _run_experiment_ids.put(run_id, experiment_id)
     username = authenticate_request().username
     return _get_permission_from_store_or_default(
         lambda: store.get_experiment_permission(experiment_id, username).permission
@@ -285,6 +304,27 @@ def validate_can_read_registered_model():
     return _get_permission_from_registered_model_name().can_read
 
 
+def validate_can_read_model_versions():
+    # A batch lookup is only allowed if all the requested registered models are readable
+    lookups = (request.get_json(silent=True) or {}).get("model_versions")
+    if not isinstance(lookups, list):
+        return True
+    names = {lookup.get("name") for lookup in lookups if isinstance(lookup, dict)}
+    username = authenticate_request().username
+    return all(
+        _get_permission_from_store_or_default(
+            lambda name=name: store.get_registered_model_permission(name, username).permission
+        ).can_read
+        for name in names
+        if isinstance(name, str)
+    )
+
+
+def validate_can_read_change_events():
+    # The change feed covers all the experiments and registered models, so only admins can read it
+    return False
+
+
 def validate_can_update_registered_model():
     return _get_permission_from_registered_model_name().can_update
 
@@ -406,6 +446,83 @@ BEFORE_REQUEST_VALIDATORS.update(
     }
 )
 
+BEFORE_REQUEST_VALIDATORS.update(
+    {
+        (path, "POST"): validate_can_read_model_versions
+        for path in _get_paths("/qcflow/model-versions/get-batch")
+    }
+)
+
+BEFORE_REQUEST_VALIDATORS.update(
+    {
+        (path, "GET"): validate_can_read_change_events
+        for path in _get_paths("/qcflow/change-events/get")
+    }
+)
+
+
+def _get_readable_resources_filter(
+    target_store,
+    list_permissions: Callable[[str], list[Any]],
+    select_ids: Callable[[str, list[str]], Any],
+    get_id: Callable[[Any], str],
+) -> AccessFilter:
+    username = authenticate_request().username
+    default_can_read = get_permission(auth_config.default_permission).can_read
+    # The permissions that override the readability given by the default permission
+    permissions = [p.name for p in ALL_PERMISSIONS.values() if p.can_read != default_can_read]
+    if getattr(target_store, "db_uri", None) == store.db_uri:
+        # The permissions are joined in the search query when both stores share a database
+        ids = select_ids(username, permissions)
+    else:
+        ids = [get_id(p) for p in list_permissions(username) if p.permission in permissions]
+    return AccessFilter(denied=ids) if default_can_read else AccessFilter(allowed=ids)
+
+
+def set_search_experiments_access_filter():
+    from qcflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+
+    tracking_store = _get_tracking_store()
+    if isinstance(tracking_store, TrackingStore):
+        g.search_access_filter = _get_readable_resources_filter(
+            tracking_store,
+            store.list_experiment_permissions,
+            store.select_experiment_ids,
+            lambda p: p.experiment_id,
+        )
+
+
+def set_search_registered_models_access_filter():
+    from qcflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore as RegistryStore
+
+    registry_store = _get_model_registry_store()
+    if isinstance(registry_store, RegistryStore):
+        g.search_access_filter = _get_readable_resources_filter(
+            registry_store,
+            store.list_registered_model_permissions,
+            store.select_registered_model_names,
+            lambda p: p.name,
+        )
+
+
+# Searches of the stores supporting access filters only return readable resources, instead of
+# being filtered by the after request handlers
+BEFORE_REQUEST_SEARCH_HANDLERS = {
+    SearchExperiments: set_search_experiments_access_filter,
+    SearchRegisteredModels: set_search_registered_models_access_filter,
+}
+
+
+def get_before_request_search_handler(request_class):
+    return BEFORE_REQUEST_SEARCH_HANDLERS.get(request_class)
+
+
+BEFORE_REQUEST_SEARCH_ACCESS_FILTERS = {
+    (http_path, method): handler
+    for http_path, handler, methods in get_endpoints(get_before_request_search_handler)
+    for method in methods
+}
+
 
 def _is_proxy_artifact_path(path: str) -> bool:
     return path.startswith(f"{_REST_API_PATH_PREFIX}/qcflow-artifacts/artifacts/")
@@ -476,6 +593,11 @@ def _before_request():
     if sender_is_admin():
         return
 
+    if set_access_filter := BEFORE_REQUEST_SEARCH_ACCESS_FILTERS.get(
+        (request.path, request.method)
+    ):
+        set_access_filter()
+
     # authorization
     if validator := BEFORE_REQUEST_VALIDATORS.get((request.path, request.method)):
         if not validator():
@@ -518,7 +640,8 @@ def delete_can_manage_registered_model_permission(resp: Response):
 
 
 def filter_search_experiments(resp: Response):
-    if sender_is_admin():
+    # the search was already restricted to the readable resources
+    if sender_is_admin() or g.get("search_access_filter") is not None:
         return
 
     response_message = SearchExperiments.Response()
@@ -569,7 +692,8 @@ def filter_search_experiments(resp: Response):
 
 
 def filter_search_registered_models(resp: Response):
-    if sender_is_admin():
+    # the search was already restricted to the readable resources
+    if sender_is_admin() or g.get("search_access_filter") is not None:
         return
 
     response_message = SearchRegisteredModels.Response()
@@ -647,6 +771,10 @@ def _after_request(resp: Response):
     if 400 <= resp.status_code < 600:
         return resp
 
+    # The empty responses to conditional requests have no content to filter
+    if resp.status_code == 304:
+        return resp
+
     if handler := AFTER_REQUEST_HANDLERS.get((request.path, request.method)):
         handler(resp)
     return resp
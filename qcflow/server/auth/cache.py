@@ -0,0 +1,161 @@
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded LRU cache whose entries expire after a fixed time to live.
+
+    Args:
+        ttl: The number of seconds an entry is kept. A non-positive value disables the cache.
+        max_size: The maximum number of entries to keep.
+        timer: The function returning the current time in seconds.
+    """
+
+    def __init__(self, ttl: float, max_size: int, timer: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, self._timer() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def pop_if(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Remove the entries for which ``predicate(key, value)`` is true and return their number.
+        """
+        with self._lock:
+            keys = [key for key, (value, _) in self._entries.items() if predicate(key, value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class CredentialCache:
+    """
+    A cache of the username and password pairs verified against the stored password hashes, which
+    are deliberately slow to check.
+
+    Passwords are never stored: entries are keyed by an HMAC of the username and password with a
+    random key generated by each process.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self._cache = TTLCache(ttl, max_size)
+        self._key = os.urandom(32)
+        # Incremented by every invalidation, so that a verification that raced with a password
+        # change or a user deletion is not cached
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    def _digest(self, username: str, password: str) -> bytes:
+        # Prefix the username with its length so that the pairs cannot collide
+        message = f"{len(username)}:{username}:{password}".encode()
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def contains(self, username: str, password: str) -> bool:
+        if not self.enabled:
+            return False
+        return self._cache.get(self._digest(username, password)) == username
+
+    def add(self, username: str, password: str, generation: int) -> None:
+        """
+        Cache credentials verified when the cache was at the specified generation.
+        """
+        if generation == self.generation:
+            self._cache.put(self._digest(username, password), username)
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """
+        Forget the verified credentials of the specified user, or of all the users if None.
+        """
+        self.generation += 1
+        if username is None:
+            self._cache.clear()
+        else:
+            self._cache.pop_if(lambda _, cached_username: cached_username == username)
+
+
+class PermissionCache:
+    """
+    A cache of the permissions of users on experiments and registered models, keyed by tuples
+    ending with the username.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self._cache = TTLCache(ttl, max_size)
+        # Incremented by every invalidation, so that a permission read that raced with a
+        # permission change is not cached
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    def get(self, key: tuple[str, ...]) -> Any:
+        return self._cache.get(key)
+
+    def add(self, key: tuple[str, ...], permission: Any, generation: int) -> None:
+        """
+        Cache a permission read when the cache was at the specified generation.
+        """
+        if generation == self.generation:
+            self._cache.put(key, permission)
+
+    def invalidate(self, key: tuple[str, ...]) -> None:
+        """
+        Forget the cached permission of a user on a resource.
+        """
+        self.generation += 1
+        self._cache.pop(key)
+
+    def invalidate_user(self, username: str) -> None:
+        """
+        Forget the cached permissions of a user on all the resources.
+        """
+        self.generation += 1
+        self._cache.pop_if(lambda key, _: key[-1] == username)
@@ -11,6 +11,10 @@ class AuthConfig(NamedTuple):
     admin_username: str
     admin_password: str
     authorization_function: str
+    credential_cache_ttl: float = 0
+    credential_cache_size: int = 10000
+    permission_cache_ttl: float = 0
+    permission_cache_size: int = 10000
 
 
 def _get_auth_config_path() -> str:
@@ -31,4 +35,8 @@ def read_auth_config() -> AuthConfig:
         authorization_function=config["qcflow"].get(
             "authorization_function", "qcflow.server.auth:authenticate_request_basic_auth"
         ),
+        credential_cache_ttl=config["qcflow"].getfloat("credential_cache_ttl", 0),
+        credential_cache_size=config["qcflow"].getint("credential_cache_size", 10000),
+        permission_cache_ttl=config["qcflow"].getfloat("permission_cache_ttl", 0),
+        permission_cache_size=config["qcflow"].getint("permission_cache_size", 10000),
     )
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Callable, NamedTuple, Optional, TypeVar
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, MultipleResultsFound, NoResultFound
 from sqlalchemy.orm import sessionmaker
 from werkzeug.security import check_password_hash, generate_password_hash
@@ -9,7 +10,9 @@ from qcflow.protos.databricks_pb2 import (
     INVALID_STATE,
     RESOURCE_ALREADY_EXISTS,
     RESOURCE_DOES_NOT_EXIST,
+    ErrorCode,
 )
+from qcflow.server.auth.cache import CredentialCache, PermissionCache
 from qcflow.server.auth.db import utils as dbutils
 from qcflow.server.auth.db.models import (
     SqlExperimentPermission,
@@ -22,8 +25,28 @@ from qcflow.store.db.utils import _get_managed_session_maker, create_sqlalchemy_
 from qcflow.utils.uri import extract_db_type_from_uri
 from qcflow.utils.validation import _validate_username
 
+_T = TypeVar("_T")
+
+
+class _MissingPermission(NamedTuple):
+    message: str
+
 
 class SqlAlchemyStore:
+    def __init__(
+        self,
+        credential_cache_ttl: float = 0,
+        credential_cache_size: int = 10000,
+        permission_cache_ttl: float = 0,
+        permission_cache_size: int = 10000,
+    ):
+        # Verified credentials are cached for `credential_cache_ttl` seconds to avoid checking
+        # the password hash on every request. Set it to 0 to disable the cache.
+        self.credential_cache = CredentialCache(credential_cache_ttl, credential_cache_size)
+        # Permissions of users on experiments and registered models are cached for
+        # `permission_cache_ttl` seconds, and invalidated when they are changed through this store
+        self.permission_cache = PermissionCache(permission_cache_ttl, permission_cache_size)
+
     def init_db(self, db_uri):
         self.db_uri = db_uri
         self.db_type = extract_db_type_from_uri(db_uri)
@@ -33,12 +56,19 @@ class SqlAlchemyStore:
         self.ManagedSessionMaker = _get_managed_session_maker(SessionMaker, self.db_type)
 
     def authenticate_user(self, username: str, password: str) -> bool:
+        if self.credential_cache.contains(username, password):
+            return True
+
+        generation = self.credential_cache.generation
         with self.ManagedSessionMaker() as session:
             try:
                 user = self._get_user(session, username)
-                return check_password_hash(user.password_hash, password)
+                authenticated = check_password_hash(user.password_hash, password)
             except QCFlowException:
                 return False
+        if authenticated:
+            self.credential_cache.add(username, password, generation)
+        return authenticated
 
     def create_user(self, username: str, password: str, is_admin: bool = False) -> User:
         _validate_username(username)
@@ -48,12 +78,15 @@ class SqlAlchemyStore:
                 user = SqlUser(username=username, password_hash=pwhash, is_admin=is_admin)
                 session.add(user)
                 session.flush()
-                return user.to_qcflow_entity()
+                entity = user.to_qcflow_entity()
             except IntegrityError as e:
                 raise QCFlowException(
                     f"User (username={username}) already exists. Error: {e}",
                     RESOURCE_ALREADY_EXISTS,
                 ) from e
+        # Forget that the user had no permissions
+        self._invalidate_user_permissions(username)
+        return entity
 
     @staticmethod
     def _get_user(session, username: str) -> SqlUser:
@@ -93,12 +126,37 @@ class SqlAlchemyStore:
                 user.password_hash = pwhash
             if is_admin is not None:
                 user.is_admin = is_admin
-            return user.to_qcflow_entity()
+            entity = user.to_qcflow_entity()
+        if password is not None:
+            self.credential_cache.invalidate(username)
+        return entity
 
     def delete_user(self, username: str):
         with self.ManagedSessionMaker() as session:
             user = self._get_user(session, username)
             session.delete(user)
+        self.credential_cache.invalidate(username)
+        self._invalidate_user_permissions(username)
+
+    def _get_cached_permission(self, key: tuple[str, ...], get_permission: Callable[[], _T]) -> _T:
+        permission = self.permission_cache.get(key)
+        if permission is None:
+            generation = self.permission_cache.generation
+            try:
+                permission = get_permission()
+            except QCFlowException as e:
+                if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                    raise
+                # Cache the absence of a permission too, in which case the default permission
+                # applies
+                permission = _MissingPermission(e.message)
+            self.permission_cache.add(key, permission, generation)
+        if isinstance(permission, _MissingPermission):
+            raise QCFlowException(permission.message, RESOURCE_DOES_NOT_EXIST)
+        return permission
+
+    def _invalidate_user_permissions(self, username: str) -> None:
+        self.permission_cache.invalidate_user(username)
 
     def create_experiment_permission(
         self, experiment_id: str, username: str, permission: str
@@ -112,13 +170,15 @@ class SqlAlchemyStore:
                 )
                 session.add(perm)
                 session.flush()
-                return perm.to_qcflow_entity()
+                entity = perm.to_qcflow_entity()
             except IntegrityError as e:
                 raise QCFlowException(
                     f"Experiment permission (experiment_id={experiment_id}, username={username}) "
                     f"already exists. Error: {e}",
                     RESOURCE_ALREADY_EXISTS,
                 )
+        self.permission_cache.invalidate(("experiment", experiment_id, username))
+        return entity
 
     def _get_experiment_permission(
         self, session, experiment_id: str, username: str
@@ -147,10 +207,13 @@ class SqlAlchemyStore:
             )
 
     def get_experiment_permission(self, experiment_id: str, username: str) -> ExperimentPermission:
-        with self.ManagedSessionMaker() as session:
-            return self._get_experiment_permission(
-                session, experiment_id, username
-            ).to_qcflow_entity()
+        def get_permission():
+            with self.ManagedSessionMaker() as session:
+                return self._get_experiment_permission(
+                    session, experiment_id, username
+                ).to_qcflow_entity()
+
+        return self._get_cached_permission(("experiment", experiment_id, username), get_permission)
 
     def list_experiment_permissions(self, username: str) -> list[ExperimentPermission]:
         with self.ManagedSessionMaker() as session:
@@ -162,6 +225,20 @@ class SqlAlchemyStore:
             )
             return [p.to_qcflow_entity() for p in perms]
 
+    def select_experiment_ids(self, username: str, permissions: list[str]):
+        """
+        Get a query selecting the IDs of the experiments on which the user has one of the
+        specified permissions, to be run in the same database as a tracking store.
+        """
+        return (
+            select(SqlExperimentPermission.experiment_id)
+            .join(SqlUser, SqlExperimentPermission.user_id == SqlUser.id)
+            .where(
+                SqlUser.username == username,
+                SqlExperimentPermission.permission.in_(permissions),
+            )
+        )
+
     def update_experiment_permission(
         self, experiment_id: str, username: str, permission: str
     ) -> ExperimentPermission:
@@ -169,12 +246,15 @@ class SqlAlchemyStore:
         with self.ManagedSessionMaker() as session:
             perm = self._get_experiment_permission(session, experiment_id, username)
             perm.permission = permission
-            return perm.to_qcflow_entity()
+            entity = perm.to_qcflow_entity()
+        self.permission_cache.invalidate(("experiment", experiment_id, username))
+        return entity
 
     def delete_experiment_permission(self, experiment_id: str, username: str):
         with self.ManagedSessionMaker() as session:
             perm = self._get_experiment_permission(session, experiment_id, username)
             session.delete(perm)
+        self.permission_cache.invalidate(("experiment", experiment_id, username))
 
     def create_registered_model_permission(
         self, name: str, username: str, permission: str
@@ -188,13 +268,15 @@ class SqlAlchemyStore:
                 )
                 session.add(perm)
                 session.flush()
-                return perm.to_qcflow_entity()
+                entity = perm.to_qcflow_entity()
             except IntegrityError as e:
                 raise QCFlowException(
                     f"Registered model permission (name={name}, username={username}) "
                     f"already exists. Error: {e}",
                     RESOURCE_ALREADY_EXISTS,
                 )
+        self.permission_cache.invalidate(("registered_model", name, username))
+        return entity
 
     def _get_registered_model_permission(
         self, session, name: str, username: str
@@ -224,8 +306,13 @@ class SqlAlchemyStore:
     def get_registered_model_permission(
         self, name: str, username: str
     ) -> RegisteredModelPermission:
-        with self.ManagedSessionMaker() as session:
-            return self._get_registered_model_permission(session, name, username).to_qcflow_entity()
+        def get_permission():
+            with self.ManagedSessionMaker() as session:
+                return self._get_registered_model_permission(
+                    session, name, username
+                ).to_qcflow_entity()
+
+        return self._get_cached_permission(("registered_model", name, username), get_permission)
 
     def list_registered_model_permissions(self, username: str) -> list[RegisteredModelPermission]:
         with self.ManagedSessionMaker() as session:
@@ -237,6 +324,20 @@ class SqlAlchemyStore:
             )
             return [p.to_qcflow_entity() for p in perms]
 
+    def select_registered_model_names(self, username: str, permissions: list[str]):
+        """
+        Get a query selecting the names of the registered models on which the user has one of
+        the specified permissions, to be run in the same database as a model registry store.
+        """
+        return (
+            select(SqlRegisteredModelPermission.name)
+            .join(SqlUser, SqlRegisteredModelPermission.user_id == SqlUser.id)
+            .where(
+                SqlUser.username == username,
+                SqlRegisteredModelPermission.permission.in_(permissions),
+            )
+        )
+
     def update_registered_model_permission(
         self, name: str, username: str, permission: str
     ) -> RegisteredModelPermission:
@@ -244,9 +345,12 @@ class SqlAlchemyStore:
         with self.ManagedSessionMaker() as session:
             perm = self._get_registered_model_permission(session, name, username)
             perm.permission = permission
-            return perm.to_qcflow_entity()
+            entity = perm.to_qcflow_entity()
+        self.permission_cache.invalidate(("registered_model", name, username))
+        return entity
 
     def delete_registered_model_permission(self, name: str, username: str):
         with self.ManagedSessionMaker() as session:
             perm = self._get_registered_model_permission(session, name, username)
             session.delete(perm)
+        self.permission_cache.invalidate(("registered_model", name, username))
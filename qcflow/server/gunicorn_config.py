@@ -0,0 +1,37 @@
+"""
+The gunicorn configuration of the production mode of the QCFlow server, loaded with
+``gunicorn -c python:qcflow.server.gunicorn_config``.
+
+The application and the backend stores are loaded once in the gunicorn master process before the
+workers are forked, so that the workers share the imported modules and start serving immediately.
+Each worker then discards the database connections it inherited from the master and opens its own
+connections, with the pool settings of the ``QCFLOW_SQLALCHEMYSTORE_*`` environment variables.
+The settings of this module can be overridden with ``--gunicorn-opts``.
+"""
+
+import os
+
+preload_app = True
+worker_class = "gthread"
+threads = 4
+
+
+def when_ready(server):
+    from qcflow.server.handlers import initialize_backend_stores
+
+    initialize_backend_stores()
+
+
+def post_fork(server, worker):
+    from qcflow.store.db.utils import dispose_sqlalchemy_engines_after_fork
+
+    dispose_sqlalchemy_engines_after_fork()
+
+
+def child_exit(server, worker):
+    from qcflow.server import PROMETHEUS_EXPORTER_ENV_VAR
+
+    if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
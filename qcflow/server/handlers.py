@@ -13,7 +13,16 @@ import urllib
 from functools import wraps
 
 import requests
-from flask import Response, current_app, jsonify, request, send_file
+from flask import (
+    Response,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+    jsonify,
+    request,
+    send_file,
+)
 from google.protobuf import descriptor
 from google.protobuf.json_format import ParseError
 
@@ -30,7 +39,11 @@ from qcflow.entities.model_registry import ModelVersionTag, RegisteredModelTag
 from qcflow.entities.multipart_upload import MultipartUploadPart
 from qcflow.entities.trace_info import TraceInfo
 from qcflow.entities.trace_status import TraceStatus
-from qcflow.environment_variables import QCFLOW_DEPLOYMENTS_TARGET
+from qcflow.environment_variables import (
+    QCFLOW_DEPLOYMENTS_TARGET,
+    QCFLOW_SERVER_RESPONSE_CACHE_SIZE,
+    QCFLOW_SERVER_RESPONSE_CACHE_TTL,
+)
 from qcflow.exceptions import QCFlowException, _UnsupportedMultipartUploadException
 from qcflow.models import Model
 from qcflow.protos import databricks_pb2
@@ -110,10 +123,18 @@ from qcflow.protos.service_pb2 import (
     UpdateExperiment,
     UpdateRun,
 )
+from qcflow.server.response_cache import (
+    MODEL_REGISTRY_SCOPE,
+    TRACKING_SCOPE,
+    CachedResponse,
+    ResponseCache,
+)
 from qcflow.server.validation import _validate_content_type
 from qcflow.store.artifact.artifact_repo import MultipartUploadMixin
 from qcflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from qcflow.store.db.db_types import DATABASE_ENGINES
+from qcflow.store.model_registry import GET_MODEL_VERSIONS_MAX_RESULTS
+from qcflow.store.tracking import CHANGE_EVENTS_MAX_RESULTS
 from qcflow.tracing.artifact_utils import (
     TRACE_DATA_FILE_NAME,
     get_artifact_uri_for_trace,
@@ -138,6 +159,7 @@ from qcflow.utils.validation import (
 _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
+_response_cache = None
 _artifact_repo = None
 STATIC_PREFIX_ENV_VAR = "_QCFLOW_STATIC_PREFIX"
 MAX_RUNS_GET_METRIC_HISTORY_BULK = 100
@@ -336,6 +358,16 @@ def _get_proxied_run_artifact_destination_path(proxied_artifact_root, relative_p
     )
 
 
+def _instrument_store(store, store_type):
+    from qcflow.server import PROMETHEUS_EXPORTER_ENV_VAR
+
+    # The latencies of the store methods are exported with the other metrics of the server
+    if os.environ.get(PROMETHEUS_EXPORTER_ENV_VAR):
+        from qcflow.server.prometheus_exporter import instrument_store
+
+        instrument_store(store, store_type)
+
+
 def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     from qcflow.server import ARTIFACT_ROOT_ENV_VAR, BACKEND_STORE_URI_ENV_VAR
 
@@ -344,6 +376,7 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
         _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        _instrument_store(_tracking_store, "tracking")
         utils.set_tracking_uri(store_uri)
     return _tracking_store
 
@@ -359,6 +392,7 @@ def _get_model_registry_store(registry_store_uri=None):
             or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         )
         _model_registry_store = _model_registry_store_registry.get_store(store_uri)
+        _instrument_store(_model_registry_store, "model_registry")
         registry_utils.set_registry_uri(store_uri)
     return _model_registry_store
 
@@ -616,6 +650,91 @@ def _disable_if_artifacts_only(func):
     return wrapper
 
 
+# The endpoints of the read requests sent with the POST method, which don't invalidate the
+# response cache. The operations of the GraphQL API, including its mutations, are all reads.
+_READ_POST_ENDPOINTS = {"_search_experiments", "_search_runs", "_get_latest_versions", "_graphql"}
+
+
+def _get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            ttl=QCFLOW_SERVER_RESPONSE_CACHE_TTL.get(),
+            max_size=QCFLOW_SERVER_RESPONSE_CACHE_SIZE.get(),
+        )
+    return _response_cache
+
+
+def _get_response_cache_scope(path):
+    if "/registered-models/" in path or "/model-versions/" in path:
+        return MODEL_REGISTRY_SCOPE
+    return TRACKING_SCOPE
+
+
+def invalidate_response_cache():
+    """
+    Invalidate the responses cached for the scope of the current request if it is a write
+    request. Registered to run both before and after every request, so that the responses computed
+    while the changes are being made are not cached either.
+    """
+    if request.method in ("GET", "HEAD", "OPTIONS") or request.endpoint in _READ_POST_ENDPOINTS:
+        return
+    cache = _get_response_cache()
+    if cache.enabled:
+        cache.invalidate(_get_response_cache_scope(request.path))
+
+
+def _make_conditional(response, etag=None):
+    if etag is None:
+        response.add_etag()
+    else:
+        response.set_etag(etag)
+    # Make clients revalidate the response instead of reusing it without a request
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _cached_conditional_response(func):
+    """
+    Make a read handler return its response with an ETag, answering the requests whose
+    ``If-None-Match`` header matches it with an empty ``304 Not Modified`` response, and cache the
+    response in-process if ``QCFLOW_SERVER_RESPONSE_CACHE_TTL`` is set.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not has_request_context():
+            return func(*args, **kwargs)
+
+        cache = _get_response_cache()
+        # The searches restricted by the access filter of the sender are specific to the sender
+        if not cache.enabled or _get_search_access_filter() is not None:
+            response = func(*args, **kwargs)
+            return _make_conditional(response) if response.status_code == 200 else response
+
+        scope = _get_response_cache_scope(request.path)
+        key = (
+            request.method,
+            request.path,
+            tuple(sorted(request.args.items(multi=True))),
+            request.get_data(),
+        )
+        cached, generation = cache.get(scope, key)
+        if cached is not None:
+            response = Response(cached.data, mimetype="application/json")
+            return _make_conditional(response, cached.etag)
+
+        response = func(*args, **kwargs)
+        if response.status_code != 200:
+            return response
+        response.add_etag()
+        etag, _ = response.get_etag()
+        cache.put(scope, key, generation, CachedResponse(response.get_data(), etag))
+        return _make_conditional(response, etag)
+
+    return wrapper
+
+
 @catch_qcflow_exception
 def get_artifact_handler():
     run_id = request.args.get("run_id") or request.args.get("run_uuid")
@@ -679,6 +798,7 @@ def _create_experiment():
 
 @catch_qcflow_exception
 @_disable_if_artifacts_only
+@_cached_conditional_response
 def _get_experiment():
     request_message = _get_request_message(
         GetExperiment(), schema={"experiment_id": [_assert_required, _assert_string]}
@@ -988,6 +1108,7 @@ def get_run_impl(request_message):
 
 @catch_qcflow_exception
 @_disable_if_artifacts_only
+@_cached_conditional_response
 def _search_runs():
     request_message = _get_request_message(
         SearchRuns(),
@@ -1104,6 +1225,7 @@ def _list_artifacts_for_proxied_run_artifact_root(proxied_artifact_root, relativ
 
 @catch_qcflow_exception
 @_disable_if_artifacts_only
+@_cached_conditional_response
 def _get_metric_history():
     request_message = _get_request_message(
         GetMetricHistory(),
@@ -1533,6 +1655,24 @@ def upload_artifact_handler():
     return Response(mimetype="application/json")
 
 
+def _get_search_access_filter():
+    """
+    Get the :py:class:`AccessFilter <qcflow.store.entities.AccessFilter>` set for the current
+    request by a server plugin, e.g. the basic auth plugin, to restrict a search to the resources
+    readable by the sender, or None.
+    """
+    if not has_app_context():
+        return None
+    return g.get("search_access_filter")
+
+
+def _get_search_access_filter_kwargs():
+    # Only the stores supporting access filters receive the argument
+    if (access_filter := _get_search_access_filter()) is not None:
+        return {"access_filter": access_filter}
+    return {}
+
+
 @catch_qcflow_exception
 @_disable_if_artifacts_only
 def _search_experiments():
@@ -1552,6 +1692,7 @@ def _search_experiments():
         order_by=request_message.order_by,
         filter_string=request_message.filter,
         page_token=request_message.page_token,
+        **_get_search_access_filter_kwargs(),
     )
     response_message = SearchExperiments.Response()
     response_message.experiments.extend([e.to_proto() for e in experiment_entities])
@@ -1646,6 +1787,15 @@ def _wrap_response(response_message):
     return response
 
 
+def _wrap_conditional_response(response_message):
+    """
+    Wrap the response of a GET request with an ETag computed from its content, so that clients
+    polling for changes can send it in an ``If-None-Match`` header and get an empty
+    ``304 Not Modified`` response while the content is unchanged.
+    """
+    return _make_conditional(_wrap_response(response_message))
+
+
 # Model Registry APIs
 
 
@@ -1730,6 +1880,7 @@ def _delete_registered_model():
 
 @catch_qcflow_exception
 @_disable_if_artifacts_only
+@_cached_conditional_response
 def _search_registered_models():
     request_message = _get_request_message(
         SearchRegisteredModels(),
@@ -1749,6 +1900,7 @@ def _search_registered_models():
         max_results=request_message.max_results,
         order_by=request_message.order_by,
         page_token=request_message.page_token,
+        **_get_search_access_filter_kwargs(),
     )
     response_message = SearchRegisteredModels.Response()
     response_message.registered_models.extend([e.to_proto() for e in registered_models])
@@ -1772,7 +1924,7 @@ def _get_latest_versions():
     )
     response_message = GetLatestVersions.Response()
     response_message.model_versions.extend([e.to_proto() for e in latest_versions])
-    return _wrap_response(response_message)
+    return _wrap_conditional_response(response_message)
 
 
 @catch_qcflow_exception
@@ -2007,7 +2159,7 @@ def _get_model_version_download_uri():
         name=request_message.name, version=request_message.version
     )
     response_message = GetModelVersionDownloadUri.Response(artifact_uri=download_uri)
-    return _wrap_response(response_message)
+    return _wrap_conditional_response(response_message)
 
 
 @catch_qcflow_exception
@@ -2132,7 +2284,90 @@ def _get_model_version_by_alias():
     )
     response_proto = model_version.to_proto()
     response_message = GetModelVersionByAlias.Response(model_version=response_proto)
-    return _wrap_response(response_message)
+    return _wrap_conditional_response(response_message)
+
+
+@catch_qcflow_exception
+@_disable_if_artifacts_only
+def get_model_versions_handler():
+    """
+    Get multiple model versions, each specified by the ``name`` of its registered model and
+    either its ``version`` or an ``alias``. The model versions that do not exist are null in the
+    response.
+    """
+    _validate_content_type(request, ["application/json"])
+    lookups = request.json.get("model_versions")
+    if not isinstance(lookups, list) or not lookups:
+        raise QCFlowException(
+            message="GetModelVersions request must specify a list of model_versions.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if len(lookups) > GET_MODEL_VERSIONS_MAX_RESULTS:
+        raise QCFlowException(
+            message=(
+                f"GetModelVersions request cannot specify more than "
+                f"{GET_MODEL_VERSIONS_MAX_RESULTS} model_versions. "
+                f"Received {len(lookups)} model_versions."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    model_versions = []
+    for lookup in lookups:
+        if (
+            not isinstance(lookup, dict)
+            or not is_string_type(lookup.get("name"))
+            or ("version" in lookup) == ("alias" in lookup)
+        ):
+            raise QCFlowException(
+                message=(
+                    "Each model version of a GetModelVersions request must specify a name and "
+                    f"either a version or an alias. Received {lookup}."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        model_versions.append((lookup["name"], lookup.get("version", lookup.get("alias"))))
+
+    results = _get_model_registry_store().get_model_versions(model_versions)
+    return {
+        "model_versions": [
+            json.loads(message_to_json(model_version.to_proto())) if model_version else None
+            for model_version in results
+        ]
+    }
+
+
+@catch_qcflow_exception
+@_disable_if_artifacts_only
+def get_change_events_handler():
+    """
+    Read the change feed after the ``page_token``. If there are no new events, the request waits
+    up to ``timeout_seconds`` for new events, so that clients can long-poll the feed instead of
+    repeatedly searching runs and model versions. Each waiting request occupies a server worker.
+    """
+    args = request.args
+
+    def parse_number(name, parse, default):
+        value = args.get(name)
+        if value is None:
+            return default
+        try:
+            return parse(value)
+        except ValueError:
+            raise QCFlowException(
+                message=f"GetChangeEvents request has an invalid {name}: '{value}'.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+    events = _get_tracking_store().get_change_events(
+        entity_types=args.getlist("entity_types") or None,
+        page_token=args.get("page_token"),
+        max_results=parse_number("max_results", int, CHANGE_EVENTS_MAX_RESULTS),
+        timeout_seconds=parse_number("timeout_seconds", float, 0),
+    )
+    return {
+        "events": [event.to_dictionary() for event in events],
+        "next_page_token": events.token,
+    }
 
 
 # QCFlow Artifacts APIs
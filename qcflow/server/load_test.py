@@ -0,0 +1,164 @@
+"""
+A load test of the QCFlow tracking server, which measures the throughput and the latencies of the
+``log_batch`` and ``search_runs`` requests sent by concurrent clients.
+"""
+
+import functools
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from qcflow.entities import Metric
+from qcflow.tracking import QCFlowClient
+
+LOG_BATCH = "log_batch"
+SEARCH_RUNS = "search_runs"
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+@dataclass
+class OperationStats:
+    """
+    The statistics of an operation of a load test.
+
+    Args:
+        name: The name of the operation, e.g. ``log_batch``.
+        latencies: The latencies of the successful requests, in seconds.
+        errors: The number of failed requests.
+    """
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    def percentile(self, q: float) -> float:
+        """
+        The ``q`` quantile of the latencies, in seconds, e.g. ``0.99`` for the 99th percentile.
+        """
+        return _percentile(sorted(self.latencies), q)
+
+
+@dataclass
+class LoadTestResult:
+    """
+    The result of :py:func:`run_load_test`.
+
+    Args:
+        duration: The duration of the load test, in seconds.
+        batch_size: The number of metrics logged by each ``log_batch`` request.
+        operations: The statistics of each operation, by name.
+    """
+
+    duration: float
+    batch_size: int
+    operations: dict[str, OperationStats]
+
+    def throughput(self, name: str) -> float:
+        """
+        The number of successful requests of an operation per second.
+        """
+        return self.operations[name].count / self.duration if self.duration > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"Duration: {self.duration:.1f}s",
+            f"{'operation':<12} {'requests':>9} {'errors':>7} {'req/s':>9} "
+            f"{'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9}",
+        ]
+        for name, stats in self.operations.items():
+            latencies = sorted(stats.latencies)
+            lines.append(
+                f"{name:<12} {stats.count:>9} {stats.errors:>7} {self.throughput(name):>9.1f} "
+                + " ".join(f"{_percentile(latencies, q) * 1000:>9.1f}" for q in (0.5, 0.95, 0.99))
+            )
+        metrics_per_second = self.throughput(LOG_BATCH) * self.batch_size
+        lines.append(f"Logged metrics/s: {metrics_per_second:.1f}")
+        return "\n".join(lines)
+
+
+def run_load_test(
+    tracking_uri: Optional[str] = None,
+    duration: float = 30,
+    concurrency: int = 8,
+    batch_size: int = 100,
+    search_ratio: float = 0.1,
+) -> LoadTestResult:
+    """
+    Run a load test against a tracking server.
+
+    Each of the ``concurrency`` threads creates a run in a new experiment, then sends requests
+    for ``duration`` seconds: with a probability of ``search_ratio`` a ``search_runs`` request for
+    the runs of the experiment, otherwise a ``log_batch`` request logging ``batch_size`` metrics.
+    The experiment is deleted at the end of the test.
+
+    Args:
+        tracking_uri: The tracking URI of the server, e.g. ``http://localhost:5000``. If not
+            specified, the current tracking URI is used.
+        duration: The number of seconds to send requests for.
+        concurrency: The number of threads sending requests.
+        batch_size: The number of metrics logged by each ``log_batch`` request.
+        search_ratio: The proportion of the requests that are ``search_runs`` requests.
+
+    Returns:
+        A :py:class:`LoadTestResult`.
+    """
+    client = QCFlowClient(tracking_uri)
+    experiment_id = client.create_experiment(f"qcflow-load-test-{uuid.uuid4().hex}")
+    operations = {LOG_BATCH: OperationStats(LOG_BATCH), SEARCH_RUNS: OperationStats(SEARCH_RUNS)}
+    lock = threading.Lock()
+
+    def worker(index):
+        rng = random.Random(index)
+        run_id = client.create_run(experiment_id).info.run_id
+        latencies = {LOG_BATCH: [], SEARCH_RUNS: []}
+        errors = dict.fromkeys(latencies, 0)
+        step = 0
+        while time.monotonic() < deadline:
+            if rng.random() < search_ratio:
+                name = SEARCH_RUNS
+                request = functools.partial(client.search_runs, [experiment_id], max_results=100)
+            else:
+                name = LOG_BATCH
+                timestamp = int(time.time() * 1000)
+                metrics = [
+                    Metric(f"metric_{i}", rng.random(), timestamp, step) for i in range(batch_size)
+                ]
+                step += 1
+                request = functools.partial(client.log_batch, run_id, metrics=metrics)
+            start = time.monotonic()
+            try:
+                request()
+            except Exception:
+                errors[name] += 1
+            else:
+                latencies[name].append(time.monotonic() - start)
+        with lock:
+            for name, stats in operations.items():
+                stats.latencies.extend(latencies[name])
+                stats.errors += errors[name]
+
+    try:
+        start = time.monotonic()
+        deadline = start + duration
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+    finally:
+        client.delete_experiment(experiment_id)
+
+    return LoadTestResult(elapsed, batch_size, operations)
@@ -1,17 +1,222 @@
-from flask import request
+import inspect
+import logging
+import time
+from functools import wraps
+
+from flask import g, has_app_context, request
+from prometheus_client import Counter, Histogram
 from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
+from qcflow.environment_variables import QCFLOW_SERVER_SLOW_REQUEST_THRESHOLD
 from qcflow.version import VERSION
 
+_logger = logging.getLogger(__name__)
+
+_EXCLUDED_PATHS = ["/health", "/version", "/metrics"]
+
+# The endpoints transferring the content of artifacts
+_ARTIFACT_DOWNLOAD_ENDPOINTS = {
+    "_download_artifact",
+    "serve_artifacts",
+    "serve_model_version_artifact",
+    "serve_get_trace_artifact",
+}
+_ARTIFACT_UPLOAD_ENDPOINTS = {"_upload_artifact", "serve_upload_artifact"}
+
+_DB_QUERIES_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float("inf"))
+
+REQUEST_DURATION = Histogram(
+    "qcflow_endpoint_request_duration_seconds",
+    "The duration of the requests of each endpoint.",
+    ["endpoint", "method", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "qcflow_endpoint_request_db_queries",
+    "The number of database queries executed by the requests of each endpoint.",
+    ["endpoint"],
+    buckets=_DB_QUERIES_BUCKETS,
+)
+REQUEST_DB_QUERY_DURATION = Histogram(
+    "qcflow_endpoint_request_db_query_duration_seconds",
+    "The total duration of the database queries executed by the requests of each endpoint.",
+    ["endpoint"],
+)
+STORE_METHOD_DURATION = Histogram(
+    "qcflow_store_method_duration_seconds",
+    "The duration of the calls of the methods of the backend stores.",
+    ["store", "method"],
+)
+ARTIFACT_BYTES = Counter(
+    "qcflow_artifact_bytes",
+    "The number of bytes of artifacts uploaded to and downloaded from the server.",
+    ["direction"],
+)
+
+
+class _RequestStats:
+    """
+    The statistics of the database queries and store method calls of a request.
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.db_queries = 0
+        self.db_query_duration = 0.0
+        # The number of calls and the total duration of each store method
+        self.store_methods = {}
+
+    def record_store_method(self, name, duration):
+        count, total = self.store_methods.get(name, (0, 0.0))
+        self.store_methods[name] = (count + 1, total + duration)
+
+
+def _get_request_stats():
+    if not has_app_context():
+        return None
+    return g.get("qcflow_request_stats")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._qcflow_query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, "_qcflow_query_start_time", None)
+    if start_time is not None and (stats := _get_request_stats()) is not None:
+        stats.db_queries += 1
+        stats.db_query_duration += time.perf_counter() - start_time
+
+
+def _timed_store_method(store_type, name, method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start_time
+            STORE_METHOD_DURATION.labels(store_type, name).observe(duration)
+            if (stats := _get_request_stats()) is not None:
+                stats.record_store_method(f"{store_type}.{name}", duration)
+
+    return wrapper
+
+
+def instrument_store(store, store_type):
+    """
+    Record the duration of the calls of the public methods of a backend store.
+
+    Args:
+        store: The store, whose methods are replaced by timed ones.
+        store_type: The type of the store, e.g. ``tracking`` or ``model_registry``.
+    """
+    if getattr(store, "_qcflow_instrumented", False):
+        return
+    for name, _ in inspect.getmembers(type(store), inspect.isfunction):
+        if not name.startswith("_"):
+            setattr(store, name, _timed_store_method(store_type, name, getattr(store, name)))
+    store._qcflow_instrumented = True
+
+
+def _iter_counting_artifact_bytes(iterable):
+    num_bytes = 0
+    try:
+        for chunk in iterable:
+            num_bytes += len(chunk)
+            yield chunk
+    finally:
+        ARTIFACT_BYTES.labels("download").inc(num_bytes)
+        if hasattr(iterable, "close"):
+            iterable.close()
+
+
+def _record_artifact_bytes(response):
+    if request.endpoint in _ARTIFACT_UPLOAD_ENDPOINTS:
+        if request.content_length:
+            ARTIFACT_BYTES.labels("upload").inc(request.content_length)
+    elif request.endpoint in _ARTIFACT_DOWNLOAD_ENDPOINTS and response.status_code == 200:
+        if response.content_length is not None:
+            ARTIFACT_BYTES.labels("download").inc(response.content_length)
+        else:
+            # Count the bytes of streamed responses as they are sent
+            response.response = _iter_counting_artifact_bytes(response.response)
+
+
+def _log_slow_request(stats, endpoint, status, duration):
+    store_methods = ", ".join(
+        f"{name} x{count} {total:.3f}s"
+        for name, (count, total) in sorted(
+            stats.store_methods.items(), key=lambda item: item[1][1], reverse=True
+        )
+    )
+    _logger.warning(
+        "Slow request: %s %s (%s) returned %s in %.3fs, with %d database queries taking %.3fs. "
+        "Store methods: %s",
+        request.method,
+        request.path,
+        endpoint,
+        status,
+        duration,
+        stats.db_queries,
+        stats.db_query_duration,
+        store_methods or "none",
+    )
+
+
+def _start_request_instrumentation():
+    g.qcflow_request_stats = _RequestStats()
+
+
+def _finish_request_instrumentation(response):
+    stats = g.pop("qcflow_request_stats", None)
+    if stats is None or request.path in _EXCLUDED_PATHS:
+        return response
+
+    duration = time.perf_counter() - stats.start_time
+    endpoint = request.endpoint or "unknown"
+    REQUEST_DURATION.labels(endpoint, request.method, response.status_code).observe(duration)
+    REQUEST_DB_QUERIES.labels(endpoint).observe(stats.db_queries)
+    REQUEST_DB_QUERY_DURATION.labels(endpoint).observe(stats.db_query_duration)
+    _record_artifact_bytes(response)
+
+    threshold = QCFLOW_SERVER_SLOW_REQUEST_THRESHOLD.get()
+    if threshold is not None and duration >= threshold:
+        _log_slow_request(stats, endpoint, response.status_code, duration)
+    return response
+
+
+def activate_request_instrumentation(app):
+    """
+    Record the latencies, database queries and artifact bytes of the requests handled by the app,
+    and the latencies of the methods of the backend stores.
+    """
+    from qcflow.server import handlers
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    app.before_request(_start_request_instrumentation)
+    app.after_request(_finish_request_instrumentation)
+    # The stores created later are instrumented by the handlers
+    if handlers._tracking_store is not None:
+        instrument_store(handlers._tracking_store, "tracking")
+    if handlers._model_registry_store is not None:
+        instrument_store(handlers._model_registry_store, "model_registry")
+
 
 def activate_prometheus_exporter(app):
     def qcflow_version(_: request):
         return VERSION
 
-    return GunicornInternalPrometheusMetrics(
+    metrics = GunicornInternalPrometheusMetrics(
         app,
         export_defaults=True,
         defaults_prefix="qcflow",
         excluded_paths=["/health", "/version"],
         group_by=qcflow_version,
     )
+    activate_request_instrumentation(app)
+    return metrics
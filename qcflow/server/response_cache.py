@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+TRACKING_SCOPE = "tracking"
+MODEL_REGISTRY_SCOPE = "model_registry"
+
+
+class CachedResponse(NamedTuple):
+    data: bytes
+    etag: str
+
+
+class _CacheEntry(NamedTuple):
+    scope: str
+    generation: int
+    expires_at: float
+    response: CachedResponse
+
+
+class ResponseCache:
+    """
+    An in-process cache of the responses of the read endpoints of the tracking server.
+
+    The responses are cached by scope, either :py:data:`TRACKING_SCOPE` or
+    :py:data:`MODEL_REGISTRY_SCOPE`. Each scope has a generation that is bumped by the write
+    requests handled by the process, before and after the change, so that a response is only
+    returned while the generation of its scope is the one it was computed with. The changes made
+    by other processes, e.g. the other workers of the server, are visible after at most ``ttl``
+    seconds.
+
+    Args:
+        ttl: The number of seconds a response is kept. A non-positive value disables the cache.
+        max_size: The maximum number of responses to keep.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def invalidate(self, scope: str) -> None:
+        """
+        Invalidate the responses cached for a scope.
+        """
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def get(self, scope: str, key: Hashable) -> tuple[Optional[CachedResponse], int]:
+        """
+        Get the response cached for a key, or None, and the current generation of the scope, to
+        pass to :py:meth:`put` with the response computed on a miss.
+        """
+        with self._lock:
+            generation = self._generations.get(scope, 0)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.generation == generation and entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry.response, generation
+                del self._entries[key]
+        return None, generation
+
+    def put(self, scope: str, key: Hashable, generation: int, response: CachedResponse) -> None:
+        """
+        Cache a response computed while the scope had the specified generation.
+        """
+        with self._lock:
+            # Skip the responses computed while the scope was being changed, which may be stale
+            if self._generations.get(scope, 0) != generation:
+                return
+            self._entries[key] = _CacheEntry(
+                scope, generation, time.monotonic() + self.ttl, response
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,10 @@
+from uvicorn.workers import UvicornWorker
+
+
+class QCFlowUvicornWorker(UvicornWorker):
+    """
+    A gunicorn worker serving the QCFlow server with uvicorn. The server is a WSGI application,
+    whose requests uvicorn handles in a thread pool.
+    """
+
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "interface": "wsgi"}
@@ -24,7 +24,11 @@ from qcflow.protos.databricks_pb2 import (
     INVALID_PARAMETER_VALUE,
     RESOURCE_DOES_NOT_EXIST,
 )
-from qcflow.tracing.artifact_utils import TRACE_DATA_FILE_NAME
+from qcflow.tracing.artifact_utils import (
+    TRACE_DATA_FILE_NAME,
+    TRACE_SPAN_BATCH_DIR,
+    get_trace_span_batch_file_name,
+)
 from qcflow.utils.annotations import developer_stable
 from qcflow.utils.async_logging.async_artifacts_logging_queue import (
     AsyncArtifactsLoggingQueue,
@@ -379,6 +383,43 @@ class ArtifactRepository:
         with write_local_temp_trace_data_file(trace_data) as temp_file:
             self.log_artifact(temp_file)
 
+    def download_trace_span_batch(self, batch_index: int) -> dict[str, Any]:
+        """
+        Download a batch of spans exported incrementally before the root span of the trace ended.
+
+        Args:
+            batch_index: The index of the span batch.
+
+        Returns:
+            The span batch as a dictionary with a ``spans`` field.
+
+        Raises:
+            - `QCFlowTraceDataNotFound`: The span batch is not found.
+            - `QCFlowTraceDataCorrupted`: The span batch is corrupted.
+        """
+        batch_file_name = get_trace_span_batch_file_name(batch_index)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = Path(temp_dir, posixpath.basename(batch_file_name))
+            try:
+                self._download_file(batch_file_name, temp_file)
+            except Exception as e:
+                raise QCFlowTraceDataNotFound(artifact_path=batch_file_name) from e
+            return try_read_trace_data(temp_file)
+
+    def upload_trace_span_batch(self, span_batch: str, batch_index: int) -> None:
+        """
+        Upload a batch of spans of an in-flight trace.
+
+        Args:
+            span_batch: The json-serialized span batch to upload.
+            batch_index: The index of the span batch.
+        """
+        batch_file_name = posixpath.basename(get_trace_span_batch_file_name(batch_index))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = Path(temp_dir, batch_file_name)
+            temp_file.write_text(span_batch)
+            self.log_artifact(temp_file, TRACE_SPAN_BATCH_DIR)
+
 
 @contextmanager
 def write_local_temp_trace_data_file(trace_data: str):
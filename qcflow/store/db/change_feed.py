@@ -0,0 +1,139 @@
+"""
+The change feed of the SQL tracking and model registry stores.
+
+The stores record an event in the ``change_events`` table in the transaction of every change of an
+experiment, run, registered model, model version or alias, so that clients can wait for new events
+instead of repeatedly searching the entities. The sequences of the events are assigned by the
+database and are used as page tokens to resume reading the feed.
+
+The sequences are assigned when the events are inserted, not when their transactions commit, so a
+reader could see an event before a concurrent transaction commits an event with a lower sequence,
+and would then skip that event when resuming after the first one. To avoid this, the events are
+only returned once they are older than ``QCFLOW_CHANGE_FEED_COMMIT_LAG``, and never after a more
+recent event. No event is skipped as long as the write transactions commit within that duration.
+"""
+
+import json
+import time
+from typing import Any, Optional
+
+from qcflow.entities.change_event import ChangeEntityType, ChangeEvent
+from qcflow.environment_variables import (
+    QCFLOW_CHANGE_FEED_COMMIT_LAG,
+    QCFLOW_CHANGE_FEED_POLL_INTERVAL,
+    QCFLOW_ENABLE_CHANGE_FEED,
+)
+from qcflow.exceptions import QCFlowException
+from qcflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from qcflow.store.entities.paged_list import PagedList
+from qcflow.store.tracking import CHANGE_EVENTS_MAX_RESULTS, CHANGE_EVENTS_MAX_TIMEOUT_SECONDS
+from qcflow.store.tracking.dbmodels.models import SqlChangeEvent
+from qcflow.utils.time import get_current_time_millis
+
+
+def record_change_event(
+    session, entity_type: str, entity_id: str, op: str, data: Optional[dict[str, Any]] = None
+) -> None:
+    """
+    Record a change event in the session, if the change feed is enabled.
+    """
+    if not QCFLOW_ENABLE_CHANGE_FEED.get():
+        return
+    session.add(
+        SqlChangeEvent(
+            timestamp=get_current_time_millis(),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            op=op,
+            data=json.dumps(data) if data else None,
+        )
+    )
+
+
+def _parse_page_token(page_token: Optional[str]) -> int:
+    if not page_token:
+        return 0
+    try:
+        sequence = int(page_token)
+    except ValueError:
+        sequence = -1
+    if sequence < 0:
+        raise QCFlowException(
+            f"Invalid page token '{page_token}' for the change feed.", INVALID_PARAMETER_VALUE
+        )
+    return sequence
+
+
+def _validate_get_change_events_params(entity_types, max_results, timeout_seconds):
+    for entity_type in entity_types or []:
+        if not ChangeEntityType.is_valid(entity_type):
+            raise QCFlowException(
+                f"Invalid entity type '{entity_type}' for the change feed. Valid types are "
+                f"{sorted(ChangeEntityType._VALID_TYPES)}.",
+                INVALID_PARAMETER_VALUE,
+            )
+    if not isinstance(max_results, int) or not 0 < max_results <= CHANGE_EVENTS_MAX_RESULTS:
+        raise QCFlowException(
+            f"Invalid value {max_results} for parameter 'max_results' supplied. It must be a "
+            f"positive integer at most {CHANGE_EVENTS_MAX_RESULTS}.",
+            INVALID_PARAMETER_VALUE,
+        )
+    if not 0 <= timeout_seconds <= CHANGE_EVENTS_MAX_TIMEOUT_SECONDS:
+        raise QCFlowException(
+            f"Invalid value {timeout_seconds} for parameter 'timeout_seconds' supplied. It must "
+            f"be between 0 and {CHANGE_EVENTS_MAX_TIMEOUT_SECONDS}.",
+            INVALID_PARAMETER_VALUE,
+        )
+
+
+def _get_committed_events(sql_events) -> list[ChangeEvent]:
+    """
+    Convert the events ordered by sequence, up to the first one recorded within the commit lag,
+    which may still be preceded by uncommitted events.
+    """
+    max_timestamp = get_current_time_millis() - int(QCFLOW_CHANGE_FEED_COMMIT_LAG.get() * 1000)
+    events = []
+    for sql_event in sql_events:
+        if sql_event.timestamp > max_timestamp:
+            break
+        events.append(sql_event.to_qcflow_entity())
+    return events
+
+
+def get_change_events(
+    session_maker,
+    entity_types: Optional[list[str]] = None,
+    page_token: Optional[str] = None,
+    max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+    timeout_seconds: float = 0,
+) -> PagedList[ChangeEvent]:
+    """
+    Read the events recorded after the page token, waiting up to ``timeout_seconds`` for new
+    events if there are none. See ``AbstractStore.get_change_events``.
+
+    Args:
+        session_maker: The managed session maker of the store.
+        entity_types: The types of the entities whose events to return, or None for all types.
+        page_token: The token of the last read event, or None to read from the beginning.
+        max_results: Maximum number of events to return.
+        timeout_seconds: Maximum number of seconds to wait for new events when there are no
+            events after the page token.
+    """
+    _validate_get_change_events_params(entity_types, max_results, timeout_seconds)
+    after_sequence = _parse_page_token(page_token)
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        with session_maker() as session:
+            query = session.query(SqlChangeEvent).filter(SqlChangeEvent.sequence > after_sequence)
+            if entity_types:
+                query = query.filter(SqlChangeEvent.entity_type.in_(entity_types))
+            events = _get_committed_events(
+                query.order_by(SqlChangeEvent.sequence).limit(max_results)
+            )
+        remaining = deadline - time.monotonic()
+        if events or remaining <= 0:
+            break
+        time.sleep(min(QCFLOW_CHANGE_FEED_POLL_INTERVAL.get(), remaining))
+
+    token = events[-1].token if events else str(after_sequence)
+    return PagedList(events, token)
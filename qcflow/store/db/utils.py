@@ -1,6 +1,7 @@
 import logging
 import os
 import time
+import weakref
 from contextlib import contextmanager
 
 import sqlalchemy
@@ -57,6 +58,10 @@ _logger = logging.getLogger(__name__)
 
 MAX_RETRY_COUNT = 10
 
+# The engines created by `create_sqlalchemy_engine`, which must be disposed of in the processes
+# forked after they were created, e.g. the workers of a server preloading the stores
+_engines = weakref.WeakSet()
+
 
 def _get_package_dir():
     """Returns directory containing QCFlow python package."""
@@ -262,7 +267,7 @@ def create_sqlalchemy_engine(db_uri):
     # Some engine does not support them (for example sqllite)
     if pool_size:
         pool_kwargs["pool_size"] = pool_size
-    if pool_max_overflow:
+    if pool_max_overflow is not None:
         pool_kwargs["max_overflow"] = pool_max_overflow
     if pool_recycle:
         pool_kwargs["pool_recycle"] = pool_recycle
@@ -289,4 +294,51 @@ def create_sqlalchemy_engine(db_uri):
         pool_kwargs["poolclass"] = pool_class_map[poolclass]
     if pool_kwargs:
         _logger.info("Create SQLAlchemy engine with pool options %s", pool_kwargs)
-    return sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **pool_kwargs)
+    engine = sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **pool_kwargs)
+    _engines.add(engine)
+    return engine
+
+
+def dispose_sqlalchemy_engines_after_fork():
+    """
+    Discard the connections that a forked process inherited from the pools of the engines created
+    by its parent, without closing them, so that the process opens its own connections instead of
+    sharing the sockets of the parent.
+    """
+    for engine in list(_engines):
+        engine.dispose(close=False)
+
+
+def _get_access_filter_clauses(access_filter, column, id_type=str):
+    """
+    Get the clauses restricting a query to the resources allowed by an
+    :py:class:`AccessFilter <qcflow.store.entities.AccessFilter>`.
+
+    Args:
+        access_filter: The access filter, or None.
+        column: The column identifying the resources.
+        id_type: The Python type of the identifiers stored in the column. The identifiers of a
+            collection that cannot be converted to this type match no resource.
+    """
+    if access_filter is None:
+        return []
+
+    def in_clause(ids):
+        if isinstance(ids, sql.Select):
+            # Compare as strings, because the identifiers may be stored with another type in the
+            # queried table
+            return sqlalchemy.cast(column, sqlalchemy.String).in_(ids)
+        converted_ids = []
+        for id_ in ids:
+            try:
+                converted_ids.append(id_type(id_))
+            except ValueError:
+                pass
+        return column.in_(converted_ids)
+
+    clauses = []
+    if access_filter.allowed is not None:
+        clauses.append(in_clause(access_filter.allowed))
+    if access_filter.denied is not None:
+        clauses.append(sqlalchemy.not_(in_clause(access_filter.denied)))
+    return clauses
@@ -0,0 +1,71 @@
+"""add trace span tables
+
+Revision ID: 3f2a9c1d7e5b
+Revises: 0584bdc529eb
+Create Date: 2026-10-19 10:12:41.381214
+
+"""
+from alembic import op
+from qcflow.store.tracking.dbmodels.models import SqlTraceInfo, SqlTraceSpan, SqlTraceSpanAttribute
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7e5b'
+down_revision = '0584bdc529eb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        SqlTraceSpan.__tablename__,
+        sa.Column(
+            "request_id",
+            sa.String(length=50),
+            sa.ForeignKey(
+                column=SqlTraceInfo.request_id,
+                name=f"fk_{SqlTraceSpan.__tablename__}_request_id",
+                ondelete="CASCADE",
+            ),
+            nullable=False,
+        ),
+        sa.Column("span_id", sa.String(length=50), nullable=False),
+        sa.Column("parent_span_id", sa.String(length=50), nullable=True),
+        sa.Column("name", sa.String(length=500), nullable=True),
+        sa.Column("span_type", sa.String(length=500), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("duration_ms", sa.BigInteger(), nullable=True),
+        sa.PrimaryKeyConstraint("request_id", "span_id", name="trace_spans_pk"),
+        sa.Index(
+            f"index_{SqlTraceSpan.__tablename__}_span_type_duration_ms",
+            "span_type",
+            "duration_ms",
+            unique=False,
+        ),
+        sa.Index(f"index_{SqlTraceSpan.__tablename__}_name", "name", unique=False),
+    )
+    op.create_table(
+        SqlTraceSpanAttribute.__tablename__,
+        sa.Column(
+            "request_id",
+            sa.String(length=50),
+            sa.ForeignKey(
+                column=SqlTraceInfo.request_id,
+                name=f"fk_{SqlTraceSpanAttribute.__tablename__}_request_id",
+                ondelete="CASCADE",
+            ),
+            nullable=False,
+        ),
+        sa.Column("span_id", sa.String(length=50), nullable=False),
+        sa.Column("key", sa.String(length=250), nullable=False),
+        sa.Column("value", sa.String(length=8000), nullable=True),
+        sa.PrimaryKeyConstraint(
+            "request_id", "span_id", "key", name="trace_span_attributes_pk"
+        ),
+        sa.Index(f"index_{SqlTraceSpanAttribute.__tablename__}_key", "key", unique=False),
+    )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,40 @@
+"""add change events table
+
+Revision ID: 8d1c4e7f2a6b
+Revises: 3f2a9c1d7e5b
+Create Date: 2026-10-19 17:48:05.274913
+
+"""
+from alembic import op
+from qcflow.store.tracking.dbmodels.models import SqlChangeEvent
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d1c4e7f2a6b'
+down_revision = '3f2a9c1d7e5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        SqlChangeEvent.__tablename__,
+        sa.Column(
+            "sequence",
+            sa.BigInteger().with_variant(sa.Integer, "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("timestamp", sa.BigInteger(), nullable=False),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.String(length=500), nullable=False),
+        sa.Column("op", sa.String(length=20), nullable=False),
+        sa.Column("data", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("sequence", name="change_events_pk"),
+        sa.Index(f"index_{SqlChangeEvent.__tablename__}_timestamp", "timestamp", unique=False),
+    )
+
+
+def downgrade():
+    pass
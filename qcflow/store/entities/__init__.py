@@ -1,3 +1,4 @@
+from qcflow.store.entities.access_filter import AccessFilter
 from qcflow.store.entities.paged_list import PagedList
 
-__all__ = ["PagedList"]
+__all__ = ["AccessFilter", "PagedList"]
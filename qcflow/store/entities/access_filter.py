@@ -0,0 +1,19 @@
+from typing import Any, Collection, NamedTuple, Optional, Union
+
+# A collection of resource identifiers, or a SQLAlchemy `Select` returning a single column of
+# identifiers that is run in the same database as the store
+AccessFilterIds = Union[Collection[str], Any]
+
+
+class AccessFilter(NamedTuple):
+    """
+    Restricts a search to the resources that a user is allowed to read, so that the search can
+    return full pages of readable resources without post-filtering.
+
+    Resources are identified by experiment ID for experiments and by name for registered models.
+    """
+
+    # If not None, only the resources with these identifiers are returned
+    allowed: Optional[AccessFilterIds] = None
+    # The resources with these identifiers are never returned
+    denied: Optional[AccessFilterIds] = None
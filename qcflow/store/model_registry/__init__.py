@@ -8,3 +8,5 @@ SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD = 1000
 # increasing this default maximum results value to avoid breaking compatibility with such backends
 SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT = 10000
 SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = 200_000
+# Maximum number of model versions that can be requested by a single batch lookup
+GET_MODEL_VERSIONS_MAX_RESULTS = 1000
@@ -5,7 +5,11 @@ from time import sleep, time
 from qcflow.entities.model_registry import ModelVersionTag
 from qcflow.entities.model_registry.model_version_status import ModelVersionStatus
 from qcflow.exceptions import QCFlowException
-from qcflow.protos.databricks_pb2 import RESOURCE_ALREADY_EXISTS, ErrorCode
+from qcflow.protos.databricks_pb2 import (
+    RESOURCE_ALREADY_EXISTS,
+    RESOURCE_DOES_NOT_EXIST,
+    ErrorCode,
+)
 from qcflow.utils.annotations import developer_stable
 from qcflow.utils.logging_utils import eprint
 
@@ -14,6 +18,16 @@ _logger = logging.getLogger(__name__)
 AWAIT_MODEL_VERSION_CREATE_SLEEP_INTERVAL_SECONDS = 3
 
 
+def _parse_version_or_alias(version_or_alias):
+    """
+    Parse the version or alias of a model version lookup into a ``(version, alias)`` tuple. As in
+    ``models:/`` URIs, integers and strings of digits are versions, and other strings are aliases.
+    """
+    if isinstance(version_or_alias, int) or str(version_or_alias).isdigit():
+        return int(version_or_alias), None
+    return None, version_or_alias
+
+
 @developer_stable
 class AbstractStore:
     """
@@ -370,6 +384,41 @@ class AbstractStore:
             A single :py:class:`qcflow.entities.model_registry.ModelVersion` object.
         """
 
+    def get_model_versions(self, model_versions):
+        """
+        Get multiple model versions by name and version or alias in a single call.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+        """
+
+        def get_or_none(get_fn, *args):
+            try:
+                return get_fn(*args)
+            except QCFlowException as e:
+                if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                    raise
+                return None
+
+        # Resolve the aliases of each registered model only once
+        aliases_by_name = {}
+        results = []
+        for name, version_or_alias in model_versions:
+            version, alias = _parse_version_or_alias(version_or_alias)
+            if alias is not None:
+                if name not in aliases_by_name:
+                    registered_model = get_or_none(self.get_registered_model, name)
+                    aliases_by_name[name] = registered_model.aliases if registered_model else {}
+                version = aliases_by_name[name].get(alias)
+            results.append(get_or_none(self.get_model_version, name, version) if version else None)
+        return results
+
     def copy_model_version(self, src_mv, dst_name):
         """
         Copy a model version from one registered model to another as a new model version.
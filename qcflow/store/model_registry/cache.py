@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, NamedTuple
+
+
+class _CacheEntry(NamedTuple):
+    name: str
+    stamp: int
+    expires_at: float
+    value: Any
+
+
+class ModelRegistryCache:
+    """
+    A cache of the lookups of a model registry store, e.g. the resolution of model aliases,
+    invalidated by version stamps.
+
+    Each registered model has a version stamp that is bumped by every change of the model, its
+    versions or its aliases made through the store. A cached value is only returned while the
+    stamp of its model is the one it was looked up with, and for at most ``ttl`` seconds, which
+    bounds the staleness of the values when other processes change the registry.
+
+    Args:
+        ttl: The number of seconds a value is kept. A non-positive value disables the cache.
+        max_size: The maximum number of values to keep.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._stamps = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def bump(self, name: str) -> None:
+        """
+        Invalidate the values cached for a registered model.
+        """
+        with self._lock:
+            self._stamps[name] = self._stamps.get(name, 0) + 1
+            keys = [key for key, entry in self._entries.items() if entry.name == name]
+            for key in keys:
+                del self._entries[key]
+
+    @contextmanager
+    def invalidating(self, *names: str):
+        """
+        Invalidate the values cached for the specified registered models when the context exits,
+        i.e. after the changes made in the context are committed.
+        """
+        try:
+            yield
+        finally:
+            for name in names:
+                self.bump(name)
+
+    def get_or_load(self, key: Hashable, name: str, load_fn: Callable[[], Any]) -> Any:
+        """
+        Get the value cached for the key of a registered model, or load it with ``load_fn``.
+        """
+        if not self.enabled:
+            return load_fn()
+
+        with self._lock:
+            stamp = self._stamps.get(name, 0)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.stamp == stamp and entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry.value
+                del self._entries[key]
+
+        value = load_fn()
+        with self._lock:
+            # Skip values loaded while the model was being changed, which may be stale
+            if self._stamps.get(name, 0) == stamp:
+                self._entries[key] = _CacheEntry(name, stamp, time.monotonic() + self.ttl, value)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return value
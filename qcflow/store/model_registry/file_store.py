@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 import shutil
@@ -5,6 +6,7 @@ import sys
 import time
 import urllib
 from os.path import join
+from typing import Optional
 
 from qcflow.entities.model_registry import (
     ModelVersion,
@@ -21,7 +23,10 @@ from qcflow.entities.model_registry.model_version_stages import (
     STAGE_NONE,
     get_canonical_stage,
 )
-from qcflow.environment_variables import QCFLOW_REGISTRY_DIR
+from qcflow.environment_variables import (
+    QCFLOW_ENABLE_REGISTRY_FILE_STORE_INDEX,
+    QCFLOW_REGISTRY_DIR,
+)
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import (
     INVALID_PARAMETER_VALUE,
@@ -35,7 +40,8 @@ from qcflow.store.model_registry import (
     SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD,
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD,
 )
-from qcflow.store.model_registry.abstract_store import AbstractStore
+from qcflow.store.model_registry.abstract_store import AbstractStore, _parse_version_or_alias
+from qcflow.store.model_registry.file_store_index import FileStoreIndex
 from qcflow.utils.file_utils import (
     contains_path_separator,
     contains_percent,
@@ -86,6 +92,23 @@ def _validate_model_name(name):
         )
 
 
+def _get_latest_versions(model_versions, stages=None):
+    if stages is None or len(stages) == 0:
+        expected_stages = {get_canonical_stage(stage) for stage in ALL_STAGES}
+    else:
+        expected_stages = {get_canonical_stage(stage) for stage in stages}
+    latest_versions = {}
+    for mv in model_versions:
+        if mv.current_stage in expected_stages:
+            if (
+                mv.current_stage not in latest_versions
+                or latest_versions[mv.current_stage].version < mv.version
+            ):
+                latest_versions[mv.current_stage] = mv.to_qcflow_entity()
+
+    return [latest_versions[stage] for stage in expected_stages if stage in latest_versions]
+
+
 class FileModelVersion(ModelVersion):
     def __init__(self, storage_location=None, **kwargs):
         super().__init__(**kwargs)
@@ -130,6 +153,11 @@ class FileStore(AbstractStore):
         # Create models directory if needed
         if not exists(self.models_directory):
             mkdir(self.models_directory)
+        self._index = (
+            FileStoreIndex(self.models_directory, self._load_registered_model_with_versions)
+            if QCFLOW_ENABLE_REGISTRY_FILE_STORE_INDEX.get()
+            else None
+        )
 
     @property
     def models_directory(self):
@@ -170,6 +198,17 @@ class FileStore(AbstractStore):
                 FileStore.META_DATA_FILE_NAME,
                 registered_model_dict,
             )
+        self._mark_registered_model_changed(meta_dir)
+
+    def _mark_registered_model_changed(self, model_path):
+        """
+        Update the modification time of the directory of a registered model, which is how the
+        indexes of all the processes sharing the store detect the changes of the model.
+        """
+        # Make sure that the modification time changes even if the file system has a coarse
+        # timestamp resolution
+        mtime_ns = max(time.time_ns(), os.stat(model_path).st_mtime_ns + 1)
+        os.utime(model_path, ns=(mtime_ns, mtime_ns))
 
     def _update_registered_model_last_updated_time(self, name, updated_time):
         registered_model = self.get_registered_model(name)
@@ -335,7 +374,21 @@ class FileStore(AbstractStore):
         """
         return self.search_registered_models(max_results=max_results, page_token=page_token)
 
+    def _load_registered_model_with_versions(self, model_path):
+        meta = FileStore._read_yaml(model_path, FileStore.META_DATA_FILE_NAME)
+        aliases = self.get_all_registered_model_aliases_from_path(model_path)
+        meta["tags"] = self.get_all_registered_model_tags_from_path(model_path)
+        meta["aliases"] = aliases
+        registered_model = RegisteredModel.from_dictionary(meta)
+        # Read the files of the model versions only once for both the latest versions and the
+        # model versions
+        file_model_versions = self._list_file_model_versions_under_path(model_path, aliases)
+        registered_model.latest_versions = _get_latest_versions(file_model_versions)
+        return registered_model, [mv.to_qcflow_entity() for mv in file_model_versions]
+
     def _list_all_registered_models(self):
+        if self._index is not None:
+            return self._index.registered_models()
         registered_model_paths = self._get_all_registered_model_paths()
         registered_models = []
         for path in registered_model_paths:
@@ -382,6 +435,9 @@ class FileStore(AbstractStore):
         final_offset = start_offset + max_results
 
         paginated_rms = sorted_rms[start_offset:final_offset]
+        if self._index is not None:
+            # The registered models of the index must not be modified by the caller
+            paginated_rms = copy.deepcopy(paginated_rms)
         next_page_token = None
         if final_offset < len(sorted_rms):
             next_page_token = SearchUtils.create_page_token(final_offset)
@@ -426,20 +482,7 @@ class FileStore(AbstractStore):
                 RESOURCE_DOES_NOT_EXIST,
             )
         model_versions = self._list_file_model_versions_under_path(registered_model_path)
-        if stages is None or len(stages) == 0:
-            expected_stages = {get_canonical_stage(stage) for stage in ALL_STAGES}
-        else:
-            expected_stages = {get_canonical_stage(stage) for stage in stages}
-        latest_versions = {}
-        for mv in model_versions:
-            if mv.current_stage in expected_stages:
-                if (
-                    mv.current_stage not in latest_versions
-                    or latest_versions[mv.current_stage].version < mv.version
-                ):
-                    latest_versions[mv.current_stage] = mv.to_qcflow_entity()
-
-        return [latest_versions[stage] for stage in expected_stages if stage in latest_versions]
+        return _get_latest_versions(model_versions, stages)
 
     def _get_registered_model_tag_path(self, name, tag_name):
         _validate_model_name(name)
@@ -568,10 +611,14 @@ class FileStore(AbstractStore):
         version = os.path.basename(directory).replace("version-", "")
         return [alias.alias for alias in aliases if alias.version == version]
 
-    def _get_file_model_version_from_dir(self, directory) -> FileModelVersion:
+    def _get_file_model_version_from_dir(self, directory, aliases=None) -> FileModelVersion:
         meta = FileStore._read_yaml(directory, FileStore.META_DATA_FILE_NAME)
         meta["tags"] = self._get_model_version_tags_from_dir(directory)
-        meta["aliases"] = self._get_model_version_aliases(directory)
+        if aliases is None:
+            meta["aliases"] = self._get_model_version_aliases(directory)
+        else:
+            version = os.path.basename(directory).replace("version-", "")
+            meta["aliases"] = [alias.alias for alias in aliases if alias.version == version]
         return FileModelVersion.from_dictionary(meta)
 
     def _save_model_version_as_meta_file(
@@ -594,6 +641,7 @@ class FileStore(AbstractStore):
                 FileStore.META_DATA_FILE_NAME,
                 model_version_dict,
             )
+        self._mark_registered_model_changed(os.path.dirname(meta_dir))
 
     def create_model_version(
         self,
@@ -807,6 +855,53 @@ class FileStore(AbstractStore):
         """
         return self._fetch_file_model_version_if_exists(name, version).to_qcflow_entity()
 
+    def get_model_versions(self, model_versions) -> list[Optional[ModelVersion]]:
+        """
+        Get multiple model versions by name and version or alias, reading the aliases of each
+        registered model only once.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+        """
+        # The path and aliases of each registered model, or None if it does not exist
+        registered_models = {}
+        results = []
+        for name, version_or_alias in model_versions:
+            version, alias = _parse_version_or_alias(version_or_alias)
+            if alias is None:
+                _validate_model_version(version)
+            else:
+                _validate_model_alias_name(alias)
+            if name not in registered_models:
+                model_path = self._get_registered_model_path(name)
+                registered_models[name] = (
+                    (model_path, self.get_all_registered_model_aliases_from_path(model_path))
+                    if exists(model_path)
+                    else None
+                )
+            if registered_models[name] is None:
+                results.append(None)
+                continue
+            model_path, aliases = registered_models[name]
+            if alias is not None:
+                version = next((a.version for a in aliases if a.alias == alias), None)
+            directory = join(model_path, f"version-{version}") if version is not None else None
+            if directory is None or not exists(directory):
+                results.append(None)
+                continue
+            model_version = self._get_file_model_version_from_dir(directory, aliases)
+            if model_version.current_stage == STAGE_DELETED_INTERNAL:
+                results.append(None)
+            else:
+                results.append(model_version.to_qcflow_entity())
+        return results
+
     def get_model_version_download_uri(self, name, version) -> str:
         """
         Get the download location in Model Registry for this model version.
@@ -827,7 +922,7 @@ class FileStore(AbstractStore):
         self._check_root_dir()
         return list_subdirs(join(self.root_directory, FileStore.MODELS_FOLDER_NAME), full_path=True)
 
-    def _list_file_model_versions_under_path(self, path) -> list[FileModelVersion]:
+    def _list_file_model_versions_under_path(self, path, aliases=None) -> list[FileModelVersion]:
         model_versions = []
         model_version_dirs = list_all(
             path,
@@ -836,7 +931,7 @@ class FileStore(AbstractStore):
             full_path=True,
         )
         for directory in model_version_dirs:
-            model_versions.append(self._get_file_model_version_from_dir(directory))
+            model_versions.append(self._get_file_model_version_from_dir(directory, aliases))
         return model_versions
 
     def search_model_versions(
@@ -875,13 +970,15 @@ class FileStore(AbstractStore):
                 INVALID_PARAMETER_VALUE,
             )
 
-        registered_model_paths = self._get_all_registered_model_paths()
-        model_versions = []
-        for path in registered_model_paths:
-            model_versions.extend(
-                file_mv.to_qcflow_entity()
-                for file_mv in self._list_file_model_versions_under_path(path)
-            )
+        if self._index is not None:
+            model_versions = self._index.model_versions()
+        else:
+            model_versions = []
+            for path in self._get_all_registered_model_paths():
+                model_versions.extend(
+                    file_mv.to_qcflow_entity()
+                    for file_mv in self._list_file_model_versions_under_path(path)
+                )
         filtered_mvs = SearchModelVersionUtils.filter(model_versions, filter_string)
 
         sorted_mvs = SearchModelVersionUtils.sort(
@@ -892,6 +989,9 @@ class FileStore(AbstractStore):
         final_offset = start_offset + max_results
 
         paginated_mvs = sorted_mvs[start_offset:final_offset]
+        if self._index is not None:
+            # The model versions of the index must not be modified by the caller
+            paginated_mvs = copy.deepcopy(paginated_mvs)
         next_page_token = None
         if final_offset < len(sorted_mvs):
             next_page_token = SearchUtils.create_page_token(final_offset)
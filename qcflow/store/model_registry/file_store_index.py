@@ -0,0 +1,77 @@
+import os
+import threading
+from typing import Callable, NamedTuple
+
+from qcflow.entities.model_registry import ModelVersion, RegisteredModel
+from qcflow.exceptions import MissingConfigException
+
+
+class _IndexEntry(NamedTuple):
+    mtime_ns: int
+    registered_model: RegisteredModel
+    model_versions: list[ModelVersion]
+
+
+class FileStoreIndex:
+    """
+    An in-memory index of the registered models and model versions of a model registry
+    :py:class:`FileStore <qcflow.store.model_registry.file_store.FileStore>`, which lets searches
+    avoid reading the files of every registered model.
+
+    The entry of a registered model is reloaded when the modification time of its directory
+    changes. The file store updates it on every change of the model, its tags, aliases or
+    versions, so that the changes made by other processes sharing the store are also detected.
+
+    Args:
+        models_directory: The directory containing a directory per registered model.
+        load_registered_model: The function loading the registered model, with its latest
+            versions, tags and aliases, and all its model versions from the directory of the
+            registered model.
+    """
+
+    def __init__(
+        self,
+        models_directory: str,
+        load_registered_model: Callable[[str], tuple[RegisteredModel, list[ModelVersion]]],
+    ):
+        self.models_directory = models_directory
+        self._load_registered_model = load_registered_model
+        self._entries: dict[str, _IndexEntry] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> list[_IndexEntry]:
+        with self._lock:
+            entries = {}
+            with os.scandir(self.models_directory) as it:
+                for dir_entry in it:
+                    if not dir_entry.is_dir():
+                        continue
+                    # Get the modification time before loading the model, so that a change made
+                    # during the load is detected by the next refresh
+                    mtime_ns = dir_entry.stat().st_mtime_ns
+                    entry = self._entries.get(dir_entry.name)
+                    if entry is None or entry.mtime_ns != mtime_ns:
+                        try:
+                            entry = _IndexEntry(
+                                mtime_ns, *self._load_registered_model(dir_entry.path)
+                            )
+                        except (FileNotFoundError, MissingConfigException):
+                            # The registered model is being created, renamed or deleted
+                            continue
+                    entries[dir_entry.name] = entry
+            self._entries = entries
+            return list(entries.values())
+
+    def registered_models(self) -> list[RegisteredModel]:
+        """
+        Get all the registered models. The returned objects are shared by the index and must
+        not be modified.
+        """
+        return [entry.registered_model for entry in self._refresh()]
+
+    def model_versions(self) -> list[ModelVersion]:
+        """
+        Get all the model versions, including the deleted ones. The returned objects are shared
+        by the index and must not be modified.
+        """
+        return [mv for entry in self._refresh() for mv in entry.model_versions]
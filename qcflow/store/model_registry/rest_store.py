@@ -25,21 +25,35 @@ from qcflow.protos.model_registry_pb2 import (
     UpdateModelVersion,
     UpdateRegisteredModel,
 )
+from qcflow.protos.model_registry_pb2 import (
+    ModelVersion as ProtoModelVersion,
+)
 from qcflow.store.entities.paged_list import PagedList
+from qcflow.store.model_registry import GET_MODEL_VERSIONS_MAX_RESULTS
+from qcflow.store.model_registry.abstract_store import _parse_version_or_alias
 from qcflow.store.model_registry.base_rest_store import BaseRestStore
-from qcflow.utils.proto_json_utils import message_to_json
+from qcflow.utils.proto_json_utils import message_to_json, parse_dict
 from qcflow.utils.rest_utils import (
     _REST_API_PATH_PREFIX,
     extract_all_api_info_for_service,
     extract_api_info_for_service,
+    http_request,
+    verify_rest_response,
 )
 
 _METHOD_TO_INFO = extract_api_info_for_service(ModelRegistryService, _REST_API_PATH_PREFIX)
 _METHOD_TO_ALL_INFO = extract_all_api_info_for_service(ModelRegistryService, _REST_API_PATH_PREFIX)
+_GET_MODEL_VERSIONS_ENDPOINT = f"{_REST_API_PATH_PREFIX}/qcflow/model-versions/get-batch"
 
 _logger = logging.getLogger(__name__)
 
 
+def _model_version_from_json(js_dict):
+    proto = ProtoModelVersion()
+    parse_dict(js_dict, proto)
+    return ModelVersion.from_proto(proto)
+
+
 class RestStore(BaseRestStore):
     """
     Client for a remote model registry server accessed via REST API calls
@@ -344,6 +358,49 @@ class RestStore(BaseRestStore):
         response_proto = self._call_endpoint(GetModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
+    def get_model_versions(self, model_versions):
+        """
+        Get multiple model versions by name and version or alias, with one request for every
+        ``GET_MODEL_VERSIONS_MAX_RESULTS`` model versions. Falls back to one request per model
+        version if the server does not support batch lookups.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+        """
+        lookups = []
+        for name, version_or_alias in model_versions:
+            version, alias = _parse_version_or_alias(version_or_alias)
+            lookups.append(
+                {"name": name, "version": str(version)}
+                if alias is None
+                else {"name": name, "alias": alias}
+            )
+
+        results = []
+        for start in range(0, len(lookups), GET_MODEL_VERSIONS_MAX_RESULTS):
+            batch = lookups[start : start + GET_MODEL_VERSIONS_MAX_RESULTS]
+            response = http_request(
+                host_creds=self.get_host_creds(),
+                endpoint=_GET_MODEL_VERSIONS_ENDPOINT,
+                method="POST",
+                json={"model_versions": batch},
+            )
+            if response.status_code == 404 and start == 0:
+                _logger.debug("The server does not support batch lookups of model versions")
+                return super().get_model_versions(model_versions)
+            response = verify_rest_response(response, _GET_MODEL_VERSIONS_ENDPOINT)
+            results.extend(
+                _model_version_from_json(model_version) if model_version else None
+                for model_version in response.json()["model_versions"]
+            )
+        return results
+
     def get_model_version_download_uri(self, name, version):
         """
         Get the download location in Model Registry for this model version.
@@ -5,6 +5,7 @@ import sqlalchemy
 from sqlalchemy.future import select
 
 import qcflow.store.db.utils
+from qcflow.entities.change_event import ChangeEntityType, ChangeOperation
 from qcflow.entities.model_registry.model_version_stages import (
     ALL_STAGES,
     DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS,
@@ -12,6 +13,10 @@ from qcflow.entities.model_registry.model_version_stages import (
     STAGE_DELETED_INTERNAL,
     get_canonical_stage,
 )
+from qcflow.environment_variables import (
+    QCFLOW_MODEL_REGISTRY_CACHE_SIZE,
+    QCFLOW_MODEL_REGISTRY_CACHE_TTL,
+)
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import (
     INVALID_PARAMETER_VALUE,
@@ -20,6 +25,7 @@ from qcflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
 )
 from qcflow.store.artifact.utils.models import _parse_model_uri
+from qcflow.store.db.change_feed import record_change_event
 from qcflow.store.entities.paged_list import PagedList
 from qcflow.store.model_registry import (
     SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
@@ -27,7 +33,8 @@ from qcflow.store.model_registry import (
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD,
 )
-from qcflow.store.model_registry.abstract_store import AbstractStore
+from qcflow.store.model_registry.abstract_store import AbstractStore, _parse_version_or_alias
+from qcflow.store.model_registry.cache import ModelRegistryCache
 from qcflow.store.model_registry.dbmodels.models import (
     SqlModelVersion,
     SqlModelVersionTag,
@@ -58,6 +65,29 @@ _logger = logging.getLogger(__name__)
 sqlalchemy.orm.configure_mappers()
 
 
+def _record_model_version_event(session, sql_model_version, op):
+    record_change_event(
+        session,
+        ChangeEntityType.MODEL_VERSION,
+        f"{sql_model_version.name}/{sql_model_version.version}",
+        op,
+        {
+            "name": sql_model_version.name,
+            "version": sql_model_version.version,
+            "current_stage": sql_model_version.current_stage,
+        },
+    )
+
+
+def _record_alias_event(session, name, alias, op, version=None):
+    data = {"name": name, "alias": alias}
+    if version is not None:
+        data["version"] = int(version)
+    record_change_event(
+        session, ChangeEntityType.REGISTERED_MODEL_ALIAS, f"{name}@{alias}", op, data
+    )
+
+
 class SqlAlchemyStore(AbstractStore):
     """
     This entity may change or be removed in a future release without warning.
@@ -104,6 +134,12 @@ class SqlAlchemyStore(AbstractStore):
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
         # qcflow.store.db.utils._verify_schema(self.engine)
+        # Caches the resolution of aliases, latest versions and download URIs, which is done by
+        # every load of a ``models:/`` URI
+        self._cache = ModelRegistryCache(
+            ttl=QCFLOW_MODEL_REGISTRY_CACHE_TTL.get(),
+            max_size=QCFLOW_MODEL_REGISTRY_CACHE_SIZE.get(),
+        )
 
     def _get_dialect(self):
         return self.engine.dialect.name
@@ -168,7 +204,7 @@ class SqlAlchemyStore(AbstractStore):
         _validate_model_name(name)
         for tag in tags or []:
             _validate_registered_model_tag(tag.key, tag.value)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             try:
                 creation_time = get_current_time_millis()
                 registered_model = SqlRegisteredModel(
@@ -185,6 +221,9 @@ class SqlAlchemyStore(AbstractStore):
                 ]
                 session.add(registered_model)
                 session.flush()
+                record_change_event(
+                    session, ChangeEntityType.REGISTERED_MODEL, name, ChangeOperation.CREATE
+                )
                 return registered_model.to_qcflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
                 raise QCFlowException(
@@ -232,13 +271,16 @@ class SqlAlchemyStore(AbstractStore):
             A single updated :py:class:`qcflow.entities.model_registry.RegisteredModel` object.
 
         """
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, name)
             updated_time = get_current_time_millis()
             sql_registered_model.description = description
             sql_registered_model.last_updated_time = updated_time
             session.add(sql_registered_model)
             session.flush()
+            record_change_event(
+                session, ChangeEntityType.REGISTERED_MODEL, name, ChangeOperation.UPDATE
+            )
             return sql_registered_model.to_qcflow_entity()
 
     def rename_registered_model(self, name, new_name):
@@ -254,7 +296,7 @@ class SqlAlchemyStore(AbstractStore):
 
         """
         _validate_model_name(new_name)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name, new_name), self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, name)
             try:
                 updated_time = get_current_time_millis()
@@ -265,6 +307,13 @@ class SqlAlchemyStore(AbstractStore):
                 sql_registered_model.last_updated_time = updated_time
                 session.add_all([sql_registered_model] + sql_registered_model.model_versions)
                 session.flush()
+                record_change_event(
+                    session,
+                    ChangeEntityType.REGISTERED_MODEL,
+                    name,
+                    ChangeOperation.UPDATE,
+                    {"new_name": new_name},
+                )
                 return sql_registered_model.to_qcflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
                 raise QCFlowException(
@@ -283,9 +332,12 @@ class SqlAlchemyStore(AbstractStore):
         Returns:
             None
         """
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, name)
             session.delete(sql_registered_model)
+            record_change_event(
+                session, ChangeEntityType.REGISTERED_MODEL, name, ChangeOperation.DELETE
+            )
 
     def _compute_next_token(self, max_results_for_query, current_size, offset, max_results):
         next_token = None
@@ -300,6 +352,7 @@ class SqlAlchemyStore(AbstractStore):
         max_results=SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        access_filter=None,
     ):
         """
         Search for registered models in backend that satisfy the filter criteria.
@@ -311,6 +364,9 @@ class SqlAlchemyStore(AbstractStore):
                 matching search results.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_registered_models`` call.
+            access_filter: An optional :py:class:`AccessFilter <qcflow.store.entities.AccessFilter>`
+                of registered model names restricting the search to the models readable by a
+                user.
 
         Returns:
             A PagedList of :py:class:`qcflow.entities.model_registry.RegisteredModel` objects
@@ -328,6 +384,10 @@ class SqlAlchemyStore(AbstractStore):
 
         filter_query = self._get_search_registered_model_filter_query(
             parsed_filters, self.engine.dialect.name
+        ).filter(
+            *qcflow.store.db.utils._get_access_filter_clauses(
+                access_filter, SqlRegisteredModel.name
+            )
         )
 
         parsed_orderby = self._parse_search_registered_models_order_by(order_by)
@@ -562,15 +622,20 @@ class SqlAlchemyStore(AbstractStore):
             List of :py:class:`qcflow.entities.model_registry.ModelVersion` objects.
 
         """
-        with self.ManagedSessionMaker() as session:
-            sql_registered_model = self._get_registered_model(session, name)
-            # Convert to RegisteredModel entity first and then extract latest_versions
-            latest_versions = sql_registered_model.to_qcflow_entity().latest_versions
-            if stages is None or len(stages) == 0:
-                expected_stages = {get_canonical_stage(stage) for stage in ALL_STAGES}
-            else:
-                expected_stages = {get_canonical_stage(stage) for stage in stages}
-            return [mv for mv in latest_versions if mv.current_stage in expected_stages]
+        if stages is None or len(stages) == 0:
+            expected_stages = {get_canonical_stage(stage) for stage in ALL_STAGES}
+        else:
+            expected_stages = {get_canonical_stage(stage) for stage in stages}
+
+        def load_latest_versions():
+            with self.ManagedSessionMaker() as session:
+                sql_registered_model = self._get_registered_model(session, name)
+                # Convert to RegisteredModel entity first and then extract latest_versions
+                latest_versions = sql_registered_model.to_qcflow_entity().latest_versions
+                return [mv for mv in latest_versions if mv.current_stage in expected_stages]
+
+        key = ("latest_versions", name, frozenset(expected_stages))
+        return list(self._cache.get_or_load(key, name, load_latest_versions))
 
     @classmethod
     def _get_registered_model_tag(cls, session, name, key):
@@ -602,7 +667,7 @@ class SqlAlchemyStore(AbstractStore):
         """
         _validate_model_name(name)
         _validate_registered_model_tag(tag.key, tag.value)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if registered model exists
             self._get_registered_model(session, name)
             session.merge(SqlRegisteredModelTag(name=name, key=tag.key, value=tag.value))
@@ -620,7 +685,7 @@ class SqlAlchemyStore(AbstractStore):
         """
         _validate_model_name(name)
         _validate_tag_name(key)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if registered model exists
             self._get_registered_model(session, name)
             existing_tag = self._get_registered_model_tag(session, name, key)
@@ -679,7 +744,7 @@ class SqlAlchemyStore(AbstractStore):
                     f"Unable to fetch model from model URI source artifact location '{source}'."
                     f"Error: {e}"
                 ) from e
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             creation_time = get_current_time_millis()
             for attempt in range(self.CREATE_MODEL_VERSION_RETRIES):
                 try:
@@ -705,6 +770,7 @@ class SqlAlchemyStore(AbstractStore):
                     ]
                     session.add_all([sql_registered_model, model_version])
                     session.flush()
+                    _record_model_version_event(session, model_version, ChangeOperation.CREATE)
                     return self._populate_model_version_aliases(
                         session, name, model_version.to_qcflow_entity()
                     )
@@ -802,12 +868,13 @@ class SqlAlchemyStore(AbstractStore):
             A single :py:class:`qcflow.entities.model_registry.ModelVersion` object.
 
         """
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             updated_time = get_current_time_millis()
             sql_model_version = self._get_sql_model_version(session, name=name, version=version)
             sql_model_version.description = description
             sql_model_version.last_updated_time = updated_time
             session.add(sql_model_version)
+            _record_model_version_event(session, sql_model_version, ChangeOperation.UPDATE)
             return self._populate_model_version_aliases(
                 session, name, sql_model_version.to_qcflow_entity()
             )
@@ -837,7 +904,7 @@ class SqlAlchemyStore(AbstractStore):
             )
             raise QCFlowException(msg_tpl.format(stage, DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS))
 
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             last_updated_time = get_current_time_millis()
 
             model_versions = []
@@ -860,6 +927,8 @@ class SqlAlchemyStore(AbstractStore):
             sql_registered_model = sql_model_version.registered_model
             sql_registered_model.last_updated_time = last_updated_time
             session.add_all([*model_versions, sql_model_version, sql_registered_model])
+            for mv in [*model_versions, sql_model_version]:
+                _record_model_version_event(session, mv, ChangeOperation.UPDATE)
             return self._populate_model_version_aliases(
                 session, name, sql_model_version.to_qcflow_entity()
             )
@@ -876,7 +945,7 @@ class SqlAlchemyStore(AbstractStore):
             None
         """
         # currently delete model version still keeps the tags associated with the version
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             updated_time = get_current_time_millis()
             sql_model_version = self._get_sql_model_version(session, name, version)
             sql_registered_model = sql_model_version.registered_model
@@ -885,6 +954,7 @@ class SqlAlchemyStore(AbstractStore):
             for alias in aliases:
                 if alias.version == version:
                     session.delete(alias)
+                    _record_alias_event(session, name, alias.alias, ChangeOperation.DELETE)
             sql_model_version.current_stage = STAGE_DELETED_INTERNAL
             sql_model_version.last_updated_time = updated_time
             sql_model_version.description = None
@@ -894,6 +964,7 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version.run_link = "REDACTED-RUN-LINK"
             sql_model_version.status_message = None
             session.add_all([sql_registered_model, sql_model_version])
+            _record_model_version_event(session, sql_model_version, ChangeOperation.DELETE)
 
     def get_model_version(self, name, version):
         """
@@ -912,6 +983,75 @@ class SqlAlchemyStore(AbstractStore):
                 session, name, sql_model_version.to_qcflow_entity()
             )
 
+    def get_model_versions(self, model_versions):
+        """
+        Get multiple model versions by name and version or alias with a single query of the model
+        versions, after a query of the aliases of their registered models.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+        """
+        lookups = []
+        for name, version_or_alias in model_versions:
+            _validate_model_name(name)
+            version, alias = _parse_version_or_alias(version_or_alias)
+            if alias is None:
+                _validate_model_version(version)
+            else:
+                _validate_model_alias_name(alias)
+            lookups.append((name, version, alias))
+        if not lookups:
+            return []
+
+        with self.ManagedSessionMaker() as session:
+            aliases_by_name = {}
+            for sql_alias in (
+                session.query(SqlRegisteredModelAlias)
+                .filter(SqlRegisteredModelAlias.name.in_({name for name, _, _ in lookups}))
+                .all()
+            ):
+                aliases_by_name.setdefault(sql_alias.name, {})[sql_alias.alias] = sql_alias.version
+            keys = [
+                (name, version if alias is None else aliases_by_name.get(name, {}).get(alias))
+                for name, version, alias in lookups
+            ]
+            existing_keys = {(name, version) for name, version in keys if version is not None}
+            # Filter the names and the versions separately rather than with a disjunction of the
+            # pairs, whose expression tree is too deep for some databases, e.g. SQLite, and drop
+            # the other combinations of the names and versions below
+            sql_model_versions = (
+                session.query(SqlModelVersion)
+                .options(*self._get_eager_model_version_query_options())
+                .filter(
+                    SqlModelVersion.name.in_({name for name, _ in existing_keys}),
+                    SqlModelVersion.version.in_({version for _, version in existing_keys}),
+                    SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL,
+                )
+                .all()
+                if existing_keys
+                else []
+            )
+            model_versions_by_key = {}
+            for sql_model_version in sql_model_versions:
+                if (sql_model_version.name, sql_model_version.version) not in existing_keys:
+                    continue
+                model_version = sql_model_version.to_qcflow_entity()
+                model_version.aliases = [
+                    alias
+                    for alias, version in aliases_by_name.get(model_version.name, {}).items()
+                    if version == sql_model_version.version
+                ]
+                model_versions_by_key[(sql_model_version.name, sql_model_version.version)] = (
+                    model_version
+                )
+        return [model_versions_by_key.get(key) for key in keys]
+
     def get_model_version_download_uri(self, name, version):
         """
         Get the download location in Model Registry for this model version.
@@ -925,9 +1065,14 @@ class SqlAlchemyStore(AbstractStore):
         Returns:
             A single URI location that allows reads for downloading.
         """
-        with self.ManagedSessionMaker() as session:
-            sql_model_version = self._get_sql_model_version(session, name, version)
-            return sql_model_version.storage_location or sql_model_version.source
+
+        def load_download_uri():
+            with self.ManagedSessionMaker() as session:
+                sql_model_version = self._get_sql_model_version(session, name, version)
+                return sql_model_version.storage_location or sql_model_version.source
+
+        key = ("download_uri", name, str(version))
+        return self._cache.get_or_load(key, name, load_download_uri)
 
     def search_model_versions(
         self,
@@ -1082,7 +1227,7 @@ class SqlAlchemyStore(AbstractStore):
         _validate_model_name(name)
         _validate_model_version(version)
         _validate_model_version_tag(tag.key, tag.value)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if model version exists
             self._get_sql_model_version(session, name, version)
             session.merge(
@@ -1104,7 +1249,7 @@ class SqlAlchemyStore(AbstractStore):
         _validate_model_name(name)
         _validate_model_version(version)
         _validate_tag_name(key)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if model version exists
             self._get_sql_model_version(session, name, version)
             existing_tag = self._get_model_version_tag(session, name, version, key)
@@ -1137,10 +1282,11 @@ class SqlAlchemyStore(AbstractStore):
         _validate_model_name(name)
         _validate_model_alias_name(alias)
         _validate_model_version(version)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if model version exists
             self._get_sql_model_version(session, name, version)
             session.merge(SqlRegisteredModelAlias(name=name, alias=alias, version=version))
+            _record_alias_event(session, name, alias, ChangeOperation.UPDATE, version)
 
     def delete_registered_model_alias(self, name, alias):
         """
@@ -1155,12 +1301,13 @@ class SqlAlchemyStore(AbstractStore):
         """
         _validate_model_name(name)
         _validate_model_alias_name(alias)
-        with self.ManagedSessionMaker() as session:
+        with self._cache.invalidating(name), self.ManagedSessionMaker() as session:
             # check if registered model exists
             self._get_registered_model(session, name)
             existing_alias = self._get_registered_model_alias(session, name, alias)
             if existing_alias is not None:
                 session.delete(existing_alias)
+                _record_alias_event(session, name, alias, ChangeOperation.DELETE)
 
     def get_model_version_by_alias(self, name, alias):
         """
@@ -1175,19 +1322,23 @@ class SqlAlchemyStore(AbstractStore):
         """
         _validate_model_name(name)
         _validate_model_alias_name(alias)
-        with self.ManagedSessionMaker() as session:
-            existing_alias = self._get_registered_model_alias(session, name, alias)
-            if existing_alias is not None:
-                sql_model_version = self._get_sql_model_version(
-                    session, existing_alias.name, existing_alias.version
-                )
-                return self._populate_model_version_aliases(
-                    session, name, sql_model_version.to_qcflow_entity()
-                )
-            else:
-                raise QCFlowException(
-                    f"Registered model alias {alias} not found.", INVALID_PARAMETER_VALUE
-                )
+
+        def load_model_version():
+            with self.ManagedSessionMaker() as session:
+                existing_alias = self._get_registered_model_alias(session, name, alias)
+                if existing_alias is not None:
+                    sql_model_version = self._get_sql_model_version(
+                        session, existing_alias.name, existing_alias.version
+                    )
+                    return self._populate_model_version_aliases(
+                        session, name, sql_model_version.to_qcflow_entity()
+                    )
+                else:
+                    raise QCFlowException(
+                        f"Registered model alias {alias} not found.", INVALID_PARAMETER_VALUE
+                    )
+
+        return self._cache.get_or_load(("alias", name, alias), name, load_model_version)
 
     def _await_model_version_creation(self, mv, await_creation_for):
         """
@@ -20,3 +20,5 @@ SEARCH_MAX_RESULTS_DEFAULT = 1000
 SEARCH_MAX_RESULTS_THRESHOLD = 50000
 GET_METRIC_HISTORY_MAX_RESULTS = 25000
 SEARCH_TRACES_DEFAULT_MAX_RESULTS = 100
+CHANGE_EVENTS_MAX_RESULTS = 1000
+CHANGE_EVENTS_MAX_TIMEOUT_SECONDS = 60
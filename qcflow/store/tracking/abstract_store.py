@@ -2,7 +2,9 @@ from abc import ABCMeta, abstractmethod
 from typing import Optional
 
 from qcflow.entities import (
+    ChangeEvent,
     DatasetInput,
+    Span,
     TraceInfo,
     ViewType,
 )
@@ -10,7 +12,11 @@ from qcflow.entities.metric import MetricWithRunId
 from qcflow.entities.trace_status import TraceStatus
 from qcflow.exceptions import QCFlowException
 from qcflow.store.entities.paged_list import PagedList
-from qcflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT, SEARCH_TRACES_DEFAULT_MAX_RESULTS
+from qcflow.store.tracking import (
+    CHANGE_EVENTS_MAX_RESULTS,
+    SEARCH_MAX_RESULTS_DEFAULT,
+    SEARCH_TRACES_DEFAULT_MAX_RESULTS,
+)
 from qcflow.utils.annotations import developer_stable
 from qcflow.utils.async_logging.async_logging_queue import AsyncLoggingQueue
 from qcflow.utils.async_logging.run_operations import RunOperations
@@ -282,6 +288,49 @@ class AbstractStore:
         """
         raise NotImplementedError
 
+    def end_traces(self, trace_infos: list[TraceInfo]) -> list[TraceInfo]:
+        """
+        Update multiple TraceInfo objects in the backend store with the completed trace info.
+        Stores that can persist the updates more efficiently in bulk should override this
+        method. The default implementation calls :py:meth:`end_trace` for each trace.
+
+        Args:
+            trace_infos: The completed TraceInfo objects. The end time of each trace is
+                computed as ``timestamp_ms + execution_time_ms``, and its request metadata
+                and tags are merged with the existing ones.
+
+        Returns:
+            The updated TraceInfo objects, in the same order as ``trace_infos``.
+        """
+        return [
+            self.end_trace(
+                request_id=trace_info.request_id,
+                timestamp_ms=trace_info.timestamp_ms + trace_info.execution_time_ms,
+                status=trace_info.status,
+                request_metadata=trace_info.request_metadata,
+                tags=trace_info.tags,
+            )
+            for trace_info in trace_infos
+        ]
+
+    def index_trace_spans(
+        self,
+        request_id: str,
+        spans: list[Span],
+        attribute_keys: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Store the summaries of the spans of a trace, such as the span name, type, status and
+        duration, so that traces can be searched by their spans without downloading the trace
+        data. Spans that are already indexed for the trace are skipped. Stores that do not
+        support searching traces by their spans ignore this call.
+
+        Args:
+            request_id: Unique string identifier of the trace.
+            spans: The spans of the trace to index.
+            attribute_keys: The keys of the span attributes to index for search.
+        """
+
     def delete_traces(
         self,
         experiment_id: str,
@@ -376,6 +425,35 @@ class AbstractStore:
         """
         raise NotImplementedError
 
+    def get_change_events(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+        timeout_seconds: float = 0,
+    ) -> PagedList[ChangeEvent]:
+        """
+        Read the change feed, i.e. the events recorded by the changes of experiments, runs,
+        registered models, model versions and aliases, in the order in which they were recorded.
+
+        Args:
+            entity_types: The types of the entities whose events to return, see
+                :py:class:`ChangeEntityType <qcflow.entities.ChangeEntityType>`. All the events
+                are returned if unspecified.
+            page_token: The token of the last read event. The feed is read from the beginning if
+                unspecified.
+            max_results: Maximum number of events to return.
+            timeout_seconds: Maximum number of seconds to wait for new events when there are no
+                events after the page token.
+
+        Returns:
+            A :py:class:`PagedList <qcflow.store.entities.PagedList>` of
+            :py:class:`ChangeEvent <qcflow.entities.ChangeEvent>` objects, whose ``token`` resumes
+            the feed after the returned events, or at the same position if no events were
+            returned.
+        """
+        raise NotImplementedError
+
     def set_trace_tag(self, request_id: str, key: str, value: str):
         """
         Set a tag on the trace with the given request_id.
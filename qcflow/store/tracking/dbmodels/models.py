@@ -1,3 +1,5 @@
+import json
+
 import sqlalchemy as sa
 from sqlalchemy import (
     BigInteger,
@@ -14,6 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import backref, relationship
 
 from qcflow.entities import (
+    ChangeEvent,
     Dataset,
     Experiment,
     ExperimentTag,
@@ -753,3 +756,141 @@ class SqlTraceRequestMetadata(Base):
         PrimaryKeyConstraint("request_id", "key", name="trace_request_metadata_pk"),
         Index(f"index_{__tablename__}_request_id"),
     )
+
+
+class SqlTraceSpan(Base):
+    """
+    Summary of a span in a trace, used to search traces by their spans without downloading the
+    trace data from the artifact store. The full span data is not stored in the database.
+    """
+
+    __tablename__ = "trace_spans"
+
+    request_id = Column(
+        String(50), ForeignKey("trace_info.request_id", ondelete="CASCADE"), nullable=False
+    )
+    """
+    Request ID to which this span belongs: *Foreign Key* into ``trace_info`` table.
+    """
+    span_id = Column(String(50), nullable=False)
+    """
+    Span ID: `String` (limit 50 characters). Unique within a trace.
+    """
+    parent_span_id = Column(String(50), nullable=True)
+    """
+    Span ID of the parent span. *null* for the root span.
+    """
+    name = Column(String(500), nullable=True)
+    """
+    Span name: `String` (limit 500 characters).
+    """
+    span_type = Column(String(500), nullable=True)
+    """
+    Span type: `String` (limit 500 characters), e.g. ``RETRIEVER``.
+    """
+    status = Column(String(50), nullable=False)
+    """
+    Status code of the span, defined in :py:class:`qcflow.entities.SpanStatusCode`.
+    """
+    duration_ms = Column(BigInteger, nullable=True)
+    """
+    Duration of the span, in milliseconds. Could be *null* if the span has not ended.
+    """
+    trace_info = relationship("SqlTraceInfo", backref=backref("spans", cascade="all"))
+    """
+    SQLAlchemy relationship (many:one) with
+    :py:class:`qcflow.store.dbmodels.models.SqlTraceInfo`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("request_id", "span_id", name="trace_spans_pk"),
+        Index(f"index_{__tablename__}_span_type_duration_ms", "span_type", "duration_ms"),
+        Index(f"index_{__tablename__}_name", "name"),
+    )
+
+
+class SqlTraceSpanAttribute(Base):
+    """
+    Span attribute selected for search, stored as a string.
+    """
+
+    __tablename__ = "trace_span_attributes"
+
+    request_id = Column(
+        String(50), ForeignKey("trace_info.request_id", ondelete="CASCADE"), nullable=False
+    )
+    """
+    Request ID to which the span belongs: *Foreign Key* into ``trace_info`` table.
+    """
+    span_id = Column(String(50), nullable=False)
+    """
+    Span ID of the span the attribute belongs to.
+    """
+    key = Column(String(250), nullable=False)
+    """
+    Attribute key: `String` (limit 250 characters).
+    """
+    value = Column(String(8000), nullable=True)
+    """
+    Attribute value: `String` (limit 8000 characters). Non-string values are JSON-serialized.
+    """
+
+    # Key is unique within a span
+    __table_args__ = (
+        PrimaryKeyConstraint("request_id", "span_id", "key", name="trace_span_attributes_pk"),
+        Index(f"index_{__tablename__}_key", "key"),
+    )
+
+
+class SqlChangeEvent(Base):
+    """
+    DB model for the change feed of the tracking and model registry stores.
+    """
+
+    __tablename__ = "change_events"
+
+    sequence = Column(BigInteger().with_variant(Integer, "sqlite"), autoincrement=True)
+    """
+    Position of the event in the feed: `BigInteger`. *Primary Key* for ``change_events`` table.
+    """
+    timestamp = Column(BigInteger, nullable=False)
+    """
+    Time the event was recorded, in milliseconds since the UNIX epoch: `BigInteger`.
+    """
+    entity_type = Column(String(50), nullable=False)
+    """
+    Type of the changed entity: `String` (limit 50 characters).
+    """
+    entity_id = Column(String(500), nullable=False)
+    """
+    Identifier of the changed entity: `String` (limit 500 characters).
+    """
+    op = Column(String(20), nullable=False)
+    """
+    Operation applied to the entity: `String` (limit 20 characters).
+    """
+    data = Column(sa.Text, nullable=True)
+    """
+    Changed fields of the entity, serialized as a JSON object: `Text`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("sequence", name="change_events_pk"),
+        Index(f"index_{__tablename__}_timestamp", "timestamp"),
+    )
+
+    def to_qcflow_entity(self):
+        """
+        Convert DB model to corresponding QCFlow entity.
+
+        Returns:
+            :py:class:`qcflow.entities.ChangeEvent`.
+        """
+        return ChangeEvent(
+            sequence=self.sequence,
+            timestamp=self.timestamp,
+            entity_type=self.entity_type,
+            entity_id=self.entity_id,
+            op=self.op,
+            data=json.loads(self.data) if self.data else None,
+        )
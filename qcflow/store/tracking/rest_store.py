@@ -2,8 +2,18 @@ import json
 import logging
 from typing import Optional
 
-from qcflow.entities import DatasetInput, Experiment, Metric, Run, RunInfo, TraceInfo, ViewType
+from qcflow.entities import (
+    ChangeEvent,
+    DatasetInput,
+    Experiment,
+    Metric,
+    Run,
+    RunInfo,
+    TraceInfo,
+    ViewType,
+)
 from qcflow.entities.trace_status import TraceStatus
+from qcflow.environment_variables import QCFLOW_HTTP_REQUEST_TIMEOUT
 from qcflow.exceptions import QCFlowException
 from qcflow.protos import databricks_pb2
 from qcflow.protos.service_pb2 import (
@@ -41,7 +51,7 @@ from qcflow.protos.service_pb2 import (
     UpdateRun,
 )
 from qcflow.store.entities.paged_list import PagedList
-from qcflow.store.tracking import SEARCH_TRACES_DEFAULT_MAX_RESULTS
+from qcflow.store.tracking import CHANGE_EVENTS_MAX_RESULTS, SEARCH_TRACES_DEFAULT_MAX_RESULTS
 from qcflow.store.tracking.abstract_store import AbstractStore
 from qcflow.utils.proto_json_utils import message_to_json
 from qcflow.utils.rest_utils import (
@@ -51,9 +61,12 @@ from qcflow.utils.rest_utils import (
     get_set_trace_tag_endpoint,
     get_single_trace_endpoint,
     get_trace_info_endpoint,
+    http_request,
+    verify_rest_response,
 )
 
 _METHOD_TO_INFO = extract_api_info_for_service(QCFlowService, _REST_API_PATH_PREFIX)
+_GET_CHANGE_EVENTS_ENDPOINT = f"{_REST_API_PATH_PREFIX}/qcflow/change-events/get"
 _logger = logging.getLogger(__name__)
 
 
@@ -361,6 +374,30 @@ class RestStore(AbstractStore):
         trace_infos = [TraceInfo.from_proto(t) for t in response_proto.traces]
         return trace_infos, response_proto.next_page_token or None
 
+    def get_change_events(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+        timeout_seconds: float = 0,
+    ) -> PagedList[ChangeEvent]:
+        params = {"max_results": max_results, "timeout_seconds": timeout_seconds}
+        if entity_types:
+            params["entity_types"] = entity_types
+        if page_token:
+            params["page_token"] = page_token
+        response = http_request(
+            host_creds=self.get_host_creds(),
+            endpoint=_GET_CHANGE_EVENTS_ENDPOINT,
+            method="GET",
+            params=params,
+            # The server holds the request for up to ``timeout_seconds`` when there are no events
+            timeout=QCFLOW_HTTP_REQUEST_TIMEOUT.get() + timeout_seconds,
+        )
+        response = verify_rest_response(response, _GET_CHANGE_EVENTS_ENDPOINT).json()
+        events = [ChangeEvent.from_dictionary(event) for event in response.get("events", [])]
+        return PagedList(events, response.get("next_page_token"))
+
     def set_trace_tag(self, request_id: str, key: str, value: str):
         """
         Set a tag on the trace with the given request_id.
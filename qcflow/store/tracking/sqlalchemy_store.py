@@ -15,6 +15,9 @@ from sqlalchemy.future import select
 
 import qcflow.store.db.utils
 from qcflow.entities import (
+    ChangeEntityType,
+    ChangeEvent,
+    ChangeOperation,
     DatasetInput,
     Experiment,
     Run,
@@ -22,6 +25,7 @@ from qcflow.entities import (
     RunStatus,
     RunTag,
     SourceType,
+    Span,
     TraceInfo,
     ViewType,
     _DatasetSummary,
@@ -37,9 +41,11 @@ from qcflow.protos.databricks_pb2 import (
     RESOURCE_ALREADY_EXISTS,
     RESOURCE_DOES_NOT_EXIST,
 )
+from qcflow.store.db.change_feed import get_change_events, record_change_event
 from qcflow.store.db.db_types import MSSQL, MYSQL
 from qcflow.store.entities.paged_list import PagedList
 from qcflow.store.tracking import (
+    CHANGE_EVENTS_MAX_RESULTS,
     SEARCH_MAX_RESULTS_DEFAULT,
     SEARCH_MAX_RESULTS_THRESHOLD,
     SEARCH_TRACES_DEFAULT_MAX_RESULTS,
@@ -58,6 +64,8 @@ from qcflow.store.tracking.dbmodels.models import (
     SqlTag,
     SqlTraceInfo,
     SqlTraceRequestMetadata,
+    SqlTraceSpan,
+    SqlTraceSpanAttribute,
     SqlTraceTag,
 )
 from qcflow.tracing.utils import generate_request_id
@@ -292,6 +300,13 @@ class SqlAlchemyStore(AbstractStore):
                 )
 
             session.flush()
+            record_change_event(
+                session,
+                ChangeEntityType.EXPERIMENT,
+                str(experiment.experiment_id),
+                ChangeOperation.CREATE,
+                {"name": name},
+            )
             return str(experiment.experiment_id)
 
     def _search_experiments(
@@ -301,6 +316,7 @@ class SqlAlchemyStore(AbstractStore):
         filter_string,
         order_by,
         page_token,
+        access_filter=None,
     ):
         def compute_next_token(current_size):
             next_token = None
@@ -326,6 +342,9 @@ class SqlAlchemyStore(AbstractStore):
                 .options(*self._get_eager_experiment_query_options())
                 .filter(
                     *attribute_filters,
+                    *qcflow.store.db.utils._get_access_filter_clauses(
+                        access_filter, SqlExperiment.experiment_id, id_type=int
+                    ),
                     SqlExperiment.lifecycle_stage.in_(lifecycle_stags),
                 )
                 .order_by(*order_by_clauses)
@@ -345,9 +364,27 @@ class SqlAlchemyStore(AbstractStore):
         filter_string=None,
         order_by=None,
         page_token=None,
+        access_filter=None,
     ):
+        """
+        Search for experiments that satisfy the filter criteria.
+
+        Args:
+            view_type: One of enumerated types in :py:class:`qcflow.entities.ViewType`.
+            max_results: Maximum number of experiments desired.
+            filter_string: Filter query string, defaults to searching all experiments.
+            order_by: List of columns to order by, defaults to ordering by experiment ID.
+            page_token: Token specifying the next page of results. It should be obtained from
+                a ``search_experiments`` call.
+            access_filter: An optional :py:class:`AccessFilter <qcflow.store.entities.AccessFilter>`
+                of experiment IDs restricting the search to the experiments readable by a user.
+
+        Returns:
+            A :py:class:`PagedList <qcflow.store.entities.PagedList>` of
+            :py:class:`Experiment <qcflow.entities.Experiment>` objects.
+        """
         experiments, next_page_token = self._search_experiments(
-            view_type, max_results, filter_string, order_by, page_token
+            view_type, max_results, filter_string, order_by, page_token, access_filter
         )
         return PagedList(experiments, next_page_token)
 
@@ -425,6 +462,9 @@ class SqlAlchemyStore(AbstractStore):
             for run in runs:
                 self._mark_run_deleted(session, run)
             session.add(experiment)
+            record_change_event(
+                session, ChangeEntityType.EXPERIMENT, str(experiment_id), ChangeOperation.DELETE
+            )
 
     def _hard_delete_experiment(self, experiment_id):
         """
@@ -461,6 +501,9 @@ class SqlAlchemyStore(AbstractStore):
             for run in runs:
                 self._mark_run_active(session, run)
             session.add(experiment)
+            record_change_event(
+                session, ChangeEntityType.EXPERIMENT, str(experiment_id), ChangeOperation.RESTORE
+            )
 
     def rename_experiment(self, experiment_id, new_name):
         with self.ManagedSessionMaker() as session:
@@ -471,6 +514,13 @@ class SqlAlchemyStore(AbstractStore):
             experiment.name = new_name
             experiment.last_update_time = get_current_time_millis()
             session.add(experiment)
+            record_change_event(
+                session,
+                ChangeEntityType.EXPERIMENT,
+                str(experiment_id),
+                ChangeOperation.UPDATE,
+                {"name": new_name},
+            )
 
     def create_run(self, experiment_id, user_id, start_time, tags, run_name):
         with self.ManagedSessionMaker() as session:
@@ -517,6 +567,13 @@ class SqlAlchemyStore(AbstractStore):
 
             run.tags = [SqlTag(key=tag.key, value=tag.value) for tag in tags]
             session.add(run)
+            record_change_event(
+                session,
+                ChangeEntityType.RUN,
+                run_id,
+                ChangeOperation.CREATE,
+                {"experiment_id": str(experiment_id), "run_name": run_name},
+            )
 
             return run.to_qcflow_entity()
 
@@ -638,6 +695,18 @@ class SqlAlchemyStore(AbstractStore):
                     run_name_tag.value = run_name
 
             session.add(run)
+            record_change_event(
+                session,
+                ChangeEntityType.RUN,
+                run_id,
+                ChangeOperation.UPDATE,
+                {
+                    "experiment_id": str(run.experiment_id),
+                    "status": run.status,
+                    "end_time": run.end_time,
+                    "run_name": run.name,
+                },
+            )
             run = run.to_qcflow_entity()
 
             return run.info
@@ -669,6 +738,13 @@ class SqlAlchemyStore(AbstractStore):
             run.lifecycle_stage = LifecycleStage.ACTIVE
             run.deleted_time = None
             session.add(run)
+            record_change_event(
+                session,
+                ChangeEntityType.RUN,
+                run_id,
+                ChangeOperation.RESTORE,
+                {"experiment_id": str(run.experiment_id)},
+            )
 
     def delete_run(self, run_id):
         with self.ManagedSessionMaker() as session:
@@ -676,6 +752,13 @@ class SqlAlchemyStore(AbstractStore):
             run.lifecycle_stage = LifecycleStage.DELETED
             run.deleted_time = get_current_time_millis()
             session.add(run)
+            record_change_event(
+                session,
+                ChangeEntityType.RUN,
+                run_id,
+                ChangeOperation.DELETE,
+                {"experiment_id": str(run.experiment_id)},
+            )
 
     def _hard_delete_run(self, run_id):
         """
@@ -1656,6 +1739,44 @@ class SqlAlchemyStore(AbstractStore):
                 session.merge(SqlTraceTag(request_id=request_id, key=k, value=v))
             return sql_trace_info.to_qcflow_entity()
 
+    def end_traces(self, trace_infos: list[TraceInfo]) -> list[TraceInfo]:
+        """
+        Update multiple TraceInfo objects in the database with the completed trace info,
+        within a single transaction.
+
+        Args:
+            trace_infos: The completed TraceInfo objects. The end time of each trace is
+                computed as ``timestamp_ms + execution_time_ms``, and its request metadata
+                and tags are merged with the existing ones.
+
+        Returns:
+            The updated TraceInfo objects, in the same order as ``trace_infos``.
+        """
+        with self.ManagedSessionMaker() as session:
+            request_ids = [trace_info.request_id for trace_info in trace_infos]
+            sql_trace_infos = {
+                sql_trace_info.request_id: sql_trace_info
+                for sql_trace_info in session.query(SqlTraceInfo).filter(
+                    SqlTraceInfo.request_id.in_(request_ids)
+                )
+            }
+            for trace_info in trace_infos:
+                request_id = trace_info.request_id
+                sql_trace_info = sql_trace_infos.get(request_id)
+                if sql_trace_info is None:
+                    raise QCFlowException(
+                        f"Trace with request_id '{request_id}' not found.",
+                        RESOURCE_DOES_NOT_EXIST,
+                    )
+                end_time_ms = trace_info.timestamp_ms + trace_info.execution_time_ms
+                sql_trace_info.execution_time_ms = end_time_ms - sql_trace_info.timestamp_ms
+                sql_trace_info.status = trace_info.status
+                for k, v in trace_info.request_metadata.items():
+                    session.merge(SqlTraceRequestMetadata(request_id=request_id, key=k, value=v))
+                for k, v in trace_info.tags.items():
+                    session.merge(SqlTraceTag(request_id=request_id, key=k, value=v))
+            return [sql_trace_infos[request_id].to_qcflow_entity() for request_id in request_ids]
+
     def get_trace_info(self, request_id) -> TraceInfo:
         """
         Fetch the trace info for the given request id.
@@ -1670,6 +1791,67 @@ class SqlAlchemyStore(AbstractStore):
             sql_trace_info = self._get_sql_trace_info(session, request_id)
             return sql_trace_info.to_qcflow_entity()
 
+    def index_trace_spans(
+        self,
+        request_id: str,
+        spans: list[Span],
+        attribute_keys: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Store the summaries of the spans of a trace in the database, so that traces can be
+        searched by their spans without downloading the trace data. Spans that are already
+        indexed for the trace are skipped, e.g. when spans are exported in multiple batches.
+
+        Args:
+            request_id: Unique string identifier of the trace.
+            spans: The spans of the trace to index.
+            attribute_keys: The keys of the span attributes to index for search. Non-string
+                attribute values are stored as JSON strings.
+        """
+        with self.ManagedSessionMaker() as session:
+            self._get_sql_trace_info(session, request_id)
+            indexed_span_ids = {
+                span_id
+                for (span_id,) in session.query(SqlTraceSpan.span_id).filter(
+                    SqlTraceSpan.request_id == request_id
+                )
+            }
+            for span in spans:
+                if span.span_id in indexed_span_ids:
+                    continue
+                indexed_span_ids.add(span.span_id)
+
+                end_time_ns = span.end_time_ns
+                session.add(
+                    SqlTraceSpan(
+                        request_id=request_id,
+                        span_id=span.span_id,
+                        parent_span_id=span.parent_id,
+                        name=span.name[:500] if span.name else span.name,
+                        span_type=span.span_type[:500] if span.span_type else span.span_type,
+                        status=span.status.status_code.value,
+                        duration_ms=(
+                            (end_time_ns - span.start_time_ns) // 1_000_000
+                            if end_time_ns is not None
+                            else None
+                        ),
+                    )
+                )
+                for key in attribute_keys or []:
+                    value = span.get_attribute(key)
+                    if value is None:
+                        continue
+                    if not isinstance(value, str):
+                        value = json.dumps(value)
+                    session.add(
+                        SqlTraceSpanAttribute(
+                            request_id=request_id,
+                            span_id=span.span_id,
+                            key=key,
+                            value=value[:8000],
+                        )
+                    )
+
     def _get_sql_trace_info(self, session, request_id) -> SqlTraceInfo:
         sql_trace_info = (
             session.query(SqlTraceInfo).filter(SqlTraceInfo.request_id == request_id).one_or_none()
@@ -1753,6 +1935,25 @@ class SqlAlchemyStore(AbstractStore):
 
             return trace_infos, next_token
 
+    def get_change_events(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+        timeout_seconds: float = 0,
+    ) -> PagedList[ChangeEvent]:
+        """
+        Read the change feed of the database, which includes the events of the model registry
+        stores sharing the database. See ``AbstractStore.get_change_events``.
+        """
+        return get_change_events(
+            self.ManagedSessionMaker,
+            entity_types=entity_types,
+            page_token=page_token,
+            max_results=max_results,
+            timeout_seconds=timeout_seconds,
+        )
+
     def _validate_max_results_param(self, max_results: int, allow_null=False):
         if (not allow_null and max_results is None) or max_results < 1:
             raise QCFlowException(
@@ -2141,6 +2342,7 @@ def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
     """
     attribute_filters = []
     non_attribute_filters = []
+    span_filters = []
 
     parsed_filters = SearchTraceUtils.parse_search_filter_for_search_traces(filter_string)
     for sql_statement in parsed_filters:
@@ -2155,6 +2357,8 @@ def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
                 attribute, value
             )
             attribute_filters.append(attr_filter)
+        elif SearchTraceUtils.is_span(key_type, key_name, comparator):
+            span_filters.append(_get_span_filter(key_name, comparator, value, dialect))
         else:
             if SearchTraceUtils.is_tag(key_type, comparator):
                 entity = SqlTraceTag
@@ -2176,4 +2380,36 @@ def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
                 session.query(entity).filter(key_filter, val_filter).subquery()
             )
 
+    if span_filters:
+        # All span clauses must be satisfied by the same span. A trace may have multiple matching
+        # spans, so the spans are filtered in a subquery rather than joined, which keeps the
+        # result unique on request_id.
+        attribute_filters.append(
+            SqlTraceInfo.request_id.in_(select(SqlTraceSpan.request_id).where(*span_filters))
+        )
+
     return attribute_filters, non_attribute_filters
+
+
+def _get_span_filter(key_name, comparator, value, dialect):
+    """
+    Creates a filter on the indexed spans for a span clause, e.g. `span.type = 'RETRIEVER'`.
+    """
+    if key_name.startswith(SearchTraceUtils.SPAN_ATTRIBUTE_PREFIX):
+        attribute_key = key_name[len(SearchTraceUtils.SPAN_ATTRIBUTE_PREFIX) :]
+        return (
+            select(SqlTraceSpanAttribute.key)
+            .where(
+                SqlTraceSpanAttribute.request_id == SqlTraceSpan.request_id,
+                SqlTraceSpanAttribute.span_id == SqlTraceSpan.span_id,
+                SqlTraceSpanAttribute.key == attribute_key,
+                SearchTraceUtils.get_sql_comparison_func(comparator, dialect)(
+                    SqlTraceSpanAttribute.value, value
+                ),
+            )
+            .exists()
+        )
+
+    return SearchTraceUtils.get_sql_comparison_func(comparator, dialect)(
+        getattr(SqlTraceSpan, key_name), value
+    )
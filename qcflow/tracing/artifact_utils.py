@@ -4,6 +4,8 @@ from qcflow.protos.databricks_pb2 import INTERNAL_ERROR
 from qcflow.utils.qcflow_tags import QCFLOW_ARTIFACT_LOCATION
 
 TRACE_DATA_FILE_NAME = "traces.json"
+# Directory holding the span batches of a trace exported incrementally
+TRACE_SPAN_BATCH_DIR = "spans"
 
 
 def get_artifact_uri_for_trace(trace_info: TraceInfo) -> str:
@@ -19,3 +21,11 @@ def get_artifact_uri_for_trace(trace_info: TraceInfo) -> str:
             error_code=INTERNAL_ERROR,
         )
     return trace_info.tags[QCFLOW_ARTIFACT_LOCATION]
+
+
+def get_trace_span_batch_file_name(batch_index: int) -> str:
+    """
+    Get the name of the file storing the span batch with the given index, relative
+    to the trace artifact root.
+    """
+    return f"{TRACE_SPAN_BATCH_DIR}/batch-{batch_index:05d}.json"
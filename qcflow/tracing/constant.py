@@ -3,6 +3,8 @@ class TraceMetadataKey:
     INPUTS = "qcflow.traceInputs"
     OUTPUTS = "qcflow.traceOutputs"
     SOURCE_RUN = "qcflow.sourceRun"
+    # Number of span batches exported incrementally before the root span ended
+    SPAN_BATCHES = "qcflow.traceSpanBatches"
 
 
 class TraceTagKey:
@@ -1,21 +1,37 @@
 import atexit
+import dataclasses
 import logging
 import threading
+import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from queue import Empty, Queue
 from typing import Callable, Optional, Sequence
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter
 
+from qcflow.entities.span import Span
 from qcflow.entities.trace import Trace
-from qcflow.environment_variables import QCFLOW_ENABLE_ASYNC_LOGGING
-from qcflow.tracing.constant import TraceTagKey
+from qcflow.entities.trace_info import TraceInfo
+from qcflow.environment_variables import (
+    QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL,
+    QCFLOW_ASYNC_TRACE_LOGGING_MAX_BATCH_SIZE,
+    QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE,
+    QCFLOW_ASYNC_TRACE_LOGGING_MAX_WORKERS,
+    QCFLOW_ENABLE_ASYNC_LOGGING,
+    QCFLOW_TRACE_INCREMENTAL_EXPORT,
+    QCFLOW_TRACE_INDEX_SPANS,
+    QCFLOW_TRACE_SPAN_BATCH_SIZE,
+)
+from qcflow.tracing.constant import SpanAttributeKey, TraceTagKey
 from qcflow.tracing.display import get_display_handler
 from qcflow.tracing.display.display_handler import IPythonTraceDisplayHandler
 from qcflow.tracing.fluent import TRACE_BUFFER
+from qcflow.tracing.sampling import TailSampler
 from qcflow.tracing.trace_manager import InMemoryTraceManager
-from qcflow.tracing.utils import maybe_get_request_id
+from qcflow.tracing.utils import encode_span_id, get_otel_attribute, maybe_get_request_id
 from qcflow.tracking.client import QCFlowClient
 
 _logger = logging.getLogger(__name__)
@@ -25,14 +41,20 @@ class QCFlowSpanExporter(SpanExporter):
     """
     An exporter implementation that logs the traces to QCFlow.
 
-    QCFlow backend (will) only support logging the complete trace, not incremental updates
-    for spans, so this exporter is designed to aggregate the spans into traces in memory.
-    Therefore, this only works within a single process application and not intended to work
-    in a distributed environment. For the same reason, this exporter should only be used with
-    SimpleSpanProcessor.
+    By default, this exporter aggregates the spans into traces in memory and logs the complete
+    trace when the root span ends. When ``QCFLOW_TRACE_INCREMENTAL_EXPORT`` is enabled, ended
+    child spans are additionally flushed to the trace artifact location in batches of
+    ``QCFLOW_TRACE_SPAN_BATCH_SIZE`` spans, which bounds the memory used by long-running
+    traces. The batches are assembled into the full trace when the trace data is downloaded.
+    Note that the trace displayed in the notebook and kept in the in-memory trace buffer only
+    contains the spans that have not been flushed.
 
-    If we want to support distributed tracing, we should first implement an incremental trace
-    logging in QCFlow backend, then we can get rid of the in-memory trace aggregation.
+    Traces can be dropped before export by tail sampling, configured with the
+    ``QCFLOW_TRACE_TAIL_SAMPLING_*`` environment variables.
+
+    Spans are still aggregated within a single process, so this exporter is not intended to
+    work in a distributed environment. For the same reason, this exporter should only be used
+    with SimpleSpanProcessor.
 
     :meta private:
     """
@@ -46,6 +68,7 @@ class QCFlowSpanExporter(SpanExporter):
         self._display_handler = display_handler or get_display_handler()
         self._trace_manager = InMemoryTraceManager.get_instance()
         self._async_queue = AsyncTraceExportQueue(self._client)
+        self._tail_sampler = TailSampler.from_env()
 
     def export(self, root_spans: Sequence[ReadableSpan]):
         """
@@ -57,14 +80,25 @@ class QCFlowSpanExporter(SpanExporter):
         """
         for span in root_spans:
             if span._parent is not None:
-                _logger.debug("Received a non-root span. Skipping export.")
+                if QCFLOW_TRACE_INCREMENTAL_EXPORT.get():
+                    self._export_span_batch(span)
+                else:
+                    _logger.debug("Received a non-root span. Skipping export.")
                 continue
 
-            trace = self._trace_manager.pop_trace(span.context.trace_id)
-            if trace is None:
+            trace_state = self._trace_manager.pop_trace_state(span.context.trace_id)
+            if trace_state is None:
                 _logger.debug(f"TraceInfo for span {span} not found. Skipping export.")
                 continue
 
+            # Decide before converting the spans, so that the span attributes of a dropped
+            # trace are never serialized.
+            if not self._tail_sampler.should_keep(trace_state.info):
+                self._discard_trace(trace_state.info)
+                continue
+
+            trace = trace_state.to_qcflow_trace()
+
             # Add the trace to the in-memory buffer
             TRACE_BUFFER[trace.info.request_id] = trace
             # Add evaluation trace to the in-memory buffer with eval_request_id key
@@ -78,6 +112,51 @@ class QCFlowSpanExporter(SpanExporter):
 
             self._log_trace(trace)
 
+    def _discard_trace(self, trace_info: TraceInfo):
+        """
+        Discard a trace dropped by tail sampling. The trace info has already been created in
+        QCFlow backend when the root span started, so it is deleted.
+        """
+        _logger.debug(f"Trace {trace_info.request_id} is dropped by tail sampling.")
+        delete_trace_task = Task(
+            handler=self._client.delete_traces,
+            args=(trace_info.experiment_id, None, None, [trace_info.request_id]),
+            error_msg="Failed to delete trace dropped by tail sampling from QCFlow backend.",
+        )
+        if QCFLOW_ENABLE_ASYNC_LOGGING.get():
+            self._async_queue.put(delete_trace_task)
+        else:
+            delete_trace_task.handle()
+
+    def _export_span_batch(self, span: ReadableSpan):
+        """Log a batch of ended child spans to QCFlow backend once the batch is full."""
+        request_id = get_otel_attribute(span, SpanAttributeKey.REQUEST_ID)
+        batch = self._trace_manager.pop_ended_spans(
+            request_id,
+            encode_span_id(span.context.span_id),
+            batch_size=QCFLOW_TRACE_SPAN_BATCH_SIZE.get(),
+        )
+        if batch is None:
+            return
+
+        tasks = [
+            Task(
+                handler=self._client._upload_trace_span_batch,
+                args=(batch.info, batch.spans, batch.index),
+                error_msg="Failed to log span batch to QCFlow backend.",
+            )
+        ]
+        if QCFLOW_TRACE_INDEX_SPANS.get():
+            tasks.append(self._get_index_spans_task(batch.info, batch.spans))
+
+        if QCFLOW_ENABLE_ASYNC_LOGGING.get():
+            # The root span records the number of the batches of the trace, so dropping one
+            # would leave the trace data incomplete
+            self._async_queue.put(*tasks, droppable=False)
+        else:
+            for task in tasks:
+                task.handle()
+
     def _log_trace(self, trace: Trace):
         """Log the trace to QCFlow backend."""
         upload_tag_task = Task(
@@ -96,47 +175,143 @@ class QCFlowSpanExporter(SpanExporter):
             handler=self._client._upload_ended_trace_info,
             args=(trace.info,),
             error_msg="Failed to log trace to QCFlow backend.",
+            batch_handler=self._upload_ended_trace_infos,
         )
 
+        tasks = [upload_tag_task, upload_trace_data_task, upload_ended_trace_info_task]
+        if QCFLOW_TRACE_INDEX_SPANS.get():
+            tasks.append(self._get_index_spans_task(trace.info, trace.data.spans))
+
         if QCFLOW_ENABLE_ASYNC_LOGGING.get():
-            self._async_queue.put(upload_tag_task)
-            self._async_queue.put(upload_trace_data_task)
-            self._async_queue.put(upload_ended_trace_info_task)
+            # All tasks of a trace are enqueued at once, so that the trace is either exported
+            # or dropped as a whole when the queue is full.
+            self._async_queue.put(*tasks)
         else:
-            upload_tag_task.handle()
-            upload_trace_data_task.handle()
-            upload_ended_trace_info_task.handle()
+            for task in tasks:
+                task.handle()
+
+    def _get_index_spans_task(self, trace_info: TraceInfo, spans: list[Span]) -> "Task":
+        return Task(
+            handler=self._client._index_trace_spans,
+            args=(trace_info, spans),
+            error_msg="Failed to index trace spans in QCFlow backend.",
+        )
+
+    def _upload_ended_trace_infos(self, batch_args: list[tuple[TraceInfo]]):
+        """Update the trace infos of multiple ended traces in a single bulk call."""
+        self._client._upload_ended_trace_infos([trace_info for (trace_info,) in batch_args])
 
 
 class Task:
     """A dataclass to represent a task to be processed by the async trace export queue."""
 
-    def __init__(self, handler: Callable, args: Sequence, error_msg: str = ""):
+    def __init__(
+        self,
+        handler: Callable,
+        args: Sequence,
+        error_msg: str = "",
+        batch_handler: Optional[Callable[[list[Sequence]], None]] = None,
+    ):
+        """
+        Args:
+            handler: The function to handle the task, called with ``args``.
+            args: The arguments to pass to the handler.
+            error_msg: The message to log when the handler fails.
+            batch_handler: An optional function to handle multiple tasks at once, called with
+                the list of ``args`` of the tasks. The async trace export queue coalesces
+                pending tasks sharing the same batch handler into a single call.
+        """
         self._handler = handler
         self._args = args
         self._error_msg = error_msg
+        self._batch_handler = batch_handler
+        self._enqueued_time = None
 
-    def handle(self):
-        """Handle the task. This method must not raise any exception."""
+    def handle(self) -> bool:
+        """
+        Handle the task. This method must not raise any exception.
+
+        Returns:
+            True if the task is handled successfully, False otherwise.
+        """
         try:
             self._handler(*self._args)
+            return True
         except Exception as e:
             _logger.warning(
                 f"{self._error_msg} Error: {e}. For full traceback, set logging level to debug.",
                 exc_info=_logger.isEnabledFor(logging.DEBUG),
             )
+            return False
+
+
+def _handle_task_batch(tasks: list[Task]) -> list[bool]:
+    """
+    Handle tasks sharing the same batch handler with a single call. If the batch call fails,
+    fall back to handling the tasks one by one so that a single bad task does not fail the
+    whole batch. This function must not raise any exception.
+    """
+    if len(tasks) == 1:
+        return [tasks[0].handle()]
+
+    try:
+        tasks[0]._batch_handler([task._args for task in tasks])
+        return [True] * len(tasks)
+    except Exception as e:
+        _logger.debug(
+            f"Failed to handle a batch of {len(tasks)} tasks: {e}. Retrying one by one.",
+            exc_info=True,
+        )
+        return [task.handle() for task in tasks]
+
+
+@dataclass
+class AsyncTraceExportMetrics:
+    """
+    A snapshot of the metrics of the async trace export queue.
+
+    Args:
+        queue_depth: Number of tasks waiting in the queue.
+        num_pending_tasks: Number of tasks that have been enqueued but not handled yet,
+            including the tasks being handled by the workers.
+        num_handled_tasks: Number of tasks handled successfully.
+        num_failed_tasks: Number of tasks whose handler failed.
+        num_dropped_tasks: Number of tasks dropped because the queue was full.
+        num_batches: Number of bulk calls made for coalesced tasks.
+        avg_export_latency_seconds: Average time from enqueueing a task to finishing it.
+        max_export_latency_seconds: Maximum time from enqueueing a task to finishing it.
+    """
+
+    queue_depth: int = 0
+    num_pending_tasks: int = 0
+    num_handled_tasks: int = 0
+    num_failed_tasks: int = 0
+    num_dropped_tasks: int = 0
+    num_batches: int = 0
+    avg_export_latency_seconds: float = 0.0
+    max_export_latency_seconds: float = 0.0
 
 
 class AsyncTraceExportQueue:
     """
-    This is a queue based run data processor that queue incoming data and process it using a single
-    worker thread. This class is used to process traces saving in async fashion.
+    This is a queue based run data processor that queue incoming data and process it using a
+    dispatcher thread and a pool of worker threads. This class is used to process traces saving
+    in async fashion.
+
+    The queue is bounded by ``QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE``. When it is full, new
+    tasks are dropped (default) or the caller is blocked, depending on
+    ``QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL``. Tasks that must not be dropped, e.g. the span
+    batches of a trace being exported incrementally, always block the caller. Pending tasks
+    sharing the same batch handler, e.g. trace info updates, are coalesced into bulk calls.
     """
 
     def __init__(self, client) -> None:
-        self._queue: Queue[Task] = Queue()
+        self._queue: Queue[Task] = Queue(maxsize=QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE.get())
         self._client = client
         self._lock = threading.RLock()
+        self._max_workers = QCFLOW_ASYNC_TRACE_LOGGING_MAX_WORKERS.get()
+        self._max_batch_size = QCFLOW_ASYNC_TRACE_LOGGING_MAX_BATCH_SIZE.get()
+        self._drop_when_full = QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL.get()
 
         # A thread event that indicates the logging queue stop processing task.
         self._stop_event = threading.Event()
@@ -144,8 +319,25 @@ class AsyncTraceExportQueue:
         self._unprocessed_tasks = set()
         self._atexit_callback_registered = False
 
-    def put(self, task: Task) -> None:
-        """Put a new task to the queue for processing."""
+        self._metrics_lock = threading.Lock()
+        self._metrics = AsyncTraceExportMetrics()
+        self._total_export_latency_seconds = 0.0
+        self._issued_drop_warning = False
+
+    def put(self, *tasks: Task, droppable: bool = True) -> bool:
+        """
+        Put new tasks to the queue for processing. The tasks are enqueued atomically, i.e.
+        either all of them or none of them are dropped when the queue is full.
+
+        Args:
+            tasks: The tasks to enqueue.
+            droppable: Whether the tasks can be dropped when the queue is full. If False, the
+                caller is blocked until the queue has room for the tasks, regardless of
+                ``QCFLOW_ASYNC_TRACE_LOGGING_DROP_WHEN_FULL``.
+
+        Returns:
+            True if the tasks are enqueued, False if they are dropped.
+        """
         if not self.is_active():
             self.activate()
 
@@ -153,9 +345,72 @@ class AsyncTraceExportQueue:
         if self._stop_event.is_set():
             self._stop_event.wait()
 
+        if self._drop_when_full and droppable:
+            # The check and the enqueueing are atomic, so that the tasks are not enqueued
+            # partially
+            with self._lock:
+                if self._is_full(len(tasks)):
+                    self._record_dropped_tasks(len(tasks))
+                    return False
+                for task in tasks:
+                    self._enqueue(task)
+        else:
+            # Block without holding the lock, so that the other callers can still drop their
+            # tasks rather than wait
+            for task in tasks:
+                self._enqueue(task)
+        return True
+
+    def _enqueue(self, task: Task) -> None:
+        task._enqueued_time = time.monotonic()
         self._unprocessed_tasks.add(task)
         self._queue.put(task)
 
+    def _is_full(self, num_new_tasks: int) -> bool:
+        return 0 < self._queue.maxsize < self._queue.qsize() + num_new_tasks
+
+    def _record_dropped_tasks(self, num_tasks: int) -> None:
+        with self._metrics_lock:
+            self._metrics.num_dropped_tasks += num_tasks
+
+        message = (
+            "The async trace export queue is full, dropping the trace. Consider increasing "
+            f"{QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE.name} or "
+            f"{QCFLOW_ASYNC_TRACE_LOGGING_MAX_WORKERS.name}."
+        )
+        if self._issued_drop_warning:
+            _logger.debug(message)
+        else:
+            _logger.warning(message)
+            self._issued_drop_warning = True
+
+    def _record_handled_tasks(self, tasks: list[Task], results: list[bool]) -> None:
+        now = time.monotonic()
+        with self._metrics_lock:
+            for task, success in zip(tasks, results):
+                if success:
+                    self._metrics.num_handled_tasks += 1
+                else:
+                    self._metrics.num_failed_tasks += 1
+                latency = now - task._enqueued_time
+                self._total_export_latency_seconds += latency
+                self._metrics.max_export_latency_seconds = max(
+                    self._metrics.max_export_latency_seconds, latency
+                )
+
+    def get_metrics(self) -> AsyncTraceExportMetrics:
+        """Get a snapshot of the metrics of the queue, for monitoring the trace export."""
+        with self._metrics_lock:
+            num_finished = self._metrics.num_handled_tasks + self._metrics.num_failed_tasks
+            return dataclasses.replace(
+                self._metrics,
+                queue_depth=self._queue.qsize(),
+                num_pending_tasks=len(self._unprocessed_tasks),
+                avg_export_latency_seconds=(
+                    self._total_export_latency_seconds / num_finished if num_finished else 0.0
+                ),
+            )
+
     def _logging_loop(self) -> None:
         """
         Continuously process incoming tasks in the queue until the stop event is set.
@@ -167,17 +422,43 @@ class AsyncTraceExportQueue:
             self._handle_task()
 
     def _handle_task(self) -> None:
-        """Process the given task in the running runs queues."""
+        """
+        Process the tasks in the running runs queues. Tasks that are already waiting in the
+        queue are dispatched together, so that tasks sharing a batch handler can be coalesced.
+        """
         try:
-            task = self._queue.get(timeout=1)
+            tasks = [self._queue.get(timeout=1)]
         except Empty:
             return
 
-        def _handle(task):
-            task.handle()
-            self._unprocessed_tasks.discard(task)
+        while len(tasks) < self._max_batch_size:
+            try:
+                tasks.append(self._queue.get_nowait())
+            except Empty:
+                break
+
+        batches = defaultdict(list)
+        for task in tasks:
+            if task._batch_handler is not None:
+                batches[task._batch_handler].append(task)
+            else:
+                self._trace_logging_worker_threadpool.submit(self._handle_batch, [task])
+
+        for batch in batches.values():
+            self._trace_logging_worker_threadpool.submit(self._handle_batch, batch)
+
+    def _handle_batch(self, tasks: list[Task]) -> None:
+        if len(tasks) == 1 and tasks[0]._batch_handler is None:
+            results = [tasks[0].handle()]
+        else:
+            results = _handle_task_batch(tasks)
+            if len(tasks) > 1:
+                with self._metrics_lock:
+                    self._metrics.num_batches += 1
 
-        self._trace_logging_worker_threadpool.submit(_handle, task)
+        self._record_handled_tasks(tasks, results)
+        for task in tasks:
+            self._unprocessed_tasks.discard(task)
 
     def activate(self) -> None:
         """Activates the async logging queue"""
@@ -205,7 +486,7 @@ class AsyncTraceExportQueue:
                 daemon=True,
             )
             self._trace_logging_worker_threadpool = ThreadPoolExecutor(
-                max_workers=5,
+                max_workers=self._max_workers,
                 thread_name_prefix="QCFlowTraceLoggingWorkerPool",
             )
             self._trace_logging_thread.start()
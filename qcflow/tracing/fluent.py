@@ -137,11 +137,13 @@ def trace(
             span_name = name or fn.__name__
 
             with start_span(name=span_name, span_type=span_type, attributes=attributes) as span:
-                span.set_attribute(SpanAttributeKey.FUNCTION_NAME, fn.__name__)
-                try:
-                    span.set_inputs(capture_function_input_args(fn, args, kwargs))
-                except Exception:
-                    _logger.warning(f"Failed to capture inputs for function {fn.__name__}.")
+                # Skip capturing inputs for spans that are not recorded, e.g. not sampled
+                if not isinstance(span, NoOpSpan):
+                    span.set_attribute(SpanAttributeKey.FUNCTION_NAME, fn.__name__)
+                    try:
+                        span.set_inputs(capture_function_input_args(fn, args, kwargs))
+                    except Exception:
+                        _logger.warning(f"Failed to capture inputs for function {fn.__name__}.")
                 result = yield  # sync/async function output to be sent here
                 span.set_outputs(result)
                 yield result
@@ -511,6 +513,18 @@ def get_current_active_span() -> Optional[LiveSpan]:
     return trace_manager.get_span_from_id(request_id, encode_span_id(otel_span.context.span_id))
 
 
+def _is_in_unrecorded_trace() -> bool:
+    """
+    Whether the current span belongs to a trace that is not recorded, e.g. not sampled, in which
+    case the fluent APIs updating the current trace do nothing.
+    """
+    otel_span = trace_api.get_current_span()
+    if otel_span is None or otel_span.is_recording():
+        return False
+    span_context = otel_span.get_span_context()
+    return span_context is not None and span_context.is_valid
+
+
 def get_last_active_trace() -> Optional[Trace]:
     """
     Get the last active trace in the same process if exists.
@@ -578,7 +592,8 @@ def update_current_trace(
 
     You can use this function either within a function decorated with `@qcflow.trace` or within the
     scope of the `with qcflow.start_span` context manager. If there is no active trace found, this
-    function will raise an exception.
+    function will raise an exception. If the active trace is not recorded, e.g. it is not sampled,
+    this function does nothing.
 
     Using within a function decorated with `@qcflow.trace`:
 
@@ -600,6 +615,9 @@ def update_current_trace(
     active_span = get_current_active_span()
 
     if not active_span:
+        if _is_in_unrecorded_trace():
+            _logger.debug("The current trace is not recorded. Skipping update_current_trace.")
+            return
         raise QCFlowException(
             "No active trace found. Please create a span using `qcflow.start_span` or "
             "`@qcflow.trace` before calling this function.",
@@ -672,6 +690,8 @@ def add_trace(trace: Union[Trace, dict[str, Any]], target: Optional[LiveSpan] =
             - If not provided, the trace will be merged under the current active span.
             - If not provided and there is no active span, a new span named "Remote Trace <...>"
               will be created and the trace will be merged under it.
+            - If not provided and the active trace is not recorded, e.g. it is not sampled, the
+              trace is not added.
     """
     if not is_tracing_enabled():
         _logger.debug("Tracing is disabled. Skipping add_trace.")
@@ -698,6 +718,10 @@ def add_trace(trace: Union[Trace, dict[str, Any]], target: Optional[LiveSpan] =
             f"Current status: {trace.info.status}.",
         )
 
+    if target is None and _is_in_unrecorded_trace():
+        _logger.debug("The current trace is not recorded. Skipping add_trace.")
+        return
+
     if target_span := target or get_current_active_span():
         _merge_trace(
             trace=trace,
@@ -10,6 +10,7 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter
 
 from qcflow.entities.trace_info import TraceInfo
 from qcflow.entities.trace_status import TraceStatus
+from qcflow.environment_variables import QCFLOW_TRACE_INCREMENTAL_EXPORT
 from qcflow.tracing.constant import (
     MAX_CHARS_IN_TRACE_INFO_METADATA_AND_TAGS,
     TRACE_SCHEMA_VERSION,
@@ -22,6 +23,7 @@ from qcflow.tracing.constant import (
 from qcflow.tracing.trace_manager import InMemoryTraceManager, _Trace
 from qcflow.tracing.utils import (
     deduplicate_span_names_in_place,
+    encode_span_id,
     get_otel_attribute,
     maybe_get_dependencies_schemas,
     maybe_get_request_id,
@@ -154,8 +156,11 @@ class QCFlowSpanProcessor(SimpleSpanProcessor):
         Args:
             span: An OpenTelemetry ReadableSpan object that is ended.
         """
-        # Processing the trace only when the root span is found.
+        # Processing the trace only when the root span is found, unless ended child spans
+        # are exported incrementally.
         if span._parent is not None:
+            if QCFLOW_TRACE_INCREMENTAL_EXPORT.get():
+                super().on_end(span)
             return
 
         request_id = get_otel_attribute(span, SpanAttributeKey.REQUEST_ID)
@@ -177,17 +182,28 @@ class QCFlowSpanProcessor(SimpleSpanProcessor):
         trace.info.timestamp_ms = root_span.start_time // 1_000_000  # nanosecond to millisecond
         trace.info.execution_time_ms = (root_span.end_time - root_span.start_time) // 1_000_000
         trace.info.status = TraceStatus.from_otel_status(root_span.status)
+        if trace.num_span_batches:
+            trace.info.request_metadata[TraceMetadataKey.SPAN_BATCHES] = str(trace.num_span_batches)
         trace.info.request_metadata.update(
             {
                 TraceMetadataKey.INPUTS: self._truncate_metadata(
-                    root_span.attributes.get(SpanAttributeKey.INPUTS)
+                    self._get_serialized_attribute(trace, root_span, SpanAttributeKey.INPUTS)
                 ),
                 TraceMetadataKey.OUTPUTS: self._truncate_metadata(
-                    root_span.attributes.get(SpanAttributeKey.OUTPUTS)
+                    self._get_serialized_attribute(trace, root_span, SpanAttributeKey.OUTPUTS)
                 ),
             }
         )
 
+    def _get_serialized_attribute(
+        self, trace: _Trace, span: OTelReadableSpan, key: str
+    ) -> Optional[str]:
+        # NB: The value is read from the live span if available, because the serialization
+        #  of the span attributes is deferred and they may not be stored in the OTel span yet.
+        if live_span := trace.span_dict.get(encode_span_id(span.context.span_id)):
+            return live_span._attributes.get_serialized(key)
+        return span.attributes.get(key)
+
     def _truncate_metadata(self, value: Optional[str]) -> str:
         """Get truncated value of the attribute if it exceeds the maximum length."""
         if not value:
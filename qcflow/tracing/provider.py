@@ -180,7 +180,9 @@ def _setup_tracer_provider(disabled=False):
         exporter = QCFlowSpanExporter()
         processor = QCFlowSpanProcessor(exporter)
 
-    tracer_provider = TracerProvider()
+    from qcflow.tracing.sampling import get_head_sampler
+
+    tracer_provider = TracerProvider(sampler=get_head_sampler())
     tracer_provider.add_span_processor(processor)
     _QCFLOW_TRACER_PROVIDER = tracer_provider
 
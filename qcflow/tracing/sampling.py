@@ -0,0 +1,127 @@
+"""
+Sampling controls for QCFlow tracing.
+
+Two complementary sampling stages are supported:
+
+* **Head sampling** decides whether a trace is recorded when its root span starts. It is
+  implemented as an OpenTelemetry sampler, so spans of unsampled traces are non-recording spans
+  and neither reach the span processor nor serialize their inputs, outputs, and attributes.
+* **Tail sampling** decides whether a recorded trace is exported when its root span ends, based
+  on the final trace info, e.g. always keep errors and slow traces and sample the rest.
+"""
+
+import logging
+import random
+from typing import Optional
+
+from opentelemetry.sdk.trace.sampling import ParentBased, Sampler, TraceIdRatioBased
+
+from qcflow.entities.trace_info import TraceInfo
+from qcflow.entities.trace_status import TraceStatus
+from qcflow.environment_variables import (
+    QCFLOW_TRACE_SAMPLING_RATIO,
+    QCFLOW_TRACE_TAIL_SAMPLING_KEEP_ERRORS,
+    QCFLOW_TRACE_TAIL_SAMPLING_KEEP_TAGS,
+    QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS,
+    QCFLOW_TRACE_TAIL_SAMPLING_RATIO,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def get_head_sampler() -> Optional[Sampler]:
+    """
+    Get the OpenTelemetry sampler that implements head sampling with the ratio configured by
+    ``QCFLOW_TRACE_SAMPLING_RATIO``. Child spans follow the decision made for their root span.
+
+    Returns:
+        The sampler, or None if every trace should be recorded.
+    """
+    ratio = QCFLOW_TRACE_SAMPLING_RATIO.get()
+    if ratio >= 1.0:
+        return None
+    return ParentBased(root=TraceIdRatioBased(max(ratio, 0.0)))
+
+
+class TailSampler:
+    """
+    Decide whether a trace is exported after its root span ends.
+
+    A trace is always kept if it matches any of the rules: it ended with an error (if
+    ``keep_errors`` is True), its execution time reached ``latency_threshold_ms``, or it has any
+    of ``keep_tags``. Other traces are kept with the probability ``ratio``.
+
+    Args:
+        ratio: The probability of keeping a trace that does not match any rule.
+        keep_errors: Whether to keep traces that ended with an error status.
+        latency_threshold_ms: Keep traces whose execution time is greater than or equal to this
+            threshold in milliseconds.
+        keep_tags: Keep traces with any of these tags. A tag value of None matches any value.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        keep_errors: bool = True,
+        latency_threshold_ms: Optional[int] = None,
+        keep_tags: Optional[dict[str, Optional[str]]] = None,
+    ):
+        self.ratio = ratio
+        self.keep_errors = keep_errors
+        self.latency_threshold_ms = latency_threshold_ms
+        self.keep_tags = keep_tags or {}
+
+    @classmethod
+    def from_env(cls) -> "TailSampler":
+        """Create a tail sampler configured with the ``QCFLOW_TRACE_TAIL_SAMPLING_*`` variables."""
+        return cls(
+            ratio=QCFLOW_TRACE_TAIL_SAMPLING_RATIO.get(),
+            keep_errors=QCFLOW_TRACE_TAIL_SAMPLING_KEEP_ERRORS.get(),
+            latency_threshold_ms=QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS.get(),
+            keep_tags=_parse_keep_tags(QCFLOW_TRACE_TAIL_SAMPLING_KEEP_TAGS.get()),
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether the sampler may drop any trace."""
+        return self.ratio < 1.0
+
+    def should_keep(self, trace_info: TraceInfo) -> bool:
+        """
+        Decide whether to export the trace.
+
+        Args:
+            trace_info: The trace info updated with the final values from the root span.
+
+        Returns:
+            True if the trace should be exported, False if it should be dropped.
+        """
+        if not self.is_enabled:
+            return True
+
+        if self.keep_errors and trace_info.status == TraceStatus.ERROR:
+            return True
+
+        if (
+            self.latency_threshold_ms is not None
+            and trace_info.execution_time_ms is not None
+            and trace_info.execution_time_ms >= self.latency_threshold_ms
+        ):
+            return True
+
+        for key, value in self.keep_tags.items():
+            if key in trace_info.tags and (value is None or trace_info.tags[key] == value):
+                return True
+
+        return random.random() < self.ratio
+
+
+def _parse_keep_tags(keep_tags: Optional[str]) -> dict[str, Optional[str]]:
+    """Parse a comma-separated list of ``key=value`` pairs or bare keys into a dictionary."""
+    parsed = {}
+    for item in (keep_tags or "").split(","):
+        if not (item := item.strip()):
+            continue
+        key, sep, value = item.partition("=")
+        parsed[key.strip()] = value.strip() if sep else None
+    return parsed
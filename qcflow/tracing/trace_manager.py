@@ -2,11 +2,11 @@ import contextlib
 import logging
 import threading
 from dataclasses import dataclass, field
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 
 from cachetools import TTLCache
 
-from qcflow.entities import LiveSpan, Trace, TraceData, TraceInfo
+from qcflow.entities import LiveSpan, Span, Trace, TraceData, TraceInfo
 from qcflow.environment_variables import (
     QCFLOW_TRACE_BUFFER_MAX_SIZE,
     QCFLOW_TRACE_BUFFER_TTL_SECONDS,
@@ -22,6 +22,11 @@ _logger = logging.getLogger(__name__)
 class _Trace:
     info: TraceInfo
     span_dict: dict[str, LiveSpan] = field(default_factory=dict)
+    # IDs of the non-root spans that have ended but have not been exported yet. Only
+    # populated when incremental span export is enabled.
+    ended_span_ids: list[str] = field(default_factory=list)
+    # Number of span batches that have been flushed to the backend before the root span ends.
+    num_span_batches: int = 0
 
     def to_qcflow_trace(self) -> Trace:
         trace_data = TraceData()
@@ -29,12 +34,54 @@ class _Trace:
             # Convert LiveSpan, mutable objects, into immutable Span objects before persisting.
             trace_data.spans.append(span.to_immutable_span())
             if span.parent_id is None:
-                # Accessing the OTel span directly get serialized value directly.
-                trace_data.request = span._span.attributes.get(SpanAttributeKey.INPUTS)
-                trace_data.response = span._span.attributes.get(SpanAttributeKey.OUTPUTS)
+                # Accessing the attributes registry directly to get the serialized value.
+                trace_data.request = span._attributes.get_serialized(SpanAttributeKey.INPUTS)
+                trace_data.response = span._attributes.get_serialized(SpanAttributeKey.OUTPUTS)
         return Trace(self.info, trace_data)
 
 
+@dataclass
+class _SpanBatch:
+    """A batch of ended spans popped from an in-flight trace for incremental export."""
+
+    info: TraceInfo
+    spans: list[Span]
+    index: int
+
+
+class _TraceBuffer(TTLCache):
+    """
+    A TTL- and size-bounded buffer of in-flight traces. Traces evicted before their root span
+    ends (abandoned, or pushed out by newer traces) are reported to the ``on_evict`` callback
+    so that the associated state can be released.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, on_evict: Callable[[str, str], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def popitem(self):
+        request_id, trace = super().popitem()
+        self._on_evict(request_id, "the trace buffer is full")
+        return request_id, trace
+
+    def expire(self, time=None):
+        # NB: cachetools < 5.3 does not return the expired items.
+        expired = super().expire(time) or []
+        for request_id, _ in expired:
+            self._on_evict(request_id, "the trace has been in-flight longer than the TTL")
+        return expired
+
+    def clear(self):
+        # MutableMapping.clear() is implemented with popitem(), but explicitly cleared
+        # traces should not be reported as evicted.
+        on_evict, self._on_evict = self._on_evict, lambda *_: None
+        try:
+            super().clear()
+        finally:
+            self._on_evict = on_evict
+
+
 class InMemoryTraceManager:
     """
     Manage spans and traces created by the tracing system in memory.
@@ -53,14 +100,26 @@ class InMemoryTraceManager:
 
     def __init__(self):
         # Storing request_id -> _Trace mapping
-        self._traces: dict[str, _Trace] = TTLCache(
+        self._traces: dict[str, _Trace] = _TraceBuffer(
             maxsize=QCFLOW_TRACE_BUFFER_MAX_SIZE.get(),
             ttl=QCFLOW_TRACE_BUFFER_TTL_SECONDS.get(),
+            on_evict=self._on_trace_evicted,
         )
         # Store mapping between OpenTelemetry trace ID and QCFlow request ID
         self._trace_id_to_request_id: dict[int, str] = {}
         self._lock = threading.Lock()  # Lock for _traces
 
+    def _on_trace_evicted(self, request_id: str, reason: str):
+        # Called with the lock held by the buffer mutation that triggered the eviction.
+        for trace_id, rid in list(self._trace_id_to_request_id.items()):
+            if rid == request_id:
+                del self._trace_id_to_request_id[trace_id]
+        _logger.warning(
+            f"Trace {request_id} is dropped from the in-memory buffer before its root span "
+            f"ended, because {reason}. Consider increasing {QCFLOW_TRACE_BUFFER_MAX_SIZE.name} "
+            f"or {QCFLOW_TRACE_BUFFER_TTL_SECONDS.name}."
+        )
+
     def register_trace(self, trace_id: int, trace_info: TraceInfo):
         """
         Register a new trace info object to the in-memory trace registry.
@@ -98,8 +157,12 @@ class InMemoryTraceManager:
             return
 
         with self._lock:
-            trace_data_dict = self._traces[span.request_id].span_dict
-            trace_data_dict[span.span_id] = span
+            trace = self._traces.get(span.request_id)
+            if trace is None:
+                # The trace may have been evicted from the buffer already.
+                _logger.debug(f"Trace data with request ID {span.request_id} not found.")
+                return
+            trace.span_dict[span.span_id] = span
 
     @contextlib.contextmanager
     def get_trace(self, request_id: str) -> Generator[Optional[_Trace], None, None]:
@@ -140,6 +203,38 @@ class InMemoryTraceManager:
         """
         return self._trace_id_to_request_id.get(trace_id)
 
+    def pop_ended_spans(
+        self, request_id: str, span_id: str, batch_size: int
+    ) -> Optional[_SpanBatch]:
+        """
+        Mark the given non-root span as ended. Once ``batch_size`` ended spans have accumulated
+        for the trace, remove them from the buffer and return them as a batch to be exported
+        incrementally, so that long-running traces do not hold every span in memory until
+        the root span ends.
+
+        Args:
+            request_id: The request ID of the trace the span belongs to.
+            span_id: The ID of the ended span.
+            batch_size: The number of ended spans to accumulate before flushing a batch.
+
+        Returns:
+            A batch of immutable spans, or None if the batch is not full yet.
+        """
+        with self._lock:
+            trace = self._traces.get(request_id)
+            if trace is None or span_id not in trace.span_dict:
+                return None
+
+            trace.ended_span_ids.append(span_id)
+            if len(trace.ended_span_ids) < batch_size:
+                return None
+
+            spans = [trace.span_dict.pop(sid).to_immutable_span() for sid in trace.ended_span_ids]
+            trace.ended_span_ids = []
+            batch = _SpanBatch(info=trace.info, spans=spans, index=trace.num_span_batches)
+            trace.num_span_batches += 1
+            return batch
+
     def set_request_metadata(self, request_id: str, key: str, value: str):
         """
         Set the request metadata for the given request ID.
@@ -152,12 +247,21 @@ class InMemoryTraceManager:
         """
         Pop the trace data for the given id and return it as a ready-to-publish Trace object.
         """
+        trace = self.pop_trace_state(trace_id)
+        return trace.to_qcflow_trace() if trace else None
+
+    def pop_trace_state(self, trace_id: int) -> Optional[_Trace]:
+        """
+        Pop the internal state of the trace for the given id, without converting the spans into
+        immutable spans. This allows to skip serializing the span attributes of a trace that is
+        not exported.
+        """
         with self._lock:
             request_id = self._trace_id_to_request_id.pop(trace_id, None)
-            trace = self._traces.pop(request_id, None)
-        return trace.to_qcflow_trace() if trace else None
+            return self._traces.pop(request_id, None)
 
     def flush(self):
         """Clear all the aggregated trace data. This should only be used for testing."""
         with self._lock:
             self._traces.clear()
+            self._trace_id_to_request_id.clear()
@@ -423,3 +423,18 @@ class ModelRegistryClient:
 
         """
         return self.store.get_model_version_by_alias(name, alias)
+
+    def get_model_versions(self, model_versions):
+        """Get multiple model versions by name and version or alias.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+
+        """
+        return self.store.get_model_versions(model_versions)
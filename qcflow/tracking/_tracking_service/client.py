@@ -4,6 +4,7 @@ This is a lower level API than the :py:mod:`qcflow.tracking.fluent` module, and
 exposed in the :py:mod:`qcflow.tracking` module.
 """
 
+import dataclasses
 import json
 import logging
 import os
@@ -13,11 +14,13 @@ from itertools import zip_longest
 from typing import Optional
 
 from qcflow.entities import (
+    ChangeEvent,
     ExperimentTag,
     Metric,
     Param,
     RunStatus,
     RunTag,
+    Span,
     TraceData,
     TraceInfo,
     ViewType,
@@ -36,6 +39,7 @@ from qcflow.protos.databricks_pb2 import BAD_REQUEST, INVALID_PARAMETER_VALUE, E
 from qcflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from qcflow.store.entities.paged_list import PagedList
 from qcflow.store.tracking import (
+    CHANGE_EVENTS_MAX_RESULTS,
     GET_METRIC_HISTORY_MAX_RESULTS,
     SEARCH_MAX_RESULTS_DEFAULT,
     SEARCH_TRACES_DEFAULT_MAX_RESULTS,
@@ -234,6 +238,40 @@ class TrackingServiceClient:
             tags=tags,
         )
 
+    def end_traces(self, trace_infos: list[TraceInfo]) -> list[TraceInfo]:
+        """
+        Update multiple TraceInfo objects in the backend store with the completed trace info.
+
+        Args:
+            trace_infos: The completed TraceInfo objects. The end time of each trace is
+                computed as ``timestamp_ms + execution_time_ms``.
+
+        Returns:
+            The updated TraceInfo objects.
+        """
+        trace_infos = [
+            dataclasses.replace(trace_info, tags=exclude_immutable_tags(trace_info.tags or {}))
+            for trace_info in trace_infos
+        ]
+        return self.store.end_traces(trace_infos)
+
+    def index_trace_spans(
+        self,
+        request_id: str,
+        spans: list[Span],
+        attribute_keys: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Store the summaries of the spans of a trace in the backend store, so that traces can
+        be searched by their spans.
+
+        Args:
+            request_id: Unique string identifier of the trace.
+            spans: The spans of the trace to index.
+            attribute_keys: The keys of the span attributes to index for search.
+        """
+        self.store.index_trace_spans(request_id, spans, attribute_keys)
+
     def delete_traces(
         self,
         experiment_id: str,
@@ -843,13 +881,46 @@ class TrackingServiceClient:
 
     def _download_trace_data(self, trace_info: TraceInfo) -> TraceData:
         artifact_repo = self._get_artifact_repo_for_trace(trace_info)
-        return TraceData.from_dict(artifact_repo.download_trace_data())
+        trace_data = TraceData.from_dict(artifact_repo.download_trace_data())
+
+        # Spans exported incrementally before the root span ended are stored in separate
+        # batches, which are assembled into the trace data in the order they were exported.
+        num_span_batches = int(trace_info.request_metadata.get(TraceMetadataKey.SPAN_BATCHES, 0))
+        if num_span_batches:
+
+            def download_span_batch(batch_index: int) -> Optional[TraceData]:
+                try:
+                    return TraceData.from_dict(artifact_repo.download_trace_span_batch(batch_index))
+                except QCFlowTraceDataNotFound:
+                    return None
+
+            with ThreadPoolExecutor() as executor:
+                span_batches = list(executor.map(download_span_batch, range(num_span_batches)))
+            # A batch may be missing if its upload failed, in which case the trace is returned
+            # with the spans that were exported rather than not at all
+            if missing_batches := [i for i, batch in enumerate(span_batches) if batch is None]:
+                _logger.warning(
+                    f"{len(missing_batches)} of the {num_span_batches} span batches of trace "
+                    f"{trace_info.request_id!r} are missing, so the trace is incomplete."
+                )
+            flushed_spans = [span for batch in span_batches if batch for span in batch.spans]
+            trace_data.spans = flushed_spans + trace_data.spans
+        return trace_data
 
     def _upload_trace_data(self, trace_info: TraceInfo, trace_data: TraceData) -> None:
         artifact_repo = self._get_artifact_repo_for_trace(trace_info)
         trace_data_json = json.dumps(trace_data.to_dict(), cls=TraceJSONEncoder, ensure_ascii=False)
         return artifact_repo.upload_trace_data(trace_data_json)
 
+    def _upload_trace_span_batch(
+        self, trace_info: TraceInfo, spans: list[Span], batch_index: int
+    ) -> None:
+        artifact_repo = self._get_artifact_repo_for_trace(trace_info)
+        span_batch_json = json.dumps(
+            {"spans": [span.to_dict() for span in spans]}, cls=TraceJSONEncoder, ensure_ascii=False
+        )
+        return artifact_repo.upload_trace_span_batch(span_batch_json, batch_index)
+
     def _log_artifact_async(self, run_id, filename, artifact_path=None, artifact=None):
         """
         Write an artifact to the remote ``artifact_uri`` asynchronously.
@@ -1002,3 +1073,29 @@ class TrackingServiceClient:
             order_by=order_by,
             page_token=page_token,
         )
+
+    def get_change_events(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+        timeout_seconds: float = 0,
+    ) -> PagedList[ChangeEvent]:
+        """Read the change feed of the tracking store. See ``QCFlowClient.get_change_events``.
+
+        Args:
+            entity_types: The types of the entities whose events to return.
+            page_token: The token of the last read event.
+            max_results: Maximum number of events to return.
+            timeout_seconds: Maximum number of seconds to wait for new events.
+
+        Returns:
+            A :py:class:`PagedList <qcflow.store.entities.PagedList>` of
+            :py:class:`ChangeEvent <qcflow.entities.ChangeEvent>` objects.
+        """
+        return self.store.get_change_events(
+            entity_types=entity_types,
+            page_token=page_token,
+            max_results=max_results,
+            timeout_seconds=timeout_seconds,
+        )
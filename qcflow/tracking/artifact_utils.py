@@ -104,9 +104,33 @@ def _download_artifact_from_uri(artifact_uri, output_path=None, lineage_header_i
             a local output path will be created.
         lineage_header_info: The model lineage header info to be consumed by lineage services.
     """
+    repo, artifact_path = _get_artifact_repository_and_path(artifact_uri)
+    return _download_artifact_from_repository(
+        repo, artifact_path, output_path=output_path, lineage_header_info=lineage_header_info
+    )
+
+
+def _get_artifact_repository_and_path(artifact_uri):
+    """Get the artifact repository containing an artifact and the path of the artifact in it.
+
+    Args:
+        artifact_uri: The *absolute* URI of the artifact.
+    """
     root_uri, artifact_path = _get_root_uri_and_artifact_path(artifact_uri)
-    repo = get_artifact_repository(artifact_uri=root_uri)
+    return get_artifact_repository(artifact_uri=root_uri), artifact_path
+
 
+def _download_artifact_from_repository(
+    repo, artifact_path, output_path=None, lineage_header_info=None
+):
+    """
+    Args:
+        repo: The artifact repository containing the artifact.
+        artifact_path: The path of the artifact, relative to the root of the repository.
+        output_path: The local filesystem path to which to download the artifact. If unspecified,
+            a local output path will be created.
+        lineage_header_info: The model lineage header info to be consumed by lineage services.
+    """
     if isinstance(repo, ModelsArtifactRepository):
         return repo.download_artifacts(
             artifact_path=artifact_path,
@@ -15,12 +15,13 @@ import tempfile
 import urllib
 import uuid
 import warnings
-from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence, Union
 
 import yaml
 
 import qcflow
 from qcflow.entities import (
+    ChangeEvent,
     DatasetInput,
     Experiment,
     FileInfo,
@@ -40,7 +41,10 @@ from qcflow.entities.model_registry import ModelVersion, RegisteredModel
 from qcflow.entities.model_registry.model_version_stages import ALL_STAGES
 from qcflow.entities.span import NO_OP_SPAN_REQUEST_ID, NoOpSpan, create_qcflow_span
 from qcflow.entities.trace_status import TraceStatus
-from qcflow.environment_variables import QCFLOW_ENABLE_ASYNC_LOGGING
+from qcflow.environment_variables import (
+    QCFLOW_ENABLE_ASYNC_LOGGING,
+    QCFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES,
+)
 from qcflow.exceptions import QCFlowException
 from qcflow.protos.databricks_pb2 import (
     BAD_REQUEST,
@@ -56,7 +60,12 @@ from qcflow.store.model_registry import (
     SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
 )
-from qcflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT, SEARCH_TRACES_DEFAULT_MAX_RESULTS
+from qcflow.store.tracking import (
+    CHANGE_EVENTS_MAX_RESULTS,
+    CHANGE_EVENTS_MAX_TIMEOUT_SECONDS,
+    SEARCH_MAX_RESULTS_DEFAULT,
+    SEARCH_TRACES_DEFAULT_MAX_RESULTS,
+)
 from qcflow.tracing.constant import (
     TRACE_REQUEST_ID_PREFIX,
     SpanAttributeKey,
@@ -395,6 +404,11 @@ class QCFlowClient:
     def _upload_trace_data(self, trace_info: TraceInfo, trace_data: TraceData) -> None:
         return self._tracking_client._upload_trace_data(trace_info, trace_data)
 
+    def _upload_trace_span_batch(
+        self, trace_info: TraceInfo, spans: list[Span], batch_index: int
+    ) -> None:
+        return self._tracking_client._upload_trace_span_batch(trace_info, spans, batch_index)
+
     def delete_traces(
         self,
         experiment_id: str,
@@ -1019,6 +1033,35 @@ class QCFlowClient:
             tags=trace_info.tags or {},
         )
 
+    def _index_trace_spans(self, trace_info: TraceInfo, spans: list[Span]) -> None:
+        """
+        Index the summaries of the spans of a trace in the backend store, so that traces can be
+        searched by their spans, e.g. with the ``span.type = 'RETRIEVER'`` filter.
+
+        Args:
+            trace_info: The TraceInfo object of the trace the spans belong to.
+            spans: The spans to index.
+        """
+        attribute_keys = [
+            key.strip()
+            for key in (QCFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES.get() or "").split(",")
+            if key.strip()
+        ]
+        self._tracking_client.index_trace_spans(trace_info.request_id, spans, attribute_keys)
+
+    def _upload_ended_trace_infos(self, trace_infos: list[TraceInfo]) -> list[TraceInfo]:
+        """
+        Update multiple TraceInfo objects in the backend store with the completed trace info
+        in bulk.
+
+        Args:
+            trace_infos: Updated TraceInfo objects to be stored in the backend store.
+
+        Returns:
+            The updated TraceInfo objects.
+        """
+        return self._tracking_client.end_traces(trace_infos)
+
     def set_trace_tag(self, request_id: str, key: str, value: str):
         """
         Set a tag on the trace with the given trace ID.
@@ -3092,6 +3135,110 @@ class QCFlowClient:
             experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
         )
 
+    @experimental
+    def get_change_events(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        max_results: int = CHANGE_EVENTS_MAX_RESULTS,
+        timeout_seconds: float = 0,
+    ) -> PagedList[ChangeEvent]:
+        """
+        Read the change feed, i.e. the events recorded by the creation, update, deletion and
+        restoration of experiments, runs, registered models, model versions and model aliases, in
+        the order in which they were recorded. This lets tools react to new model versions, alias
+        moves or finished runs without repeatedly searching them.
+
+        The change feed is only supported by SQL tracking stores, and must be enabled on the
+        server by setting the ``QCFLOW_ENABLE_CHANGE_FEED`` environment variable to ``true``. The
+        events of the model registry are only included if the registry uses the same database as
+        the tracking store.
+
+        Each event is returned once, in the order of the sequences, when resuming the feed with
+        the returned ``token``. To guarantee this with concurrent writers, the events are only
+        returned after ``QCFLOW_CHANGE_FEED_COMMIT_LAG`` seconds, 1 second by default, so that the
+        transactions recording events with lower sequences have committed.
+
+        Args:
+            entity_types: The types of the entities whose events to return, see
+                :py:class:`ChangeEntityType <qcflow.entities.ChangeEntityType>`. All the events
+                are returned if unspecified.
+            page_token: The ``token`` of the last read event or page. The feed is read from the
+                beginning if unspecified.
+            max_results: Maximum number of events to return, at most 1000.
+            timeout_seconds: Maximum number of seconds, at most 60, to wait for new events when
+                there are no events after the page token.
+
+        Returns:
+            A :py:class:`PagedList <qcflow.store.entities.PagedList>` of
+            :py:class:`ChangeEvent <qcflow.entities.ChangeEvent>` objects, whose ``token``
+            resumes the feed after the returned events.
+
+        .. code-block:: python
+            :caption: Example
+
+            from qcflow import QCFlowClient
+            from qcflow.entities import ChangeEntityType
+
+            client = QCFlowClient()
+            events = client.get_change_events([ChangeEntityType.MODEL_VERSION], max_results=10)
+            for event in events:
+                print(event.op, event.entity_id, event.data)
+            # Wait up to 30 seconds for the next events
+            events = client.get_change_events(
+                [ChangeEntityType.MODEL_VERSION], page_token=events.token, timeout_seconds=30
+            )
+        """
+        return self._tracking_client.get_change_events(
+            entity_types=entity_types,
+            page_token=page_token,
+            max_results=max_results,
+            timeout_seconds=timeout_seconds,
+        )
+
+    @experimental
+    def watch_changes(
+        self,
+        entity_types: Optional[list[str]] = None,
+        page_token: Optional[str] = None,
+        timeout_seconds: float = 30,
+    ) -> Iterator[ChangeEvent]:
+        """
+        Iterate over the events of the change feed, waiting for new events when all the recorded
+        events have been read. The iteration never ends. Use the ``token`` of the last processed
+        event as ``page_token`` to resume watching after a restart. See
+        :py:meth:`get_change_events` for the supported stores.
+
+        Args:
+            entity_types: The types of the entities whose events to return, see
+                :py:class:`ChangeEntityType <qcflow.entities.ChangeEntityType>`. All the events
+                are returned if unspecified.
+            page_token: The ``token`` of the last processed event. The feed is read from the
+                beginning if unspecified.
+            timeout_seconds: Maximum number of seconds, at most 60, each request waits for new
+                events.
+
+        .. code-block:: python
+            :caption: Example
+
+            from qcflow import QCFlowClient
+            from qcflow.entities import ChangeEntityType, ChangeOperation
+
+            client = QCFlowClient()
+            for event in client.watch_changes([ChangeEntityType.REGISTERED_MODEL_ALIAS]):
+                if event.op == ChangeOperation.UPDATE:
+                    print(f"{event.entity_id} now points to version {event.data['version']}")
+        """
+        timeout_seconds = min(timeout_seconds, CHANGE_EVENTS_MAX_TIMEOUT_SECONDS)
+        while True:
+            events = self.get_change_events(
+                entity_types=entity_types,
+                page_token=page_token,
+                timeout_seconds=timeout_seconds,
+            )
+            yield from events
+            page_token = events.token
+
     # Registry API
 
     # Registered Model Methods
@@ -4781,3 +4928,36 @@ class QCFlowClient:
         """
         _validate_model_name(name)
         return self._get_registry_client().get_model_version_by_alias(name, alias)
+
+    def get_model_versions(
+        self, model_versions: list[tuple[str, Union[int, str]]]
+    ) -> list[Optional[ModelVersion]]:
+        """Get multiple model versions by name and version or alias in a single call, e.g. to
+        resolve many ``models:/`` URIs at once. With a tracking server, the model versions are
+        fetched with a single request for up to 1000 model versions.
+
+        Args:
+            model_versions: A list of ``(name, version_or_alias)`` tuples, where
+                ``version_or_alias`` is a version number, or the name of an alias of the
+                registered model if it is not a number.
+
+        Returns:
+            A list of :py:class:`qcflow.entities.model_registry.ModelVersion` objects in the
+            order of ``model_versions``, with None for the model versions that do not exist.
+
+        .. code-block:: python
+            :caption: Example
+
+            from qcflow import QCFlowClient
+
+            client = QCFlowClient()
+            model_versions = client.get_model_versions(
+                [("model-a", "champion"), ("model-b", 3), ("model-c", "challenger")]
+            )
+            for mv in model_versions:
+                if mv is not None:
+                    print(f"{mv.name} version {mv.version}: {mv.source}")
+        """
+        for name, _ in model_versions:
+            _validate_model_name(name)
+        return self._get_registry_client().get_model_versions(model_versions)
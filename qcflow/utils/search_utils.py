@@ -1513,6 +1513,7 @@ class SearchTraceUtils(SearchUtils):
     _REQUEST_METADATA_IDENTIFIER = "request_metadata"
     _TAG_IDENTIFIER = "tag"
     _ATTRIBUTE_IDENTIFIER = "attribute"
+    _SPAN_IDENTIFIER = "span"
 
     # These are aliases for the base identifiers
     # e.g. trace.status is equivalent to attribute.status
@@ -1521,8 +1522,14 @@ class SearchTraceUtils(SearchUtils):
         "attributes": _ATTRIBUTE_IDENTIFIER,
         "trace": _ATTRIBUTE_IDENTIFIER,
         "metadata": _REQUEST_METADATA_IDENTIFIER,
+        "spans": _SPAN_IDENTIFIER,
+    }
+    _IDENTIFIERS = {
+        _TAG_IDENTIFIER,
+        _REQUEST_METADATA_IDENTIFIER,
+        _ATTRIBUTE_IDENTIFIER,
+        _SPAN_IDENTIFIER,
     }
-    _IDENTIFIERS = {_TAG_IDENTIFIER, _REQUEST_METADATA_IDENTIFIER, _ATTRIBUTE_IDENTIFIER}
     _VALID_IDENTIFIERS = _IDENTIFIERS | set(_ALTERNATE_IDENTIFIERS.keys())
 
     SUPPORT_IN_COMPARISON_ATTRIBUTE_KEYS = {"name", "status", "request_id", "run_id"}
@@ -1541,6 +1548,18 @@ class SearchTraceUtils(SearchUtils):
         "execution_time": "execution_time_ms",
     }
 
+    # Keys to search traces by their spans, e.g. "span.type = 'RETRIEVER' AND span.duration > 2000"
+    # matches traces that have a retriever span which took more than 2 seconds. All span clauses
+    # in a filter must be satisfied by the same span. Span attributes that are indexed by the
+    # tracking store can be searched with the "span.attributes.<key>" identifier.
+    VALID_SPAN_KEYS = {"name", "type", "status", "duration", "duration_ms"}
+    NUMERIC_SPAN_KEYS = {"duration", "duration_ms"}
+    SEARCH_KEY_TO_SPAN_COLUMN = {
+        "type": "span_type",
+        "duration": "duration_ms",
+    }
+    SPAN_ATTRIBUTE_PREFIX = "attributes."
+
     @classmethod
     def filter(cls, traces, filter_string):
         """Filters a set of traces based on a search filter string."""
@@ -1566,6 +1585,12 @@ class SearchTraceUtils(SearchUtils):
             lhs = trace.request_metadata.get(key)
         elif cls.is_attribute(type_, key, comparator):
             lhs = getattr(trace, key)
+        elif cls.is_span(type_, key, comparator):
+            raise QCFlowException(
+                "Searching traces by their spans is only supported by the SQL-based "
+                "tracking store.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
         elif sed.get("type") == cls._TAG_IDENTIFIER:
             lhs = trace.tags.get(key)
         else:
@@ -1600,7 +1625,9 @@ class SearchTraceUtils(SearchUtils):
         Replace search key to tag or metadata key if it is in the mapping.
         """
         key = parsed.get("key").lower()
-        if key in cls.SEARCH_KEY_TO_TAG:
+        if parsed.get("type") == cls._SPAN_IDENTIFIER:
+            parsed["key"] = cls.SEARCH_KEY_TO_SPAN_COLUMN.get(key, parsed["key"])
+        elif key in cls.SEARCH_KEY_TO_TAG:
             parsed["type"] = cls._TAG_IDENTIFIER
             parsed["key"] = cls.SEARCH_KEY_TO_TAG[key]
         elif key in cls.SEARCH_KEY_TO_METADATA:
@@ -1622,6 +1649,24 @@ class SearchTraceUtils(SearchUtils):
             return True
         return False
 
+    @classmethod
+    def is_span(cls, key_type, key_name, comparator):
+        if key_type != cls._SPAN_IDENTIFIER:
+            return False
+
+        if key_name.startswith(cls.SPAN_ATTRIBUTE_PREFIX):
+            valid_comparators = cls.VALID_TAG_COMPARATORS
+        elif key_name in cls.NUMERIC_SPAN_KEYS:
+            valid_comparators = cls.VALID_NUMERIC_ATTRIBUTE_COMPARATORS
+        else:
+            valid_comparators = cls.VALID_STRING_ATTRIBUTE_COMPARATORS
+        if comparator not in valid_comparators:
+            raise QCFlowException(
+                f"Invalid comparator '{comparator}' not one of '{valid_comparators}'",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return True
+
     @classmethod
     def _valid_entity_type(cls, entity_type):
         entity_type = cls._trim_backticks(entity_type)
@@ -1635,6 +1680,21 @@ class SearchTraceUtils(SearchUtils):
         else:
             return entity_type
 
+    @classmethod
+    def _get_identifier(cls, identifier, valid_attributes):
+        parsed = super()._get_identifier(identifier, valid_attributes)
+        key = parsed["key"]
+        if (
+            parsed["type"] == cls._SPAN_IDENTIFIER
+            and key not in cls.VALID_SPAN_KEYS
+            and not key.startswith(cls.SPAN_ATTRIBUTE_PREFIX)
+        ):
+            raise QCFlowException.invalid_parameter_value(
+                f"Invalid span key '{key}' specified. Valid keys are '{cls.VALID_SPAN_KEYS}' "
+                f"and '{cls.SPAN_ATTRIBUTE_PREFIX}<key>'"
+            )
+        return parsed
+
     @classmethod
     def _get_sort_key(cls, order_by_list):
         order_by = []
@@ -1706,6 +1766,25 @@ class SearchTraceUtils(SearchUtils):
                     f"{token.value}",
                     error_code=INVALID_PARAMETER_VALUE,
                 )
+        elif identifier_type == cls._SPAN_IDENTIFIER:
+            if key in cls.NUMERIC_SPAN_KEYS:
+                if token.ttype == TokenType.Literal.Number.Integer:
+                    return int(token.value)
+                elif token.ttype == TokenType.Literal.Number.Float:
+                    return float(token.value)
+                raise QCFlowException(
+                    f"Expected numeric value type for span key: {key}. Got value {token.value}",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            if token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier):
+                return cls._strip_quotes(token.value, expect_quoted_value=True)
+            elif isinstance(token, Parenthesis) and not key.startswith(cls.SPAN_ATTRIBUTE_PREFIX):
+                return cls._parse_attribute_lists(token)
+            raise QCFlowException(
+                "Expected a quoted string value or a list of quoted string values for "
+                f"span key: {key}. Got value {token.value}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
         else:
             # Expected to be either "param" or "metric".
             raise QCFlowException(
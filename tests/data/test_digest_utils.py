@@ -0,0 +1,130 @@
+import json
+import os
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from qcflow.data import digest_utils
+from qcflow.data.digest_utils import compute_delta_digest, compute_parquet_digest
+from qcflow.exceptions import QCFlowException
+
+
+@pytest.fixture(autouse=True)
+def clear_file_digest_cache():
+    digest_utils._file_digest_cache.clear()
+    yield
+    digest_utils._file_digest_cache.clear()
+
+
+def _write_parquet(path, df, row_group_size=10):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, row_group_size)
+
+
+def _make_df(start=0, num_rows=25):
+    return pd.DataFrame(
+        {
+            "x": range(start, start + num_rows),
+            "y": [f"value-{i}" for i in range(start, start + num_rows)],
+            "z": [[i, i + 1] for i in range(start, start + num_rows)],
+        }
+    )
+
+
+def test_parquet_digest_hashes_full_content(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    df = _make_df(num_rows=25_000)
+    _write_parquet(path, df, row_group_size=1000)
+    digest = compute_parquet_digest(path)
+    assert len(digest) == 8
+
+    digest_utils._file_digest_cache.clear()
+    assert compute_parquet_digest(path, max_workers=1) == digest
+
+    # A change beyond the rows sampled by `compute_pandas_digest` changes the digest
+    df.loc[len(df) - 1, "y"] = "changed"
+    _write_parquet(path, df, row_group_size=1000)
+    assert compute_parquet_digest(path) != digest
+
+
+def test_parquet_digest_of_directory(tmp_path):
+    _write_parquet(str(tmp_path / "part=a" / "0.parquet"), _make_df(0))
+    _write_parquet(str(tmp_path / "part=b" / "0.parquet"), _make_df(25))
+    (tmp_path / "_SUCCESS").touch()
+    digest = compute_parquet_digest(str(tmp_path))
+
+    # Partition values are part of the file paths, so they are part of the digest
+    os.rename(tmp_path / "part=b", tmp_path / "part=c")
+    assert compute_parquet_digest(str(tmp_path)) != digest
+
+
+def test_parquet_digest_reuses_cached_file_digests(tmp_path):
+    _write_parquet(str(tmp_path / "0.parquet"), _make_df(0))
+    compute_parquet_digest(str(tmp_path))
+
+    _write_parquet(str(tmp_path / "1.parquet"), _make_df(25))
+    with mock.patch.object(
+        digest_utils, "_hash_row_group", wraps=digest_utils._hash_row_group
+    ) as mock_hash_row_group:
+        digest = compute_parquet_digest(str(tmp_path))
+
+    # Only the row groups of the new file are read
+    assert {c.args[0] for c in mock_hash_row_group.call_args_list} == {str(tmp_path / "1.parquet")}
+    digest_utils._file_digest_cache.clear()
+    assert compute_parquet_digest(str(tmp_path)) == digest
+
+
+def test_parquet_digest_without_parquet_files(tmp_path):
+    with pytest.raises(QCFlowException, match="No Parquet files were found"):
+        compute_parquet_digest(str(tmp_path))
+
+
+def _write_delta_commit(path, version, actions):
+    log_dir = path / "_delta_log"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / f"{version:020d}.json", "w") as f:
+        f.writelines(json.dumps(action) + "\n" for action in actions)
+
+
+def test_delta_digest_follows_transaction_log(tmp_path):
+    _write_parquet(str(tmp_path / "0.parquet"), _make_df(0))
+    _write_parquet(str(tmp_path / "1.parquet"), _make_df(25))
+    _write_parquet(str(tmp_path / "2.parquet"), _make_df(50))
+    _write_delta_commit(tmp_path, 0, [{"commitInfo": {}}, {"add": {"path": "0.parquet"}}])
+    _write_delta_commit(tmp_path, 1, [{"add": {"path": "1.parquet"}}])
+    _write_delta_commit(
+        tmp_path, 2, [{"remove": {"path": "1.parquet"}}, {"add": {"path": "2.parquet"}}]
+    )
+
+    first_version = compute_delta_digest(str(tmp_path), version=0)
+    assert first_version == compute_parquet_digest(str(tmp_path / "0.parquet"))
+    second_version = compute_delta_digest(str(tmp_path), version=1)
+    latest_version = compute_delta_digest(str(tmp_path))
+    assert len({first_version, second_version, latest_version}) == 3
+    assert latest_version == compute_delta_digest(str(tmp_path), version=2)
+
+
+def test_delta_digest_starts_from_checkpoint(tmp_path):
+    _write_parquet(str(tmp_path / "0.parquet"), _make_df(0))
+    _write_parquet(str(tmp_path / "1.parquet"), _make_df(25))
+    _write_delta_commit(tmp_path, 0, [{"add": {"path": "0.parquet"}}])
+    _write_delta_commit(tmp_path, 1, [{"add": {"path": "1.parquet"}}])
+    expected = compute_delta_digest(str(tmp_path))
+
+    checkpoint = pa.Table.from_pylist(
+        [{"add": {"path": "0.parquet"}, "remove": None}, {"add": {"path": "1.parquet"}}]
+    )
+    pq.write_table(checkpoint, tmp_path / "_delta_log" / f"{1:020d}.checkpoint.parquet")
+    # Commits preceding the checkpoint may have been cleaned up
+    os.remove(tmp_path / "_delta_log" / f"{0:020d}.json")
+    os.remove(tmp_path / "_delta_log" / f"{1:020d}.json")
+    assert compute_delta_digest(str(tmp_path)) == expected
+
+
+def test_delta_digest_without_transaction_log(tmp_path):
+    (tmp_path / "_delta_log").mkdir()
+    with pytest.raises(QCFlowException, match="has no transaction log"):
+        compute_delta_digest(str(tmp_path))
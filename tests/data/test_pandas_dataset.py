@@ -6,6 +6,7 @@ import pytest
 import qcflow.data
 from qcflow.data.code_dataset_source import CodeDatasetSource
 from qcflow.data.delta_dataset_source import DeltaDatasetSource
+from qcflow.data.digest_utils import compute_parquet_digest, get_normalized_md5_digest
 from qcflow.data.evaluation_dataset import EvaluationDataset
 from qcflow.data.filesystem_dataset_source import FileSystemDatasetSource
 from qcflow.data.pandas_dataset import PandasDataset
@@ -279,3 +280,26 @@ def test_df_hashing_with_dicts():
     assert evaluation_dataset.features_data.equals(df)
     evaluation_dataset2 = dataset2.to_evaluation_dataset()
     assert evaluation_dataset.hash == evaluation_dataset2.hash
+
+
+def test_from_pandas_parquet_datasource_with_full_content_digest(tmp_path, monkeypatch):
+    df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=["a", "b", "c"])
+    path = tmp_path / "temp.parquet"
+    df.to_parquet(path)
+    sampled_digest = qcflow.data.from_pandas(df, source=path).digest
+
+    monkeypatch.setenv("QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST", "true")
+    dataset = qcflow.data.from_pandas(df, source=path)
+    assert dataset.digest == get_normalized_md5_digest(
+        [compute_parquet_digest(str(path)).encode(), sampled_digest.encode()]
+    )
+    assert dataset.digest != sampled_digest
+
+    # Data filtered after it is read from the source has a different digest
+    filtered_dataset = qcflow.data.from_pandas(df[df["a"] > 1], source=path)
+    assert filtered_dataset.digest != dataset.digest
+
+    # Sources that are not Parquet files fall back to hashing the DataFrame
+    csv_path = tmp_path / "temp.csv"
+    df.to_csv(csv_path)
+    assert qcflow.data.from_pandas(df, source=csv_path).digest == sampled_digest
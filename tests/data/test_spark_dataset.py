@@ -7,6 +7,7 @@ import pytest
 import qcflow.data
 from qcflow.data.code_dataset_source import CodeDatasetSource
 from qcflow.data.delta_dataset_source import DeltaDatasetSource
+from qcflow.data.digest_utils import compute_parquet_digest, get_normalized_md5_digest
 from qcflow.data.evaluation_dataset import EvaluationDataset
 from qcflow.data.spark_dataset import SparkDataset
 from qcflow.data.spark_dataset_source import SparkDatasetSource
@@ -249,6 +250,24 @@ def test_from_spark_path(spark_session, tmp_path, df):
     _check_spark_dataset(qcflow_df_from_file, df, df_spark, SparkDatasetSource)
 
 
+def test_from_spark_path_with_full_content_digest(spark_session, tmp_path, df, monkeypatch):
+    df_spark = spark_session.createDataFrame(df)
+    dir_path = str(tmp_path / "df_dir")
+    df_spark.write.parquet(dir_path)
+    df_read = spark_session.read.parquet(dir_path)
+    plan_digest = qcflow.data.from_spark(df_read, path=dir_path).digest
+
+    monkeypatch.setenv("QCFLOW_ENABLE_FULL_CONTENT_DATA_DIGEST", "true")
+    dataset = qcflow.data.from_spark(df_read, path=dir_path)
+    assert dataset.digest == get_normalized_md5_digest(
+        [compute_parquet_digest(dir_path).encode(), plan_digest.encode()]
+    )
+
+    # Data filtered after it is read from the source has a different digest
+    filtered_dataset = qcflow.data.from_spark(df_read.filter("a > 1"), path=dir_path)
+    assert filtered_dataset.digest != dataset.digest
+
+
 def test_from_spark_delta_path(spark_session, tmp_path, df):
     df_spark = spark_session.createDataFrame(df)
     path = str(tmp_path / "temp.delta")
@@ -5,6 +5,17 @@ CREATE TABLE alembic_version (
 )
 
 
+CREATE TABLE change_events (
+	sequence BIGINT GENERATED BY DEFAULT AS IDENTITY (INCREMENT BY 1 START WITH 1),
+	timestamp BIGINT NOT NULL,
+	entity_type VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	entity_id VARCHAR(500) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	op VARCHAR(20) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	data VARCHAR COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	CONSTRAINT change_events_pk PRIMARY KEY (sequence)
+)
+
+
 CREATE TABLE experiments (
 	experiment_id INTEGER GENERATED BY DEFAULT AS IDENTITY (INCREMENT BY 1 START WITH 1),
 	name VARCHAR(256) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
@@ -195,6 +206,29 @@ CREATE TABLE trace_request_metadata (
 )
 
 
+CREATE TABLE trace_span_attributes (
+	request_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	key VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	value VARCHAR(8000) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	CONSTRAINT trace_span_attributes_pk PRIMARY KEY (request_id, span_id, key),
+	CONSTRAINT fk_trace_span_attributes_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
+CREATE TABLE trace_spans (
+	request_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	parent_span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	name VARCHAR(500) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	span_type VARCHAR(500) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	status VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	duration_ms BIGINT,
+	CONSTRAINT trace_spans_pk PRIMARY KEY (request_id, span_id),
+	CONSTRAINT fk_trace_spans_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
 CREATE TABLE trace_tags (
 	key VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
 	value VARCHAR(8000) COLLATE "SQL_Latin1_General_CP1_CI_AS",
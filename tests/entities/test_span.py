@@ -1,4 +1,5 @@
 import json
+from dataclasses import dataclass
 from datetime import datetime
 
 import opentelemetry.trace as trace_api
@@ -9,6 +10,7 @@ import qcflow
 from qcflow.entities import LiveSpan, Span, SpanEvent, SpanStatus, SpanStatusCode, SpanType
 from qcflow.entities.span import NoOpSpan, create_qcflow_span
 from qcflow.exceptions import QCFlowException
+from qcflow.tracing.constant import SpanAttributeKey
 from qcflow.tracing.provider import _get_tracer, trace_disabled
 from qcflow.tracing.utils import encode_span_id, encode_trace_id
 
@@ -205,6 +207,67 @@ def test_to_immutable_span():
         span.set_attribute("OK")
 
 
+@dataclass
+class Document:
+    page_content: str
+
+
+def test_attribute_serialization_is_deferred():
+    tracer = _get_tracer("test")
+    with tracer.start_as_current_span("parent") as parent_span:
+        live_span = LiveSpan(parent_span, request_id="tr-12345")
+        documents = [{"page_content": "foo"}]
+        live_span.set_inputs({"documents": documents})
+        live_span.set_outputs("bar")
+
+        # Primitive values are serialized immediately, other values are not
+        assert parent_span.attributes["qcflow.spanOutputs"] == '"bar"'
+        assert "qcflow.spanInputs" not in parent_span.attributes
+
+        # Mutating the value after it is set does not change the recorded value
+        documents.append({"page_content": "baz"})
+        assert live_span.inputs == {"documents": [{"page_content": "foo"}]}
+
+        # Nested containers are copied at any depth
+        nested = {"a": {"b": {"c": [1]}}}
+        live_span.set_attribute("nested", nested)
+        nested["a"]["b"]["c"].append(2)
+        assert live_span.get_attribute("nested") == {"a": {"b": {"c": [1]}}}
+
+        # Values containing other, possibly mutable, objects are serialized immediately
+        document = Document(page_content="foo")
+        live_span.set_attribute("document", {"documents": [document]})
+        assert parent_span.attributes["document"] == '{"documents": [{"page_content": "foo"}]}'
+        document.page_content = "bar"
+        assert live_span.get_attribute("document") == {"documents": [{"page_content": "foo"}]}
+
+        live_span.set_attribute("key", {"a": 1})
+
+    # The value set before the span ended is serialized at export time
+    span = live_span.to_immutable_span()
+    assert span.get_attribute("key") == {"a": 1}
+    assert span.to_dict()["attributes"]["key"] == '{"a": 1}'
+    assert span.inputs == {"documents": [{"page_content": "foo"}]}
+
+
+def test_attribute_size_limit(monkeypatch):
+    monkeypatch.setenv("QCFLOW_TRACE_MAX_ATTRIBUTE_SIZE", "30")
+
+    tracer = _get_tracer("test")
+    with tracer.start_as_current_span("parent") as parent_span:
+        live_span = LiveSpan(parent_span, request_id="tr-12345")
+        live_span.set_inputs({"input": "a" * 100})
+        live_span.set_outputs("short")
+
+    span = live_span.to_immutable_span()
+    # The escaped quotes of the truncated JSON count towards the limit
+    serialized_inputs = span.to_dict()["attributes"][SpanAttributeKey.INPUTS]
+    assert serialized_inputs == r'"{\"input\": \"aaaaaaaaaaa..."'
+    assert len(serialized_inputs) == 30
+    assert span.inputs == '{"input": "aaaaaaaaaaa...'
+    assert span.outputs == "short"
+
+
 def test_from_dict_raises_when_request_id_is_empty():
     with pytest.raises(QCFlowException, match=r"Failed to create a Span object from "):
         Span.from_dict(
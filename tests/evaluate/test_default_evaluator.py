@@ -56,6 +56,7 @@ from qcflow.models.evaluation.default_evaluator import (
     _extract_predict_fn,
     _extract_raw_model,
     _get_aggregate_metrics_values,
+    _ParallelPredictor,
 )
 from qcflow.models.evaluation.evaluators.classifier import (
     _extract_predict_fn_and_prodict_proba_fn,
@@ -66,8 +67,16 @@ from qcflow.models.evaluation.evaluators.classifier import (
     _infer_model_type_by_labels,
 )
 from qcflow.models.evaluation.evaluators.default import _extract_output_and_other_columns
-from qcflow.models.evaluation.evaluators.regressor import _get_regressor_metrics
-from qcflow.models.evaluation.evaluators.shap import _compute_df_mode_or_mean
+from qcflow.models.evaluation.evaluators.regressor import (
+    _extract_predict_fns,
+    _get_regressor_metrics,
+)
+from qcflow.models.evaluation.evaluators.shap import (
+    _compute_df_mode_or_mean,
+    _compute_shap_values,
+    _shap_cache,
+    _stratified_sample,
+)
 from qcflow.models.evaluation.utils.metric import MetricDefinition
 
 from tests.evaluate.test_evaluation import (
@@ -646,6 +655,82 @@ def test_pipeline_model_kernel_explainer_on_categorical_features(pipeline_model_
     assert isinstance(explainer, _PatchedKernelExplainer)
 
 
+@pytest.fixture
+def clear_shap_cache():
+    _shap_cache.clear()
+    yield
+    _shap_cache.clear()
+
+
+@pytest.mark.usefixtures("clear_shap_cache")
+@pytest.mark.parametrize(("cache_size", "expected_calls"), [("4", 1), ("0", 2)])
+def test_shap_values_are_cached_across_evaluations(monkeypatch, cache_size, expected_calls):
+    monkeypatch.setenv("QCFLOW_EVALUATE_SHAP_CACHE_SIZE", cache_size)
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(LinearRegression().fit(X, y), "model")
+
+    with mock.patch(
+        "qcflow.models.evaluation.evaluators.shap._compute_shap_values",
+        side_effect=_compute_shap_values,
+    ) as mock_compute:
+        for _ in range(2):
+            with qcflow.start_run() as run:
+                evaluate(
+                    model_info.model_uri,
+                    X.assign(target=y),
+                    model_type="regressor",
+                    targets="target",
+                    evaluator_config={"explainability_nsamples": 50},
+                )
+            _, _, _, artifacts = get_run_data(run.info.run_id)
+            assert "shap_beeswarm_plot.png" in artifacts
+
+    assert mock_compute.call_count == expected_calls
+
+
+@pytest.mark.parametrize("algorithm", ["exact", "kernel"])
+def test_compute_shap_values_in_parallel_matches_sequential(algorithm):
+    import shap
+
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    X = X.iloc[:, :5]
+    model = LinearRegression().fit(X, y)
+    background = X.iloc[:20]
+    if algorithm == "kernel":
+        explainer = shap.KernelExplainer(model.predict, background)
+    else:
+        explainer = shap.Explainer(model.predict, background, algorithm=algorithm)
+
+    sampled_X = X.iloc[20:51]
+    values = [
+        _compute_shap_values(shap, explainer, sampled_X, algorithm, list(X.columns), n_jobs)
+        for n_jobs in [1, 3]
+    ]
+    assert values[1].values.shape == (len(sampled_X), X.shape[1])
+    np.testing.assert_allclose(values[1].values, values[0].values, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("y", "model_type", "nsamples", "expected_counts"),
+    [
+        ([0] * 80 + [1] * 20, "classifier", 10, {0: 8, 1: 2}),
+        ([0] * 97 + [1] * 2 + [2], "classifier", 10, {0: 8, 1: 1, 2: 1}),
+        (["a"] * 50 + ["b"] * 50, "classifier", 7, {"a": 4, "b": 3}),
+        ([0] * 80 + [1] * 20, "classifier", 200, {0: 80, 1: 20}),
+        (np.arange(100), "regressor", 20, {decile: 2 for decile in range(10)}),
+    ],
+)
+def test_stratified_sample(y, model_type, nsamples, expected_counts):
+    X = pd.DataFrame({"x": np.arange(len(y))})
+    sampled = _stratified_sample(X, y, nsamples, random_state=0, model_type=model_type)
+    assert sampled["x"].is_monotonic_increasing
+    strata = pd.Series(y).iloc[sampled["x"]]
+    if model_type == "regressor":
+        strata = strata // 10
+    assert strata.value_counts().to_dict() == expected_counts
+
+
 def test_compute_df_mode_or_mean():
     df = pd.DataFrame(
         {
@@ -1914,6 +1999,312 @@ def test_evaluation_multiclass_classification_with_average(average):
         np.testing.assert_allclose(result.metrics["f1_score"], f1)
 
 
+def _evaluate_with_and_without_chunks(model_uri, data, model_type, evaluator, evaluator_config):
+    results = []
+    for chunk_size in [None, 37]:
+        config = dict(evaluator_config)
+        if chunk_size:
+            config["chunk_size"] = chunk_size
+        with qcflow.start_run():
+            results.append(
+                evaluate(
+                    model_uri,
+                    data,
+                    model_type=model_type,
+                    targets="target",
+                    evaluators=evaluator,
+                    evaluator_config=config,
+                )
+            )
+    return results
+
+
+@pytest.mark.parametrize("use_sample_weights", [False, True])
+def test_chunked_regressor_evaluation(use_sample_weights):
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    sample_weights = np.random.rand(len(y)) if use_sample_weights else None
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(LinearRegression().fit(X, y), "model")
+
+    result, chunked_result = _evaluate_with_and_without_chunks(
+        model_info.model_uri,
+        X.assign(target=y),
+        model_type="regressor",
+        evaluator="regressor",
+        evaluator_config={"sample_weights": sample_weights},
+    )
+
+    expected_metrics = {k: v for k, v in result.metrics.items() if k != "score"}
+    assert chunked_result.metrics.keys() == expected_metrics.keys()
+    assert_metrics_equal(chunked_result.metrics, expected_metrics)
+
+    eval_table = chunked_result.artifacts["eval_results_table"]
+    assert isinstance(eval_table, ParquetEvaluationArtifact)
+    eval_table_df = pd.read_parquet(eval_table.uri)
+    assert len(eval_table_df) == len(X)
+    assert list(eval_table_df.columns) == [*X.columns, "target", "outputs"]
+    np.testing.assert_allclose(eval_table_df["target"], y)
+
+
+@pytest.mark.parametrize(
+    ("load_data", "evaluator_config"),
+    [
+        (load_breast_cancer, {}),
+        (load_breast_cancer, {"pos_label": 0}),
+        (load_iris, {}),
+        (load_iris, {"average": "macro"}),
+    ],
+)
+@pytest.mark.parametrize("use_sample_weights", [False, True])
+def test_chunked_classifier_evaluation(load_data, evaluator_config, use_sample_weights):
+    X, y = load_data(as_frame=True, return_X_y=True)
+    X = X.iloc[:, :4]
+    sample_weights = np.random.rand(len(y)) if use_sample_weights else None
+    with qcflow.start_run():
+        model = LogisticRegression(max_iter=1000).fit(X, y)
+        model_info = qcflow.sklearn.log_model(model, "model")
+
+    result, chunked_result = _evaluate_with_and_without_chunks(
+        model_info.model_uri,
+        X.assign(target=y),
+        model_type="classifier",
+        evaluator="classifier",
+        evaluator_config={**evaluator_config, "sample_weights": sample_weights},
+    )
+
+    # Metrics that require the full distribution of the predicted probabilities are skipped
+    expected_metrics = {
+        k: v
+        for k, v in result.metrics.items()
+        if k not in ("score", "roc_auc", "precision_recall_auc")
+    }
+    assert chunked_result.metrics.keys() == expected_metrics.keys()
+    assert_metrics_equal(chunked_result.metrics, expected_metrics)
+    assert "confusion_matrix" in chunked_result.artifacts
+    eval_table_df = pd.read_parquet(chunked_result.artifacts["eval_results_table"].uri)
+    np.testing.assert_array_equal(eval_table_df["outputs"], model.predict(X))
+
+
+def test_chunked_evaluation_with_static_predictions():
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    data = X.assign(target=y, prediction=LinearRegression().fit(X, y).predict(X))
+    results = []
+    for config in [{}, {"chunk_size": 100}]:
+        with qcflow.start_run():
+            results.append(
+                evaluate(
+                    data=data,
+                    model_type="regressor",
+                    targets="target",
+                    predictions="prediction",
+                    evaluators="regressor",
+                    evaluator_config=config,
+                )
+            )
+    assert_metrics_equal(results[1].metrics, results[0].metrics)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5, "100", True])
+def test_chunked_evaluation_invalid_chunk_size(chunk_size):
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(LinearRegression().fit(X, y), "model")
+        with pytest.raises(QCFlowException, match="chunk_size must be a positive integer"):
+            evaluate(
+                model_info.model_uri,
+                X.assign(target=y),
+                model_type="regressor",
+                targets="target",
+                evaluators="regressor",
+                evaluator_config={"chunk_size": chunk_size},
+            )
+
+
+def test_chunked_evaluation_does_not_support_extra_metrics():
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    metric = make_metric(
+        eval_fn=lambda predictions, targets: 1.0, greater_is_better=True, name="constant"
+    )
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(LinearRegression().fit(X, y), "model")
+        with pytest.raises(QCFlowException, match="not supported when `chunk_size` is specified"):
+            evaluate(
+                model_info.model_uri,
+                X.assign(target=y),
+                model_type="regressor",
+                targets="target",
+                evaluators="regressor",
+                extra_metrics=[metric],
+                evaluator_config={"chunk_size": 100},
+            )
+
+
+@pytest.mark.parametrize(
+    ("load_data", "model_class", "model_type"),
+    [
+        (load_diabetes, LinearRegression, "regressor"),
+        (load_breast_cancer, LogisticRegression, "classifier"),
+    ],
+)
+def test_streaming_evaluation_of_arrow_dataset(tmp_path, load_data, model_class, model_type):
+    import pyarrow.dataset as ds
+
+    X, y = load_data(as_frame=True, return_X_y=True)
+    data = X.assign(target=y)
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    for i, part in enumerate(np.array_split(data, 4)):
+        part.to_parquet(data_path / f"part-{i}.parquet", index=False)
+    model = model_class(max_iter=1000) if model_type == "classifier" else model_class()
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(model.fit(X, y), "model")
+
+    results = []
+    for input_data, config in [(data, {"chunk_size": 50}), (ds.dataset(str(data_path)), {})]:
+        with qcflow.start_run():
+            results.append(
+                evaluate(
+                    model_info.model_uri,
+                    input_data,
+                    model_type=model_type,
+                    targets="target",
+                    evaluators=model_type,
+                    evaluator_config=config,
+                )
+            )
+
+    chunked_result, streaming_result = results
+    assert_metrics_equal(streaming_result.metrics, chunked_result.metrics)
+    eval_table = streaming_result.artifacts["eval_results_table"]
+    assert isinstance(eval_table, ParquetEvaluationArtifact)
+    assert len(eval_table.content) == len(data)
+
+
+def test_streaming_evaluation_with_static_predictions(tmp_path):
+    import pyarrow.dataset as ds
+
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    data = X.assign(target=y, prediction=LinearRegression().fit(X, y).predict(X))
+    data_path = tmp_path / "data.parquet"
+    data.to_parquet(data_path, index=False)
+    results = []
+    for input_data in [data, ds.dataset(str(data_path))]:
+        with qcflow.start_run():
+            results.append(
+                evaluate(
+                    data=input_data,
+                    model_type="regressor",
+                    targets="target",
+                    predictions="prediction",
+                    evaluators="regressor",
+                    evaluator_config={"chunk_size": 100},
+                )
+            )
+    assert_metrics_equal(results[1].metrics, results[0].metrics)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 100])
+def test_regressor_evaluation_with_prediction_workers(chunk_size):
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(LinearRegression().fit(X, y), "model")
+
+    results = []
+    for num_prediction_workers in [None, 2]:
+        with qcflow.start_run():
+            results.append(
+                evaluate(
+                    model_info.model_uri,
+                    X.assign(target=y),
+                    model_type="regressor",
+                    targets="target",
+                    evaluators="regressor",
+                    evaluator_config={
+                        "chunk_size": chunk_size,
+                        "num_prediction_workers": num_prediction_workers,
+                    },
+                )
+            )
+    assert results[1].metrics == pytest.approx(results[0].metrics)
+
+
+def test_classifier_evaluation_with_prediction_workers():
+    X, y = load_iris(as_frame=True, return_X_y=True)
+    model = LogisticRegression(max_iter=1000).fit(X, y)
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(model, "model")
+
+    with mock.patch(
+        "qcflow.models.evaluation.default_evaluator._ParallelPredictor.predict",
+        autospec=True,
+        side_effect=_ParallelPredictor.predict,
+    ) as mock_predict:
+        results = []
+        for num_prediction_workers in [None, 3]:
+            with qcflow.start_run():
+                results.append(
+                    evaluate(
+                        model_info.model_uri,
+                        X.assign(target=y),
+                        model_type="classifier",
+                        targets="target",
+                        evaluators="classifier",
+                        evaluator_config={"num_prediction_workers": num_prediction_workers},
+                    )
+                )
+    mock_predict.assert_called_once()
+    assert results[1].metrics == pytest.approx(results[0].metrics)
+    assert {"log_loss", "roc_auc"} <= results[1].metrics.keys()
+
+
+def test_parallel_predictor_reassembles_predictions_in_order():
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    model = LinearRegression().fit(X, y)
+    with qcflow.start_run():
+        model_info = qcflow.sklearn.log_model(model, "model")
+    pyfunc_model = qcflow.pyfunc.load_model(model_info.model_uri)
+
+    with _ParallelPredictor(pyfunc_model, num_workers=2) as predictor:
+        (y_pred,) = predictor.predict(X.iloc[:11], _extract_predict_fns)
+        np.testing.assert_allclose(y_pred, model.predict(X.iloc[:11]))
+        (y_pred,) = predictor.predict(X.iloc[:1], _extract_predict_fns)
+        np.testing.assert_allclose(y_pred, model.predict(X.iloc[:1]))
+
+
+def test_prediction_workers_fall_back_to_sequential_prediction_for_functions():
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    model = LinearRegression().fit(X, y)
+    with (
+        qcflow.start_run(),
+        mock.patch("qcflow.models.evaluation.default_evaluator._logger.warning") as mock_warning,
+    ):
+        result = evaluate(
+            model.predict,
+            X.assign(target=y),
+            model_type="regressor",
+            targets="target",
+            evaluators="regressor",
+            evaluator_config={"num_prediction_workers": 2},
+        )
+    assert "requires a model loaded from a model URI" in mock_warning.call_args[0][0]
+    assert "mean_squared_error" in result.metrics
+
+
+@pytest.mark.parametrize("num_prediction_workers", [0, 1.5, "2", False])
+def test_invalid_num_prediction_workers(num_prediction_workers):
+    X, y = load_diabetes(as_frame=True, return_X_y=True)
+    with qcflow.start_run():
+        with pytest.raises(QCFlowException, match="num_prediction_workers must be a positive"):
+            evaluate(
+                LinearRegression().fit(X, y).predict,
+                X.assign(target=y),
+                model_type="regressor",
+                targets="target",
+                evaluators="regressor",
+                evaluator_config={"num_prediction_workers": num_prediction_workers},
+            )
+
+
 def test_custom_metrics():
     X, y = load_iris(as_frame=True, return_X_y=True)
     with qcflow.start_run():
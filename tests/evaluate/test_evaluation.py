@@ -33,7 +33,11 @@ from sklearn.metrics import (
 
 import qcflow
 from qcflow import QCFlowClient
-from qcflow.data.evaluation_dataset import EvaluationDataset, _gen_md5_for_arraylike_obj
+from qcflow.data.evaluation_dataset import (
+    EvaluationDataset,
+    StreamingEvaluationDataset,
+    _gen_md5_for_arraylike_obj,
+)
 from qcflow.data.pandas_dataset import from_pandas
 from qcflow.entities import Trace, TraceData
 from qcflow.exceptions import QCFlowException
@@ -797,6 +801,74 @@ def test_dataset_from_spark_df(spark_session):
         assert list(dataset.labels_data) == [3.0] * 5
 
 
+def _write_arrow_dataset(path, df, num_files=3):
+    import pyarrow.dataset as ds
+
+    path.mkdir(exist_ok=True)
+    for i, part in enumerate(np.array_split(df, num_files)):
+        part.to_parquet(path / f"part-{i}.parquet", index=False)
+    return ds.dataset(str(path), format="parquet")
+
+
+def test_streaming_dataset_from_arrow_dataset(tmp_path):
+    data = pd.DataFrame({"f1": range(10), "f2": [f"v{i}" for i in range(10)], "y": [0, 1] * 5})
+    arrow_dataset = _write_arrow_dataset(tmp_path, data)
+    dataset = StreamingEvaluationDataset(arrow_dataset, targets="y", batch_size=4)
+
+    assert dataset.feature_names == ["f1", "f2"]
+    assert dataset.has_targets
+    assert not dataset.has_predictions
+    batches = list(dataset.iter_batches())
+    assert all(len(features) <= 4 for features, _, _ in batches)
+    pd.testing.assert_frame_equal(
+        pd.concat([features for features, _, _ in batches], ignore_index=True), data[["f1", "f2"]]
+    )
+    np.testing.assert_array_equal(np.concatenate([y for _, y, _ in batches]), data["y"])
+    assert all(predictions is None for _, _, predictions in batches)
+
+    head = dataset.head(5)
+    assert isinstance(head, EvaluationDataset)
+    pd.testing.assert_frame_equal(head.features_data, data[["f1", "f2"]].head(5))
+    np.testing.assert_array_equal(head.labels_data, data["y"].head(5))
+
+    with pytest.raises(QCFlowException, match="not loaded in memory"):
+        dataset.features_data
+
+
+def test_streaming_dataset_hash(tmp_path):
+    data = pd.DataFrame({"f1": range(100), "f2": np.arange(100) * 0.5, "y": [0, 1] * 50})
+    arrow_dataset = _write_arrow_dataset(tmp_path / "a", data)
+    hashes = {
+        StreamingEvaluationDataset(arrow_dataset, targets="y", batch_size=batch_size).hash
+        for batch_size in [7, 30, 1000]
+    }
+    # The hash does not depend on how the rows are split into files and batches
+    hashes.add(
+        StreamingEvaluationDataset(
+            _write_arrow_dataset(tmp_path / "b", data, num_files=1), targets="y"
+        ).hash
+    )
+    assert len(hashes) == 1
+
+    changed = data.copy()
+    changed.loc[50, "f2"] = -1.0
+    changed_dataset = _write_arrow_dataset(tmp_path / "c", changed)
+    assert StreamingEvaluationDataset(changed_dataset, targets="y").hash not in hashes
+
+
+def test_streaming_dataset_validation(tmp_path):
+    data = pd.DataFrame({"f1": [1, 2], "y": [0, 1]})
+    arrow_dataset = _write_arrow_dataset(tmp_path, data, num_files=1)
+    with pytest.raises(QCFlowException, match="must be a `pyarrow.dataset.Dataset`"):
+        StreamingEvaluationDataset(data, targets="y")
+    with pytest.raises(QCFlowException, match="`targets` argument must be the name of a column"):
+        StreamingEvaluationDataset(arrow_dataset, targets="label")
+    with pytest.raises(QCFlowException, match="are not present in the streaming"):
+        StreamingEvaluationDataset(arrow_dataset, targets="y", feature_names=["f2"])
+    with pytest.raises(QCFlowException, match="batch_size must be a positive integer"):
+        StreamingEvaluationDataset(arrow_dataset, targets="y", batch_size=-1)
+
+
 def test_log_dataset_tag(iris_dataset, iris_pandas_df_dataset):
     model_uuid = uuid.uuid4().hex
     with qcflow.start_run() as run:
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import re
+import time
+from unittest import mock
+
+import pandas as pd
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from qcflow.exceptions import QCFlowException
+from qcflow.metrics.genai import make_genai_metric_from_prompt
+from qcflow.metrics.genai.async_scoring import (
+    AdaptiveConcurrencyLimiter,
+    AsyncJudgeScorer,
+    TokenBucket,
+    _get_backoff_seconds,
+    _parse_retry_after,
+    is_async_scoring_supported,
+)
+
+
+def _anthropic_response(text):
+    return {
+        "content": [{"text": text, "type": "text"}],
+        "id": "msg_013Zva2CMHLNnXjNJJKqJ2EF",
+        "model": "claude-3-5-sonnet-20241022",
+        "role": "assistant",
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "type": "message",
+        "usage": {"input_tokens": 10, "output_tokens": 10},
+    }
+
+
+@pytest.fixture(autouse=True)
+def anthropic_api_key(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+
+def test_is_async_scoring_supported():
+    assert is_async_scoring_supported("openai:/gpt-4o-mini")
+    assert is_async_scoring_supported("anthropic:/claude-3-5-sonnet-20241022")
+    assert not is_async_scoring_supported("bedrock:/anthropic.claude-3-5-sonnet")
+    assert not is_async_scoring_supported("endpoints:/my-endpoint")
+
+
+def test_adaptive_concurrency_limiter():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=5)
+
+        # Additive increase by one per window of successful requests
+        for _ in range(4):
+            token = await limiter.acquire()
+            await limiter.release(token, throttled=False, latency=0.1)
+        assert 4.9 < limiter.limit < 5.0
+
+        # A burst of throttled responses from the same window only halves the limit once
+        tokens = [await limiter.acquire() for _ in range(4)]
+        assert limiter.in_flight == 4
+        for token in tokens:
+            await limiter.release(token, throttled=True)
+        assert limiter.limit == pytest.approx(4.9 / 2, rel=0.01)
+
+        # Slow requests are treated as congestion when a latency threshold is set
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=8, max_limit=8, latency_threshold_seconds=1.0
+        )
+        token = await limiter.acquire()
+        await limiter.release(token, throttled=False, latency=2.0)
+        assert limiter.limit == 4
+
+        # The limit never drops below the minimum
+        for _ in range(5):
+            token = await limiter.acquire()
+            await limiter.release(token, throttled=True)
+        assert limiter.limit == 1
+
+    asyncio.run(run())
+
+
+def test_adaptive_concurrency_limiter_blocks_at_limit():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        token = await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await limiter.release(token, throttled=False, latency=0.1)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(run())
+
+
+def test_token_bucket():
+    async def run():
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_backoff():
+    assert _parse_retry_after("2") == 2.0
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+    assert _parse_retry_after(None) is None
+    assert _get_backoff_seconds(0, 3.0) == 3.0
+    assert 0 <= _get_backoff_seconds(3, None) <= 8
+
+
+def _run_with_server(handler, func):
+    """Serve the handler on a local port and call ``func(url)`` from another thread."""
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/messages", handler)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/v1/messages"))
+            return await asyncio.get_running_loop().run_in_executor(None, func, url)
+
+    return asyncio.run(run())
+
+
+def test_async_judge_scorer_retries_throttled_requests():
+    requests = []
+
+    async def handler(request):
+        body = await request.json()
+        requests.append((request.headers["x-api-key"], body))
+        if len(requests) <= 2:
+            return web.json_response(
+                {"error": "rate limited"}, status=429, headers={"Retry-After": "0"}
+            )
+        return web.json_response(_anthropic_response(body["messages"][0]["content"].upper()))
+
+    def score(url):
+        scorer = AsyncJudgeScorer(
+            "anthropic:/claude-3-5-sonnet-20241022",
+            parameters={"max_tokens": 100},
+            proxy_url=url,
+            initial_concurrency=2,
+        )
+        return scorer.score(["a", "b", "c"])
+
+    assert _run_with_server(handler, score) == ["A", "B", "C"]
+    assert len(requests) == 5
+    assert all(api_key == "test-key" for api_key, _ in requests)
+    assert requests[0][1]["max_tokens"] == 100
+
+
+def test_async_judge_scorer_returns_errors():
+    async def handler(request):
+        body = await request.json()
+        if body["messages"][0]["content"] == "throttled":
+            return web.json_response({}, status=429, headers={"Retry-After": "0"})
+        if body["messages"][0]["content"] == "bad":
+            return web.json_response({"error": "bad request"}, status=400)
+        return web.json_response(_anthropic_response("ok"))
+
+    def score(url):
+        scorer = AsyncJudgeScorer(
+            "anthropic:/claude-3-5-sonnet-20241022", proxy_url=url, max_retries=1
+        )
+        return scorer.score(["throttled", "bad", "good"])
+
+    throttled, bad, good = _run_with_server(handler, score)
+    assert isinstance(throttled, QCFlowException)
+    assert "after 2 attempts" in str(throttled)
+    assert isinstance(bad, QCFlowException)
+    assert "400" in str(bad)
+    assert good == "ok"
+
+
+def test_genai_metric_with_async_scoring(monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_GENAI_ASYNC_SCORING", "true")
+    metric = make_genai_metric_from_prompt(
+        name="custom",
+        judge_prompt="Judge <{output}>",
+        model="anthropic:/claude-3-5-sonnet-20241022",
+    )
+
+    async def send(self, session, url, headers, payload):
+        assert url == "https://api.anthropic.com/v1/messages"
+        output = re.search(r"<(.*)>", payload["messages"][0]["content"]).group(1)
+        if output == "error":
+            raise QCFlowException("Failed to call LLM endpoint")
+        return _anthropic_response(json.dumps({"score": len(output), "justification": output}))
+
+    with (
+        mock.patch.object(AsyncJudgeScorer, "_send", send),
+        mock.patch("qcflow.metrics.genai.model_utils.score_model_on_payload") as mock_sync,
+    ):
+        metric_value = metric.eval_fn(output=pd.Series(["a", "bb", "error"]))
+
+    mock_sync.assert_not_called()
+    assert metric_value.scores == [1, 2, None]
+    assert metric_value.justifications[:2] == ["a", "bb"]
+    assert "Failed to call LLM endpoint" in metric_value.justifications[2]
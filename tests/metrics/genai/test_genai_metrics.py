@@ -1330,6 +1330,56 @@ def test_genai_metrics_with_llm_judge_callable():
     }
 
 
+def test_genai_metrics_with_judge_cache(custom_metric, tmp_path, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_GENAI_JUDGE_CACHE", "true")
+    monkeypatch.setenv("QCFLOW_GENAI_JUDGE_CACHE_PATH", str(tmp_path / "judge.db"))
+    custom_judge_prompt_metric = make_genai_metric_from_prompt(
+        name="custom", judge_prompt="Judge {input} and {output}"
+    )
+
+    def evaluate(predictions):
+        return (
+            custom_metric.eval_fn(
+                pd.Series(predictions),
+                {},
+                pd.Series(["What is QCFlow?"] * len(predictions)),
+                pd.Series([qcflow_ground_truth] * len(predictions)),
+            ),
+            custom_judge_prompt_metric.eval_fn(
+                input=pd.Series(["What is QCFlow?"] * len(predictions)),
+                output=pd.Series(predictions),
+            ),
+        )
+
+    with mock.patch.object(
+        model_utils,
+        "score_model_on_payload",
+        return_value=properly_formatted_openai_response1,
+    ) as mock_predict_function:
+        for metric_value in evaluate([qcflow_prediction]):
+            assert metric_value.scores == [3]
+            assert metric_value.aggregate_results["judge_cache_hits"] == 0
+        assert mock_predict_function.call_count == 2
+
+        # Only the new prediction is sent to the judge
+        for metric_value in evaluate([qcflow_prediction, "QCFlow is a platform"]):
+            assert metric_value.scores == [3, 3]
+            assert metric_value.justifications == [openai_justification1] * 2
+            assert metric_value.aggregate_results["judge_cache_hits"] == 1
+        assert mock_predict_function.call_count == 4
+
+    # Failed requests are not cached
+    with mock.patch.object(
+        model_utils, "score_model_on_payload", side_effect=Exception("error")
+    ) as mock_predict_function:
+        for metric_value in evaluate(["QCFlow is a library"]):
+            assert metric_value.scores == [None]
+            assert metric_value.aggregate_results["judge_cache_hits"] == 0
+        for metric_value in evaluate(["QCFlow is a library"]):
+            assert metric_value.aggregate_results["judge_cache_hits"] == 0
+        assert mock_predict_function.call_count == 4
+
+
 @pytest.mark.parametrize("with_endpoint_type", [True, False])
 def test_genai_metric_with_custom_chat_endpoint(with_endpoint_type):
     similarity_metric = answer_similarity(
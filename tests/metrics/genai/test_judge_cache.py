@@ -0,0 +1,72 @@
+import threading
+
+from qcflow.metrics.genai.judge_cache import JudgeResponseCache
+
+
+def test_make_key():
+    key = JudgeResponseCache.make_key("openai:/gpt-4o-mini", {"temperature": 0.0}, "prompt")
+    assert key == JudgeResponseCache.make_key("openai:/gpt-4o-mini", {"temperature": 0.0}, "prompt")
+    assert key != JudgeResponseCache.make_key("openai:/gpt-4o", {"temperature": 0.0}, "prompt")
+    assert key != JudgeResponseCache.make_key("openai:/gpt-4o-mini", {"temperature": 1.0}, "prompt")
+    assert key != JudgeResponseCache.make_key("openai:/gpt-4o-mini", {"temperature": 0.0}, "other")
+    assert JudgeResponseCache.make_key("m", None, "p") == JudgeResponseCache.make_key("m", {}, "p")
+
+
+def test_get_and_set(tmp_path):
+    path = str(tmp_path / "cache" / "judge.db")
+    cache = JudgeResponseCache(path, max_entries=10)
+    assert cache.get("a") is None
+    cache.set("a", "response")
+    assert cache.get("a") == "response"
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    # Responses are persisted and the counters are per instance
+    cache = JudgeResponseCache(path, max_entries=10)
+    assert cache.get("a") == "response"
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.close()
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path, monkeypatch):
+    timestamps = iter(range(100))
+    monkeypatch.setattr("qcflow.metrics.genai.judge_cache.time.time", lambda: next(timestamps))
+
+    cache = JudgeResponseCache(str(tmp_path / "judge.db"), max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_thread_safe(tmp_path):
+    cache = JudgeResponseCache(str(tmp_path / "judge.db"), max_entries=1000)
+
+    def worker(i):
+        for j in range(20):
+            cache.set(f"{i}-{j}", str(j))
+            assert cache.get(f"{i}-{j}") == str(j)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.hits == 160
+
+
+def test_from_env(tmp_path, monkeypatch):
+    assert JudgeResponseCache.from_env() is None
+
+    path = str(tmp_path / "judge.db")
+    monkeypatch.setenv("QCFLOW_ENABLE_GENAI_JUDGE_CACHE", "true")
+    monkeypatch.setenv("QCFLOW_GENAI_JUDGE_CACHE_PATH", path)
+    monkeypatch.setenv("QCFLOW_GENAI_JUDGE_CACHE_MAX_ENTRIES", "5")
+    cache = JudgeResponseCache.from_env()
+    assert cache.path == path
+    assert cache.max_entries == 5
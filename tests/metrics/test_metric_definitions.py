@@ -3,6 +3,7 @@ import io
 import sys
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -365,6 +366,99 @@ def test_ndcg_at_k():
     assert result.scores[0] == 0.0
 
 
+def _reference_precision_at_k(predictions, targets, k):
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        ground_truth, retrieved = set(target), prediction[:k]
+        relevant_doc_count = sum(1 for doc in retrieved if doc in ground_truth)
+        scores.append(relevant_doc_count / len(retrieved) if len(retrieved) > 0 else 0)
+    return scores
+
+
+def _reference_recall_at_k(predictions, targets, k):
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        ground_truth, retrieved = set(target), set(prediction[:k])
+        if len(ground_truth) > 0:
+            scores.append(len(ground_truth & retrieved) / len(ground_truth))
+        else:
+            scores.append(1 if len(retrieved) == 0 else 0)
+    return scores
+
+
+def _reference_ndcg_at_k(predictions, targets, k):
+    from sklearn.metrics import ndcg_score
+
+    scores = []
+    for target, prediction in zip(targets, predictions):
+        if len(prediction) == 0 or len(target) == 0:
+            scores.append(1 if len(prediction) == len(target) else 0)
+            continue
+        # Rename duplicate retrieved docs to distinct docs that are relevant if the original is
+        retrieved, ground_truth, counts = [], set(target), {}
+        for doc in prediction[:k]:
+            counts[doc] = counts.get(doc, 0) + 1
+            retrieved.append(doc if counts[doc] == 1 else (doc, counts[doc]))
+            if counts[doc] > 1 and doc in ground_truth:
+                ground_truth.add(retrieved[-1])
+        doc_to_index = {doc: i for i, doc in enumerate(ground_truth.union(retrieved))}
+        y_true = np.zeros((1, max(len(doc_to_index), 2)))
+        y_score = np.zeros((1, max(len(doc_to_index), 2)))
+        for i, doc in enumerate(retrieved):
+            y_score[0, doc_to_index[doc]] = 1 - i * 1e-6
+        for doc in ground_truth:
+            y_true[0, doc_to_index[doc]] = 1
+        scores.append(ndcg_score(y_true, y_score, k=len(retrieved), ignore_ties=True))
+    return scores
+
+
+def _generate_retrieval_data(num_rows, num_docs, seed):
+    rng = np.random.default_rng(seed)
+
+    def generate_ids():
+        ids = rng.integers(0, num_docs, size=rng.integers(0, 8)).tolist()
+        # Mix string and integer doc IDs, which are different IDs even if they look the same
+        return ids if rng.random() < 0.5 else [str(i) if i % 3 else i for i in ids]
+
+    return (
+        pd.Series([generate_ids() for _ in range(num_rows)]),
+        pd.Series([generate_ids() for _ in range(num_rows)]),
+    )
+
+
+@pytest.mark.parametrize(
+    ("metric", "reference"),
+    [
+        (precision_at_k, _reference_precision_at_k),
+        (recall_at_k, _reference_recall_at_k),
+        (ndcg_at_k, _reference_ndcg_at_k),
+    ],
+)
+@pytest.mark.parametrize("k", [1, 3, 10])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_retrieval_metrics_parity_with_row_wise_implementation(metric, reference, k, seed):
+    predictions, targets = _generate_retrieval_data(num_rows=300, num_docs=10, seed=seed)
+    # Also cover numpy arrays of IDs
+    predictions[::7] = [np.array(ids, dtype=np.int64) for ids in [[1, 1, 2], [3], []]] * (
+        len(predictions[::7]) // 3
+    ) + [np.array([4])] * (len(predictions[::7]) % 3)
+
+    result = metric(k).eval_fn(predictions, targets)
+
+    np.testing.assert_allclose(result.scores, reference(predictions, targets, k), atol=1e-6)
+
+
+def test_token_count():
+    from qcflow.metrics.metric_definitions import _token_count_eval_fn
+
+    result = _token_count_eval_fn(pd.Series(["hello world", None, "", "hello " * 100, 1]))
+    assert result.scores == [2, None, 0, 100, None]
+
+    # The predictions of a filtered dataset keep the index of the original rows
+    result = _token_count_eval_fn(pd.Series(["hello world", None, "hello"], index=[3, 7, 1]))
+    assert result.scores == [2, None, 1]
+
+
 def test_bleu():
     predictions = ["hello world", "this is a test"]
     targets = ["hello world", "this is a test sentence"]
@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+
+import qcflow
+from qcflow.exceptions import QCFlowException
+from qcflow.pyfunc.load_timing import (
+    ModelLoadTimings,
+    register_model_load_hook,
+    unregister_model_load_hook,
+)
+
+
+class ConstantModel(qcflow.pyfunc.PythonModel):
+    def predict(self, context, model_input, params=None):
+        return [1] * len(model_input)
+
+
+@pytest.fixture
+def model_uri():
+    with qcflow.start_run():
+        return qcflow.pyfunc.log_model(
+            "model", python_model=ConstantModel(), pip_requirements=["scikit-learn"]
+        ).model_uri
+
+
+@pytest.fixture
+def timings():
+    timings = []
+    register_model_load_hook(timings.append)
+    yield timings
+    unregister_model_load_hook(timings.append)
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_load_model_reports_timings(model_uri, timings, pipelined, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_PIPELINED_MODEL_LOAD", str(pipelined))
+    with mock.patch("qcflow.pyfunc.warn_dependency_requirement_mismatches") as mock_warn:
+        model = qcflow.pyfunc.load_model(model_uri)
+
+    assert model.predict([0, 0]) == [1, 1]
+    mock_warn.assert_called_once()
+    assert "scikit-learn" in mock_warn.call_args.args[0]
+    assert len(timings) == 1
+    assert timings[0].model_uri == model_uri
+    durations = timings[0].to_dict()
+    assert set(durations) == {*ModelLoadTimings.STAGES, "total"}
+    assert all(seconds > 0 for seconds in durations.values())
+
+
+def test_load_model_skips_env_check_when_warnings_are_suppressed(model_uri, timings, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_PIPELINED_MODEL_LOAD", "true")
+    with mock.patch("qcflow.pyfunc.warn_dependency_requirement_mismatches") as mock_warn:
+        qcflow.pyfunc.load_model(model_uri, suppress_warnings=True)
+
+    mock_warn.assert_not_called()
+    assert timings[0].stages["env_check"] == 0
+
+
+def test_pipelined_load_copies_model_to_dst_path(model_uri, tmp_path, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_PIPELINED_MODEL_LOAD", "true")
+    model = qcflow.pyfunc.load_model(model_uri, dst_path=str(tmp_path))
+
+    assert model._model_path == str(tmp_path / "model")
+    assert (tmp_path / "model" / "MLmodel").exists()
+
+
+def test_pipelined_load_of_missing_model_fails(monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_PIPELINED_MODEL_LOAD", "true")
+    with qcflow.start_run() as run:
+        pass
+
+    with pytest.raises((QCFlowException, OSError), match="MLmodel"):
+        qcflow.pyfunc.load_model(f"runs:/{run.info.run_id}/model")
+
+
+def test_failing_hooks_are_logged(model_uri):
+    def hook(timings):
+        raise ValueError("hook error")
+
+    register_model_load_hook(hook)
+    try:
+        with mock.patch("qcflow.pyfunc.load_timing._logger") as mock_logger:
+            qcflow.pyfunc.load_model(model_uri)
+    finally:
+        unregister_model_load_hook(hook)
+
+    mock_logger.debug.assert_called_once()
+    assert mock_logger.debug.call_args.args[1] == model_uri
+    mock_logger.warning.assert_called_once()
+    assert "hook error" in mock_logger.warning.call_args.args[0]
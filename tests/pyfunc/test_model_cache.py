@@ -0,0 +1,147 @@
+import threading
+from unittest import mock
+
+import pytest
+
+import qcflow
+from qcflow import QCFlowClient
+from qcflow.pyfunc import model_cache
+from qcflow.pyfunc.model_cache import (
+    PyFuncModelCache,
+    get_model_cache_stats,
+    invalidate_model_cache,
+    resolve_immutable_model_uri,
+)
+
+
+class ConstantModel(qcflow.pyfunc.PythonModel):
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, context, model_input, params=None):
+        return [self.value] * len(model_input)
+
+
+@pytest.fixture(autouse=True)
+def model_cache_enabled(monkeypatch):
+    monkeypatch.setenv("QCFLOW_PYFUNC_MODEL_CACHE_SIZE", "2")
+    model_cache._model_cache.invalidate()
+    model_cache._model_cache.reset_stats()
+    yield
+    model_cache._model_cache.invalidate()
+    model_cache._model_cache.reset_stats()
+
+
+def _log_model(value, registered_model_name=None):
+    with qcflow.start_run():
+        return qcflow.pyfunc.log_model(
+            "model",
+            python_model=ConstantModel(value),
+            registered_model_name=registered_model_name,
+        )
+
+
+def test_load_model_reuses_cached_model():
+    model_info = _log_model(1)
+    model = qcflow.pyfunc.load_model(model_info.model_uri)
+    assert qcflow.pyfunc.load_model(model_info.model_uri) is model
+    assert model.predict([0, 0]) == [1, 1]
+
+    # Models loaded with another config are cached separately
+    assert qcflow.pyfunc.load_model(model_info.model_uri, model_config={"a": 1}) is not model
+    assert get_model_cache_stats() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+def test_load_model_evicts_least_recently_used_models():
+    uris = [_log_model(i).model_uri for i in range(3)]
+    first_model = qcflow.pyfunc.load_model(uris[0])
+    qcflow.pyfunc.load_model(uris[1])
+    qcflow.pyfunc.load_model(uris[2])
+
+    assert get_model_cache_stats()["evictions"] == 1
+    assert qcflow.pyfunc.load_model(uris[0]) is not first_model
+
+
+def test_load_model_resolves_aliases_before_caching():
+    client = QCFlowClient()
+    _log_model(1, registered_model_name="cached_model")
+    _log_model(2, registered_model_name="cached_model")
+    client.set_registered_model_alias("cached_model", "champion", "1")
+
+    model = qcflow.pyfunc.load_model("models:/cached_model@champion")
+    assert qcflow.pyfunc.load_model("models:/cached_model/1") is model
+    assert model.predict([0]) == [1]
+
+    client.set_registered_model_alias("cached_model", "champion", "2")
+    assert resolve_immutable_model_uri("models:/cached_model@champion") == "models:/cached_model/2"
+    assert qcflow.pyfunc.load_model("models:/cached_model@champion").predict([0]) == [2]
+    assert qcflow.pyfunc.load_model("models:/cached_model/latest").predict([0]) == [2]
+
+
+def test_invalidate_model_cache():
+    client = QCFlowClient()
+    _log_model(1, registered_model_name="cached_model")
+    client.set_registered_model_alias("cached_model", "champion", "1")
+    model = qcflow.pyfunc.load_model("models:/cached_model/1")
+
+    assert invalidate_model_cache("models:/cached_model@champion") == 1
+    assert qcflow.pyfunc.load_model("models:/cached_model/1") is not model
+    assert invalidate_model_cache() == 1
+    assert get_model_cache_stats()["size"] == 0
+
+
+def test_load_model_does_not_cache_mutable_locations(tmp_path, monkeypatch):
+    model_info = _log_model(1)
+    path = str(tmp_path / "model")
+    qcflow.pyfunc.save_model(path, python_model=ConstantModel(1))
+
+    assert qcflow.pyfunc.load_model(path) is not qcflow.pyfunc.load_model(path)
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    assert qcflow.pyfunc.load_model(
+        model_info.model_uri, dst_path=str(dst_path)
+    ) is not qcflow.pyfunc.load_model(model_info.model_uri, dst_path=str(dst_path))
+
+    monkeypatch.setenv("QCFLOW_PYFUNC_MODEL_CACHE_SIZE", "0")
+    assert qcflow.pyfunc.load_model(model_info.model_uri) is not qcflow.pyfunc.load_model(
+        model_info.model_uri
+    )
+    assert get_model_cache_stats()["size"] == 0
+
+
+def test_concurrent_loads_of_the_same_model_are_coalesced():
+    cache = PyFuncModelCache(max_size=4)
+    key = cache.make_key("runs:/abc/model")
+    started = threading.Event()
+    load_fn = mock.Mock(side_effect=lambda: started.wait(1) or object())
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load(key, load_fn)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+
+    load_fn.assert_called_once()
+    assert len({id(result) for result in results}) == 1
+    assert cache.get_stats()["hits"] == 7
+
+
+def test_failed_loads_are_not_cached():
+    cache = PyFuncModelCache(max_size=4)
+    key = cache.make_key("runs:/abc/model")
+    with pytest.raises(ValueError, match="failed"):
+        cache.get_or_load(key, mock.Mock(side_effect=ValueError("failed")))
+
+    model = object()
+    assert cache.get_or_load(key, lambda: model) is model
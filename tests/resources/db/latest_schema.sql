@@ -5,6 +5,17 @@ CREATE TABLE alembic_version (
 )
 
 
+CREATE TABLE change_events (
+	sequence INTEGER NOT NULL,
+	timestamp BIGINT NOT NULL,
+	entity_type VARCHAR(50) NOT NULL,
+	entity_id VARCHAR(500) NOT NULL,
+	op VARCHAR(20) NOT NULL,
+	data TEXT,
+	CONSTRAINT change_events_pk PRIMARY KEY (sequence)
+)
+
+
 CREATE TABLE experiments (
 	experiment_id INTEGER NOT NULL,
 	name VARCHAR(256) NOT NULL,
@@ -203,6 +214,29 @@ CREATE TABLE trace_request_metadata (
 )
 
 
+CREATE TABLE trace_span_attributes (
+	request_id VARCHAR(50) NOT NULL,
+	span_id VARCHAR(50) NOT NULL,
+	key VARCHAR(250) NOT NULL,
+	value VARCHAR(8000),
+	CONSTRAINT trace_span_attributes_pk PRIMARY KEY (request_id, span_id, key),
+	CONSTRAINT fk_trace_span_attributes_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
+CREATE TABLE trace_spans (
+	request_id VARCHAR(50) NOT NULL,
+	span_id VARCHAR(50) NOT NULL,
+	parent_span_id VARCHAR(50),
+	name VARCHAR(500),
+	span_type VARCHAR(500),
+	status VARCHAR(50) NOT NULL,
+	duration_ms BIGINT,
+	CONSTRAINT trace_spans_pk PRIMARY KEY (request_id, span_id),
+	CONSTRAINT fk_trace_spans_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
 CREATE TABLE trace_tags (
 	key VARCHAR(250) NOT NULL,
 	value VARCHAR(8000),
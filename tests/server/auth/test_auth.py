@@ -26,7 +26,7 @@ from qcflow.server.auth.routes import GET_REGISTERED_MODEL_PERMISSION
 from qcflow.utils.os import is_windows
 
 from tests.helper_functions import random_str
-from tests.server.auth.auth_test_utils import ADMIN_USERNAME, User, create_user
+from tests.server.auth.auth_test_utils import ADMIN_PASSWORD, ADMIN_USERNAME, User, create_user
 from tests.tracking.integration_test_utils import (
     _init_server,
     _send_rest_tracking_post_request,
@@ -354,6 +354,51 @@ def test_create_and_delete_registered_model(client, monkeypatch):
     assert rm.name == "test_model"
 
 
+def test_get_model_versions(client, monkeypatch):
+    username1, password1 = create_user(client.tracking_uri)
+    username2, password2 = create_user(client.tracking_uri)
+
+    with User(username1, password1, monkeypatch):
+        for name, permission in [("readable_model", "READ"), ("hidden_model", "NO_PERMISSIONS")]:
+            client.create_registered_model(name)
+            client.create_model_version(name, "s3://bucket/path/to/source")
+            client.set_registered_model_alias(name, "champion", "1")
+            _send_rest_tracking_post_request(
+                client.tracking_uri,
+                "/api/2.0/qcflow/registered-models/permissions/create",
+                json_payload={"name": name, "username": username2, "permission": permission},
+                auth=(username1, password1),
+            )
+
+    with User(username2, password2, monkeypatch):
+        model_versions = client.get_model_versions(
+            [("readable_model", "champion"), ("readable_model", 2)]
+        )
+        assert model_versions[0].version == "1"
+        assert model_versions[0].aliases == ["champion"]
+        assert model_versions[1] is None
+        with pytest.raises(QCFlowException, match=r"Permission denied"):
+            client.get_model_versions([("readable_model", 1), ("hidden_model", "champion")])
+
+
+@pytest.mark.parametrize(
+    "client",
+    [{"QCFLOW_ENABLE_CHANGE_FEED": "true", "QCFLOW_CHANGE_FEED_COMMIT_LAG": "0"}],
+    indirect=True,
+)
+def test_get_change_events(client, monkeypatch):
+    username, password = create_user(client.tracking_uri)
+
+    with User(username, password, monkeypatch):
+        experiment_id = client.create_experiment("exp")
+        with pytest.raises(QCFlowException, match=r"Permission denied"):
+            client.get_change_events()
+
+    with User(ADMIN_USERNAME, ADMIN_PASSWORD, monkeypatch):
+        events = client.get_change_events(entity_types=["experiment"])
+        assert [(event.entity_id, event.op) for event in events] == [(experiment_id, "create")]
+
+
 def _wait(url: str):
     t = time.time()
     while time.time() - t < 5:
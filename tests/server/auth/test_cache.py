@@ -0,0 +1,83 @@
+from qcflow.server.auth.cache import CredentialCache, PermissionCache, TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    timer = FakeTimer()
+    cache = TTLCache(ttl=10, max_size=10, timer=timer)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    timer.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used_entries():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.pop_if(lambda key, value: value > 1) == 1
+    assert len(cache) == 1
+    cache.pop("a")
+    cache.pop("missing")
+    assert len(cache) == 0
+
+
+def test_disabled_ttl_cache_stores_nothing():
+    cache = TTLCache(ttl=0, max_size=10)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_credential_cache():
+    cache = CredentialCache(ttl=10, max_size=10)
+    generation = cache.generation
+    cache.add("user", "password", generation)
+    cache.add("other", "password", generation)
+    assert cache.contains("user", "password")
+    assert not cache.contains("user", "wrong")
+    # The username and password cannot be split differently
+    assert not cache.contains("user:", "password")
+
+    cache.invalidate("user")
+    assert not cache.contains("user", "password")
+    assert cache.contains("other", "password")
+
+    # Credentials verified before an invalidation are not cached
+    cache.add("user", "password", generation)
+    assert not cache.contains("user", "password")
+
+    cache.invalidate()
+    assert not cache.contains("other", "password")
+
+
+def test_permission_cache():
+    cache = PermissionCache(ttl=10, max_size=10)
+    generation = cache.generation
+    cache.add(("experiment", "1", "user"), "READ", generation)
+    cache.add(("experiment", "2", "user"), "EDIT", generation)
+    cache.add(("experiment", "1", "other"), "READ", generation)
+    assert cache.get(("experiment", "1", "user")) == "READ"
+
+    cache.invalidate(("experiment", "1", "user"))
+    assert cache.get(("experiment", "1", "user")) is None
+    assert cache.get(("experiment", "2", "user")) == "EDIT"
+
+    # Permissions read before an invalidation are not cached
+    cache.add(("experiment", "1", "user"), "READ", generation)
+    assert cache.get(("experiment", "1", "user")) is None
+
+    cache.invalidate_user("user")
+    assert cache.get(("experiment", "2", "user")) is None
+    assert cache.get(("experiment", "1", "other")) == "READ"
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from qcflow.exceptions import QCFlowException
@@ -11,6 +13,7 @@ from qcflow.server.auth.entities import ExperimentPermission, RegisteredModelPer
 from qcflow.server.auth.permissions import (
     ALL_PERMISSIONS,
     EDIT,
+    NO_PERMISSIONS,
     READ,
 )
 from qcflow.server.auth.sqlalchemy_store import SqlAlchemyStore
@@ -27,6 +30,20 @@ def store(tmp_sqlite_uri):
     return store
 
 
+@pytest.fixture
+def store_with_credential_cache(tmp_sqlite_uri):
+    store = SqlAlchemyStore(credential_cache_ttl=60)
+    store.init_db(tmp_sqlite_uri)
+    return store
+
+
+@pytest.fixture
+def store_with_permission_cache(tmp_sqlite_uri):
+    store = SqlAlchemyStore(permission_cache_ttl=60)
+    store.init_db(tmp_sqlite_uri)
+    return store
+
+
 def _user_maker(store, username, password, is_admin=False):
     return store.create_user(username, password, is_admin)
 
@@ -161,6 +178,40 @@ def test_delete_user(store):
     assert exception_context.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
 
 
+def test_authenticate_user_caches_verified_credentials(store_with_credential_cache):
+    store = store_with_credential_cache
+    username1 = random_str()
+    password1 = random_str()
+    _user_maker(store, username1, password1)
+
+    with mock.patch(
+        "qcflow.server.auth.sqlalchemy_store.check_password_hash", return_value=True
+    ) as mock_check:
+        assert store.authenticate_user(username1, password1)
+        assert store.authenticate_user(username1, password1)
+        mock_check.assert_called_once()
+
+    # failed attempts are never cached
+    assert not store.authenticate_user(username1, random_str())
+    assert not store.authenticate_user(random_str(), password1)
+
+
+def test_credential_cache_is_invalidated_by_password_change(store_with_credential_cache):
+    store = store_with_credential_cache
+    username1 = random_str()
+    password1 = random_str()
+    _user_maker(store, username1, password1)
+    assert store.authenticate_user(username1, password1)
+
+    password2 = random_str()
+    store.update_user(username1, password=password2)
+    assert not store.authenticate_user(username1, password1)
+    assert store.authenticate_user(username1, password2)
+
+    store.delete_user(username1)
+    assert not store.authenticate_user(username1, password2)
+
+
 def test_create_experiment_permission(store):
     username1 = random_str()
     password1 = random_str()
@@ -231,6 +282,104 @@ def test_get_experiment_permission(store):
     assert exception_context.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
 
 
+def test_select_resources_by_permission(store):
+    username1 = random_str()
+    username2 = random_str()
+    _user_maker(store, username1, random_str())
+    _user_maker(store, username2, random_str())
+    _ep_maker(store, "1", username1, READ.name)
+    _ep_maker(store, "2", username1, NO_PERMISSIONS.name)
+    _ep_maker(store, "3", username2, READ.name)
+    _rmp_maker(store, "model1", username1, EDIT.name)
+    _rmp_maker(store, "model2", username2, EDIT.name)
+
+    with store.engine.connect() as conn:
+        readable_ids = store.select_experiment_ids(username1, [READ.name, EDIT.name])
+        assert conn.execute(readable_ids).scalars().all() == ["1"]
+        denied_ids = store.select_experiment_ids(username1, [NO_PERMISSIONS.name])
+        assert conn.execute(denied_ids).scalars().all() == ["2"]
+        names = store.select_registered_model_names(username1, [EDIT.name])
+        assert conn.execute(names).scalars().all() == ["model1"]
+
+
+def test_permissions_are_cached_until_changed(store_with_permission_cache):
+    store = store_with_permission_cache
+    username1 = random_str()
+    _user_maker(store, username1, random_str())
+    experiment_id1 = random_str()
+
+    with mock.patch.object(
+        store, "_get_experiment_permission", wraps=store._get_experiment_permission
+    ) as mock_get:
+        # missing permissions are cached too
+        for _ in range(2):
+            with pytest.raises(QCFlowException, match="not found") as exception_context:
+                store.get_experiment_permission(experiment_id1, username1)
+            assert exception_context.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+        assert mock_get.call_count == 1
+
+        _ep_maker(store, experiment_id1, username1, READ.name)
+        assert store.get_experiment_permission(experiment_id1, username1).permission == READ.name
+        assert store.get_experiment_permission(experiment_id1, username1).permission == READ.name
+        assert mock_get.call_count == 2
+
+    store.update_experiment_permission(experiment_id1, username1, EDIT.name)
+    assert store.get_experiment_permission(experiment_id1, username1).permission == EDIT.name
+    store.delete_experiment_permission(experiment_id1, username1)
+    with pytest.raises(QCFlowException, match="not found"):
+        store.get_experiment_permission(experiment_id1, username1)
+
+    name1 = random_str()
+    _rmp_maker(store, name1, username1, READ.name)
+    assert store.get_registered_model_permission(name1, username1).permission == READ.name
+    store.update_registered_model_permission(name1, username1, EDIT.name)
+    assert store.get_registered_model_permission(name1, username1).permission == EDIT.name
+    store.delete_registered_model_permission(name1, username1)
+    with pytest.raises(QCFlowException, match="not found"):
+        store.get_registered_model_permission(name1, username1)
+
+
+def test_permission_read_racing_with_change_is_not_cached(store_with_permission_cache):
+    store = store_with_permission_cache
+    username1 = random_str()
+    _user_maker(store, username1, random_str())
+    experiment_id1 = random_str()
+    _ep_maker(store, experiment_id1, username1, READ.name)
+    get_experiment_permission = store._get_experiment_permission
+
+    def get_permission_then_update(*args, **kwargs):
+        # The permission is changed after it is read, before it is cached
+        permission = get_experiment_permission(*args, **kwargs).to_qcflow_entity()
+        store.permission_cache.invalidate(("experiment", experiment_id1, username1))
+        return mock.Mock(to_qcflow_entity=mock.Mock(return_value=permission))
+
+    with mock.patch.object(
+        store, "_get_experiment_permission", side_effect=get_permission_then_update
+    ) as mock_get:
+        store.get_experiment_permission(experiment_id1, username1)
+        store.get_experiment_permission(experiment_id1, username1)
+        assert mock_get.call_count == 2
+
+
+def test_permission_cache_is_invalidated_by_user_changes(store_with_permission_cache):
+    store = store_with_permission_cache
+    username1 = random_str()
+    experiment_id1 = random_str()
+    with pytest.raises(QCFlowException, match="not found"):
+        store.get_experiment_permission(experiment_id1, username1)
+
+    _user_maker(store, username1, random_str())
+    _ep_maker(store, experiment_id1, username1, READ.name)
+    assert store.get_experiment_permission(experiment_id1, username1).permission == READ.name
+    store.delete_experiment_permission(experiment_id1, username1)
+    with pytest.raises(QCFlowException, match="Experiment permission .* not found"):
+        store.get_experiment_permission(experiment_id1, username1)
+
+    store.delete_user(username1)
+    with pytest.raises(QCFlowException, match=rf"User with username={username1} not found"):
+        store.get_experiment_permission(experiment_id1, username1)
+
+
 def test_list_experiment_permission(store):
     username1 = random_str()
     password1 = random_str()
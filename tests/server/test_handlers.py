@@ -5,7 +5,7 @@ from unittest import mock
 import pytest
 
 import qcflow
-from qcflow.entities import ViewType
+from qcflow.entities import ChangeEvent, Experiment, Metric, ViewType
 from qcflow.entities.model_registry import (
     ModelVersion,
     ModelVersionTag,
@@ -78,6 +78,7 @@ from qcflow.server.handlers import (
     catch_qcflow_exception,
     get_endpoints,
 )
+from qcflow.server.response_cache import ResponseCache
 from qcflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
 from qcflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from qcflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
@@ -495,14 +496,16 @@ def test_get_latest_versions(mock_get_request_message, mock_model_registry_store
         ),
     ]
     mock_model_registry_store.get_latest_versions.return_value = mvds
-    resp = _get_latest_versions()
+    with app.test_request_context():
+        resp = _get_latest_versions()
     _, args = mock_model_registry_store.get_latest_versions.call_args
     assert args == {"name": name, "stages": []}
     assert json.loads(resp.get_data()) == {"model_versions": jsonify(mvds)}
 
     for stages in [[], ["None"], ["Staging"], ["Staging", "Production"]]:
         mock_get_request_message.return_value = GetLatestVersions(name=name, stages=stages)
-        _get_latest_versions()
+        with app.test_request_context():
+            _get_latest_versions()
         _, args = mock_model_registry_store.get_latest_versions.call_args
         assert args == {"name": name, "stages": stages}
 
@@ -625,7 +628,8 @@ def test_get_model_version_download_uri(mock_get_request_message, mock_model_reg
     version = "32"
     mock_get_request_message.return_value = GetModelVersionDownloadUri(name=name, version=version)
     mock_model_registry_store.get_model_version_download_uri.return_value = "some/download/path"
-    resp = _get_model_version_download_uri()
+    with app.test_request_context():
+        resp = _get_model_version_download_uri()
     _, args = mock_model_registry_store.get_model_version_download_uri.call_args
     assert args == {"name": name, "version": version}
     assert json.loads(resp.get_data()) == {"artifact_uri": "some/download/path"}
@@ -802,12 +806,37 @@ def test_get_model_version_by_alias(mock_get_request_message, mock_model_registr
         aliases=["test_alias"],
     )
     mock_model_registry_store.get_model_version_by_alias.return_value = mvd
-    resp = _get_model_version_by_alias()
+    with app.test_request_context():
+        resp = _get_model_version_by_alias()
     _, args = mock_model_registry_store.get_model_version_by_alias.call_args
     assert args == {"name": name, "alias": alias}
     assert json.loads(resp.get_data()) == {"model_version": jsonify(mvd)}
 
 
+def test_get_model_version_by_alias_conditional_request(mock_model_registry_store):
+    mock_model_registry_store.get_model_version_by_alias.return_value = ModelVersion(
+        name="model1", version="5", creation_timestamp=1, aliases=["champion"]
+    )
+    path = "/api/2.0/qcflow/registered-models/alias"
+    params = {"name": "model1", "alias": "champion"}
+    with app.test_client() as c:
+        response = c.get(path, query_string=params)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = c.get(path, query_string=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.get_data() == b""
+
+        mock_model_registry_store.get_model_version_by_alias.return_value = ModelVersion(
+            name="model1", version="6", creation_timestamp=2, aliases=["champion"]
+        )
+        response = c.get(path, query_string=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json["model_version"]["version"] == "6"
+
+
 @pytest.mark.parametrize(
     "path",
     [
@@ -896,3 +925,209 @@ def test_get_trace_artifact_repo(location, expected_class, expected_uri, monkeyp
     repo = _get_trace_artifact_repo(trace_info)
     assert isinstance(repo, expected_class)
     assert repo.artifact_uri == expected_uri
+
+
+def test_get_model_versions_handler(mock_model_registry_store):
+    mock_model_registry_store.get_model_versions.return_value = [
+        ModelVersion(name="model1", version="5", creation_timestamp=1, aliases=["champion"]),
+        None,
+    ]
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/qcflow/model-versions/get-batch",
+            json={
+                "model_versions": [
+                    {"name": "model1", "alias": "champion"},
+                    {"name": "model2", "version": "3"},
+                ]
+            },
+        )
+    assert response.status_code == 200
+    mock_model_registry_store.get_model_versions.assert_called_once_with(
+        [("model1", "champion"), ("model2", "3")]
+    )
+    model_versions = response.json["model_versions"]
+    assert model_versions[0]["name"] == "model1"
+    assert model_versions[0]["aliases"] == ["champion"]
+    assert model_versions[1] is None
+
+
+@pytest.mark.parametrize(
+    "model_versions",
+    [
+        None,
+        [],
+        [{"name": "model1"}],
+        [{"name": "model1", "version": "1", "alias": "champion"}],
+        [{"version": "1"}],
+        ["model1"],
+    ],
+)
+def test_get_model_versions_handler_rejects_invalid_requests(
+    mock_model_registry_store, model_versions
+):
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/qcflow/model-versions/get-batch", json={"model_versions": model_versions}
+        )
+    assert response.status_code == 400
+    assert response.json["error_code"] == "INVALID_PARAMETER_VALUE"
+    mock_model_registry_store.get_model_versions.assert_not_called()
+
+
+def test_get_change_events_handler(mock_tracking_store):
+    event = ChangeEvent(
+        sequence=7,
+        timestamp=1000,
+        entity_type="run",
+        entity_id="abc",
+        op="update",
+        data={"status": "FINISHED"},
+    )
+    mock_tracking_store.get_change_events.return_value = PagedList([event], "7")
+    with app.test_client() as c:
+        response = c.get(
+            "/api/2.0/qcflow/change-events/get",
+            query_string={
+                "entity_types": ["run", "experiment"],
+                "page_token": "3",
+                "max_results": "10",
+                "timeout_seconds": "5",
+            },
+        )
+    assert response.status_code == 200
+    mock_tracking_store.get_change_events.assert_called_once_with(
+        entity_types=["run", "experiment"], page_token="3", max_results=10, timeout_seconds=5.0
+    )
+    assert response.json == {"events": [event.to_dictionary()], "next_page_token": "7"}
+
+
+def test_get_change_events_handler_rejects_invalid_numbers(mock_tracking_store):
+    with app.test_client() as c:
+        response = c.get("/api/2.0/qcflow/change-events/get", query_string={"max_results": "x"})
+    assert response.status_code == 400
+    assert response.json["error_code"] == "INVALID_PARAMETER_VALUE"
+    mock_tracking_store.get_change_events.assert_not_called()
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    cache = ResponseCache(ttl=60, max_size=100)
+    monkeypatch.setattr(qcflow.server.handlers, "_response_cache", cache)
+    return cache
+
+
+def _get_experiment_response(c):
+    return c.get("/api/2.0/qcflow/experiments/get", query_string={"experiment_id": "1"})
+
+
+def test_get_experiment_conditional_request(mock_tracking_store):
+    mock_tracking_store.get_experiment.return_value = Experiment("1", "exp", "loc", "active")
+    with app.test_client() as c:
+        response = _get_experiment_response(c)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+
+        response = c.get(
+            "/api/2.0/qcflow/experiments/get",
+            query_string={"experiment_id": "1"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+        mock_tracking_store.get_experiment.return_value = Experiment("1", "new", "loc", "active")
+        response = c.get(
+            "/api/2.0/qcflow/experiments/get",
+            query_string={"experiment_id": "1"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.json["experiment"]["name"] == "new"
+    assert mock_tracking_store.get_experiment.call_count == 3
+
+
+def test_get_metric_history_conditional_request(mock_tracking_store):
+    mock_tracking_store.get_metric_history.return_value = [Metric("m", 1.0, 1, 0)]
+    path = "/api/2.0/qcflow/metrics/get-history"
+    params = {"run_id": "run", "metric_key": "m"}
+    with app.test_client() as c:
+        etag = c.get(path, query_string=params).headers["ETag"]
+        response = c.get(path, query_string=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+def test_read_responses_are_cached(mock_tracking_store, response_cache):
+    mock_tracking_store.get_experiment.return_value = Experiment("1", "exp", "loc", "active")
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+    with app.test_client() as c:
+        response = _get_experiment_response(c)
+        etag = response.headers["ETag"]
+        mock_tracking_store.get_experiment.return_value = Experiment("1", "new", "loc", "active")
+        response = _get_experiment_response(c)
+        assert response.headers["ETag"] == etag
+        assert response.json["experiment"]["name"] == "exp"
+        response = c.get(
+            "/api/2.0/qcflow/experiments/get",
+            query_string={"experiment_id": "1"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        mock_tracking_store.get_experiment.assert_called_once()
+
+        for _ in range(2):
+            response = c.post("/api/2.0/qcflow/runs/search", json={"experiment_ids": ["1"]})
+            assert response.status_code == 200
+            assert "ETag" in response.headers
+        mock_tracking_store.search_runs.assert_called_once()
+        # Other arguments are cached separately
+        c.post("/api/2.0/qcflow/runs/search", json={"experiment_ids": ["2"]})
+        assert mock_tracking_store.search_runs.call_count == 2
+
+
+def test_read_responses_are_invalidated_by_writes(
+    mock_tracking_store, mock_model_registry_store, response_cache
+):
+    mock_tracking_store.get_experiment.return_value = Experiment("1", "exp", "loc", "active")
+    mock_model_registry_store.search_registered_models.return_value = PagedList([], None)
+    with app.test_client() as c:
+        _get_experiment_response(c)
+        c.get("/api/2.0/qcflow/registered-models/search")
+
+        mock_tracking_store.get_experiment.return_value = Experiment("1", "new", "loc", "active")
+        response = c.post(
+            "/api/2.0/qcflow/experiments/update", json={"experiment_id": "1", "new_name": "new"}
+        )
+        assert response.status_code == 200
+        assert _get_experiment_response(c).json["experiment"]["name"] == "new"
+        assert mock_tracking_store.get_experiment.call_count == 2
+        # The changes of the tracking store don't invalidate the model registry responses
+        c.get("/api/2.0/qcflow/registered-models/search")
+        mock_model_registry_store.search_registered_models.assert_called_once()
+
+        c.post("/api/2.0/qcflow/registered-models/create", json={"name": "model"})
+        c.get("/api/2.0/qcflow/registered-models/search")
+        assert mock_model_registry_store.search_registered_models.call_count == 2
+
+
+def test_error_responses_are_not_cached(mock_tracking_store, response_cache):
+    mock_tracking_store.get_experiment.side_effect = [
+        QCFlowException("error", INVALID_PARAMETER_VALUE),
+        Experiment("1", "exp", "loc", "active"),
+    ]
+    with app.test_client() as c:
+        response = _get_experiment_response(c)
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+        assert _get_experiment_response(c).status_code == 200
+
+
+def test_searches_with_access_filter_are_not_cached(mock_model_registry_store, response_cache):
+    mock_model_registry_store.search_registered_models.return_value = PagedList([], None)
+    with (
+        mock.patch("qcflow.server.handlers._get_search_access_filter", return_value=mock.Mock()),
+        app.test_client() as c,
+    ):
+        c.get("/api/2.0/qcflow/registered-models/search")
+        c.get("/api/2.0/qcflow/registered-models/search")
+    assert mock_model_registry_store.search_registered_models.call_count == 2
@@ -64,6 +64,36 @@ def test_build_gunicorn_command():
     ]
 
 
+def test_build_gunicorn_command_production():
+    assert server._build_gunicorn_command(
+        "--timeout 60",
+        "localhost",
+        "5000",
+        "4",
+        f"{server.__name__}:app",
+        worker_class="uvicorn",
+        threads=8,
+        production=True,
+    ) == [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "-c",
+        "python:qcflow.server.gunicorn_config",
+        "-k",
+        "qcflow.server.uvicorn_worker.QCFlowUvicornWorker",
+        "--threads",
+        "8",
+        "--timeout",
+        "60",
+        "-b",
+        "localhost:5000",
+        "-w",
+        "4",
+        "qcflow.server:app",
+    ]
+
+
 def test_run_server(mock_exec_cmd):
     """Make sure this runs."""
     with mock.patch("sys.platform", return_value="linux"):
@@ -76,3 +106,31 @@ def test_run_server_win32(mock_exec_cmd):
     with mock.patch("sys.platform", return_value="win32"):
         server._run_server("", "", "", "", "", "", "", "")
     mock_exec_cmd.assert_called_once()
+
+
+def test_run_server_db_pool_options(mock_exec_cmd):
+    with mock.patch("sys.platform", "linux"):
+        server._run_server(
+            "sqlite:///qcflow.db",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "localhost",
+            "5000",
+            worker_class="gthread",
+            production=True,
+            db_pool_size=8,
+            db_max_overflow=0,
+            db_pool_recycle=3600,
+        )
+    mock_exec_cmd.assert_called_once()
+    (command,), kwargs = mock_exec_cmd.call_args
+    assert command[3:7] == ["-c", "python:qcflow.server.gunicorn_config", "-k", "gthread"]
+    assert kwargs["extra_env"] == {
+        server.BACKEND_STORE_URI_ENV_VAR: "sqlite:///qcflow.db",
+        "QCFLOW_SQLALCHEMYSTORE_POOL_SIZE": "8",
+        "QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW": "0",
+        "QCFLOW_SQLALCHEMYSTORE_POOL_RECYCLE": "3600",
+    }
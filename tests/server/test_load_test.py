@@ -0,0 +1,49 @@
+from qcflow.entities import ViewType
+from qcflow.server.load_test import (
+    LOG_BATCH,
+    SEARCH_RUNS,
+    LoadTestResult,
+    OperationStats,
+    run_load_test,
+)
+from qcflow.tracking import QCFlowClient
+
+
+def test_run_load_test(tmp_path):
+    tracking_uri = f"sqlite:///{tmp_path / 'qcflow.db'}"
+    result = run_load_test(tracking_uri, duration=1, concurrency=2, batch_size=5, search_ratio=0.5)
+    assert result.duration >= 1
+    assert result.batch_size == 5
+    for name in (LOG_BATCH, SEARCH_RUNS):
+        assert result.operations[name].count > 0
+        assert result.operations[name].errors == 0
+
+    client = QCFlowClient(tracking_uri)
+    (experiment,) = [
+        e
+        for e in client.search_experiments(view_type=ViewType.DELETED_ONLY)
+        if e.name.startswith("qcflow-load-test-")
+    ]
+    runs = client.search_runs([experiment.experiment_id], run_view_type=ViewType.ALL)
+    assert len(runs) == 2
+    for run in runs:
+        assert len(run.data.metrics) == 5
+
+
+def test_load_test_result_format():
+    result = LoadTestResult(
+        duration=2,
+        batch_size=10,
+        operations={
+            LOG_BATCH: OperationStats(LOG_BATCH, latencies=[0.01, 0.02, 0.03, 0.04], errors=1),
+            SEARCH_RUNS: OperationStats(SEARCH_RUNS),
+        },
+    )
+    assert result.throughput(LOG_BATCH) == 2
+    assert result.operations[LOG_BATCH].percentile(0.5) == 0.03
+    assert result.operations[LOG_BATCH].percentile(0.99) == 0.04
+    lines = result.format().splitlines()
+    assert lines[0] == "Duration: 2.0s"
+    assert lines[2].split() == ["log_batch", "4", "1", "2.0", "30.0", "40.0", "40.0"]
+    assert lines[3].split() == ["search_runs", "0", "0", "0.0", "0.0", "0.0", "0.0"]
+    assert lines[4] == "Logged metrics/s: 20.0"
@@ -1,6 +1,16 @@
+from unittest import mock
+
 import pytest
+import sqlalchemy
+from flask import Flask, Response, request
+from prometheus_client import REGISTRY
 
-from qcflow.server.prometheus_exporter import activate_prometheus_exporter
+from qcflow.server import handlers
+from qcflow.server.prometheus_exporter import (
+    activate_prometheus_exporter,
+    activate_request_instrumentation,
+    instrument_store,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -69,3 +79,113 @@ def test_metrics(app, test_client):
     assert (
         metrics.registry.get_sample_value("qcflow_http_request_total", labels=failure_labels) == 1
     )
+
+
+class _Store:
+    def get_value(self):
+        return 1
+
+    def _private(self):
+        return 2
+
+
+@pytest.fixture
+def instrumented_app(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    store = _Store()
+    instrument_store(store, "test")
+    app = Flask(__name__)
+
+    @app.route("/query")
+    def query():
+        with engine.connect() as conn:
+            conn.execute(sqlalchemy.text("SELECT 1"))
+            conn.execute(sqlalchemy.text("SELECT 2"))
+        return str(store.get_value())
+
+    def download():
+        return Response(iter([b"abc", b"de"]))
+
+    def upload():
+        request.get_data()
+        return ""
+
+    app.add_url_rule("/download", "_download_artifact", download)
+    app.add_url_rule("/upload", "_upload_artifact", upload, methods=["PUT"])
+    activate_request_instrumentation(app)
+    yield app
+    engine.dispose()
+
+
+def _get_sample_value(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_request_instrumentation(instrumented_app):
+    request_labels = {"endpoint": "query", "method": "GET", "status": "200"}
+    endpoint_labels = {"endpoint": "query"}
+    store_labels = {"store": "test", "method": "get_value"}
+    before = [
+        _get_sample_value("qcflow_endpoint_request_duration_seconds_count", request_labels),
+        _get_sample_value("qcflow_endpoint_request_db_queries_sum", endpoint_labels),
+        _get_sample_value("qcflow_store_method_duration_seconds_count", store_labels),
+    ]
+    with instrumented_app.test_client() as c:
+        assert c.get("/query").data == b"1"
+    after = [
+        _get_sample_value("qcflow_endpoint_request_duration_seconds_count", request_labels),
+        _get_sample_value("qcflow_endpoint_request_db_queries_sum", endpoint_labels),
+        _get_sample_value("qcflow_store_method_duration_seconds_count", store_labels),
+    ]
+    assert [a - b for a, b in zip(after, before)] == [1, 2, 1]
+    assert (
+        _get_sample_value(
+            "qcflow_store_method_duration_seconds_count", {"store": "test", "method": "_private"}
+        )
+        == 0
+    )
+
+
+def test_artifact_bytes(instrumented_app):
+    download_before = _get_sample_value("qcflow_artifact_bytes_total", {"direction": "download"})
+    upload_before = _get_sample_value("qcflow_artifact_bytes_total", {"direction": "upload"})
+    with instrumented_app.test_client() as c:
+        assert c.get("/download").data == b"abcde"
+        c.put("/upload", data=b"0123456789")
+    download_after = _get_sample_value("qcflow_artifact_bytes_total", {"direction": "download"})
+    upload_after = _get_sample_value("qcflow_artifact_bytes_total", {"direction": "upload"})
+    assert download_after - download_before == 5
+    assert upload_after - upload_before == 10
+
+
+def test_slow_request_logging(instrumented_app, monkeypatch):
+    with mock.patch("qcflow.server.prometheus_exporter._logger.warning") as mock_warning:
+        with instrumented_app.test_client() as c:
+            c.get("/query")
+        mock_warning.assert_not_called()
+
+        monkeypatch.setenv("QCFLOW_SERVER_SLOW_REQUEST_THRESHOLD", "0")
+        with instrumented_app.test_client() as c:
+            c.get("/query")
+    mock_warning.assert_called_once()
+    message = mock_warning.call_args[0][0] % mock_warning.call_args[0][1:]
+    assert message.startswith("Slow request: GET /query (query) returned 200")
+    assert "with 2 database queries" in message
+    assert "Store methods: test.get_value x1" in message
+
+
+def test_instrument_store_is_idempotent():
+    store = _Store()
+    instrument_store(store, "test")
+    method = store.get_value
+    instrument_store(store, "test")
+    assert store.get_value is method
+    assert store.get_value() == 1
+
+
+def test_backend_stores_are_instrumented_when_exporter_is_enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("prometheus_multiproc_dir", str(tmp_path))
+    monkeypatch.setattr(handlers, "_tracking_store", None)
+    with mock.patch.object(handlers._tracking_store_registry, "get_store", return_value=_Store()):
+        store = handlers._get_tracking_store("sqlite:///qcflow.db", str(tmp_path))
+    assert store._qcflow_instrumented
@@ -0,0 +1,61 @@
+from unittest import mock
+
+from qcflow.server.response_cache import (
+    MODEL_REGISTRY_SCOPE,
+    TRACKING_SCOPE,
+    CachedResponse,
+    ResponseCache,
+)
+
+RESPONSE = CachedResponse(b"{}", "etag")
+
+
+def test_get_returns_cached_responses():
+    cache = ResponseCache(ttl=60, max_size=10)
+    assert cache.get(TRACKING_SCOPE, "key") == (None, 0)
+    cache.put(TRACKING_SCOPE, "key", 0, RESPONSE)
+    assert cache.get(TRACKING_SCOPE, "key") == (RESPONSE, 0)
+
+
+def test_enabled():
+    assert ResponseCache(ttl=60, max_size=10).enabled
+    assert not ResponseCache(ttl=0, max_size=10).enabled
+    assert not ResponseCache(ttl=60, max_size=0).enabled
+
+
+def test_invalidate_invalidates_responses_of_scope():
+    cache = ResponseCache(ttl=60, max_size=10)
+    cache.put(TRACKING_SCOPE, "key", 0, RESPONSE)
+    cache.put(MODEL_REGISTRY_SCOPE, "other_key", 0, RESPONSE)
+    cache.invalidate(TRACKING_SCOPE)
+    assert cache.get(TRACKING_SCOPE, "key") == (None, 1)
+    assert cache.get(MODEL_REGISTRY_SCOPE, "other_key") == (RESPONSE, 0)
+
+
+def test_put_skips_responses_computed_during_changes():
+    cache = ResponseCache(ttl=60, max_size=10)
+    _, generation = cache.get(TRACKING_SCOPE, "key")
+    cache.invalidate(TRACKING_SCOPE)
+    cache.put(TRACKING_SCOPE, "key", generation, RESPONSE)
+    assert cache.get(TRACKING_SCOPE, "key") == (None, 1)
+
+
+def test_responses_expire():
+    cache = ResponseCache(ttl=60, max_size=10)
+    with mock.patch("time.monotonic", return_value=100):
+        cache.put(TRACKING_SCOPE, "key", 0, RESPONSE)
+    with mock.patch("time.monotonic", return_value=159):
+        assert cache.get(TRACKING_SCOPE, "key") == (RESPONSE, 0)
+    with mock.patch("time.monotonic", return_value=161):
+        assert cache.get(TRACKING_SCOPE, "key") == (None, 0)
+
+
+def test_least_recently_used_responses_are_evicted():
+    cache = ResponseCache(ttl=60, max_size=2)
+    cache.put(TRACKING_SCOPE, "key1", 0, RESPONSE)
+    cache.put(TRACKING_SCOPE, "key2", 0, RESPONSE)
+    cache.get(TRACKING_SCOPE, "key1")
+    cache.put(TRACKING_SCOPE, "key3", 0, RESPONSE)
+    assert cache.get(TRACKING_SCOPE, "key1") == (RESPONSE, 0)
+    assert cache.get(TRACKING_SCOPE, "key2") == (None, 0)
+    assert cache.get(TRACKING_SCOPE, "key3") == (RESPONSE, 0)
@@ -103,3 +103,27 @@ def test_create_sqlalchemy_engine_with_retry_fail():
             mock_create_sqlalchemy_engine.mock_calls
             == [mock.call("mydb://host:port/")] * utils.MAX_RETRY_COUNT
         )
+
+
+def test_create_sqlalchemy_engine_zero_max_overflow(monkeypatch):
+    monkeypatch.setenv("QCFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW", "0")
+    with mock.patch("sqlalchemy.create_engine") as mock_create_engine:
+        utils.create_sqlalchemy_engine("mydb://host:port/")
+        mock_create_engine.assert_called_once_with(
+            "mydb://host:port/", pool_pre_ping=True, max_overflow=0
+        )
+
+
+def test_dispose_sqlalchemy_engines_after_fork(tmp_path):
+    engine = utils.create_sqlalchemy_engine(f"sqlite:///{tmp_path / 'qcflow.db'}")
+    with engine.connect():
+        pass
+    pool = engine.pool
+    assert pool.checkedin() == 1
+
+    with mock.patch.object(pool, "dispose") as mock_dispose:
+        utils.dispose_sqlalchemy_engines_after_fork()
+    # The connections of the parent process must not be closed
+    mock_dispose.assert_not_called()
+    assert engine.pool is not pool
+    assert engine.pool.checkedin() == 0
@@ -0,0 +1,72 @@
+from unittest import mock
+
+from qcflow.store.model_registry.cache import ModelRegistryCache
+
+
+def test_get_or_load_caches_values():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+    load_fn = mock.Mock(return_value="value")
+    assert cache.get_or_load("key", "model", load_fn) == "value"
+    assert cache.get_or_load("key", "model", load_fn) == "value"
+    load_fn.assert_called_once()
+
+
+def test_get_or_load_does_not_cache_when_disabled():
+    cache = ModelRegistryCache(ttl=0, max_size=10)
+    load_fn = mock.Mock(return_value="value")
+    cache.get_or_load("key", "model", load_fn)
+    cache.get_or_load("key", "model", load_fn)
+    assert load_fn.call_count == 2
+
+
+def test_get_or_load_does_not_cache_exceptions():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+    load_fn = mock.Mock(side_effect=[ValueError("error"), "value"])
+    try:
+        cache.get_or_load("key", "model", load_fn)
+    except ValueError:
+        pass
+    assert cache.get_or_load("key", "model", load_fn) == "value"
+
+
+def test_bump_invalidates_values_of_model():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+    cache.get_or_load("key", "model", lambda: "old")
+    cache.get_or_load("other_key", "other_model", lambda: "other")
+    cache.bump("model")
+    assert cache.get_or_load("key", "model", lambda: "new") == "new"
+    assert cache.get_or_load("other_key", "other_model", lambda: "new") == "other"
+
+
+def test_values_loaded_during_a_change_are_not_cached():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+
+    def load_racing_with_change():
+        cache.bump("model")
+        return "stale"
+
+    assert cache.get_or_load("key", "model", load_racing_with_change) == "stale"
+    assert cache.get_or_load("key", "model", lambda: "new") == "new"
+
+
+def test_invalidating_bumps_models_on_exit():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+    cache.get_or_load("key", "model", lambda: "old")
+    with cache.invalidating("model"):
+        assert cache.get_or_load("key", "model", lambda: "new") == "old"
+    assert cache.get_or_load("key", "model", lambda: "new") == "new"
+
+
+def test_values_are_evicted_beyond_max_size():
+    cache = ModelRegistryCache(ttl=60, max_size=2)
+    for i in range(3):
+        cache.get_or_load(i, "model", lambda: "value")
+    assert list(cache._entries) == [1, 2]
+
+
+def test_values_expire_after_ttl():
+    cache = ModelRegistryCache(ttl=60, max_size=10)
+    with mock.patch("time.monotonic", return_value=0):
+        cache.get_or_load("key", "model", lambda: "old")
+    with mock.patch("time.monotonic", return_value=61):
+        assert cache.get_or_load("key", "model", lambda: "new") == "new"
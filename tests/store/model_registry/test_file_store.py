@@ -1,3 +1,4 @@
+import os
 import time
 import uuid
 from typing import NamedTuple
@@ -1641,3 +1642,140 @@ def test_writing_model_version_preserves_storage_location(store):
         store._fetch_file_model_version_if_exists("test_storage_location_new", 1).storage_location
         == source
     )
+
+
+def test_get_model_versions(store):
+    store.create_registered_model("model_1")
+    store.create_model_version("model_1", "path/to/source_1")
+    store.create_model_version("model_1", "path/to/source_2")
+    store.create_model_version("model_1", "path/to/source_3")
+    store.create_registered_model("model_2")
+    store.create_model_version("model_2", "path/to/source")
+    store.set_registered_model_alias("model_1", "champion", 2)
+    store.set_registered_model_alias("model_1", "challenger", 2)
+    store.delete_model_version("model_1", 3)
+
+    model_versions = store.get_model_versions(
+        [
+            ("model_1", "champion"),
+            ("model_2", 1),
+            ("model_1", "1"),
+            ("model_1", 3),
+            ("model_1", 4),
+            ("model_1", "missing_alias"),
+            ("missing_model", 1),
+            ("missing_model", "champion"),
+        ]
+    )
+    assert [(mv.name, mv.version) if mv else None for mv in model_versions] == [
+        ("model_1", 2),
+        ("model_2", 1),
+        ("model_1", 1),
+        None,
+        None,
+        None,
+        None,
+        None,
+    ]
+    assert sorted(model_versions[0].aliases) == ["challenger", "champion"]
+    assert model_versions[1].source == "path/to/source"
+    assert model_versions[2].aliases == []
+    assert store.get_model_versions([]) == []
+
+
+def _search_model_version_keys(store, filter_string=None):
+    return sorted(
+        (mv.name, mv.version, mv.current_stage, mv.description, tuple(sorted(mv.aliases)))
+        for mv in store.search_model_versions(filter_string, max_results=1000)
+    )
+
+
+def test_index_reflects_changes(store):
+    store.create_registered_model("model_1")
+    store.create_model_version("model_1", "path/to/source")
+    store.create_model_version("model_1", "path/to/source")
+    assert [rm.name for rm in store.search_registered_models(max_results=10)] == ["model_1"]
+    assert _search_model_version_keys(store) == [
+        ("model_1", 1, "None", None, ()),
+        ("model_1", 2, "None", None, ()),
+    ]
+
+    store.update_model_version("model_1", 1, "new description")
+    store.transition_model_version_stage("model_1", 2, "Production", False)
+    store.set_registered_model_alias("model_1", "champion", 2)
+    store.set_model_version_tag("model_1", 1, ModelVersionTag("key", "value"))
+    store.set_registered_model_tag("model_1", RegisteredModelTag("key", "value"))
+    assert _search_model_version_keys(store) == [
+        ("model_1", 1, "None", "new description", ()),
+        ("model_1", 2, "Production", None, ("champion",)),
+    ]
+    assert _search_model_version_keys(store, "tag.key = 'value'") == [
+        ("model_1", 1, "None", "new description", ()),
+    ]
+    (registered_model,) = store.search_registered_models("tag.key = 'value'", max_results=10)
+    assert registered_model.aliases == {"champion": "2"}
+    assert {mv.version for mv in registered_model.latest_versions} == {1, 2}
+
+    store.delete_model_version_tag("model_1", 1, "key")
+    store.delete_model_version("model_1", 1)
+    store.rename_registered_model("model_1", "model_2")
+    assert [rm.name for rm in store.search_registered_models(max_results=10)] == ["model_2"]
+    assert _search_model_version_keys(store) == [("model_2", 2, "Production", None, ())]
+
+    store.delete_registered_model("model_2")
+    assert store.search_registered_models(max_results=10) == []
+    assert store.search_model_versions(max_results=10) == []
+
+
+def test_index_reflects_changes_of_other_processes(store):
+    other_store = FileStore(store.root_directory)
+    store.create_registered_model("model_1")
+    store.create_model_version("model_1", "path/to/source")
+    assert _search_model_version_keys(other_store) == [("model_1", 1, "None", None, ())]
+
+    store.update_model_version("model_1", 1, "new description")
+    store.create_registered_model("model_2")
+    assert _search_model_version_keys(other_store) == [
+        ("model_1", 1, "None", "new description", ())
+    ]
+    assert [rm.name for rm in other_store.search_registered_models(max_results=10)] == [
+        "model_1",
+        "model_2",
+    ]
+
+
+def test_index_only_reloads_changed_registered_models(store):
+    for name in ["model_1", "model_2", "model_3"]:
+        store.create_registered_model(name)
+        store.create_model_version(name, "path/to/source")
+    store.search_model_versions(max_results=10)
+
+    with mock.patch.object(
+        store._index,
+        "_load_registered_model",
+        wraps=store._index._load_registered_model,
+    ) as mock_load:
+        store.search_model_versions(max_results=10)
+        mock_load.assert_not_called()
+
+        store.set_registered_model_alias("model_2", "champion", 1)
+        store.search_registered_models(max_results=10)
+        mock_load.assert_called_once_with(os.path.join(store.models_directory, "model_2"))
+
+
+def test_index_results_can_be_modified(store):
+    store.create_registered_model("model_1")
+    store.create_model_version("model_1", "path/to/source")
+    store.search_model_versions(max_results=10)[0].description = "modified"
+    store.search_registered_models(max_results=10)[0].description = "modified"
+    assert store.search_model_versions(max_results=10)[0].description is None
+    assert store.search_registered_models(max_results=10)[0].description is None
+
+
+def test_index_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_REGISTRY_FILE_STORE_INDEX", "false")
+    store = FileStore(str(tmp_path))
+    assert store._index is None
+    store.create_registered_model("model_1")
+    store.create_model_version("model_1", "path/to/source")
+    assert _search_model_version_keys(store) == [("model_1", 1, "None", None, ())]
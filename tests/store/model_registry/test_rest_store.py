@@ -456,3 +456,62 @@ def test_await_model_version_creation_failed(store):
         pytest.raises(QCFlowException, match="Model version creation failed for model name"),
     ):
         store._await_model_version_creation(pending_mv, 0.5)
+
+
+def test_get_model_versions(store, creds):
+    response = mock.MagicMock(status_code=200)
+    response.text = json.dumps(
+        {"model_versions": [{"name": "model_1", "version": "3", "aliases": ["champion"]}, None]}
+    )
+    response.json.return_value = json.loads(response.text)
+    with mock.patch(
+        "qcflow.store.model_registry.rest_store.http_request", return_value=response
+    ) as mock_http:
+        model_versions = store.get_model_versions([("model_1", "champion"), ("model_2", 1)])
+    mock_http.assert_called_once_with(
+        host_creds=creds,
+        endpoint="/api/2.0/qcflow/model-versions/get-batch",
+        method="POST",
+        json={
+            "model_versions": [
+                {"name": "model_1", "alias": "champion"},
+                {"name": "model_2", "version": "1"},
+            ]
+        },
+    )
+    assert model_versions[0].name == "model_1"
+    assert model_versions[0].version == "3"
+    assert model_versions[0].aliases == ["champion"]
+    assert model_versions[1] is None
+
+
+def test_get_model_versions_splits_requests(store):
+    def http_request(**kwargs):
+        num_lookups = len(kwargs["json"]["model_versions"])
+        response = mock.MagicMock(status_code=200)
+        response.text = json.dumps({"model_versions": [None] * num_lookups})
+        response.json.return_value = json.loads(response.text)
+        return response
+
+    with (
+        mock.patch("qcflow.store.model_registry.rest_store.GET_MODEL_VERSIONS_MAX_RESULTS", 2),
+        mock.patch(
+            "qcflow.store.model_registry.rest_store.http_request", side_effect=http_request
+        ) as mock_http,
+    ):
+        model_versions = store.get_model_versions([("model", i) for i in range(1, 6)])
+    assert model_versions == [None] * 5
+    assert mock_http.call_count == 3
+
+
+def test_get_model_versions_falls_back_to_single_lookups(store):
+    response = mock.MagicMock(status_code=404, text="Not Found")
+    model_version = ModelVersion("model_1", "1", creation_timestamp=0)
+    with (
+        mock.patch("qcflow.store.model_registry.rest_store.http_request", return_value=response),
+        mock.patch.object(
+            store, "get_model_version", return_value=model_version
+        ) as mock_get_model_version,
+    ):
+        assert store.get_model_versions([("model_1", 1)]) == [model_version]
+    mock_get_model_version.assert_called_once_with("model_1", 1)
@@ -3,6 +3,7 @@ import uuid
 from unittest import mock
 
 import pytest
+import sqlalchemy
 
 from qcflow.entities.model_registry import (
     ModelVersion,
@@ -17,6 +18,9 @@ from qcflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
     ErrorCode,
 )
+from qcflow.store.db.change_feed import get_change_events
+from qcflow.store.entities import AccessFilter
+from qcflow.store.model_registry import GET_MODEL_VERSIONS_MAX_RESULTS
 from qcflow.store.model_registry.dbmodels.models import (
     SqlModelVersion,
     SqlModelVersionTag,
@@ -24,6 +28,7 @@ from qcflow.store.model_registry.dbmodels.models import (
     SqlRegisteredModelTag,
 )
 from qcflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+from qcflow.store.tracking.dbmodels.models import SqlChangeEvent
 
 from tests.helper_functions import random_str
 
@@ -39,6 +44,7 @@ def store(tmp_sqlite_uri):
     if db_uri_from_env_var is not None:
         with store.ManagedSessionMaker() as session:
             for model in (
+                SqlChangeEvent,
                 SqlModelVersionTag,
                 SqlRegisteredModelTag,
                 SqlModelVersion,
@@ -1281,6 +1287,31 @@ def test_parse_search_registered_models_order_by():
         )
 
 
+def test_search_registered_models_with_access_filter(store):
+    for name in ["RM1", "RM2", "RM3"]:
+        _rm_maker(store, name)
+
+    rms = store.search_registered_models(access_filter=AccessFilter(allowed=["RM1", "RM3"]))
+    assert sorted(rm.name for rm in rms) == ["RM1", "RM3"]
+
+    rms = store.search_registered_models(
+        filter_string="name LIKE 'RM%'", access_filter=AccessFilter(denied=["RM1"])
+    )
+    assert sorted(rm.name for rm in rms) == ["RM2", "RM3"]
+
+    readable_names = sqlalchemy.select(SqlRegisteredModel.name).where(
+        SqlRegisteredModel.name != "RM2"
+    )
+    rms = store.search_registered_models(
+        max_results=1, order_by=["name"], access_filter=AccessFilter(allowed=readable_names)
+    )
+    assert [rm.name for rm in rms] == ["RM1"]
+    rms = store.search_registered_models(
+        order_by=["name"], page_token=rms.token, access_filter=AccessFilter(allowed=readable_names)
+    )
+    assert [rm.name for rm in rms] == ["RM3"]
+
+
 def test_search_registered_model_pagination(store):
     rms = [_rm_maker(store, f"RM{i:03}").name for i in range(50)]
 
@@ -1750,3 +1781,225 @@ def test_copy_model_version(store, copy_to_same_model):
     double_copy_mv = store.copy_model_version(copied_mv, "test_for_copy_MV3")
     assert double_copy_mv.source == f"models:/{copied_mv.name}/{copied_mv.version}"
     assert store.get_model_version_download_uri(dst_mv.name, dst_mv.version) == src_mv.source
+
+
+@pytest.fixture
+def cached_store(tmp_sqlite_uri, monkeypatch):
+    monkeypatch.setenv("QCFLOW_MODEL_REGISTRY_CACHE_TTL", "60")
+    return SqlAlchemyStore(tmp_sqlite_uri)
+
+
+def test_model_registry_cache_is_disabled_by_default(store):
+    _rm_maker(store, "model")
+    _mv_maker(store, "model")
+    store.get_latest_versions("model")
+    store.get_model_version_download_uri("model", 1)
+    assert len(store._cache._entries) == 0
+
+
+def test_model_registry_cache_caches_lookups(cached_store):
+    _rm_maker(cached_store, "model")
+    _mv_maker(cached_store, "model", source="path/to/source")
+    cached_store.set_registered_model_alias("model", "champion", 1)
+
+    assert cached_store.get_model_version_by_alias("model", "champion").version == 1
+    assert [mv.version for mv in cached_store.get_latest_versions("model")] == [1]
+    assert cached_store.get_model_version_download_uri("model", 1) == "path/to/source"
+    with mock.patch.object(cached_store, "ManagedSessionMaker") as mock_session_maker:
+        assert cached_store.get_model_version_by_alias("model", "champion").version == 1
+        assert [mv.version for mv in cached_store.get_latest_versions("model")] == [1]
+        assert cached_store.get_model_version_download_uri("model", 1) == "path/to/source"
+    mock_session_maker.assert_not_called()
+
+
+def test_model_registry_cache_is_invalidated_by_changes(cached_store):
+    _rm_maker(cached_store, "model")
+    _mv_maker(cached_store, "model")
+    _mv_maker(cached_store, "model")
+    _rm_maker(cached_store, "other_model")
+    _mv_maker(cached_store, "other_model")
+
+    cached_store.set_registered_model_alias("model", "champion", 1)
+    cached_store.set_registered_model_alias("other_model", "champion", 1)
+    assert cached_store.get_model_version_by_alias("model", "champion").version == 1
+    assert cached_store.get_model_version_by_alias("other_model", "champion").version == 1
+    cached_store.set_registered_model_alias("model", "champion", 2)
+    assert cached_store.get_model_version_by_alias("model", "champion").version == 2
+    # The lookups of other models stay cached
+    assert ("alias", "other_model", "champion") in cached_store._cache._entries
+
+    assert _extract_latest_by_stage(cached_store.get_latest_versions("model")) == {"None": "2"}
+    cached_store.transition_model_version_stage("model", 1, "Production", False)
+    assert _extract_latest_by_stage(cached_store.get_latest_versions("model")) == {
+        "None": "2",
+        "Production": "1",
+    }
+    _mv_maker(cached_store, "model")
+    assert _extract_latest_by_stage(cached_store.get_latest_versions("model", stages=["None"])) == {
+        "None": "3"
+    }
+
+    cached_store.delete_registered_model_alias("model", "champion")
+    with pytest.raises(QCFlowException, match=r"Registered model alias champion not found."):
+        cached_store.get_model_version_by_alias("model", "champion")
+
+    cached_store.rename_registered_model("other_model", "renamed_model")
+    with pytest.raises(QCFlowException, match=r"Registered model alias champion not found."):
+        cached_store.get_model_version_by_alias("other_model", "champion")
+
+
+def test_model_registry_cache_expires_lookups(cached_store):
+    _rm_maker(cached_store, "model")
+    _mv_maker(cached_store, "model")
+    cached_store.set_registered_model_alias("model", "champion", 1)
+    assert cached_store.get_model_version_by_alias("model", "champion").version == 1
+
+    # Changes made by another process are only visible once the lookups expire
+    other_store = SqlAlchemyStore(cached_store.db_uri)
+    _mv_maker(other_store, "model")
+    other_store.set_registered_model_alias("model", "champion", 2)
+    assert cached_store.get_model_version_by_alias("model", "champion").version == 1
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+        assert cached_store.get_model_version_by_alias("model", "champion").version == 2
+
+
+def test_get_model_versions(store):
+    _rm_maker(store, "model_1")
+    _mv_maker(store, "model_1", source="path/to/source_1")
+    _mv_maker(store, "model_1", source="path/to/source_2")
+    _mv_maker(store, "model_1", source="path/to/source_3")
+    _rm_maker(store, "model_2")
+    _mv_maker(store, "model_2", source="path/to/source", tags=[ModelVersionTag("key", "value")])
+    store.set_registered_model_alias("model_1", "champion", 2)
+    store.set_registered_model_alias("model_1", "challenger", 2)
+    store.delete_model_version("model_1", 3)
+
+    model_versions = store.get_model_versions(
+        [
+            ("model_1", "champion"),
+            ("model_2", 1),
+            ("model_1", "1"),
+            ("model_1", 3),
+            ("model_1", 4),
+            ("model_1", "missing_alias"),
+            ("missing_model", 1),
+            ("missing_model", "champion"),
+            ("model_1", 2),
+        ]
+    )
+    assert [(mv.name, mv.version) if mv else None for mv in model_versions] == [
+        ("model_1", 2),
+        ("model_2", 1),
+        ("model_1", 1),
+        None,
+        None,
+        None,
+        None,
+        None,
+        ("model_1", 2),
+    ]
+    assert sorted(model_versions[0].aliases) == ["challenger", "champion"]
+    assert model_versions[1].source == "path/to/source"
+    assert model_versions[1].tags == {"key": "value"}
+    assert model_versions[2].aliases == []
+    assert store.get_model_versions([]) == []
+
+
+def test_get_model_versions_with_max_lookups(store):
+    _rm_maker(store, "model_1")
+    _mv_maker(store, "model_1")
+    _mv_maker(store, "model_1")
+    _rm_maker(store, "model_2")
+    _mv_maker(store, "model_2")
+
+    lookups = [(f"model_{i % 3}", i // 3 + 1) for i in range(GET_MODEL_VERSIONS_MAX_RESULTS)]
+    model_versions = store.get_model_versions(lookups)
+    assert len(model_versions) == GET_MODEL_VERSIONS_MAX_RESULTS
+    assert {(i, mv.name, mv.version) for i, mv in enumerate(model_versions) if mv} == {
+        (1, "model_1", 1),
+        (4, "model_1", 2),
+        (2, "model_2", 1),
+    }
+
+
+def test_get_model_versions_validates_lookups(store):
+    with pytest.raises(QCFlowException, match=r"'latest' alias name \(case insensitive\)"):
+        store.get_model_versions([("model", "latest")])
+
+
+def test_change_events_of_registered_models_and_model_versions(store, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_CHANGE_FEED", "true")
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_COMMIT_LAG", "0")
+    _rm_maker(store, "model")
+    _mv_maker(store, "model")
+    _mv_maker(store, "model")
+    store.set_registered_model_alias("model", "champion", 1)
+    store.transition_model_version_stage("model", 2, "Production", archive_existing_versions=False)
+    store.transition_model_version_stage("model", 1, "Production", archive_existing_versions=True)
+    store.update_model_version("model", 2, "description")
+    store.delete_model_version("model", 1)
+    store.update_registered_model("model", "description")
+    store.rename_registered_model("model", "model-renamed")
+    store.delete_registered_model("model-renamed")
+
+    events = get_change_events(store.ManagedSessionMaker)
+    assert [(event.entity_type, event.entity_id, event.op, event.data) for event in events] == [
+        ("registered_model", "model", "create", {}),
+        (
+            "model_version",
+            "model/1",
+            "create",
+            {"name": "model", "version": 1, "current_stage": "None"},
+        ),
+        (
+            "model_version",
+            "model/2",
+            "create",
+            {"name": "model", "version": 2, "current_stage": "None"},
+        ),
+        (
+            "registered_model_alias",
+            "model@champion",
+            "update",
+            {"name": "model", "alias": "champion", "version": 1},
+        ),
+        (
+            "model_version",
+            "model/2",
+            "update",
+            {"name": "model", "version": 2, "current_stage": "Production"},
+        ),
+        (
+            "model_version",
+            "model/2",
+            "update",
+            {"name": "model", "version": 2, "current_stage": "Archived"},
+        ),
+        (
+            "model_version",
+            "model/1",
+            "update",
+            {"name": "model", "version": 1, "current_stage": "Production"},
+        ),
+        (
+            "model_version",
+            "model/2",
+            "update",
+            {"name": "model", "version": 2, "current_stage": "Archived"},
+        ),
+        (
+            "registered_model_alias",
+            "model@champion",
+            "delete",
+            {"name": "model", "alias": "champion"},
+        ),
+        (
+            "model_version",
+            "model/1",
+            "delete",
+            {"name": "model", "version": 1, "current_stage": "Deleted_Internal"},
+        ),
+        ("registered_model", "model", "update", {}),
+        ("registered_model", "model", "update", {"new_name": "model-renamed"}),
+        ("registered_model", "model-renamed", "delete", {}),
+    ]
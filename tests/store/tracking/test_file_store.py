@@ -3234,6 +3234,7 @@ def test_search_traces_filter_request_metadata(store):
         ("run_id ILIKE 'run_%'", r"Invalid comparator 'ILIKE'"),
         ("tag.test_tag LIKE 'tag_%'", r"Invalid comparator 'LIKE'"),
         ("tags.test_tag ILIKE 'tag_%'", r"Invalid comparator 'ILIKE'"),
+        ("span.name = 'foo'", r"only supported by the SQL-based tracking store"),
     ],
 )
 def test_search_traces_invalid_filter(generate_trace_infos, filter_string, error):
@@ -715,3 +715,40 @@ def test_set_trace_tag():
             mock_http, creds, f"traces/{request_id}/tags", "PATCH", message_to_json(request)
         )
         assert res is None
+
+
+def test_get_change_events(monkeypatch):
+    monkeypatch.setenv("QCFLOW_HTTP_REQUEST_TIMEOUT", "10")
+    creds = QCFlowHostCreds("https://hello")
+    store = RestStore(lambda: creds)
+    event = {
+        "sequence": 4,
+        "timestamp": 123,
+        "entity_type": "model_version",
+        "entity_id": "model/1",
+        "op": "create",
+        "data": {"name": "model", "version": 1},
+    }
+    response = mock.MagicMock(status_code=200, text=json.dumps({}))
+    response.json.return_value = {"events": [event], "next_page_token": "4"}
+    with mock.patch(
+        "qcflow.store.tracking.rest_store.http_request", return_value=response
+    ) as mock_http:
+        events = store.get_change_events(
+            entity_types=["model_version"], page_token="3", max_results=5, timeout_seconds=20
+        )
+    mock_http.assert_called_once_with(
+        host_creds=creds,
+        endpoint="/api/2.0/qcflow/change-events/get",
+        method="GET",
+        params={
+            "max_results": 5,
+            "timeout_seconds": 20,
+            "entity_types": ["model_version"],
+            "page_token": "3",
+        },
+        timeout=30,
+    )
+    assert [e.to_dictionary() for e in events] == [event]
+    assert events[0].token == "4"
+    assert events.token == "4"
@@ -1,3 +1,4 @@
+import dataclasses
 import json
 import math
 import os
@@ -28,6 +29,7 @@ from qcflow.entities import (
     RunStatus,
     RunTag,
     SourceType,
+    Span,
     ViewType,
     _DatasetSummary,
 )
@@ -48,12 +50,14 @@ from qcflow.store.db.utils import (
     _get_latest_schema_revision,
     _get_schema_version,
 )
+from qcflow.store.entities import AccessFilter
 from qcflow.store.tracking import (
     SEARCH_MAX_RESULTS_DEFAULT,
     SEARCH_MAX_RESULTS_THRESHOLD,
 )
 from qcflow.store.tracking.dbmodels import models
 from qcflow.store.tracking.dbmodels.models import (
+    SqlChangeEvent,
     SqlDataset,
     SqlExperiment,
     SqlExperimentTag,
@@ -66,10 +70,12 @@ from qcflow.store.tracking.dbmodels.models import (
     SqlTag,
     SqlTraceInfo,
     SqlTraceRequestMetadata,
+    SqlTraceSpan,
+    SqlTraceSpanAttribute,
     SqlTraceTag,
 )
 from qcflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
-from qcflow.tracing.constant import TraceMetadataKey
+from qcflow.tracing.constant import SpanAttributeKey, TraceMetadataKey
 from qcflow.utils import qcflow_tags
 from qcflow.utils.file_utils import TempDir
 from qcflow.utils.qcflow_tags import (
@@ -201,6 +207,7 @@ def _cleanup_database(store: SqlAlchemyStore):
     with store.ManagedSessionMaker() as session:
         # Delete all rows in all tables
         for model in (
+            SqlChangeEvent,
             SqlParam,
             SqlMetric,
             SqlLatestMetric,
@@ -211,6 +218,8 @@ def _cleanup_database(store: SqlAlchemyStore):
             SqlRun,
             SqlTraceTag,
             SqlTraceRequestMetadata,
+            SqlTraceSpanAttribute,
+            SqlTraceSpan,
             SqlTraceInfo,
             SqlExperimentTag,
             SqlExperiment,
@@ -562,6 +571,32 @@ def test_search_experiments_filter_by_attribute_and_tag(store: SqlAlchemyStore):
     assert [e.name for e in experiments] == ["exp1"]
 
 
+def test_search_experiments_with_access_filter(store: SqlAlchemyStore):
+    exp_ids = _create_experiments(store, ["a", "b", "c"])
+
+    experiments = store.search_experiments(
+        access_filter=AccessFilter(allowed=[exp_ids[0], exp_ids[2], "not-an-id"])
+    )
+    assert sorted(e.name for e in experiments) == ["a", "c"]
+
+    experiments = store.search_experiments(access_filter=AccessFilter(denied=[exp_ids[0]]))
+    assert sorted(e.name for e in experiments) == ["Default", "b", "c"]
+
+    # The identifiers can be selected by a query run in the same database
+    readable_ids = sqlalchemy.select(
+        sqlalchemy.cast(models.SqlExperiment.experiment_id, sqlalchemy.String)
+    ).where(models.SqlExperiment.name.in_(["b", "c"]))
+    experiments = store.search_experiments(
+        max_results=1, access_filter=AccessFilter(allowed=readable_ids)
+    )
+    assert [e.name for e in experiments] == ["c"]
+    experiments = store.search_experiments(
+        page_token=experiments.token, access_filter=AccessFilter(allowed=readable_ids)
+    )
+    assert [e.name for e in experiments] == ["b"]
+    assert experiments.token is None
+
+
 def test_search_experiments_order_by(store: SqlAlchemyStore):
     experiment_names = ["x", "y", "z"]
     _create_experiments(store, experiment_names)
@@ -4154,6 +4189,36 @@ def test_start_and_end_trace(store: SqlAlchemyStore):
     assert trace_info == store.get_trace_info(request_id)
 
 
+def test_end_traces(store: SqlAlchemyStore):
+    experiment_id = store.create_experiment("test_experiment")
+    trace_infos = [
+        store.start_trace(
+            experiment_id=experiment_id,
+            timestamp_ms=1000 * i,
+            request_metadata={"rq1": "foo"},
+            tags={"tag1": "apple"},
+        )
+        for i in range(3)
+    ]
+    for i, trace_info in enumerate(trace_infos):
+        trace_info.execution_time_ms = 10 * i
+        trace_info.status = TraceStatus.OK if i else TraceStatus.ERROR
+        trace_info.request_metadata["rq1"] = f"updated_{i}"
+        trace_info.tags["tag2"] = f"orange_{i}"
+
+    updated_trace_infos = store.end_traces(trace_infos)
+
+    assert updated_trace_infos == trace_infos
+    for i, trace_info in enumerate(trace_infos):
+        assert store.get_trace_info(trace_info.request_id) == trace_info
+        assert trace_info.execution_time_ms == 10 * i
+        assert trace_info.request_metadata == {"rq1": f"updated_{i}"}
+
+    missing_trace_info = dataclasses.replace(trace_infos[0], request_id="tr-missing")
+    with pytest.raises(QCFlowException, match=r"Trace with request_id 'tr-missing' not found"):
+        store.end_traces([trace_infos[1], missing_trace_info])
+
+
 def test_start_trace_with_invalid_experiment_id(store: SqlAlchemyStore):
     with pytest.raises(QCFlowException, match="No Experiment with id=123"):
         store.start_trace(
@@ -4407,6 +4472,143 @@ def test_search_traces_pagination(store_with_traces):
     assert token is None
 
 
+def _create_test_span(
+    request_id,
+    span_id,
+    name,
+    span_type,
+    duration_ms,
+    parent_id=None,
+    status_code="OK",
+    attributes=None,
+) -> Span:
+    return Span.from_dict(
+        {
+            "name": name,
+            "context": {"span_id": span_id, "trace_id": "0x1"},
+            "parent_id": parent_id,
+            "start_time": 0,
+            "end_time": duration_ms * 1_000_000,
+            "status_code": status_code,
+            "status_message": "",
+            "attributes": {
+                SpanAttributeKey.REQUEST_ID: json.dumps(request_id),
+                SpanAttributeKey.SPAN_TYPE: json.dumps(span_type),
+                **{k: json.dumps(v) for k, v in (attributes or {}).items()},
+            },
+            "events": [],
+        }
+    )
+
+
+@pytest.fixture
+def store_with_indexed_spans(store_with_traces):
+    store = store_with_traces
+    spans = {
+        "tr-0": [
+            _create_test_span("tr-0", "0x10", "agent", "AGENT", 3000),
+            _create_test_span(
+                "tr-0", "0x11", "retrieve", "RETRIEVER", 100, "0x10", attributes={"k": 5}
+            ),
+            _create_test_span("tr-0", "0x12", "llm", "LLM", 2500, "0x10", attributes={"k": "a"}),
+        ],
+        "tr-1": [
+            _create_test_span("tr-1", "0x20", "chain", "CHAIN", 3000),
+            _create_test_span("tr-1", "0x21", "retrieve", "RETRIEVER", 2500, "0x20"),
+            _create_test_span("tr-1", "0x22", "llm", "LLM", 10, "0x20", status_code="ERROR"),
+        ],
+        "tr-3": [
+            _create_test_span("tr-3", "0x30", "retrieve", "RETRIEVER", 2001),
+            _create_test_span("tr-3", "0x31", "retrieve", "RETRIEVER", 2002),
+        ],
+    }
+    for request_id, trace_spans in spans.items():
+        store.index_trace_spans(request_id, trace_spans, attribute_keys=["k"])
+    return store
+
+
+@pytest.mark.parametrize(
+    ("filter_string", "expected_ids"),
+    [
+        ("span.type = 'RETRIEVER'", ["tr-3", "tr-1", "tr-0"]),
+        # All span clauses must be satisfied by the same span
+        ("span.type = 'RETRIEVER' AND span.duration > 2000", ["tr-3", "tr-1"]),
+        ("span.type = 'LLM' AND span.duration_ms > 2000", ["tr-0"]),
+        ("span.type = 'LLM' AND span.status = 'ERROR'", ["tr-1"]),
+        ("span.name IN ('agent', 'chain')", ["tr-1", "tr-0"]),
+        ("spans.type != 'RETRIEVER' AND span.duration < 100", ["tr-1"]),
+        ("span.attributes.k = '5'", ["tr-0"]),
+        ("span.attributes.k = 'a' AND span.type = 'LLM'", ["tr-0"]),
+        ("span.attributes.k = '5' AND span.type = 'LLM'", []),
+        # Span clauses can be combined with other clauses
+        ("span.type = 'RETRIEVER' AND status = 'OK'", ["tr-3", "tr-0"]),
+        ("span.type = 'RETRIEVER' AND tag.fruit = 'apple'", ["tr-1"]),
+    ],
+)
+def test_search_traces_by_spans(store_with_indexed_spans, filter_string, expected_ids):
+    exp1 = store_with_indexed_spans.get_experiment_by_name("exp1").experiment_id
+    exp2 = store_with_indexed_spans.get_experiment_by_name("exp2").experiment_id
+
+    trace_infos, _ = store_with_indexed_spans.search_traces(
+        experiment_ids=[exp1, exp2],
+        filter_string=filter_string,
+        max_results=5,
+        order_by=[],
+    )
+    assert [trace_info.request_id for trace_info in trace_infos] == expected_ids
+
+
+@pytest.mark.parametrize(
+    ("filter_string", "error"),
+    [
+        ("span.foo = 'bar'", r"Invalid span key 'foo'"),
+        ("span.duration = 'bar'", r"Expected numeric value type for span key"),
+        ("span.name > 'bar'", r"Invalid comparator '>'"),
+        ("span.attributes.k IN ('a')", r"Expected a quoted string value"),
+    ],
+)
+def test_search_traces_by_spans_with_invalid_filter(store_with_traces, filter_string, error):
+    exp1 = store_with_traces.get_experiment_by_name("exp1").experiment_id
+
+    with pytest.raises(QCFlowException, match=error):
+        store_with_traces.search_traces(experiment_ids=[exp1], filter_string=filter_string)
+
+
+def test_index_trace_spans(store_with_indexed_spans):
+    store = store_with_indexed_spans
+
+    # Already indexed spans are skipped
+    store.index_trace_spans(
+        "tr-3",
+        [
+            _create_test_span("tr-3", "0x30", "retrieve", "RETRIEVER", 1),
+            _create_test_span("tr-3", "0x32", "rerank", "RERANKER", 5, "0x30"),
+        ],
+    )
+    with store.ManagedSessionMaker() as session:
+        spans = (
+            session.query(SqlTraceSpan)
+            .filter(SqlTraceSpan.request_id == "tr-3")
+            .order_by(SqlTraceSpan.span_id)
+            .all()
+        )
+        assert [(s.name, s.span_type, s.duration_ms) for s in spans] == [
+            ("retrieve", "RETRIEVER", 2001),
+            ("retrieve", "RETRIEVER", 2002),
+            ("rerank", "RERANKER", 5),
+        ]
+        assert spans[2].parent_span_id == spans[0].span_id
+
+    with pytest.raises(QCFlowException, match=r"Trace with request_id 'tr-missing' not found"):
+        store.index_trace_spans("tr-missing", [])
+
+    # Indexed spans are deleted with the trace
+    exp1 = store.get_experiment_by_name("exp1").experiment_id
+    store.delete_traces(exp1, request_ids=["tr-3"])
+    with store.ManagedSessionMaker() as session:
+        assert session.query(SqlTraceSpan).filter(SqlTraceSpan.request_id == "tr-3").count() == 0
+
+
 def test_search_traces_pagination_tie_breaker(store):
     # This test is for ensuring the tie breaker for ordering traces with the same timestamp
     # works correctly.
@@ -4607,3 +4809,153 @@ def test_delete_traces_raises_error(store):
         QCFlowException, match=r"`max_traces` must be a positive integer, received 0"
     ):
         store.delete_traces(exp_id, 100, max_traces=0)
+
+
+@pytest.fixture
+def change_feed_store(store, monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_CHANGE_FEED", "true")
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_COMMIT_LAG", "0")
+    return store
+
+
+def _change_event_keys(events):
+    return [(event.entity_type, event.entity_id, event.op) for event in events]
+
+
+def test_get_change_events_of_experiments_and_runs(change_feed_store):
+    store = change_feed_store
+    exp_id = store.create_experiment("exp")
+    store.rename_experiment(exp_id, "exp-renamed")
+    run = store.create_run(exp_id, user_id="user", start_time=0, tags=[], run_name="run")
+    run_id = run.info.run_id
+    store.update_run_info(run_id, RunStatus.FINISHED, end_time=1000, run_name=None)
+    store.delete_run(run_id)
+    store.restore_run(run_id)
+    store.delete_experiment(exp_id)
+    store.restore_experiment(exp_id)
+
+    events = store.get_change_events()
+    assert _change_event_keys(events) == [
+        ("experiment", exp_id, "create"),
+        ("experiment", exp_id, "update"),
+        ("run", run_id, "create"),
+        ("run", run_id, "update"),
+        ("run", run_id, "delete"),
+        ("run", run_id, "restore"),
+        ("experiment", exp_id, "delete"),
+        ("experiment", exp_id, "restore"),
+    ]
+    assert events[1].data == {"name": "exp-renamed"}
+    assert events[3].data == {
+        "experiment_id": exp_id,
+        "status": "FINISHED",
+        "end_time": 1000,
+        "run_name": "run",
+    }
+    assert [event.sequence for event in events] == sorted(event.sequence for event in events)
+    assert events.token == events[-1].token
+
+
+def test_get_change_events_pagination_and_filtering(change_feed_store):
+    store = change_feed_store
+    exp_id = store.create_experiment("exp")
+    run_ids = [
+        store.create_run(exp_id, user_id="user", start_time=0, tags=[], run_name=None).info.run_id
+        for _ in range(3)
+    ]
+
+    page = store.get_change_events(entity_types=["run"], max_results=2)
+    assert [event.entity_id for event in page] == run_ids[:2]
+    page = store.get_change_events(entity_types=["run"], page_token=page.token, max_results=2)
+    assert [event.entity_id for event in page] == run_ids[2:]
+    last_page = store.get_change_events(entity_types=["run"], page_token=page.token)
+    assert last_page == []
+    assert last_page.token == page.token
+
+    run = store.create_run(exp_id, user_id="user", start_time=0, tags=[], run_name=None)
+    assert _change_event_keys(store.get_change_events(page_token=page.token)) == [
+        ("run", run.info.run_id, "create")
+    ]
+
+
+def test_get_change_events_waits_for_new_events(change_feed_store, monkeypatch):
+    store = change_feed_store
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_POLL_INTERVAL", "0.05")
+    store.create_experiment("exp-1")
+    token = store.get_change_events().token
+
+    start = time.monotonic()
+    assert store.get_change_events(page_token=token, timeout_seconds=0.3) == []
+    assert time.monotonic() - start >= 0.3
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(store.get_change_events, page_token=token, timeout_seconds=30)
+        time.sleep(0.1)
+        exp_id = store.create_experiment("exp-2")
+        events = future.result(timeout=10)
+    assert _change_event_keys(events) == [("experiment", exp_id, "create")]
+
+
+def test_get_change_events_holds_back_events_within_commit_lag(change_feed_store, monkeypatch):
+    store = change_feed_store
+    exp_ids = [store.create_experiment(f"exp-{i}") for i in range(3)]
+    now = get_current_time_millis()
+    with store.ManagedSessionMaker() as session:
+        sql_events = session.query(SqlChangeEvent).order_by(SqlChangeEvent.sequence).all()
+        for sql_event, timestamp in zip(sql_events, [now - 120_000, now, now - 120_000]):
+            sql_event.timestamp = timestamp
+
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_COMMIT_LAG", "60")
+    # The third event is held back with the second one, which may be preceded by events of
+    # uncommitted transactions
+    events = store.get_change_events()
+    assert _change_event_keys(events) == [("experiment", exp_ids[0], "create")]
+    assert store.get_change_events(page_token=events.token) == []
+
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_COMMIT_LAG", "0")
+    events = store.get_change_events(page_token=events.token)
+    assert [event.entity_id for event in events] == exp_ids[1:]
+
+
+def test_get_change_events_with_concurrent_writers(change_feed_store, monkeypatch):
+    store = change_feed_store
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_COMMIT_LAG", "0.2")
+    monkeypatch.setenv("QCFLOW_CHANGE_FEED_POLL_INTERVAL", "0.05")
+    num_writers, num_experiments = 4, 10
+
+    def write(writer):
+        return [store.create_experiment(f"exp-{writer}-{i}") for i in range(num_experiments)]
+
+    read_ids = []
+    with ThreadPoolExecutor(max_workers=num_writers) as executor:
+        futures = [executor.submit(write, writer) for writer in range(num_writers)]
+        token = None
+        deadline = time.monotonic() + 30
+        while len(read_ids) < num_writers * num_experiments and time.monotonic() < deadline:
+            events = store.get_change_events(page_token=token, timeout_seconds=1)
+            read_ids.extend(event.entity_id for event in events)
+            token = events.token
+        written_ids = [exp_id for future in futures for exp_id in future.result()]
+
+    assert sorted(read_ids) == sorted(written_ids)
+
+
+def test_change_events_are_not_recorded_if_disabled(store):
+    store.create_experiment("exp")
+    assert store.get_change_events() == []
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"entity_types": ["metric"]}, "Invalid entity type 'metric'"),
+        ({"page_token": "abc"}, "Invalid page token 'abc'"),
+        ({"page_token": "-1"}, "Invalid page token '-1'"),
+        ({"max_results": 0}, "Invalid value 0 for parameter 'max_results'"),
+        ({"max_results": 1001}, "Invalid value 1001 for parameter 'max_results'"),
+        ({"timeout_seconds": 61}, "Invalid value 61 for parameter 'timeout_seconds'"),
+    ],
+)
+def test_get_change_events_validates_params(store, kwargs, message):
+    with pytest.raises(QCFlowException, match=message):
+        store.get_change_events(**kwargs)
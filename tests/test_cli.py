@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
@@ -18,7 +19,7 @@ from click.testing import CliRunner
 
 import qcflow
 from qcflow import pyfunc
-from qcflow.cli import doctor, gc, server
+from qcflow.cli import doctor, gc, load_test, server
 from qcflow.data import numpy_dataset
 from qcflow.entities import ViewType
 from qcflow.exceptions import QCFlowException
@@ -48,6 +49,93 @@ def test_qcflow_server_command(command):
         process.kill()
 
 
+@pytest.mark.skipif(is_windows(), reason="gunicorn is not supported on Windows")
+def test_qcflow_server_production(tmp_path):
+    port = get_safe_port()
+    backend_store_uri = f"sqlite:///{tmp_path / 'qcflow.db'}"
+    cmd = [
+        "qcflow",
+        "server",
+        "--port",
+        str(port),
+        "--backend-store-uri",
+        backend_store_uri,
+        "--default-artifact-root",
+        str(tmp_path / "artifacts"),
+        "--workers",
+        "2",
+        "--production",
+        "--db-pool-size",
+        "4",
+    ]
+    # Start the server in a new process group to kill the gunicorn processes with it
+    process = subprocess.Popen(cmd, start_new_session=True)
+    try:
+        _await_server_up_or_die(port)
+        result = CliRunner().invoke(
+            load_test,
+            [
+                "--tracking-uri",
+                f"http://localhost:{port}",
+                "--duration",
+                "1",
+                "--concurrency",
+                "2",
+                "--batch-size",
+                "10",
+                "--search-ratio",
+                "0.5",
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "log_batch" in result.output
+        assert "search_runs" in result.output
+    finally:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def test_server_production_options_validation():
+    with mock.patch("qcflow.server._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--dev", "--production"])
+        assert "'--dev' and '--production' cannot be specified together." in result.output
+        run_server_mock.assert_not_called()
+    with (
+        mock.patch("qcflow.server._run_server") as run_server_mock,
+        mock.patch("importlib.util.find_spec", return_value=None),
+    ):
+        result = CliRunner().invoke(server, ["--worker-class", "uvicorn"])
+        assert "requires the uvicorn package" in result.output
+        run_server_mock.assert_not_called()
+    with mock.patch("qcflow.server._run_server") as run_server_mock:
+        CliRunner().invoke(
+            server,
+            [
+                "--production",
+                "--worker-class",
+                "gthread",
+                "--threads",
+                "8",
+                "--db-pool-size",
+                "8",
+                "--db-max-overflow",
+                "0",
+                "--db-pool-recycle",
+                "3600",
+            ],
+        )
+        run_server_mock.assert_called_once()
+        assert run_server_mock.call_args.kwargs == {
+            "worker_class": "gthread",
+            "threads": 8,
+            "production": True,
+            "db_pool_size": 8,
+            "db_max_overflow": 0,
+            "db_pool_recycle": 3600,
+        }
+
+
 def test_server_static_prefix_validation():
     with mock.patch("qcflow.server._run_server") as run_server_mock:
         CliRunner().invoke(server)
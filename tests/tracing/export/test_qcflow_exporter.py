@@ -1,10 +1,16 @@
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import MagicMock
 
 from qcflow.entities import LiveSpan
-from qcflow.tracing.export.qcflow import AsyncTraceExportQueue, QCFlowSpanExporter, Task
+from qcflow.tracing.export.qcflow import (
+    AsyncTraceExportQueue,
+    QCFlowSpanExporter,
+    Task,
+    _handle_task_batch,
+)
 from qcflow.tracing.fluent import TRACE_BUFFER
 from qcflow.tracing.trace_manager import InMemoryTraceManager
 
@@ -81,6 +87,118 @@ def test_async_queue_handle_tasks():
     assert len(queue._unprocessed_tasks) == 0
 
 
+def test_async_queue_coalesces_batchable_tasks():
+    queue = AsyncTraceExportQueue(MagicMock())
+    # Do not start the dispatcher until all tasks are enqueued
+    queue._is_activated = True
+
+    handled = []
+    batches = []
+
+    def _batch_handler(batch_args):
+        batches.append(batch_args)
+
+    for i in range(5):
+        queue.put(Task(handler=handled.append, args=(i,), batch_handler=_batch_handler))
+    queue.put(Task(handler=handled.append, args=(5,)))
+
+    queue._is_activated = False
+    queue.activate()
+    queue.flush(terminate=True)
+
+    assert batches == [[(0,), (1,), (2,), (3,), (4,)]]
+    assert handled == [5]
+
+    metrics = queue.get_metrics()
+    assert metrics.num_handled_tasks == 6
+    assert metrics.num_batches == 1
+    assert metrics.num_pending_tasks == 0
+    assert metrics.queue_depth == 0
+
+
+def test_async_queue_batch_failure_falls_back_to_single_tasks():
+    handled = []
+
+    def _fail(_):
+        raise Exception("Bulk call failed")
+
+    tasks = [Task(handler=handled.append, args=(i,), batch_handler=_fail) for i in range(3)]
+    assert _handle_task_batch(tasks) == [True, True, True]
+    assert handled == [0, 1, 2]
+
+
+def test_async_queue_drops_traces_when_full(monkeypatch):
+    monkeypatch.setenv("QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", "2")
+    queue = AsyncTraceExportQueue(MagicMock())
+    # Do not start the dispatcher so that the queue is not drained
+    queue._is_activated = True
+
+    handled = []
+    assert queue.put(Task(handler=handled.append, args=(1,)))
+    # Tasks of a trace are dropped as a whole
+    assert not queue.put(
+        Task(handler=handled.append, args=(2,)), Task(handler=handled.append, args=(3,))
+    )
+    assert queue.put(Task(handler=handled.append, args=(4,)))
+
+    metrics = queue.get_metrics()
+    assert metrics.queue_depth == 2
+    assert metrics.num_dropped_tasks == 2
+
+    queue._is_activated = False
+    queue.activate()
+    queue.flush(terminate=True)
+    assert handled == [1, 4]
+
+
+def test_async_queue_blocks_for_tasks_that_cannot_be_dropped(monkeypatch):
+    monkeypatch.setenv("QCFLOW_ASYNC_TRACE_LOGGING_MAX_QUEUE_SIZE", "1")
+    queue = AsyncTraceExportQueue(MagicMock())
+    # Do not start the dispatcher so that the queue is not drained
+    queue._is_activated = True
+
+    handled = []
+    assert queue.put(Task(handler=handled.append, args=(1,)))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            queue.put, Task(handler=handled.append, args=(2,)), droppable=False
+        )
+        time.sleep(0.1)
+        assert not future.done()
+        # The blocked caller does not hold the lock, so the droppable tasks are still dropped
+        # without waiting
+        assert not queue.put(Task(handler=handled.append, args=(3,)))
+
+        queue._is_activated = False
+        queue.activate()
+        assert future.result(timeout=10)
+
+    queue.flush(terminate=True)
+    assert handled == [1, 2]
+    assert queue.get_metrics().num_dropped_tasks == 1
+
+
+def test_export_span_batches_are_not_dropped(monkeypatch):
+    monkeypatch.setenv("QCFLOW_ENABLE_ASYNC_LOGGING", "true")
+    monkeypatch.setenv("QCFLOW_TRACE_INCREMENTAL_EXPORT", "true")
+    monkeypatch.setenv("QCFLOW_TRACE_SPAN_BATCH_SIZE", "1")
+    trace_id = 12345
+    request_id = f"tr-{trace_id}"
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(trace_id, create_test_trace_info(request_id, 0))
+    root_otel_span = create_mock_otel_span(trace_id=trace_id, span_id=1, parent_id=None)
+    trace_manager.register_span(LiveSpan(root_otel_span, request_id=request_id))
+    child_otel_span = create_mock_otel_span(trace_id=trace_id, span_id=2, parent_id=1)
+    trace_manager.register_span(LiveSpan(child_otel_span, request_id=request_id))
+
+    exporter = QCFlowSpanExporter(MagicMock(), MagicMock())
+    with mock.patch.object(exporter._async_queue, "put") as mock_put:
+        exporter.export([child_otel_span])
+
+    mock_put.assert_called_once()
+    assert mock_put.call_args.kwargs == {"droppable": False}
+
+
 @mock.patch("atexit.register")
 def test_async_queue_activate_thread_safe(mock_atexit):
     mock_client = MagicMock()
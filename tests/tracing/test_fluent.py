@@ -19,8 +19,9 @@ from qcflow.entities import (
 )
 from qcflow.entities.trace_status import TraceStatus
 from qcflow.environment_variables import QCFLOW_TRACKING_USERNAME
-from qcflow.exceptions import QCFlowException
+from qcflow.exceptions import QCFlowException, QCFlowTraceDataNotFound
 from qcflow.pyfunc.context import Context, set_prediction_context
+from qcflow.store.artifact.artifact_repo import ArtifactRepository
 from qcflow.store.entities.paged_list import PagedList
 from qcflow.store.tracking import SEARCH_TRACES_DEFAULT_MAX_RESULTS
 from qcflow.tracing.constant import (
@@ -679,6 +680,103 @@ def test_get_trace(mock_get_display_handler):
         mock_logger.warning.assert_called_once()
 
 
+def test_incremental_span_export(monkeypatch, async_logging_enabled):
+    monkeypatch.setenv("QCFLOW_TRACE_INCREMENTAL_EXPORT", "true")
+    monkeypatch.setenv("QCFLOW_TRACE_SPAN_BATCH_SIZE", "2")
+
+    @qcflow.trace
+    def child(x):
+        return x + 1
+
+    @qcflow.trace
+    def parent(x):
+        return sum(child(i) for i in range(x))
+
+    parent(5)
+    if async_logging_enabled:
+        qcflow.flush_trace_async_logging(terminate=True)
+
+    request_id = qcflow.get_last_active_trace().info.request_id
+    TRACE_BUFFER.clear()
+    trace = qcflow.get_trace(request_id)
+
+    assert trace.info.request_metadata[TraceMetadataKey.SPAN_BATCHES] == "2"
+    assert len(trace.data.spans) == 6
+    assert [span.name for span in trace.data.spans].count("parent") == 1
+    assert trace.data.request == '{"x": 5}'
+
+
+def test_get_trace_with_missing_span_batch(monkeypatch):
+    monkeypatch.setenv("QCFLOW_TRACE_INCREMENTAL_EXPORT", "true")
+    monkeypatch.setenv("QCFLOW_TRACE_SPAN_BATCH_SIZE", "2")
+
+    @qcflow.trace
+    def child(x):
+        return x + 1
+
+    @qcflow.trace
+    def parent(x):
+        return sum(child(i) for i in range(x))
+
+    parent(5)
+    request_id = qcflow.get_last_active_trace().info.request_id
+    TRACE_BUFFER.clear()
+
+    download_trace_span_batch = ArtifactRepository.download_trace_span_batch
+
+    def download_all_but_first_batch(self, batch_index):
+        if batch_index == 0:
+            raise QCFlowTraceDataNotFound(artifact_path="spans/batch-00000.json")
+        return download_trace_span_batch(self, batch_index)
+
+    monkeypatch.setattr(
+        ArtifactRepository, "download_trace_span_batch", download_all_but_first_batch
+    )
+    with mock.patch("qcflow.tracking._tracking_service.client._logger") as mock_logger:
+        trace = qcflow.get_trace(request_id)
+
+    # The spans of the other batches and of the root span are returned
+    assert len(trace.data.spans) == 4
+    assert [span.name for span in trace.data.spans].count("parent") == 1
+    mock_logger.warning.assert_called_once()
+    assert "1 of the 2 span batches" in mock_logger.warning.call_args[0][0]
+
+
+@pytest.mark.parametrize("incremental_export", [False, True])
+def test_search_traces_by_indexed_spans(
+    monkeypatch, tmp_path, async_logging_enabled, incremental_export
+):
+    monkeypatch.setenv("QCFLOW_TRACE_INDEX_SPANS", "true")
+    monkeypatch.setenv("QCFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES", "model")
+    monkeypatch.setenv("QCFLOW_TRACE_INCREMENTAL_EXPORT", str(incremental_export))
+    monkeypatch.setenv("QCFLOW_TRACE_SPAN_BATCH_SIZE", "1")
+    qcflow.set_tracking_uri(f"sqlite:///{tmp_path}/qcflow.db")
+
+    @qcflow.trace(span_type="LLM", attributes={"model": "gpt"})
+    def child(x):
+        return x + 1
+
+    @qcflow.trace
+    def parent(x):
+        return child(x)
+
+    parent(1)
+    request_id = qcflow.get_last_active_trace().info.request_id
+    with qcflow.start_span("other"):
+        pass
+    if async_logging_enabled:
+        qcflow.flush_trace_async_logging(terminate=True)
+
+    for filter_string in [
+        "span.name = 'child' AND span.type = 'LLM'",
+        "span.attributes.model = 'gpt'",
+    ]:
+        traces = qcflow.QCFlowClient().search_traces(
+            experiment_ids=[DEFAULT_EXPERIMENT_ID], filter_string=filter_string
+        )
+        assert [trace.info.request_id for trace in traces] == [request_id]
+
+
 def test_test_search_traces_empty(mock_client):
     mock_client.search_traces.return_value = PagedList([], token=None)
 
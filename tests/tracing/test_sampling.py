@@ -0,0 +1,141 @@
+from unittest import mock
+
+import pytest
+
+import qcflow
+from qcflow.entities.trace_status import TraceStatus
+from qcflow.tracing.provider import reset_tracer_setup
+from qcflow.tracing.sampling import TailSampler, _parse_keep_tags, get_head_sampler
+
+from tests.tracing.helper import create_test_trace_info, get_traces
+
+
+@qcflow.trace
+def _child(x):
+    return x + 1
+
+
+@qcflow.trace
+def _parent(x):
+    return _child(x) * 2
+
+
+def test_get_head_sampler(monkeypatch):
+    assert get_head_sampler() is None
+
+    monkeypatch.setenv("QCFLOW_TRACE_SAMPLING_RATIO", "0.5")
+    assert "0.5" in get_head_sampler().get_description()
+
+
+@pytest.mark.parametrize(("ratio", "expected_num_traces"), [(0.0, 0), (1.0, 1)])
+def test_head_sampling(monkeypatch, ratio, expected_num_traces):
+    monkeypatch.setenv("QCFLOW_TRACE_SAMPLING_RATIO", str(ratio))
+
+    with mock.patch("qcflow.tracing.fluent.capture_function_input_args") as mock_capture:
+        assert _parent(1) == 4
+
+    traces = get_traces()
+    assert len(traces) == expected_num_traces
+    if expected_num_traces:
+        assert len(traces[0].data.spans) == 2
+    else:
+        # Child spans follow the decision of the root span and nothing is serialized
+        mock_capture.assert_not_called()
+
+
+def test_head_sampling_with_client_apis(monkeypatch):
+    monkeypatch.setenv("QCFLOW_TRACE_SAMPLING_RATIO", "0")
+
+    client = qcflow.QCFlowClient()
+    root_span = client.start_trace("root")
+    child_span = client.start_span("child", root_span.request_id, root_span.span_id)
+    client.end_span(child_span.request_id, child_span.span_id)
+    client.end_trace(root_span.request_id)
+
+    assert get_traces() == []
+
+
+def test_fluent_apis_do_nothing_in_unsampled_trace(monkeypatch):
+    _parent(1)
+    remote_trace = get_traces()[0]
+
+    monkeypatch.setenv("QCFLOW_TRACE_SAMPLING_RATIO", "0")
+    reset_tracer_setup()
+
+    @qcflow.trace
+    def f():
+        assert qcflow.get_current_active_span() is None
+        qcflow.update_current_trace(tags={"key": "value"})
+        qcflow.add_trace(remote_trace)
+        return 0
+
+    with mock.patch("qcflow.tracking.client.QCFlowClient.start_trace") as mock_start_trace:
+        assert f() == 0
+    mock_start_trace.assert_not_called()
+    assert len(get_traces()) == 1
+
+
+@pytest.mark.parametrize(
+    ("trace_info_kwargs", "expected"),
+    [
+        ({"status": TraceStatus.ERROR}, True),
+        ({"execution_time_ms": 2000}, True),
+        ({"tags": {"env": "prod"}}, True),
+        ({"tags": {"debug": "anything"}}, True),
+        ({"tags": {"env": "dev"}}, False),
+        ({"execution_time_ms": 10}, False),
+    ],
+)
+def test_tail_sampler_rules(trace_info_kwargs, expected):
+    sampler = TailSampler(
+        ratio=0.0,
+        latency_threshold_ms=1000,
+        keep_tags={"env": "prod", "debug": None},
+    )
+    trace_info = create_test_trace_info(
+        "tr-1", **{"status": TraceStatus.OK, "execution_time_ms": 0, **trace_info_kwargs}
+    )
+    assert sampler.should_keep(trace_info) is expected
+
+
+def test_tail_sampler_keeps_everything_by_default():
+    sampler = TailSampler.from_env()
+    assert not sampler.is_enabled
+    assert sampler.should_keep(create_test_trace_info("tr-1"))
+
+
+def test_tail_sampler_from_env(monkeypatch):
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_RATIO", "0.1")
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_KEEP_ERRORS", "false")
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS", "500")
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_KEEP_TAGS", "env=prod, debug")
+
+    sampler = TailSampler.from_env()
+    assert sampler.ratio == 0.1
+    assert sampler.keep_errors is False
+    assert sampler.latency_threshold_ms == 500
+    assert sampler.keep_tags == {"env": "prod", "debug": None}
+
+
+def test_parse_keep_tags():
+    assert _parse_keep_tags(None) == {}
+    assert _parse_keep_tags("a=1,,b, c = 2 ") == {"a": "1", "b": None, "c": "2"}
+
+
+def test_tail_sampling_drops_trace(monkeypatch, async_logging_enabled):
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_RATIO", "0")
+    monkeypatch.setenv("QCFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS", "60000")
+
+    assert _parent(1) == 4
+
+    with pytest.raises(ValueError, match="error"):
+        with qcflow.start_span("error_span"):
+            raise ValueError("error")
+
+    if async_logging_enabled:
+        qcflow.flush_trace_async_logging(terminate=True)
+
+    # Only the trace with the error is kept, and the dropped trace is deleted from the backend
+    traces = get_traces()
+    assert len(traces) == 1
+    assert traces[0].info.status == TraceStatus.ERROR
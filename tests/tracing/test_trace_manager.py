@@ -152,6 +152,52 @@ def test_traces_buffer_max_size_limit(monkeypatch):
     InMemoryTraceManager._instance = None
 
 
+def test_traces_buffer_eviction_releases_trace_id_mapping(monkeypatch):
+    InMemoryTraceManager._instance = None
+    monkeypatch.setenv("QCFLOW_TRACE_BUFFER_MAX_SIZE", "1")
+
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(12345, create_test_trace_info("tr-1", "experiment"))
+    trace_manager.register_trace(67890, create_test_trace_info("tr-2", "experiment"))
+
+    assert trace_manager.get_request_id_from_trace_id(12345) is None
+    assert trace_manager.get_request_id_from_trace_id(67890) == "tr-2"
+
+    # Spans of the evicted trace should be ignored
+    trace_manager.register_span(_create_test_span("tr-1"))
+    assert "tr-1" not in trace_manager._traces
+
+    InMemoryTraceManager._instance = None
+
+
+def test_pop_ended_spans():
+    trace_manager = InMemoryTraceManager.get_instance()
+    request_id = "tr-1"
+    trace_manager.register_trace(12345, create_test_trace_info(request_id, "test"))
+    root_span = _create_test_span(request_id, span_id=1)
+    child_spans = [_create_test_span(request_id, span_id=i, parent_id=1) for i in range(2, 7)]
+    for span in [root_span, *child_spans]:
+        trace_manager.register_span(span)
+
+    batches = []
+    for span in child_spans:
+        if batch := trace_manager.pop_ended_spans(request_id, span.span_id, batch_size=2):
+            batches.append(batch)
+
+    assert [batch.index for batch in batches] == [0, 1]
+    assert [s.span_id for batch in batches for s in batch.spans] == [
+        s.span_id for s in child_spans[:4]
+    ]
+    assert all(not isinstance(s, LiveSpan) for batch in batches for s in batch.spans)
+
+    # Only the root span and the span of the incomplete batch should remain in memory
+    trace = trace_manager.pop_trace(12345)
+    assert [s.span_id for s in trace.data.spans] == [root_span.span_id, child_spans[4].span_id]
+
+    # Unknown trace
+    assert trace_manager.pop_ended_spans("tr-2", root_span.span_id, batch_size=1) is None
+
+
 def test_get_span_from_id():
     trace_manager = InMemoryTraceManager.get_instance()
     request_id_1 = "tr-1"
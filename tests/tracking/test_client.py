@@ -11,6 +11,7 @@ import qcflow
 from qcflow import QCFlowClient, flush_async_logging
 from qcflow.config import enable_async_logging
 from qcflow.entities import (
+    ChangeEvent,
     ExperimentTag,
     Run,
     RunInfo,
@@ -31,6 +32,7 @@ from qcflow.entities.trace_status import TraceStatus
 from qcflow.environment_variables import QCFLOW_TRACKING_USERNAME
 from qcflow.exceptions import QCFlowException, QCFlowTraceDataCorrupted, QCFlowTraceDataNotFound
 from qcflow.store.artifact.artifact_repo import ArtifactRepository
+from qcflow.store.entities.paged_list import PagedList
 from qcflow.store.model_registry.sqlalchemy_store import (
     SqlAlchemyStore as SqlAlchemyModelRegistryStore,
 )
@@ -1683,3 +1685,23 @@ def test_store_trace_span_tag_when_exception_raised():
         client.end_trace(span.request_id, outputs={"result": "b" * 1000000})
         mock_set_trace_tag.assert_called_once()
         mock_upload_trace_data.assert_called_once()
+
+
+def _change_event(sequence):
+    return ChangeEvent(
+        sequence=sequence, timestamp=0, entity_type="run", entity_id=str(sequence), op="create"
+    )
+
+
+def test_client_watch_changes(mock_store):
+    mock_store.get_change_events.side_effect = [
+        PagedList([_change_event(1), _change_event(2)], "2"),
+        PagedList([], "2"),
+        PagedList([_change_event(3)], "3"),
+    ]
+    events = QCFlowClient().watch_changes(entity_types=["run"], page_token="0", timeout_seconds=90)
+    assert [next(events).sequence for _ in range(3)] == [1, 2, 3]
+    assert mock_store.get_change_events.call_args_list == [
+        mock.call(entity_types=["run"], page_token=token, max_results=1000, timeout_seconds=60)
+        for token in ["0", "2", "2"]
+    ]